@@ -0,0 +1,169 @@
+"""큰 파일 S3 업로드 메모리 벤치마크.
+
+합성 파일(sparse, 기본 2GB)을 로컬 S3 대역 서버에 S3Uploader.upload_large()로 올리고
+최대 RSS가 한도 이하인지 확인한다. 대역 서버는 별도 프로세스에서 실행되는 최소한의
+멀티파트 API(CreateMultipartUpload/UploadPart/ListParts/CompleteMultipartUpload)로,
+본문은 MD5만 계산하고 버린다. --endpoint-url로 MinIO 등 실제 S3 호환 서버를 지정할 수 있다.
+
+    uv run python benchmarks/upload_large.py --size-gb 4 --max-rss-mb 200
+"""
+
+import argparse
+import hashlib
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from indieshout.utils.s3_uploader import MB, S3Uploader
+
+READ_SIZE = 1 * MB
+
+
+class StubS3Handler(BaseHTTPRequestHandler):
+    """멀티파트 업로드만 지원하는 S3 대역 (파트 본문은 저장하지 않음)."""
+
+    protocol_version = "HTTP/1.1"
+    uploads: dict[str, dict[int, str]] = {}
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+    def _query(self) -> dict[str, str]:
+        return {k: v[0] for k, v in parse_qs(urlparse(self.path).query, keep_blank_values=True).items()}
+
+    def _reply(self, status: int, body: bytes = b"", headers: dict | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _drain(self) -> str:
+        """요청 본문을 READ_SIZE씩 읽어 MD5 계산."""
+        digest = hashlib.md5()
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining > 0:
+            data = self.rfile.read(min(READ_SIZE, remaining))
+            if not data:
+                break
+            digest.update(data)
+            remaining -= len(data)
+        return f'"{digest.hexdigest()}"'
+
+    def do_POST(self):  # noqa: N802
+        query = self._query()
+        self._drain()
+        if "uploads" in query:
+            upload_id = uuid.uuid4().hex
+            self.uploads[upload_id] = {}
+            body = (
+                "<InitiateMultipartUploadResult>"
+                f"<UploadId>{upload_id}</UploadId>"
+                "</InitiateMultipartUploadResult>"
+            )
+            self._reply(200, body.encode())
+        elif query.get("uploadId") in self.uploads:
+            self.uploads.pop(query["uploadId"])
+            body = '<CompleteMultipartUploadResult><ETag>"done"</ETag></CompleteMultipartUploadResult>'
+            self._reply(200, body.encode())
+        else:
+            self._reply(404, b"<Error><Code>NoSuchUpload</Code></Error>")
+
+    def do_PUT(self):  # noqa: N802
+        query = self._query()
+        etag = self._drain()
+        parts = self.uploads.get(query.get("uploadId", ""))
+        if parts is None:
+            self._reply(404, b"<Error><Code>NoSuchUpload</Code></Error>")
+            return
+        parts[int(query["partNumber"])] = etag
+        self._reply(200, headers={"ETag": etag})
+
+    def do_GET(self):  # noqa: N802
+        parts = self.uploads.get(self._query().get("uploadId", ""))
+        if parts is None:
+            self._reply(404, b"<Error><Code>NoSuchUpload</Code></Error>")
+            return
+        items = "".join(
+            f"<Part><PartNumber>{n}</PartNumber><ETag>{etag}</ETag></Part>" for n, etag in sorted(parts.items())
+        )
+        self._reply(200, f"<ListPartsResult><IsTruncated>false</IsTruncated>{items}</ListPartsResult>".encode())
+
+
+def serve(port_queue) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubS3Handler)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def max_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB, Linux의 ru_maxrss는 KB)."""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-gb", type=float, default=2.0, help="합성 파일 크기 (GB)")
+    parser.add_argument("--max-rss-mb", type=float, default=200.0, help="허용 최대 RSS (MB)")
+    parser.add_argument("--chunksize-mb", type=int, default=8, help="파트 크기 (MB)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 파트 업로드 수")
+    parser.add_argument("--endpoint-url", default=None, help="S3 호환 서버 (기본: 내장 대역 서버)")
+    parser.add_argument("--bucket", default="bench-bucket")
+    args = parser.parse_args()
+
+    server = None
+    endpoint_url = args.endpoint_url
+    if endpoint_url is None:
+        port_queue = multiprocessing.Queue()
+        server = multiprocessing.Process(target=serve, args=(port_queue,), daemon=True)
+        server.start()
+        endpoint_url = f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "synthetic.bin"
+        size = int(args.size_gb * 1024 * MB)
+        with open(source, "wb") as f:
+            f.truncate(size)  # sparse 파일: 디스크를 쓰지 않고 읽으면 0
+
+        uploader = S3Uploader(
+            {
+                "s3": {
+                    "bucket_name": args.bucket,
+                    "access_key_id": "bench",
+                    "secret_access_key": "bench",
+                    "endpoint_url": endpoint_url,
+                    "multipart_chunksize_mb": args.chunksize_mb,
+                    "max_concurrency": args.concurrency,
+                    "resume_dir": str(Path(tmp) / "multipart"),
+                }
+            }
+        )
+        baseline = max_rss_mb()
+        started = time.perf_counter()
+        uploader.upload_large(source, "bench/synthetic.bin")
+        elapsed = time.perf_counter() - started
+        peak = max_rss_mb()
+
+    if server is not None:
+        server.terminate()
+
+    throughput = size / MB / elapsed
+    print(f"📦 {size / 1024 / MB:.1f}GB 업로드: {elapsed:.1f}s ({throughput:.0f}MB/s)")
+    print(f"🧠 최대 RSS: {peak:.0f}MB (업로드 전 {baseline:.0f}MB, 한도 {args.max_rss_mb:.0f}MB)")
+    if peak > args.max_rss_mb:
+        print("❌ RSS 한도 초과")
+        return 1
+    print("✅ RSS 한도 이내")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,23 @@
-from indieshout.blog.base import BaseBlogPublisher
-from indieshout.blog.hugo_publisher import HugoPublisher
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from indieshout.blog.base import BaseBlogPublisher
+    from indieshout.blog.hugo_publisher import HugoPublisher
+
+# 하위 모듈은 처음 접근할 때 import (boto3 로딩을 필요할 때까지 미룸)
+_LAZY_ATTRS = {
+    "BaseBlogPublisher": "indieshout.blog.base",
+    "HugoPublisher": "indieshout.blog.hugo_publisher",
+}
 
 __all__ = ["BaseBlogPublisher", "HugoPublisher"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -38,6 +38,7 @@ class ContentLoader:
                 - blog_content: Content 객체 (블로그용)
                 - sns_text: SNS용 텍스트
                 - platforms: 게시할 SNS 플랫폼 리스트
+                - scheduled_at: 예약 게시 시각 (없으면 None)
 
         Raises:
             FileNotFoundError: 필수 파일이 없을 때
@@ -88,14 +89,31 @@ class ContentLoader:
             categories=meta_data.get("categories", []),
             image_paths=image_paths if image_paths else None,
             date=datetime.now(),
+            scheduled_at=meta_data.get("scheduled_at"),
+            source_dir=str(folder_path),
         )
 
         return {
             "blog_content": blog_content,
             "sns_text": meta_data.get("sns_text", ""),
             "platforms": meta_data.get("platforms", ["x", "threads"]),
+            "scheduled_at": meta_data.get("scheduled_at"),
         }
 
+    def get_scheduled_at(self, folder_name: str) -> datetime | None:
+        """폴더 meta.md의 예약 게시 시각 반환 (없으면 None)."""
+        meta_file = self.blog_content_dir / folder_name / "meta.md"
+        if not meta_file.exists():
+            return None
+        return self._parse_meta_file(meta_file).get("scheduled_at")
+
+    def get_platforms(self, folder_name: str) -> list[str]:
+        """폴더 meta.md의 SNS 플랫폼 리스트 반환 (meta.md가 없으면 빈 리스트)."""
+        meta_file = self.blog_content_dir / folder_name / "meta.md"
+        if not meta_file.exists():
+            return []
+        return self._parse_meta_file(meta_file).get("platforms", ["x", "threads"])
+
     def _parse_meta_file(self, meta_file: Path) -> dict:
         """meta.md 파일 파싱.
 
@@ -104,16 +122,22 @@ class ContentLoader:
             tags: python, 개발, AI
             categories: 기술
             platforms: x, threads
+            scheduled_at: 2026-03-01 09:00
 
             ---
 
             SNS용 텍스트 내용...
 
+        scheduled_at(예약 게시 시각, ISO 형식)은 선택 항목이다.
+
         Args:
             meta_file: meta.md 파일 경로
 
         Returns:
             파싱된 메타데이터 dict
+
+        Raises:
+            ValueError: scheduled_at 형식이 잘못되었을 때
         """
         text = meta_file.read_text(encoding="utf-8")
 
@@ -139,6 +163,11 @@ class ContentLoader:
                     meta_data["categories"] = [c.strip() for c in value.split(",")]
                 elif key == "platforms":
                     meta_data["platforms"] = [p.strip() for p in value.split(",")]
+                elif key == "scheduled_at":
+                    try:
+                        meta_data["scheduled_at"] = datetime.fromisoformat(value)
+                    except ValueError:
+                        raise ValueError(f"scheduled_at 형식이 잘못되었습니다: {value}")
                 else:
                     meta_data[key] = value
 
@@ -150,17 +179,31 @@ class ContentLoader:
     def list_folders(self) -> list[str]:
         """blog-content 디렉토리의 모든 폴더 리스트 반환.
 
+        5자리 숫자 prefix 순서로 정렬하며, prefix가 없는 폴더는 뒤에 이름순으로 온다.
+
         Returns:
             폴더 이름 리스트
         """
         if not self.blog_content_dir.exists():
             return []
 
-        return [
+        folders = [
             f.name
             for f in self.blog_content_dir.iterdir()
             if f.is_dir() and not f.name.startswith(".")
         ]
+        return sorted(folders, key=self._folder_sort_key)
+
+    def get_slug(self, folder_name: str) -> str:
+        """폴더명에 대응하는 포스트 slug 반환."""
+        return self._remove_number_prefix(folder_name)
+
+    def _folder_sort_key(self, folder_name: str) -> tuple[int, int, str]:
+        """숫자 prefix 기준 정렬 키."""
+        match = re.match(r"^(\d+)-", folder_name)
+        if match:
+            return (0, int(match.group(1)), folder_name)
+        return (1, 0, folder_name)
 
     def _remove_number_prefix(self, folder_name: str) -> str:
         """폴더명에서 5자리 숫자 prefix 제거.
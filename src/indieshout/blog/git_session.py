@@ -0,0 +1,201 @@
+"""블로그 저장소 Git 작업 세션."""
+
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+COMMIT_MODES = ("batch", "per_post")
+
+
+class GitSession:
+    """한 번의 실행 동안 블로그 저장소의 Git 작업을 모아서 처리.
+
+    - 저장소 설정(user.name) 확인은 세션당 한 번만 실행
+    - 게시된 포스트 디렉토리를 모아 두었다가 한 번의 `git add`로 stage
+    - commit_mode에 따라 배치 전체를 하나의 커밋(batch) 또는 포스트별 커밋(per_post)
+    - 단계별(config/add/commit/push) 소요 시간 기록
+    """
+
+    def __init__(
+        self,
+        repo_path: str | Path,
+        remote: str | None = None,
+        branch: str | None = None,
+        commit_mode: str = "batch",
+    ):
+        """GitSession 초기화.
+
+        Args:
+            repo_path: 블로그 Git 저장소 경로
+            remote: push 대상 remote (None이면 git 기본값)
+            branch: push 대상 branch (None이면 git 기본값)
+            commit_mode: "batch" 또는 "per_post"
+        """
+        if commit_mode not in COMMIT_MODES:
+            raise ValueError(f"Unknown commit_mode: {commit_mode}")
+
+        self.repo_path = Path(repo_path)
+        self.remote = remote
+        self.branch = branch
+        self.commit_mode = commit_mode
+        self.timings: dict[str, float] = {}
+        self._config_checked = False
+        self._pending: list[tuple[str, str]] = []  # (포스트 디렉토리, 제목)
+        self._lock = threading.Lock()
+        self._config_lock = threading.Lock()
+        # git add/commit은 저장소의 .git/index.lock을 잡으므로 한 번에 하나만 실행
+        self._commit_lock = threading.Lock()
+
+    def _run(self, phase: str, args: list[str]) -> subprocess.CompletedProcess:
+        """git 명령 실행 후 단계별 소요 시간 누적."""
+        started = time.perf_counter()
+        try:
+            return subprocess.run(
+                ["git", *args],
+                cwd=self.repo_path,
+                check=True,
+                capture_output=True,
+            )
+        finally:
+            elapsed = time.perf_counter() - started
+            self.timings[phase] = self.timings.get(phase, 0.0) + elapsed
+
+    def check_config(self) -> bool:
+        """Git user.name 설정 확인 (세션당 한 번).
+
+        Raises:
+            RuntimeError: user.name이 설정되지 않았을 때
+        """
+        with self._config_lock:
+            if self._config_checked:
+                return True
+
+            try:
+                self._run("config", ["config", "user.name"])
+            except subprocess.CalledProcessError:
+                raise RuntimeError("Git user.name is not configured")
+
+            self._config_checked = True
+            return True
+
+    def stage_post(self, post_dir: str | Path, title: str) -> None:
+        """커밋할 포스트 디렉토리 등록 (실제 git add는 commit 시 실행)."""
+        post_dir = Path(post_dir)
+        try:
+            post_dir = post_dir.relative_to(self.repo_path)
+        except ValueError:
+            # 이미 저장소 기준 상대 경로
+            pass
+
+        with self._lock:
+            self._pending.append((str(post_dir), title))
+
+    def has_pending(self) -> bool:
+        """커밋 대기 중인 포스트가 있는지 확인."""
+        with self._lock:
+            return bool(self._pending)
+
+    def commit(self) -> int:
+        """대기 중인 포스트를 커밋.
+
+        여러 스레드에서 호출해도 add부터 commit까지는 한 번에 하나씩 실행된다.
+        add/commit이 실패하면 커밋하지 못한 포스트는 대기 목록에 남는다.
+
+        Returns:
+            생성된 커밋 수
+
+        Raises:
+            RuntimeError: git add/commit 실패 시
+        """
+        with self._commit_lock:
+            with self._lock:
+                pending = list(self._pending)
+                self._pending.clear()
+
+            if not pending:
+                return 0
+            try:
+                return self._commit_pending(pending)
+            except Exception:
+                # 커밋하지 못한 포스트는 다음 commit()에서 다시 시도
+                with self._lock:
+                    self._pending[:0] = pending
+                raise
+
+    def _commit_pending(self, pending: list[tuple[str, str]]) -> int:
+        """commit_mode에 따라 포스트 디렉토리를 add 후 커밋.
+
+        커밋한 포스트는 pending에서 제거하므로 실패 시 남은 항목이 커밋하지 못한 포스트다.
+        """
+        if self.commit_mode == "per_post":
+            commits = 0
+            while pending:
+                post_dir, title = pending[0]
+                self._add([post_dir])
+                commits += self._commit(f"Add post: {title}")
+                pending.pop(0)
+            return commits
+
+        self._add([post_dir for post_dir, _ in pending])
+        if len(pending) == 1:
+            message = f"Add post: {pending[0][1]}"
+        else:
+            body = "\n".join(f"- {title}" for _, title in pending)
+            message = f"Add {len(pending)} posts\n\n{body}"
+        commits = self._commit(message)
+        pending.clear()
+        return commits
+
+    def _add(self, paths: list[str]) -> None:
+        try:
+            self._run("add", ["add", "--", *paths])
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Git add failed: {e.stderr.decode()}")
+
+    def _commit(self, message: str) -> int:
+        try:
+            self._run("commit", ["commit", "-m", message])
+            return 1
+        except subprocess.CalledProcessError as e:
+            output = (e.stdout or b"").decode() + (e.stderr or b"").decode()
+            # 변경사항이 없으면 에러가 발생할 수 있음 (무시)
+            if "nothing to commit" in output:
+                return 0
+            raise RuntimeError(f"Git commit failed: {output}")
+
+    def uncommitted_paths(self, path: str | Path) -> set[str]:
+        """path 아래에서 커밋되지 않은(새로 만들었거나 수정한) 파일/디렉토리 경로.
+
+        저장소 기준 상대 경로를 반환하며, Git 저장소가 아니면 빈 집합.
+        """
+        try:
+            result = self._run("status", ["status", "--porcelain", "--", str(path)])
+        except (subprocess.CalledProcessError, OSError):
+            return set()
+        return {line[3:].strip('"') for line in result.stdout.decode().splitlines() if line}
+
+    def push(self) -> bool:
+        """Git push.
+
+        Raises:
+            RuntimeError: push 실패 시
+        """
+        args = ["push"]
+        if self.remote:
+            args.append(self.remote)
+            if self.branch:
+                args.append(self.branch)
+
+        try:
+            self._run("push", args)
+            return True
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Git push failed: {e.stderr.decode()}")
+
+    def format_timings(self) -> str | None:
+        """단계별 소요 시간 요약 문자열 (기록이 없으면 None)."""
+        if not self.timings:
+            return None
+        parts = [f"{phase} {seconds:.2f}s" for phase, seconds in self.timings.items()]
+        return "Git 소요 시간: " + ", ".join(parts)
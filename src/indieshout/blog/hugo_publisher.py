@@ -1,47 +1,62 @@
 import os
-import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from indieshout.blog.base import BaseBlogPublisher
+from indieshout.blog.git_session import GitSession
 from indieshout.models.content import Content
-from indieshout.utils.s3_uploader import S3Uploader
+from indieshout.utils.auth_cache import AuthCache, credential_fingerprint
+from indieshout.utils.image_optimizer import ImageOptimizer
+from indieshout.utils.markdown_images import render_pictures, rewrite_image_refs
+from indieshout.utils.s3_uploader import ProgressCallback, S3BatchUploadError, S3Uploader
+from indieshout.utils.upload_manifest import UploadManifest, file_sha256
 from indieshout.utils.translator import Translator
 
 
 class HugoPublisher(BaseBlogPublisher):
-    def __init__(self, config: dict) -> None:
-        super().__init__(config)
+    def __init__(self, config: dict, auth_cache: AuthCache | None = None) -> None:
+        super().__init__(config, auth_cache)
         self.hugo_config = config.get("hugo", {})
         self.blog_repo_path = Path(self.hugo_config.get("blog_repo_path", "./blog-site"))
         self.content_dir = self.hugo_config.get("content_dir", "content/posts")
         self.base_url = self.hugo_config.get("base_url", "https://myrestaurant.com")
         self.default_language = self.hugo_config.get("default_language", "ko")
         self.languages = self.hugo_config.get("languages", ["ko", "en"])
-        self.translator = Translator(source_lang="ko", target_lang="en")
+        self.translator = Translator.from_config(config)
+        self.git = GitSession(
+            self.blog_repo_path,
+            remote=self.hugo_config.get("git_remote"),
+            branch=self.hugo_config.get("git_branch"),
+            commit_mode=self.hugo_config.get("commit_mode", "batch"),
+        )
 
         # S3 업로더 초기화 (S3 설정이 있을 때만)
+        self.s3_config = config.get("s3", {})
         self.s3_uploader = None
-        if config.get("s3", {}).get("bucket_name"):
+        if self.s3_config.get("bucket_name"):
             try:
                 self.s3_uploader = S3Uploader(config)
             except Exception as e:
                 print(f"Warning: S3Uploader initialization failed: {e}")
                 # S3 없이도 작동하도록 계속 진행
 
+        # 업로드 전 이미지 최적화 (images.optimize, Pillow 필요)
+        self.image_optimizer = ImageOptimizer.from_config(config) if self.s3_uploader else None
+        # 기본 파일 URL → WebP/AVIF 변형 (images.picture, 마크다운에서 <picture>로 참조)
+        self._picture_sources: dict[str, list[dict]] = {}
+        self._picture_lock = threading.Lock()
+
     def authenticate(self) -> bool:
-        """Hugo는 인증이 필요 없음. Git 설정만 확인."""
-        # Git 설정 확인
-        try:
-            subprocess.run(
-                ["git", "config", "user.name"],
-                cwd=self.blog_repo_path,
-                check=True,
-                capture_output=True,
-            )
+        """Hugo는 인증이 필요 없음. Git 설정만 확인 (실행당 한 번, 인증 캐시 적용)."""
+        fingerprint = credential_fingerprint(str(self.blog_repo_path.resolve()))
+        if self.auth_cache.get("hugo", fingerprint) is not None:
             return True
-        except subprocess.CalledProcessError:
-            raise RuntimeError("Git user.name is not configured")
+
+        self.git.check_config()
+        self.auth_cache.set("hugo", fingerprint, {"repo": str(self.blog_repo_path)})
+        return True
 
     def validate(self, content: Content) -> bool:
         """게시 전 유효성 검사."""
@@ -79,47 +94,140 @@ categories: {content.categories or []}
             "slug": content.slug or self._generate_slug(content.title),
         }
 
-    def publish(self, content: Content) -> dict:
-        """마크다운 파일 생성, 이미지 S3 업로드, 번역, Git commit/push."""
+    def publish(self, content: Content, commit: bool = True) -> dict:
+        """마크다운 파일 생성, 이미지 S3 업로드, 번역, Git commit/push.
+
+        번역은 이미지 URL에 의존하지 않으므로 S3 업로드와 동시에 시작하고,
+        두 작업이 끝나면 한/영 마크다운 모두에 S3 URL을 치환한다.
+
+        Args:
+            content: 게시할 Content
+            commit: False면 포스트를 Git 세션에 등록만 하고 커밋은 호출자에게 맡김
+                (일괄 게시 시 commit_pending으로 한 번에 커밋)
+        """
         formatted = self.format_content(content)
         slug = formatted["slug"]
         markdown = formatted["markdown"]
 
-        # 이미지 S3 업로드 (있을 경우)
-        image_url_map = {}
-        if content.image_paths and self.s3_uploader:
-            image_url_map = self._upload_images_to_s3(content.image_paths, slug)
-            # 마크다운의 이미지 경로를 S3 URL로 치환
-            markdown = self._replace_image_paths(markdown, image_url_map)
+        # 1. 이미지 업로드와 번역을 동시에 실행
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="hugo-publish") as executor:
+            upload_future = executor.submit(self.upload_images, content, slug)
+            translate_future = executor.submit(self.translate, markdown)
+            image_url_map = upload_future.result()
+            translated_markdown = translate_future.result()
+
+        # 2. 이미지 경로 치환 후 한/영 마크다운 파일 생성
+        result = self.write_post(content, slug, markdown, translated_markdown, image_url_map)
+
+        # Git commit
+        self.git.stage_post(Path(result["files"]["ko"]).parent, content.title)
+        if commit:
+            self.git.commit()
+
+        return result
+
+    def upload_images(self, content: Content, slug: str) -> dict[str, str]:
+        """콘텐츠 이미지를 S3에 업로드하고 로컬 경로 → S3 URL 매핑 반환.
+
+        이미지 최적화가 켜져 있으면 축소/재압축한 파일(images.picture면 WebP/AVIF
+        변형도)을 올리고, 원본 경로를 축소된 파일의 URL로 매핑한다. 변형 URL은
+        write_post()에서 <picture>로 바꿀 때 사용한다.
+        이미지가 없거나 S3가 설정되지 않았으면 빈 dict.
+        """
+        if not content.image_paths or not self.s3_uploader:
+            return {}
+        if self.image_optimizer is None:
+            return self._upload_images_to_s3(content.image_paths, slug, source_dir=content.source_dir)
+
+        source_dir = Path(content.source_dir or Path(content.image_paths[0]).parent)
+        optimized = self.image_optimizer.optimize_many(
+            content.image_paths, cache=self.image_optimizer.cache_for(source_dir)
+        )
+        upload_paths = [path for result in optimized.values() for path in result["files"]]
+        uploaded = self._upload_images_to_s3(upload_paths, slug, source_dir=content.source_dir)
+
+        url_map: dict[str, str] = {}
+        sources: dict[str, list[dict]] = {}
+        for image_path, result in optimized.items():
+            if result["path"] not in uploaded:
+                continue
+            url_map[image_path] = uploaded[result["path"]]
+            directory = Path(result["path"]).parent
+            variants = [
+                {**variant, "url": uploaded[str(directory / variant["file"])]}
+                for variant in result.get("variants", [])
+                if str(directory / variant["file"]) in uploaded
+            ]
+            if variants:
+                sources[url_map[image_path]] = variants
+        if sources:
+            with self._picture_lock:
+                self._picture_sources.update(sources)
+        return url_map
+
+    def upload_sns_images(
+        self, image_paths: list[str], slug: str, platform: str, source_dir: str | None = None
+    ) -> dict[str, str]:
+        """플랫폼 규격으로 변환한 SNS 이미지를 posts/{slug}/sns/{platform}/에 업로드.
+
+        블로그 이미지와 이름이 같아도 덮어쓰지 않도록 플랫폼별 경로를 사용한다.
+        S3가 설정되지 않았으면 빈 dict.
+        """
+        return self._upload_images_to_s3(
+            image_paths, slug, source_dir=source_dir, s3_prefix=f"posts/{slug}/sns/{platform}"
+        )
+
+    def translate(self, markdown: str) -> str | None:
+        """영문 번역 (en이 languages에 없거나 번역 실패 시 None)."""
+        if "en" not in self.languages:
+            return None
+        return self._translate_markdown(markdown)
+
+    def write_post(
+        self,
+        content: Content,
+        slug: str,
+        markdown: str,
+        translated_markdown: str | None,
+        image_url_map: dict[str, str],
+    ) -> dict:
+        """이미지 경로를 S3 URL로 치환하고 한/영 마크다운 파일 생성 (Git 등록은 하지 않음).
+
+        Args:
+            content: 게시할 Content
+            slug: 포스트 slug
+            markdown: front matter를 포함한 한글 마크다운
+            translated_markdown: 영문 번역 (없으면 None)
+            image_url_map: 로컬 경로 → S3 URL
+
+        Returns:
+            publish()와 같은 형식의 게시 결과 dict
+        """
+        # 마크다운의 이미지 경로를 S3 URL로 치환 (한/영 모두)
+        if image_url_map:
+            markdown = self._replace_image_paths(markdown, image_url_map, content.source_dir)
+            if translated_markdown is not None:
+                translated_markdown = self._replace_image_paths(
+                    translated_markdown, image_url_map, content.source_dir
+                )
 
         # 포스트 디렉토리 생성
         post_dir = self.blog_repo_path / self.content_dir / slug
         post_dir.mkdir(parents=True, exist_ok=True)
 
-        # 1. 한글 마크다운 파일 생성
+        # 한글 마크다운 파일 생성
         ko_file = post_dir / "index.ko.md"
         ko_file.write_text(markdown, encoding="utf-8")
 
-        # 2. 영문 번역 파일 생성
+        # 영문 번역 파일 생성 (번역 실패 시 생성하지 않음)
         en_file = post_dir / "index.en.md"
-        if "en" in self.languages:
-            try:
-                translated_markdown = self.translator.translate_markdown(markdown)
-                en_file.write_text(translated_markdown, encoding="utf-8")
-            except Exception as e:
-                # 번역 실패 시 경고만 출력하고 계속 진행
-                print(f"Warning: Translation failed: {e}")
-                # 영문 파일은 생성하지 않음
-
-        # Git commit
-        self._git_commit(slug, content.title)
-
-        # URL 생성
-        url = self.get_post_url(content)
+        if translated_markdown is not None:
+            en_file.write_text(translated_markdown, encoding="utf-8")
 
         return {
             "slug": slug,
-            "url": url,
+            "title": content.title,
+            "url": self.get_post_url(content),
             "files": {
                 "ko": str(ko_file),
                 "en": str(en_file) if en_file.exists() else None,
@@ -127,6 +235,24 @@ categories: {content.categories or []}
             "images": image_url_map,
         }
 
+    def _translate_markdown(self, markdown: str) -> str | None:
+        """마크다운 번역 후 이 포스트의 캐시 통계 출력 (실패 시 경고 후 None)."""
+        # 여러 포스트를 동시에 번역해도 섞이지 않도록 호출 단위로 집계
+        stats = {"hits": 0, "misses": 0}
+
+        try:
+            translated = self.translator.translate_markdown(markdown, stats=stats)
+        except Exception as e:
+            # 번역 실패 시 경고만 출력하고 계속 진행
+            print(f"Warning: Translation failed: {e}")
+            translated = None
+
+        summary = self.translator.cache_summary(stats)
+        if summary:
+            print(f"📊 {summary}")
+
+        return translated
+
     def read_post(self, file_path: Path) -> Content:
         """마크다운 파일을 읽어 Content 객체로 변환."""
         if not file_path.exists():
@@ -151,18 +277,31 @@ categories: {content.categories or []}
             title=file_path.stem,  # 파일명을 제목으로 사용
         )
 
-    def deploy(self, content: Content) -> bool:
+    def is_published(self, slug: str) -> bool:
+        """블로그 저장소에 해당 slug의 포스트가 이미 있는지 확인."""
+        return (self.blog_repo_path / self.content_dir / slug / "index.ko.md").exists()
+
+    def uncommitted_slugs(self) -> set[str]:
+        """파일은 써 두었지만 아직 커밋하지 않은 포스트 slug (커밋 실패 등)."""
+        slugs = set()
+        for path in self.git.uncommitted_paths(self.content_dir):
+            parts = Path(path).parts
+            prefix = Path(self.content_dir).parts
+            if len(parts) > len(prefix) and parts[: len(prefix)] == prefix:
+                slugs.add(parts[len(prefix)])
+        return slugs
+
+    def deploy(self, content: Content | None = None) -> bool:
         """Git push로 배포."""
-        try:
-            subprocess.run(
-                ["git", "push"],
-                cwd=self.blog_repo_path,
-                check=True,
-                capture_output=True,
-            )
-            return True
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Git push failed: {e.stderr.decode()}")
+        return self.git.push()
+
+    def commit_pending(self) -> int:
+        """Git 세션에 등록된 포스트를 commit_mode에 따라 커밋.
+
+        Returns:
+            생성된 커밋 수
+        """
+        return self.git.commit()
 
     def get_post_url(self, content: Content) -> str:
         """게시된 포스트의 URL 반환."""
@@ -187,12 +326,24 @@ categories: {content.categories or []}
         date_prefix = datetime.now().strftime("%Y%m%d")
         return f"{date_prefix}-{slug}"
 
-    def _upload_images_to_s3(self, image_paths: list[str], slug: str) -> dict[str, str]:
+    def _upload_images_to_s3(
+        self,
+        image_paths: list[str],
+        slug: str,
+        source_dir: str | None = None,
+        s3_prefix: str | None = None,
+    ) -> dict[str, str]:
         """이미지들을 S3에 업로드하고 로컬 경로 → S3 URL 매핑 반환.
 
+        source_dir이 주어지면 폴더의 업로드 매니페스트를 사용해 내용이 바뀌지
+        않은 이미지는 네트워크 호출 없이 건너뛴다. 매니페스트가 없으면 S3의
+        ETag를 일괄 조회(HEAD)해 이미 올라가 있는 파일을 찾는다.
+
         Args:
             image_paths: 업로드할 이미지 경로 리스트
             slug: 포스트 slug (S3 폴더 이름으로 사용)
+            source_dir: 포스트 폴더 경로 (매니페스트 저장 위치)
+            s3_prefix: S3 경로 (기본: posts/{slug})
 
         Returns:
             로컬 경로 → S3 URL 매핑 dict
@@ -200,67 +351,125 @@ categories: {content.categories or []}
         if not self.s3_uploader:
             return {}
 
-        url_map = {}
-        s3_prefix = f"posts/{slug}"
+        s3_prefix = s3_prefix or f"posts/{slug}"
+        files = {}
 
         for image_path in image_paths:
-            try:
-                path = Path(image_path)
-                if not path.exists():
-                    print(f"Warning: Image not found: {image_path}")
-                    continue
+            path = Path(image_path)
+            if not path.exists():
+                print(f"Warning: Image not found: {image_path}")
+                continue
+            files[image_path] = f"{s3_prefix}/{path.name}"
+
+        manifest = None
+        hashes: dict[str, str] = {}
+        cached: dict[str, str] = {}
+        if source_dir and self.s3_config.get("upload_manifest", True):
+            manifest = UploadManifest.for_folder(source_dir, self.s3_uploader.bucket_name)
+            hashes = {image_path: file_sha256(image_path) for image_path in files}
+            cached = self._find_uploaded_images(files, hashes, manifest)
+            if cached:
+                print(f"⏭️ 변경 없는 이미지 {len(cached)}장 업로드 생략")
+
+        pending = {p: key for p, key in files.items() if p not in cached}
+
+        # S3 동시 업로드
+        try:
+            uploaded = self.s3_uploader.upload_many(
+                pending, progress_callback=self._upload_progress_printer()
+            )
+        except S3BatchUploadError as e:
+            uploaded = e.url_map
+            for image_path, error in e.errors.items():
+                print(f"Warning: Failed to upload {image_path}: {error}")
 
-                # S3 업로드
-                s3_key = f"{s3_prefix}/{path.name}"
-                url = self.s3_uploader.upload_file(path, s3_key)
-                url_map[image_path] = url
-                print(f"✅ Image uploaded: {path.name} → {url}")
+        for image_path, url in uploaded.items():
+            print(f"✅ Image uploaded: {Path(image_path).name} → {url}")
 
-            except Exception as e:
-                print(f"Warning: Failed to upload {image_path}: {e}")
+        if manifest is not None:
+            for image_path, url in uploaded.items():
+                etag = self.s3_uploader.local_etag(image_path)
+                manifest.record(hashes[image_path], files[image_path], url, etag)
+            manifest.save()
 
-        return url_map
+        # 입력 순서 유지
+        return {
+            image_path: cached.get(image_path) or uploaded[image_path]
+            for image_path in files
+            if image_path in cached or image_path in uploaded
+        }
 
-    def _replace_image_paths(self, markdown: str, url_map: dict[str, str]) -> str:
-        """마크다운의 이미지 경로를 S3 URL로 치환.
+    @staticmethod
+    def _upload_progress_printer(step: int = 25) -> ProgressCallback:
+        """파일별 업로드 진행률을 step% 단위로 출력하는 upload_many 콜백."""
+        reported: dict[str, int] = {}
+        lock = threading.Lock()
+
+        def progress(file_path: str, transferred: int, total: int) -> None:
+            percent = 100 if total <= 0 else min(100, transferred * 100 // total)
+            bucket = percent // step * step
+            with lock:
+                if bucket <= reported.get(file_path, 0):
+                    return
+                reported[file_path] = bucket
+            print(f"  ⬆️ {Path(file_path).name}: {bucket}% ({transferred:,}/{total:,} bytes)")
+
+        return progress
+
+    def _find_uploaded_images(
+        self,
+        files: dict[str, str],
+        hashes: dict[str, str],
+        manifest: UploadManifest,
+    ) -> dict[str, str]:
+        """이미 같은 내용으로 업로드된 이미지의 로컬 경로 → URL 매핑 반환.
+
+        매니페스트가 있으면 해시만 비교하고, 없으면 S3 ETag와 로컬 ETag를
+        비교한 뒤 일치하는 항목을 매니페스트에 기록한다.
+        """
+        if manifest.loaded:
+            cached = {}
+            for image_path, s3_key in files.items():
+                entry = manifest.lookup(hashes[image_path], s3_key)
+                if entry:
+                    cached[image_path] = entry["url"]
+            return cached
+
+        remote_etags = self.s3_uploader.head_many(list(files.values()))
+        cached = {}
+        for image_path, s3_key in files.items():
+            remote_etag = remote_etags.get(s3_key)
+            if remote_etag is None:
+                continue
+            local_etag = self.s3_uploader.local_etag(image_path)
+            if remote_etag == local_etag:
+                url = self.s3_uploader.get_url(s3_key)
+                manifest.record(hashes[image_path], s3_key, url, local_etag)
+                cached[image_path] = url
+        return cached
+
+    def _replace_image_paths(
+        self, markdown: str, url_map: dict[str, str], base_dir: str | None = None
+    ) -> str:
+        """마크다운의 이미지 참조(인라인, HTML img, 참조형)를 S3 URL로 한 번에 치환.
+
+        상대 경로(assets/1.png)는 base_dir(포스트 폴더) 기준으로 해석하며,
+        URL 매핑이 없는 로컬 참조는 경고로 출력한다. 업로드한 WebP/AVIF 변형이
+        있는 인라인 이미지는 <picture>로 바꾼다.
 
         Args:
             markdown: 원본 마크다운 텍스트
             url_map: 로컬 경로 → S3 URL 매핑
+            base_dir: 상대 경로 기준 디렉토리 (보통 content.source_dir)
 
         Returns:
             이미지 경로가 치환된 마크다운
         """
-        result = markdown
-        for local_path, s3_url in url_map.items():
-            # 마크다운 이미지 구문: ![alt](path)
-            result = result.replace(f"]({local_path})", f"]({s3_url})")
-            # HTML img 태그: <img src="path">
-            result = result.replace(f'src="{local_path}"', f'src="{s3_url}"')
-            result = result.replace(f"src='{local_path}'", f"src='{s3_url}'")
-
-        return result
-
-    def _git_commit(self, slug: str, title: str) -> None:
-        """Git add 및 commit."""
-        try:
-            # Git add
-            subprocess.run(
-                ["git", "add", self.content_dir],
-                cwd=self.blog_repo_path,
-                check=True,
-                capture_output=True,
-            )
-
-            # Git commit
-            commit_message = f"Add post: {title}"
-            subprocess.run(
-                ["git", "commit", "-m", commit_message],
-                cwd=self.blog_repo_path,
-                check=True,
-                capture_output=True,
-            )
-        except subprocess.CalledProcessError as e:
-            # 변경사항이 없으면 에러가 발생할 수 있음 (무시)
-            if "nothing to commit" not in e.stderr.decode():
-                raise RuntimeError(f"Git commit failed: {e.stderr.decode()}")
+        rewrite = rewrite_image_refs(markdown, url_map, base_dir)
+        if rewrite.unresolved:
+            print(f"⚠️ 치환되지 않은 이미지 참조 {len(rewrite.unresolved)}개:")
+            for reference in rewrite.unresolved:
+                print(f"  - {reference}")
+        with self._picture_lock:
+            sources = dict(self._picture_sources)
+        return render_pictures(rewrite.text, sources)
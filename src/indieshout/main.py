@@ -1,17 +1,18 @@
+"""IndieShout CLI.
+
+`indieshout --help` 같은 가벼운 명령이 boto3/tweepy/httpx/pydantic을 불러오지
+않도록, 퍼블리셔/워크플로우/모델 import는 그것을 쓰는 명령 안에서 한다.
+"""
+
 import click
 
-from indieshout.formatter.content_formatter import ContentFormatter
-from indieshout.models.content import Content, ContentType
-from indieshout.publishers.threads import ThreadsPublisher
-from indieshout.publishers.twitter import TwitterPublisher
+from indieshout.publishers.registry import (
+    available_platforms,
+    create_publisher,
+    get_publisher_class,
+)
 from indieshout.utils.config import load_config
 from indieshout.utils.logger import setup_logger
-from indieshout.workflows.publish_workflow import PublishWorkflow
-
-PLATFORM_PUBLISHERS = {
-    "x": TwitterPublisher,
-    "threads": ThreadsPublisher,
-}
 
 
 @click.group()
@@ -39,6 +40,9 @@ def blog(ctx: click.Context) -> None:
 @click.pass_context
 def publish(ctx: click.Context, file: str, platforms: str | None) -> None:
     """마크다운 파일을 블로그에 게시하고 SNS에 링크를 공유합니다."""
+    from indieshout.formatter.content_formatter import ContentFormatter
+    from indieshout.models.content import Content, ContentType
+
     logger = ctx.obj["logger"]
 
     platform_list = [p.strip() for p in platforms.split(",")] if platforms else []
@@ -72,6 +76,7 @@ def publish(ctx: click.Context, file: str, platforms: str | None) -> None:
 @click.option("--dry-run/--no-dry-run", default=False, help="Dry-run 모드 (기본: 비활성)")
 @click.option("--skip-blog", is_flag=True, help="블로그 게시 건너뛰기")
 @click.option("--skip-sns", is_flag=True, help="SNS 게시 건너뛰기")
+@click.option("--force", is_flag=True, help="변경이 없어도 블로그 재게시, 이미 게시한 SNS에도 다시 게시")
 @click.pass_context
 def publish_folder(
     ctx: click.Context,
@@ -79,6 +84,7 @@ def publish_folder(
     dry_run: bool,
     skip_blog: bool,
     skip_sns: bool,
+    force: bool,
 ) -> None:
     """blog-content 폴더에서 블로그 + SNS 통합 게시.
 
@@ -92,17 +98,21 @@ def publish_folder(
         indieshout blog publish-folder my-first-post
         indieshout blog publish-folder my-first-post --dry-run
         indieshout blog publish-folder my-first-post --skip-sns
+        indieshout blog publish-folder my-first-post --force
     """
+    from indieshout.workflows.publish_workflow import PublishWorkflow
+
     config = ctx.obj["config"]
 
     try:
-        workflow = PublishWorkflow(config)
-        result = workflow.publish_from_folder(
-            folder_name,
-            dry_run=dry_run,
-            skip_blog=skip_blog,
-            skip_sns=skip_sns,
-        )
+        with PublishWorkflow(config) as workflow:
+            result = workflow.publish_from_folder(
+                folder_name,
+                dry_run=dry_run,
+                skip_blog=skip_blog,
+                skip_sns=skip_sns,
+                force=force,
+            )
 
         # 성공 여부 확인
         if result.get("blog") or skip_blog:
@@ -128,6 +138,71 @@ def publish_folder(
         exit(1)
 
 
+@blog.command("publish-all")
+@click.option("--dry-run/--no-dry-run", default=False, help="Dry-run 모드 (기본: 비활성)")
+@click.option("--skip-blog", is_flag=True, help="블로그 게시 건너뛰기")
+@click.option("--skip-sns", is_flag=True, help="SNS 게시 건너뛰기")
+@click.option("--workers", type=int, default=None, help="동시에 처리할 폴더 수 (기본: workflow.batch_workers)")
+@click.option("--limit", type=int, default=None, help="최대 게시 폴더 수")
+@click.option("--push/--no-push", default=True, help="일괄 커밋 후 git push (기본: 활성)")
+@click.option("--include-scheduled", is_flag=True, help="scheduled_at이 아직 오지 않은 폴더도 게시")
+@click.pass_context
+def publish_all(
+    ctx: click.Context,
+    dry_run: bool,
+    skip_blog: bool,
+    skip_sns: bool,
+    workers: int | None,
+    limit: int | None,
+    push: bool,
+    include_scheduled: bool,
+) -> None:
+    """blog-content의 미게시 폴더를 번호 순서대로 일괄 게시.
+
+    Git commit/push는 배치 전체에 대해 한 번만 실행합니다.
+    scheduled_at이 미래인 폴더는 --include-scheduled를 주지 않으면 건너뜁니다.
+
+    예시:
+        indieshout blog publish-all --dry-run
+        indieshout blog publish-all --workers 4 --limit 10
+    """
+    from indieshout.workflows.publish_workflow import PublishWorkflow
+
+    config = ctx.obj["config"]
+
+    try:
+        with PublishWorkflow(config) as workflow:
+            folder_names = workflow.list_unpublished_folders(include_scheduled=include_scheduled)
+            if limit is not None:
+                folder_names = folder_names[:limit]
+
+            result = workflow.publish_batch(
+                folder_names,
+                dry_run=dry_run,
+                skip_blog=skip_blog,
+                skip_sns=skip_sns,
+                max_workers=workers,
+                push=push,
+            )
+
+        failed = [
+            name
+            for name, post in result["posts"].items()
+            if "error" in post or (not post.get("blog") and not skip_blog)
+        ]
+        if failed or "git_error" in result:
+            click.echo(f"\n❌ 일부 실패: {', '.join(failed) or 'git'}")
+            exit(1)
+        click.echo("\n✅ 일괄 게시 완료!")
+
+    except Exception as e:
+        click.echo(f"❌ 예상치 못한 오류: {e}")
+        import traceback
+
+        traceback.print_exc()
+        exit(1)
+
+
 @cli.group()
 @click.pass_context
 def sns(ctx: click.Context) -> None:
@@ -138,11 +213,24 @@ def sns(ctx: click.Context) -> None:
 @sns.command()
 @click.argument("text")
 @click.option("--image", default=None, type=click.Path(exists=True), help="첨부 이미지 경로")
+@click.option("--video", default=None, type=click.Path(exists=True), help="첨부 동영상 경로 (청크 업로드)")
 @click.option("--platforms", default=None, help="게시 대상 플랫폼 (쉼표 구분, 예: x,threads)")
 @click.option("--dry-run/--no-dry-run", default=True, help="Dry-run 모드 (기본: 활성)")
 @click.pass_context
-def post(ctx: click.Context, text: str, image: str | None, platforms: str | None, dry_run: bool) -> None:
+def post(
+    ctx: click.Context,
+    text: str,
+    image: str | None,
+    video: str | None,
+    platforms: str | None,
+    dry_run: bool,
+) -> None:
     """텍스트를 SNS에 게시합니다."""
+    from indieshout.formatter.content_formatter import ContentFormatter
+    from indieshout.models.content import Content, ContentType
+    from indieshout.utils.auth_cache import AuthCache
+    from indieshout.utils.rate_limiter import RateLimiter
+
     logger = ctx.obj["logger"]
     config = ctx.obj["config"]
 
@@ -154,6 +242,7 @@ def post(ctx: click.Context, text: str, image: str | None, platforms: str | None
         text=text,
         platforms=platform_list,
         image_paths=image_paths,
+        video_path=video,
     )
 
     if dry_run:
@@ -167,25 +256,30 @@ def post(ctx: click.Context, text: str, image: str | None, platforms: str | None
         click.echo(f"타입: {content.content_type.value}")
         click.echo(f"플랫폼: {platform_list or '(전체)'}")
         click.echo(f"이미지: {image or '없음'}")
+        click.echo(f"동영상: {video or '없음'}")
         click.echo(f"포맷된 텍스트:\n{formatted}")
         return
 
     # 실제 게시 모드
-    targets = platform_list or list(PLATFORM_PUBLISHERS.keys())
+    targets = platform_list or available_platforms()
     results: list[dict] = []
+    auth_cache = AuthCache.from_config(config)
+    rate_limiter = RateLimiter.from_config(config)
 
     for platform in targets:
-        publisher_cls = PLATFORM_PUBLISHERS.get(platform)
+        publisher_cls = get_publisher_class(platform)
         if publisher_cls is None:
             click.echo(f"[{platform}] skipped — 미구현 플랫폼")
             results.append({"platform": platform, "status": "skipped"})
             continue
 
         try:
-            publisher = publisher_cls(config)
+            publisher = create_publisher(
+                publisher_cls, config, auth_cache=auth_cache, rate_limiter=rate_limiter
+            )
             publisher.authenticate()
             publisher.validate(content)
-            result = publisher.publish(content)
+            result = rate_limiter.call(platform, publisher.publish, content)
             click.echo(f"[{platform}] 게시 완료: {result}")
             results.append({"platform": platform, "status": "success", **result})
         except Exception as e:
@@ -197,3 +291,259 @@ def post(ctx: click.Context, text: str, image: str | None, platforms: str | None
     failed = sum(1 for r in results if r["status"] == "error")
     skipped = sum(1 for r in results if r["status"] == "skipped")
     click.echo(f"\n--- 결과: 성공 {success}, 실패 {failed}, 건너뜀 {skipped} ---")
+
+
+@cli.group()
+@click.pass_context
+def schedule(ctx: click.Context) -> None:
+    """예약 게시 명령"""
+    pass
+
+
+@schedule.command("run")
+@click.option("--once", is_flag=True, help="도래한 예약만 처리하고 종료 (cron용)")
+@click.option("--push/--no-push", default=None, help="게시 후 git push (기본: schedule.push)")
+@click.pass_context
+def schedule_run(ctx: click.Context, once: bool, push: bool | None) -> None:
+    """meta.md의 scheduled_at에 맞춰 폴더를 게시하는 데몬 실행.
+
+    예시:
+        indieshout schedule run
+        indieshout schedule run --once
+    """
+    import signal
+
+    from indieshout.workflows.publish_workflow import PublishWorkflow
+    from indieshout.workflows.scheduler import PublishScheduler
+
+    config = ctx.obj["config"]
+    options = {} if push is None else {"push": push}
+    with PublishWorkflow(config) as workflow:
+        scheduler = PublishScheduler.from_config(workflow, config, **options)
+
+        def handle_signal(signum, frame):
+            click.echo("\n🛑 종료 요청, 스케줄러를 멈춥니다...")
+            scheduler.stop()
+
+        signal.signal(signal.SIGTERM, handle_signal)
+        signal.signal(signal.SIGINT, handle_signal)
+
+        try:
+            if not once:
+                click.echo("⏰ 예약 게시 스케줄러 시작")
+            scheduler.run(once=once)
+        finally:
+            scheduler.store.close()
+
+
+@schedule.command("list")
+@click.pass_context
+def schedule_list(ctx: click.Context) -> None:
+    """예약 목록 출력."""
+    from datetime import datetime
+
+    from indieshout.workflows.scheduler import ScheduleStore
+
+    config = ctx.obj["config"]
+    store = ScheduleStore.from_config(config)
+    entries = store.list_all()
+    store.close()
+
+    if not entries:
+        click.echo("예약된 게시가 없습니다.")
+        return
+    for entry in entries:
+        at = datetime.fromtimestamp(entry["scheduled_at"]).isoformat(sep=" ", timespec="minutes")
+        line = f"{at}  {entry['status']:<8} {entry['folder']}"
+        if entry["last_error"]:
+            line += f"  ({entry['attempts']}회 실패: {entry['last_error']})"
+        click.echo(line)
+
+
+@schedule.command("add")
+@click.argument("folder_name")
+@click.option("--at", "at", required=True, help="예약 시각 (ISO 형식, 예: 2026-03-01T09:00)")
+@click.pass_context
+def schedule_add(ctx: click.Context, folder_name: str, at: str) -> None:
+    """폴더 예약 게시 등록 (meta.md의 scheduled_at보다 우선)."""
+    from datetime import datetime
+
+    from indieshout.workflows.scheduler import ScheduleStore
+
+    try:
+        scheduled_at = datetime.fromisoformat(at)
+    except ValueError:
+        raise click.BadParameter(f"ISO 형식이 아닙니다: {at}", param_hint="--at")
+
+    config = ctx.obj["config"]
+    store = ScheduleStore.from_config(config)
+    store.add(folder_name, scheduled_at.timestamp())
+    store.close()
+    click.echo(f"✅ 예약 등록: {folder_name} → {scheduled_at.isoformat(sep=' ')}")
+
+
+@schedule.command("remove")
+@click.argument("folder_name")
+@click.pass_context
+def schedule_remove(ctx: click.Context, folder_name: str) -> None:
+    """폴더 예약 삭제."""
+    from indieshout.workflows.scheduler import ScheduleStore
+
+    config = ctx.obj["config"]
+    store = ScheduleStore.from_config(config)
+    removed = store.remove(folder_name)
+    store.close()
+    click.echo(f"🗑️ 예약 삭제: {folder_name}" if removed else f"예약이 없습니다: {folder_name}")
+
+
+@cli.group()
+@click.pass_context
+def jobs(ctx: click.Context) -> None:
+    """게시 작업 큐 명령 (중단된 게시를 이어서 처리)"""
+    pass
+
+
+@jobs.command("enqueue")
+@click.argument("folder_names", nargs=-1)
+@click.option("--all", "all_folders", is_flag=True, help="미게시 폴더 전체 등록")
+@click.option("--skip-blog", is_flag=True, help="블로그 게시 건너뛰기")
+@click.option("--skip-sns", is_flag=True, help="SNS 게시 건너뛰기")
+@click.option("--force", is_flag=True, help="변경이 없어도 블로그 재게시, 이미 게시한 SNS에도 다시 게시")
+@click.pass_context
+def jobs_enqueue(
+    ctx: click.Context,
+    folder_names: tuple[str, ...],
+    all_folders: bool,
+    skip_blog: bool,
+    skip_sns: bool,
+    force: bool,
+) -> None:
+    """폴더 게시 작업 등록 (같은 입력은 한 번만 등록).
+
+    예시:
+        indieshout jobs enqueue 00001-first-post
+        indieshout jobs enqueue --all
+    """
+    from indieshout.workflows.job_queue import JobRunner
+    from indieshout.workflows.publish_workflow import PublishWorkflow
+
+    config = ctx.obj["config"]
+    with PublishWorkflow(config) as workflow:
+        runner = JobRunner.from_config(workflow, config)
+        try:
+            names = list(folder_names)
+            if all_folders:
+                names += [name for name in workflow.list_unpublished_folders() if name not in names]
+            if not names:
+                click.echo("등록할 폴더가 없습니다.")
+                return
+            for name in names:
+                job_id = runner.enqueue_folder(name, skip_blog=skip_blog, skip_sns=skip_sns, force=force)
+                click.echo(f"📥 작업 #{job_id}: {name}")
+        finally:
+            runner.queue.close()
+
+
+@jobs.command("run")
+@click.option("--workers", type=int, default=None, help="동시에 처리할 작업 수 (기본: jobs.workers)")
+@click.option("--push/--no-push", default=True, help="처리 후 git push (기본: 활성)")
+@click.pass_context
+def jobs_run(ctx: click.Context, workers: int | None, push: bool) -> None:
+    """큐가 빌 때까지 작업 처리 (실패/중단된 작업은 완료되지 않은 단계부터)."""
+    from indieshout.workflows.job_queue import JOB_FAILED, JobRunner
+    from indieshout.workflows.publish_workflow import PublishWorkflow
+
+    config = ctx.obj["config"]
+    options = {} if workers is None else {"workers": workers}
+    with PublishWorkflow(config) as workflow:
+        runner = JobRunner.from_config(workflow, config, **options)
+        try:
+            results = runner.run(push=push)
+        finally:
+            runner.queue.close()
+
+    failed = [job_id for job_id, status in results.items() if status == JOB_FAILED]
+    click.echo(f"\n--- 작업 결과: 완료 {len(results) - len(failed)}, 실패 {len(failed)} ---")
+    if failed:
+        click.echo(f"실패한 작업은 'indieshout jobs retry <ID>'로 다시 실행합니다: {failed}")
+        exit(1)
+
+
+@jobs.command("list")
+@click.option("--status", default=None, help="상태 필터 (queued, running, done, failed)")
+@click.pass_context
+def jobs_list(ctx: click.Context, status: str | None) -> None:
+    """작업과 단계 상태 출력."""
+    from indieshout.workflows.job_queue import JobQueue
+
+    queue = JobQueue.from_config(ctx.obj["config"])
+    try:
+        job_list = queue.list_jobs(status)
+        if not job_list:
+            click.echo("작업이 없습니다.")
+            return
+        for job in job_list:
+            steps = " ".join(f"{step['name']}={step['status']}" for step in queue.steps(job["id"]))
+            click.echo(f"#{job['id']} {job['status']:<8} {job['folder']}  {steps}")
+            if job["last_error"]:
+                click.echo(f"    ❌ {job['last_error']}")
+    finally:
+        queue.close()
+
+
+@jobs.command("retry")
+@click.argument("job_id", type=int)
+@click.pass_context
+def jobs_retry(ctx: click.Context, job_id: int) -> None:
+    """실패한 작업을 실패한 단계부터 다시 실행하도록 대기열에 등록."""
+    from indieshout.workflows.job_queue import JobQueue
+
+    queue = JobQueue.from_config(ctx.obj["config"])
+    try:
+        if queue.retry(job_id):
+            click.echo(f"🔁 작업 #{job_id} 재시도 등록 ('indieshout jobs run'으로 실행)")
+        else:
+            click.echo(f"실패 상태의 작업이 아닙니다: #{job_id}")
+    finally:
+        queue.close()
+
+
+@cli.group()
+@click.pass_context
+def cache(ctx: click.Context) -> None:
+    """파생 이미지 캐시 명령"""
+    pass
+
+
+@cache.command("prune")
+@click.argument("folder_names", nargs=-1)
+@click.option("--max-size", type=float, default=None, help="폴더별 캐시 크기 한도 (MB, 기본: images.cache_max_mb)")
+@click.option("--all", "remove_all", is_flag=True, help="캐시 전부 삭제")
+@click.pass_context
+def cache_prune(ctx: click.Context, folder_names: tuple[str, ...], max_size: float | None, remove_all: bool) -> None:
+    """폴더별 파생 이미지 캐시를 크기 한도까지 정리 (오래 사용하지 않은 항목부터).
+
+    예시:
+        indieshout cache prune
+        indieshout cache prune 00001-first-post --max-size 50
+        indieshout cache prune --all
+    """
+    from indieshout.blog.content_loader import ContentLoader
+    from indieshout.utils.derivative_cache import DerivativeCache
+
+    config = ctx.obj["config"]
+    if remove_all:
+        max_bytes = 0
+    else:
+        max_mb = max_size if max_size is not None else (config.get("images") or {}).get("cache_max_mb")
+        max_bytes = int(max_mb * 1024 * 1024) if max_mb is not None else None
+
+    loader = ContentLoader()
+    names = list(folder_names) or loader.list_folders()
+    freed_total = 0
+    for name in names:
+        freed = DerivativeCache.for_folder(loader.blog_content_dir / name, max_bytes).prune()
+        if freed:
+            click.echo(f"🧹 {name}: {freed / 1024 / 1024:.1f}MB 삭제")
+        freed_total += freed
+    click.echo(f"✅ 캐시 정리 완료: {freed_total / 1024 / 1024:.1f}MB 삭제")
@@ -17,8 +17,10 @@ class Content(BaseModel):
     date: datetime | None = None
     categories: list[str] | None = None
     image_paths: list[str] | None = None
+    image_urls: list[str] | None = None
     video_path: str | None = None
     tags: list[str] | None = None
     platforms: list[str] = []
     sns_text: str | None = None
     scheduled_at: datetime | None = None
+    source_dir: str | None = None
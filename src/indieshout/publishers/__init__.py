@@ -1,5 +1,25 @@
-from indieshout.publishers.base import BasePublisher
-from indieshout.publishers.threads import ThreadsPublisher
-from indieshout.publishers.twitter import TwitterPublisher
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from indieshout.publishers.base import BasePublisher
+    from indieshout.publishers.threads import ThreadsPublisher
+    from indieshout.publishers.twitter import TwitterPublisher
+
+# 하위 모듈은 처음 접근할 때 import (tweepy/httpx 로딩을 필요할 때까지 미룸)
+_LAZY_ATTRS = {
+    "BasePublisher": "indieshout.publishers.base",
+    "ThreadsPublisher": "indieshout.publishers.threads",
+    "TwitterPublisher": "indieshout.publishers.twitter",
+}
 
 __all__ = ["BasePublisher", "ThreadsPublisher", "TwitterPublisher"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,11 +1,38 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from indieshout.models.content import Content
+from indieshout.utils.auth_cache import AuthCache
+from indieshout.utils.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from indieshout.utils.sns_image_adapter import ImageSpec
 
 
 class BasePublisher(ABC):
-    def __init__(self, config: dict) -> None:
+    """SNS 퍼블리셔 기본 클래스 (플러그인 퍼블리셔의 계약).
+
+    `indieshout.publishers` entry point로 등록한 퍼블리셔는 registry.create_publisher()로
+    `cls(config, auth_cache=..., rate_limiter=...)` 형태로 생성된다. 공유 객체는 생성자가
+    해당 키워드를 받을 때만 전달하므로 config만 받는 퍼블리셔도 동작하지만, 이 클래스를
+    상속하면 워크플로우 전체가 인증 캐시와 게시 한도를 공유한다.
+    """
+
+    # 첨부 이미지 규격 (워크플로우가 포스트 이미지를 이 규격으로 변환해 첨부, None이면 첨부 안 함)
+    IMAGE_SPEC: "ImageSpec | None" = None
+
+    def __init__(
+        self,
+        config: dict,
+        auth_cache: AuthCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         self.config = config
+        # 여러 퍼블리셔가 공유할 수 있도록 주입 가능 (없으면 설정으로 생성)
+        self.auth_cache = auth_cache if auth_cache is not None else AuthCache.from_config(config)
+        self.rate_limiter = (
+            rate_limiter if rate_limiter is not None else RateLimiter.from_config(config)
+        )
 
     @abstractmethod
     def authenticate(self) -> bool:
@@ -26,3 +53,14 @@ class BasePublisher(ABC):
     def publish(self, content: Content) -> dict:
         """게시 실행 후 결과 반환."""
         ...
+
+    def upload_video(self, path: str) -> str:
+        """동영상을 청크 단위로 업로드하고 플랫폼 미디어 ID 반환 (기본: 미지원).
+
+        구현은 media_stream.upload_in_chunks()로 파일을 청크씩 읽어 보내므로
+        파일 크기와 관계없이 메모리 사용량이 일정하다.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support video upload")
+
+    def close(self) -> None:
+        """연결 등 퍼블리셔 리소스 정리 (기본: 없음)."""
@@ -0,0 +1,166 @@
+"""플랫폼 이름 → 퍼블리셔 클래스 레지스트리.
+
+퍼블리셔는 `indieshout.publishers` entry point 그룹으로 등록한다.
+
+    [project.entry-points."indieshout.publishers"]
+    mastodon = "indieshout_mastodon:MastodonPublisher"
+
+퍼블리셔 모듈은 tweepy/httpx 같은 무거운 의존성을 가져오므로 클래스 경로만
+등록해 두고, 실제로 해당 플랫폼에 게시할 때 import한다. 내장 퍼블리셔(x, threads)도
+pyproject.toml의 entry point로 찾으며, 다른 패키지가 같은 이름으로 등록하면 그쪽이
+내장 퍼블리셔를 대신한다. 패키지 메타데이터가 없을 때(설치하지 않은 소스 트리에서
+실행 등)만 BUILTIN_PUBLISHERS를 사용한다. CLI와 PublishWorkflow가 같은 레지스트리를
+사용한다.
+"""
+
+import inspect
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from importlib import import_module
+from importlib.metadata import EntryPoint, entry_points
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from indieshout.publishers.base import BasePublisher
+
+ENTRY_POINT_GROUP = "indieshout.publishers"
+DISTRIBUTION_NAME = "indieshout"
+
+# entry point가 설치되지 않았을 때 사용하는 내장 퍼블리셔 (pyproject.toml과 같은 내용)
+BUILTIN_PUBLISHERS = {
+    "x": "indieshout.publishers.twitter:TwitterPublisher",
+    "threads": "indieshout.publishers.threads:ThreadsPublisher",
+}
+
+# 직접 등록한 퍼블리셔: 플랫폼 이름 → "모듈:클래스" 또는 클래스 (entry point보다 우선)
+PLATFORM_PUBLISHERS: "dict[str, str | type[BasePublisher]]" = {}
+
+# 플랫폼 이름과 설정 섹션 이름이 다른 경우 (나머지는 플랫폼 이름 = 섹션 이름)
+CONFIG_SECTIONS = {"x": "twitter"}
+
+# entry point로 찾은 퍼블리셔 (처음 필요할 때 한 번만 조회)
+_discovered: "dict[str, str | EntryPoint] | None" = None
+_discover_lock = threading.Lock()
+
+
+def _discover() -> "dict[str, str | EntryPoint]":
+    """entry point로 설치된 퍼블리셔 조회 (한 번만, 모듈은 import하지 않음).
+
+    내장 퍼블리셔 → indieshout 패키지의 entry point → 다른 패키지(플러그인)의
+    entry point 순으로 덮어쓰므로 플러그인이 내장 퍼블리셔를 대신할 수 있다.
+    """
+    global _discovered
+    with _discover_lock:
+        if _discovered is None:
+            found: "dict[str, str | EntryPoint]" = dict(BUILTIN_PUBLISHERS)
+            discovered = list(entry_points(group=ENTRY_POINT_GROUP))
+            for entry_point in sorted(discovered, key=lambda ep: not _is_builtin(ep)):
+                found[entry_point.name] = entry_point
+            _discovered = found
+        return _discovered
+
+
+def _is_builtin(entry_point: EntryPoint) -> bool:
+    """indieshout 패키지 자체가 등록한 entry point인지 여부."""
+    return entry_point.dist is not None and entry_point.dist.name == DISTRIBUTION_NAME
+
+
+def register_publisher(platform: str, target: "str | type[BasePublisher]") -> None:
+    """퍼블리셔 직접 등록 ("모듈:클래스" 또는 클래스, 같은 이름이 있으면 교체)."""
+    PLATFORM_PUBLISHERS[platform] = target
+
+
+def available_platforms() -> list[str]:
+    """등록된 플랫폼 이름 (내장 → entry point → 직접 등록 순)."""
+    return list({**_discover(), **PLATFORM_PUBLISHERS})
+
+
+def config_section(platform: str) -> str:
+    """플랫폼 설정 섹션 이름 (예: x → twitter)."""
+    return CONFIG_SECTIONS.get(platform, platform)
+
+
+def configured_platforms(config: dict) -> list[str]:
+    """설정 섹션이 있는 플랫폼 이름."""
+    return [platform for platform in available_platforms() if config.get(config_section(platform))]
+
+
+def get_publisher_class(platform: str) -> "type[BasePublisher] | None":
+    """플랫폼 퍼블리셔 클래스 반환 (처음 요청 시 모듈 import, 미등록 플랫폼이면 None)."""
+    target = PLATFORM_PUBLISHERS.get(platform) or _discover().get(platform)
+    if target is None:
+        return None
+
+    if isinstance(target, EntryPoint):
+        return target.load()
+    if isinstance(target, str):
+        module_name, _, class_name = target.partition(":")
+        return getattr(import_module(module_name), class_name)
+    return target
+
+
+def create_publisher(
+    publisher_cls: "type[BasePublisher]", config: dict, **services: object
+) -> "BasePublisher":
+    """퍼블리셔 생성 (auth_cache/rate_limiter 등 공유 객체는 생성자가 받을 때만 전달).
+
+    BasePublisher를 상속한 퍼블리셔는 모두 받지만, config만 받는 플러그인도 생성할 수 있다.
+
+    Args:
+        publisher_cls: 퍼블리셔 클래스
+        config: 전체 설정
+        **services: 공유 객체 (예: auth_cache, rate_limiter)
+
+    Returns:
+        퍼블리셔 인스턴스
+    """
+    try:
+        parameters = inspect.signature(publisher_cls).parameters.values()
+    except (TypeError, ValueError):
+        return publisher_cls(config, **services)
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+        return publisher_cls(config, **services)
+    accepted = {p.name for p in parameters}
+    return publisher_cls(config, **{k: v for k, v in services.items() if k in accepted})
+
+
+class LazyPublishers(Mapping):
+    """플랫폼 이름 → 퍼블리셔 인스턴스 매핑 (처음 접근할 때 생성).
+
+    포함 여부/순회는 대상 플랫폼 목록만 보므로 퍼블리셔 모듈을 import하지 않는다.
+    여러 스레드에서 동시에 사용할 수 있다.
+    """
+
+    def __init__(self, platforms: list[str], factory: "Callable[[str], BasePublisher]"):
+        """LazyPublishers 초기화.
+
+        Args:
+            platforms: 사용할 플랫폼 이름
+            factory: 플랫폼 이름 → 퍼블리셔 인스턴스 생성 함수
+        """
+        self._platforms = list(platforms)
+        self._factory = factory
+        self._loaded: "dict[str, BasePublisher]" = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, platform: str) -> "BasePublisher":
+        if platform not in self._platforms:
+            raise KeyError(platform)
+        with self._lock:
+            if platform not in self._loaded:
+                self._loaded[platform] = self._factory(platform)
+            return self._loaded[platform]
+
+    def __contains__(self, platform: object) -> bool:
+        return platform in self._platforms
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._platforms)
+
+    def __len__(self) -> int:
+        return len(self._platforms)
+
+    def loaded(self) -> "list[BasePublisher]":
+        """이미 생성된 퍼블리셔."""
+        with self._lock:
+            return list(self._loaded.values())
@@ -1,23 +1,173 @@
+import asyncio
+import importlib.util
+import json
 import os
+import threading
+import time
+from datetime import datetime
 
 import httpx
 
 from indieshout.formatter.content_formatter import ContentFormatter
 from indieshout.models.content import Content
 from indieshout.publishers.base import BasePublisher
+from indieshout.utils.auth_cache import AuthCache, credential_fingerprint
+from indieshout.utils.rate_limiter import RateLimiter, RateLimitError, RetryableError
+from indieshout.utils.sns_image_adapter import ImageSpec
 
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 MAX_IMAGE_SIZE = 8 * 1024 * 1024  # 8MB
 MAX_IMAGES = 10
 THREADS_API_BASE = "https://graph.threads.net/v1.0"
+DEFAULT_TIMEOUT = 30.0  # 초
+DEFAULT_CONNECT_TIMEOUT = 10.0  # 초
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 60.0  # 초
+DEFAULT_POLL_INTERVAL = 0.5  # 컨테이너 상태 첫 조회 간격 (초)
+DEFAULT_POLL_MAX_INTERVAL = 5.0  # 상태 조회 최대 간격 (초)
+DEFAULT_CONTAINER_TIMEOUT = 120.0  # 컨테이너 처리 대기 한도 (초)
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+RATE_LIMIT_ERROR_CODES = {4, 17, 32, 613}  # Graph API 호출 한도 초과 에러 코드
+USAGE_HEADERS = ("x-app-usage", "x-business-use-case-usage")
+USAGE_KEYS = ("call_count", "total_time", "total_cputime")  # 사용량 (%)
+USAGE_WINDOW = 3600.0  # Graph API 사용량 집계 기간 (초)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 지원 패키지(h2) 설치 여부."""
+    return importlib.util.find_spec("h2") is not None
 
 
 class ThreadsPublisher(BasePublisher):
-    def __init__(self, config: dict) -> None:
-        super().__init__(config)
+    # 피드에서 잘리지 않는 4:5 ~ 1.91:1, 이미지는 공개 URL로만 첨부 가능
+    IMAGE_SPEC = ImageSpec(
+        max_images=MAX_IMAGES,
+        max_bytes=MAX_IMAGE_SIZE,
+        max_width=1440,
+        min_aspect=4 / 5,
+        max_aspect=1.91,
+        public_url=True,
+    )
+
+    def __init__(
+        self,
+        config: dict,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+        auth_cache: AuthCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        """ThreadsPublisher 초기화.
+
+        Args:
+            config: 설정 dict
+            transport: httpx 전송 계층 (테스트에서 httpx.MockTransport 주입용)
+            async_transport: 이미지 게시용 비동기 전송 계층 (테스트용)
+            auth_cache: 인증 결과 캐시 (없으면 auth 설정으로 생성)
+            rate_limiter: 게시 한도 관리자 (없으면 rate_limits 설정으로 생성)
+        """
+        super().__init__(config, auth_cache, rate_limiter)
         self.access_token: str | None = None
         self.user_id: str | None = None
         self._formatter = ContentFormatter()
+        self._transport = transport
+        self._async_transport = async_transport
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        # 이미지 게시용 비동기 클라이언트는 전용 이벤트 루프(스레드)에 묶여 재사용
+        self._async_client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """게시자 수명 동안 재사용하는 HTTP 클라이언트.
+
+        keep-alive 연결을 유지하므로 인증/컨테이너 생성/게시 요청과
+        일괄 게시의 여러 포스트가 같은 TLS 연결을 재사용한다.
+        threads.http2가 true이고 h2 패키지가 설치되어 있으면 HTTP/2를 사용한다.
+        """
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    **self._client_options(self._transport is not None),
+                    transport=self._transport,
+                )
+            return self._client
+
+    def _client_options(self, custom_transport: bool) -> dict:
+        """동기/비동기 클라이언트 공통 옵션 (threads.* 설정)."""
+        threads_config = self.config.get("threads", {})
+        http2 = bool(threads_config.get("http2", False))
+        if http2 and not custom_transport and not _http2_available():
+            print("⚠️ h2 패키지가 없어 HTTP/1.1로 연결합니다 (pip install 'httpx[http2]')")
+            http2 = False
+
+        max_connections = int(threads_config.get("max_connections", DEFAULT_MAX_CONNECTIONS))
+        return {
+            "base_url": THREADS_API_BASE,
+            "timeout": httpx.Timeout(
+                float(threads_config.get("timeout", DEFAULT_TIMEOUT)),
+                connect=float(threads_config.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)),
+            ),
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=float(
+                    threads_config.get("keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY)
+                ),
+            ),
+            "http2": http2,
+        }
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """이미지 게시용 비동기 HTTP 클라이언트 (client와 같은 옵션, 게시자 수명 동안 재사용).
+
+        httpx.AsyncClient의 연결은 이벤트 루프에 묶이므로 _run_async()의 전용
+        루프 안에서만 사용한다.
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                **self._client_options(self._async_transport is not None),
+                transport=self._async_transport,
+            )
+        return self._async_client
+
+    def _run_async(self, coro):
+        """게시자 전용 이벤트 루프에서 코루틴을 실행하고 결과를 기다림.
+
+        루프는 처음 호출할 때 백그라운드 스레드에서 시작해 close()까지 유지하므로
+        async_client의 keep-alive 연결이 게시 사이에 유지되고, 호출자 스레드에
+        이미 실행 중인 이벤트 루프가 있어도 사용할 수 있다.
+        """
+        with self._client_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="threads-async", daemon=True
+                )
+                self._loop_thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self) -> None:
+        """HTTP 클라이언트 연결과 이미지 게시용 이벤트 루프 종료."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+
+        if loop is None:
+            return
+        if self._async_client is not None:
+            asyncio.run_coroutine_threadsafe(self._async_client.aclose(), loop).result()
+            self._async_client = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
 
     def authenticate(self) -> bool:
         threads_config = self.config.get("threads", {})
@@ -27,17 +177,97 @@ class ThreadsPublisher(BasePublisher):
         if not self.access_token or not self.user_id:
             raise ValueError("Threads access_token and user_id are required")
 
+        # 캐시된 검증 결과가 있으면 /me 조회 생략
+        fingerprint = credential_fingerprint(self.access_token, self.user_id)
+        if self.auth_cache.get("threads", fingerprint) is not None:
+            return True
+
         # 토큰 유효성 검증 (간단히 user info 조회)
-        with httpx.Client() as client:
-            response = client.get(
-                f"{THREADS_API_BASE}/me",
-                params={"access_token": self.access_token},
-            )
-            if response.status_code != 200:
-                raise RuntimeError(f"Authentication failed: {response.text}")
+        response = self.client.get("/me", params={"access_token": self.access_token})
+        if response.status_code != 200:
+            raise RuntimeError(f"Authentication failed: {response.text}")
 
+        me = response.json()
+        self.auth_cache.set(
+            "threads",
+            fingerprint,
+            {"id": me.get("id"), "username": me.get("username")},
+            token_expires_at=self._token_expires_at(),
+        )
         return True
 
+    def _token_expires_at(self) -> float | None:
+        """threads.token_expires_at 설정 (ISO 날짜 또는 epoch 초)을 epoch 초로 변환."""
+        value = self.config.get("threads", {}).get("token_expires_at")
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return value.timestamp()
+        if isinstance(value, str):
+            return datetime.fromisoformat(value).timestamp()
+        return float(value)
+
+    def _check_response(
+        self, response: httpx.Response, message: str, retryable: bool = False
+    ) -> None:
+        """응답 확인 후 실패 유형에 맞는 예외 발생.
+
+        - 사용량 헤더로 게시 한도 버킷 보정
+        - 401: 인증 캐시 무효화 후 RuntimeError
+        - 429 또는 호출 한도 에러 코드: RateLimitError (요청이 거부되었으므로 재시도 가능)
+        - 5xx: retryable이면 RetryableError (게시 전 단계만)
+
+        Args:
+            response: API 응답
+            message: 에러 메시지 접두어
+            retryable: 서버 에러를 재시도 가능한 에러로 볼지 여부
+        """
+        self._update_rate_limit(response)
+        if response.status_code == 200:
+            return
+
+        if response.status_code == 401:
+            self.auth_cache.invalidate("threads")
+
+        if response.status_code == 429 or self._error_code(response) in RATE_LIMIT_ERROR_CODES:
+            retry_after = response.headers.get("retry-after")
+            raise RateLimitError(
+                f"{message}: {response.text}",
+                retry_after=float(retry_after) if retry_after else None,
+            )
+        if retryable and response.status_code >= 500:
+            raise RetryableError(f"{message}: {response.text}")
+        raise RuntimeError(f"{message}: {response.text}")
+
+    @staticmethod
+    def _error_code(response: httpx.Response) -> int | None:
+        try:
+            return response.json().get("error", {}).get("code")
+        except (ValueError, AttributeError):
+            return None
+
+    def _update_rate_limit(self, response: httpx.Response) -> None:
+        """Graph API 사용량 헤더(%)가 100에 도달하면 집계 기간 동안 게시 중단."""
+        for header in USAGE_HEADERS:
+            value = response.headers.get(header)
+            if not value:
+                continue
+            try:
+                usage = json.loads(value)
+            except ValueError:
+                continue
+            # x-business-use-case-usage는 {id: [{...}]} 형태
+            entries = [usage] if header == "x-app-usage" else [
+                entry for entries in usage.values() for entry in entries
+            ]
+            for entry in entries:
+                if max(float(entry.get(key, 0)) for key in USAGE_KEYS) >= 100:
+                    reset_after = float(entry.get("estimated_time_to_regain_access", 0)) * 60
+                    self.rate_limiter.update(
+                        "threads", remaining=0, reset_after=reset_after or USAGE_WINDOW
+                    )
+                    return
+
     def validate(self, content: Content) -> bool:
         if not content.text or not content.text.strip():
             raise ValueError("Text content is required")
@@ -45,6 +275,9 @@ class ThreadsPublisher(BasePublisher):
         if not self.access_token:
             raise RuntimeError("Not authenticated. Call authenticate() first")
 
+        if content.image_urls and len(content.image_urls) > MAX_IMAGES:
+            raise ValueError(f"Maximum {MAX_IMAGES} images allowed, got {len(content.image_urls)}")
+
         if content.image_paths:
             if len(content.image_paths) > MAX_IMAGES:
                 raise ValueError(
@@ -70,51 +303,144 @@ class ThreadsPublisher(BasePublisher):
         return {"text": text}
 
     def publish(self, content: Content) -> dict:
+        """Threads에 게시.
+
+        이미지가 있으면 content.image_urls(공개 URL, 보통 블로그 단계의 S3 URL)를
+        사용해 이미지 1장은 IMAGE, 2장 이상은 CAROUSEL 게시물로 올린다.
+        """
         formatted = self.format_content(content)
 
-        with httpx.Client(timeout=30.0) as client:
-            # 텍스트만 게시
-            if not content.image_paths:
-                # 1. Create container
-                create_response = client.post(
-                    f"{THREADS_API_BASE}/{self.user_id}/threads",
-                    data={
-                        "media_type": "TEXT",
-                        "text": formatted["text"],
-                        "access_token": self.access_token,
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
+        if content.image_urls:
+            return self._run_async(self._publish_images(formatted["text"], content.image_urls))
 
-                if create_response.status_code != 200:
-                    raise RuntimeError(
-                        f"Failed to create thread container: {create_response.text}"
-                    )
+        if content.image_paths:
+            raise ValueError(
+                "Threads image posting requires public image URLs (content.image_urls)"
+            )
 
-                container_id = create_response.json().get("id")
+        # 텍스트만 게시
+        # 1. Create container
+        create_response = self.client.post(
+            f"/{self.user_id}/threads",
+            data={
+                "media_type": "TEXT",
+                "text": formatted["text"],
+                "access_token": self.access_token,
+            },
+            headers=FORM_HEADERS,
+        )
 
-                # 2. Publish container
-                publish_response = client.post(
-                    f"{THREADS_API_BASE}/{self.user_id}/threads_publish",
-                    data={
-                        "creation_id": container_id,
-                        "access_token": self.access_token,
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
+        self._check_response(create_response, "Failed to create thread container", retryable=True)
 
-                if publish_response.status_code != 200:
-                    raise RuntimeError(
-                        f"Failed to publish thread: {publish_response.text}"
+        container_id = create_response.json().get("id")
+
+        # 2. Publish container
+        publish_response = self.client.post(
+            f"/{self.user_id}/threads_publish",
+            data={
+                "creation_id": container_id,
+                "access_token": self.access_token,
+            },
+            headers=FORM_HEADERS,
+        )
+
+        self._check_response(publish_response, "Failed to publish thread")
+
+        thread_id = publish_response.json().get("id")
+
+        return {
+            "thread_id": thread_id,
+            "url": f"https://threads.net/@{self.user_id}/post/{thread_id}",
+        }
+
+    async def _publish_images(self, text: str, image_urls: list[str]) -> dict:
+        """이미지/캐러셀 게시 (비동기).
+
+        캐러셀 항목 컨테이너를 동시에 생성하고 상태 조회도 동시에 기다리므로
+        전체 소요 시간은 항목 수와 관계없이 컨테이너 하나의 처리 시간에 가깝다.
+        """
+        client = self.async_client
+        if len(image_urls) == 1:
+            container_id = await self._create_container(
+                client,
+                {"media_type": "IMAGE", "image_url": image_urls[0], "text": text},
+            )
+        else:
+            # 1. 항목 컨테이너 동시 생성 후 처리 완료 대기
+            item_ids = await asyncio.gather(
+                *(
+                    self._create_container(
+                        client,
+                        {"media_type": "IMAGE", "image_url": url, "is_carousel_item": "true"},
                     )
+                    for url in image_urls
+                )
+            )
+            await asyncio.gather(
+                *(self._wait_for_container(client, item_id) for item_id in item_ids)
+            )
+
+            # 2. 캐러셀 컨테이너 생성
+            container_id = await self._create_container(
+                client,
+                {"media_type": "CAROUSEL", "children": ",".join(item_ids), "text": text},
+            )
+
+        await self._wait_for_container(client, container_id)
+
+        # 3. 게시
+        publish_response = await client.post(
+            f"/{self.user_id}/threads_publish",
+            data={"creation_id": container_id, "access_token": self.access_token},
+            headers=FORM_HEADERS,
+        )
+        self._check_response(publish_response, "Failed to publish thread")
 
-                thread_id = publish_response.json().get("id")
+        thread_id = publish_response.json().get("id")
+        return {
+            "thread_id": thread_id,
+            "url": f"https://threads.net/@{self.user_id}/post/{thread_id}",
+        }
 
-                return {
-                    "thread_id": thread_id,
-                    "url": f"https://threads.net/@{self.user_id}/post/{thread_id}",
-                }
+    async def _create_container(self, client: httpx.AsyncClient, data: dict) -> str:
+        """미디어 컨테이너 생성 후 ID 반환."""
+        response = await client.post(
+            f"/{self.user_id}/threads",
+            data={**data, "access_token": self.access_token},
+            headers=FORM_HEADERS,
+        )
+        self._check_response(response, "Failed to create thread container", retryable=True)
+        return response.json()["id"]
+
+    async def _wait_for_container(self, client: httpx.AsyncClient, container_id: str) -> None:
+        """컨테이너 상태가 FINISHED가 될 때까지 지수 백오프로 조회.
+
+        Raises:
+            RuntimeError: 컨테이너 처리 실패(ERROR/EXPIRED) 또는 대기 시간 초과
+        """
+        threads_config = self.config.get("threads", {})
+        interval = float(threads_config.get("poll_interval", DEFAULT_POLL_INTERVAL))
+        max_interval = float(threads_config.get("poll_max_interval", DEFAULT_POLL_MAX_INTERVAL))
+        timeout = float(threads_config.get("container_timeout", DEFAULT_CONTAINER_TIMEOUT))
+        deadline = time.monotonic() + timeout
+
+        while True:
+            response = await client.get(
+                f"/{container_id}",
+                params={"fields": "status,error_message", "access_token": self.access_token},
+            )
+            self._check_response(response, "Failed to get container status", retryable=True)
+
+            data = response.json()
+            status = data.get("status")
+            if status in ("FINISHED", "PUBLISHED"):
+                return
+            if status in ("ERROR", "EXPIRED"):
+                raise RuntimeError(
+                    f"Container {container_id} {status}: {data.get('error_message', '')}"
+                )
 
-            # 이미지 포함 게시 (향후 구현)
-            else:
-                raise NotImplementedError("Image posting not yet implemented")
+            if time.monotonic() + interval > deadline:
+                raise RuntimeError(f"Container {container_id} not ready after {timeout:g}s")
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, max_interval)
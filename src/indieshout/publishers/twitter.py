@@ -1,19 +1,48 @@
+import math
+import mimetypes
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import tweepy
 
 from indieshout.formatter.content_formatter import ContentFormatter
 from indieshout.models.content import Content
 from indieshout.publishers.base import BasePublisher
+from indieshout.utils.auth_cache import AuthCache, credential_fingerprint
+from indieshout.utils.media_stream import MB, upload_in_chunks
+from indieshout.utils.rate_limiter import RateLimiter, RateLimitError, RetryableError
+from indieshout.utils.sns_image_adapter import ImageSpec
 
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB
+MAX_GIF_SIZE = 15 * 1024 * 1024  # 15MB (chunked 업로드)
 MAX_IMAGES = 4
+DEFAULT_UPLOAD_WORKERS = 4
+DEFAULT_CHUNKED_THRESHOLD = 2 * 1024 * 1024  # 이 크기 이상은 chunked 업로드
+MAX_VIDEO_SIZE = 512 * 1024 * 1024  # 512MB
+VIDEO_CHUNK_SIZE = 4 * MB  # APPEND 요청당 크기 (최대 5MB, 세그먼트 최대 1000개)
+MAX_VIDEO_SEGMENTS = 1000
+DEFAULT_VIDEO_PROCESSING_TIMEOUT = 300.0  # 업로드 후 X의 동영상 처리 대기 한도 (초)
 
 
 class TwitterPublisher(BasePublisher):
-    def __init__(self, config: dict) -> None:
-        super().__init__(config)
+    # 타임라인 미리보기가 잘리지 않는 3:4 ~ 16:9
+    IMAGE_SPEC = ImageSpec(
+        max_images=MAX_IMAGES,
+        max_bytes=MAX_IMAGE_SIZE,
+        max_width=2048,
+        min_aspect=3 / 4,
+        max_aspect=16 / 9,
+    )
+
+    def __init__(
+        self,
+        config: dict,
+        auth_cache: AuthCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        super().__init__(config, auth_cache, rate_limiter)
         self.client: tweepy.Client | None = None
         self.api: tweepy.API | None = None
         self._formatter = ContentFormatter()
@@ -37,11 +66,19 @@ class TwitterPublisher(BasePublisher):
         )
         self.api = tweepy.API(auth)
 
+        # 캐시된 검증 결과가 있으면 get_me() 생략
+        fingerprint = credential_fingerprint(api_key, access_token)
+        if self.auth_cache.get("x", fingerprint) is not None:
+            return True
+
         # 인증 검증
         me = self.client.get_me()
         if me.data is None:
             raise tweepy.TweepyException("Authentication failed: could not get user info")
 
+        self.auth_cache.set(
+            "x", fingerprint, {"id": str(me.data["id"]), "username": me.data.get("username")}
+        )
         return True
 
     def validate(self, content: Content) -> bool:
@@ -64,9 +101,18 @@ class TwitterPublisher(BasePublisher):
                     raise ValueError(f"Unsupported image format: {ext}")
 
                 size = os.path.getsize(path)
-                if size > MAX_IMAGE_SIZE:
+                if size > (MAX_GIF_SIZE if ext == ".gif" else MAX_IMAGE_SIZE):
                     raise ValueError(f"Image too large ({size} bytes): {path}")
 
+        if content.video_path:
+            if content.image_paths:
+                raise ValueError("X posts cannot combine a video with images")
+            if not os.path.exists(content.video_path):
+                raise FileNotFoundError(f"Video not found: {content.video_path}")
+            size = os.path.getsize(content.video_path)
+            if size > MAX_VIDEO_SIZE:
+                raise ValueError(f"Video too large ({size} bytes): {content.video_path}")
+
         return True
 
     def format_content(self, content: Content) -> dict:
@@ -75,21 +121,119 @@ class TwitterPublisher(BasePublisher):
 
     def publish(self, content: Content) -> dict:
         formatted = self.format_content(content)
-        media_ids = []
 
-        if content.image_paths:
-            for path in content.image_paths:
-                media = self.api.media_upload(filename=path)
-                media_ids.append(media.media_id)
-
-        kwargs: dict = {"text": formatted["text"]}
-        if media_ids:
-            kwargs["media_ids"] = media_ids
+        try:
+            try:
+                if content.video_path:
+                    media_ids = [self.upload_video(content.video_path)]
+                else:
+                    media_ids = self._upload_media_many(content.image_paths or [])
+            except tweepy.TwitterServerError as e:
+                # 트윗 생성 전이므로 다시 시도해도 중복 게시가 생기지 않음
+                raise RetryableError(f"Media upload failed: {e}") from e
+
+            kwargs: dict = {"text": formatted["text"]}
+            if media_ids:
+                kwargs["media_ids"] = media_ids
+
+            response = self.client.create_tweet(**kwargs)
+        except tweepy.Unauthorized:
+            # 토큰이 거부되면 다음 실행에서 다시 검증
+            self.auth_cache.invalidate("x")
+            raise
+        except tweepy.TooManyRequests as e:
+            raise self._rate_limit_error(e) from e
 
-        response = self.client.create_tweet(**kwargs)
         tweet_id = response.data["id"]
 
         return {
             "tweet_id": tweet_id,
             "url": f"https://x.com/i/status/{tweet_id}",
         }
+
+    def _upload_media_many(self, paths: list[str]) -> list:
+        """이미지들을 동시에 업로드하고 입력 순서대로 media_id 반환."""
+        if len(paths) <= 1:
+            return [self._upload_media(path) for path in paths]
+
+        twitter_config = self.config.get("twitter", {})
+        workers = int(twitter_config.get("upload_workers", DEFAULT_UPLOAD_WORKERS))
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(paths))), thread_name_prefix="x-media"
+        ) as executor:
+            # map은 완료 순서와 관계없이 입력 순서를 유지
+            return list(executor.map(self._upload_media, paths))
+
+    def _upload_media(self, path: str):
+        """이미지 하나 업로드 후 media_id 반환.
+
+        큰 파일과 GIF는 chunked 업로드(INIT/APPEND/FINALIZE)를 사용한다.
+        """
+        twitter_config = self.config.get("twitter", {})
+        threshold = int(twitter_config.get("chunked_threshold", DEFAULT_CHUNKED_THRESHOLD))
+        is_gif = os.path.splitext(path)[1].lower() == ".gif"
+
+        if is_gif or os.path.getsize(path) >= threshold:
+            media = self.api.media_upload(
+                filename=path,
+                chunked=True,
+                media_category="tweet_gif" if is_gif else "tweet_image",
+            )
+        else:
+            media = self.api.media_upload(filename=path)
+
+        return media.media_id
+
+    def upload_video(self, path: str) -> str:
+        """동영상을 chunked 업로드(INIT/APPEND/FINALIZE)하고 처리가 끝나면 media_id 반환.
+
+        APPEND는 파일을 VIDEO_CHUNK_SIZE씩 읽어 보내므로 메모리 사용량이 일정하다.
+
+        Raises:
+            RuntimeError: X의 동영상 처리가 실패하거나 제한 시간 안에 끝나지 않을 때
+        """
+        size = os.path.getsize(path)
+        media_type = mimetypes.guess_type(path)[0] or "video/mp4"
+        chunk_size = max(VIDEO_CHUNK_SIZE, math.ceil(size / MAX_VIDEO_SEGMENTS))
+
+        media = self.api.chunked_upload_init(size, media_type, media_category="tweet_video")
+        media_id = media.media_id
+        upload_in_chunks(
+            path,
+            lambda segment, data: self.api.chunked_upload_append(media_id, data, segment),
+            chunk_size,
+        )
+        media = self.api.chunked_upload_finalize(media_id)
+
+        # 업로드 후 X가 동영상을 처리하는 동안 check_after_secs 간격으로 상태 확인
+        twitter_config = self.config.get("twitter", {})
+        deadline = time.monotonic() + float(
+            twitter_config.get("video_processing_timeout", DEFAULT_VIDEO_PROCESSING_TIMEOUT)
+        )
+        info = getattr(media, "processing_info", None)
+        while info and info.get("state") in ("pending", "in_progress"):
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Video processing timed out: {path}")
+            time.sleep(info.get("check_after_secs", 1))
+            info = getattr(self.api.get_media_upload_status(media_id), "processing_info", None)
+        if info and info.get("state") == "failed":
+            raise RuntimeError(f"Video processing failed: {info.get('error', {}).get('message', path)}")
+
+        return str(media_id)
+
+    def _rate_limit_error(self, error: tweepy.TooManyRequests) -> RateLimitError:
+        """429 응답 헤더로 버킷을 보정하고 RateLimitError로 변환.
+
+        게시 한도(x-user-limit-24hour-*)가 있으면 우선 사용하고, 없으면
+        엔드포인트 한도(x-rate-limit-*)를 사용한다.
+        """
+        headers = getattr(error.response, "headers", None) or {}
+        reset_at = None
+        for prefix in ("x-user-limit-24hour", "x-rate-limit"):
+            if headers.get(f"{prefix}-remaining") == "0" and headers.get(f"{prefix}-reset"):
+                reset_at = float(headers[f"{prefix}-reset"])
+                break
+
+        retry_after = max(0.0, reset_at - time.time()) if reset_at is not None else None
+        self.rate_limiter.update("x", remaining=0, reset_after=retry_after)
+        return RateLimitError(f"X rate limit exceeded: {error}", retry_after=retry_after)
@@ -0,0 +1,115 @@
+"""플랫폼 인증 결과 캐시."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_TTL = 3600.0  # 초
+DEFAULT_CACHE_PATH = ".indieshout/auth-cache.json"
+
+
+def credential_fingerprint(*credentials: str | None) -> str:
+    """자격 증명의 해시 (토큰이 바뀌면 캐시 키도 바뀜, 토큰 자체는 저장하지 않음)."""
+    digest = hashlib.sha256("\0".join(c or "" for c in credentials).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class AuthCache:
+    """플랫폼별 인증 검증 결과 캐시.
+
+    검증된 계정 정보와 만료 시각을 기록해 두고, 만료 전에는 authenticate()의
+    네트워크 확인을 건너뛴다. 만료 시각은 TTL과 토큰 만료 시각 중 빠른 쪽이다.
+    persist가 켜져 있으면 실행 간에도 유지되도록 JSON 파일에 저장한다.
+    여러 스레드에서 동시에 사용할 수 있다.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, path: str | Path | None = None):
+        """AuthCache 초기화.
+
+        Args:
+            ttl: 캐시 유효 시간 (초, 0이면 캐시 안 함)
+            path: 디스크 캐시 파일 경로 (None이면 메모리에만 보관)
+        """
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+        if self.path is not None and self.path.exists():
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._entries = {}
+
+    @classmethod
+    def from_config(cls, config: dict) -> "AuthCache":
+        """auth 설정으로 캐시 생성.
+
+        auth.cache_ttl: 유효 시간 (초), auth.persist: 디스크 저장 여부,
+        auth.cache_path: 디스크 캐시 경로
+        """
+        auth_config = config.get("auth", {})
+        path = None
+        if auth_config.get("persist", False):
+            path = auth_config.get("cache_path", DEFAULT_CACHE_PATH)
+        return cls(float(auth_config.get("cache_ttl", DEFAULT_TTL)), path)
+
+    def get(self, platform: str, fingerprint: str) -> dict | None:
+        """유효한 캐시 항목의 계정 정보 반환 (없거나 만료되면 None)."""
+        with self._lock:
+            entry = self._entries.get(platform)
+            if entry is None or entry["fingerprint"] != fingerprint:
+                return None
+            if entry["expires_at"] <= time.time():
+                self._entries.pop(platform)
+                self._save()
+                return None
+            return entry["identity"]
+
+    def set(
+        self,
+        platform: str,
+        fingerprint: str,
+        identity: dict,
+        token_expires_at: float | None = None,
+    ) -> None:
+        """인증 검증 결과 기록.
+
+        Args:
+            platform: 플랫폼 이름
+            fingerprint: credential_fingerprint() 결과
+            identity: 검증된 계정 정보 (id, username 등)
+            token_expires_at: 토큰 만료 시각 (epoch 초, 알 수 없으면 None)
+        """
+        if self.ttl <= 0:
+            return
+
+        expires_at = time.time() + self.ttl
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+
+        with self._lock:
+            self._entries[platform] = {
+                "fingerprint": fingerprint,
+                "identity": identity,
+                "expires_at": expires_at,
+            }
+            self._save()
+
+    def invalidate(self, platform: str) -> None:
+        """플랫폼 캐시 삭제 (401 응답 등 토큰이 거부되었을 때)."""
+        with self._lock:
+            if self._entries.pop(platform, None) is not None:
+                self._save()
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._entries, ensure_ascii=False), encoding="utf-8")
+        os.chmod(tmp_path, 0o600)
+        tmp_path.replace(self.path)
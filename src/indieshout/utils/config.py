@@ -20,6 +20,7 @@ _ENV_MAPPING: dict[str, tuple[str, str]] = {
     "AWS_SECRET_ACCESS_KEY": ("s3", "secret_access_key"),
     "AWS_S3_BUCKET": ("s3", "bucket_name"),
     "AWS_S3_REGION": ("s3", "region"),
+    "ANTHROPIC_API_KEY": ("translator", "api_key"),
 }
 
 
@@ -0,0 +1,138 @@
+"""파생 이미지(축소/재압축/변형) 디스크 캐시.
+
+blog-content/{folder}/.cache/derivatives/{key}/ 에 결과 파일과 entry.json을 둔다.
+key는 (원본 해시, 변환 파라미터)의 해시이므로 원본이나 설정이 바뀌면 자동으로
+다른 항목을 사용한다. 항목의 마지막 사용 시각은 entry.json의 mtime으로 기록하고,
+크기 한도를 넘으면 오래 사용하지 않은 항목부터 지운다.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+from indieshout.utils.upload_manifest import file_sha256
+
+CACHE_DIRNAME = ".cache"
+DERIVATIVES_DIRNAME = "derivatives"
+ENTRY_FILENAME = "entry.json"
+DEFAULT_MAX_MB = 200  # 폴더당 캐시 크기 한도
+
+
+def cache_key(source_hash: str, params: dict) -> str:
+    """(원본 해시, 변환 파라미터) → 캐시 키."""
+    payload = json.dumps({"source": source_hash, "params": params}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+class DerivativeCache:
+    """폴더별 파생 이미지 캐시."""
+
+    def __init__(self, root: str | Path, max_bytes: int | None = DEFAULT_MAX_MB * 1024 * 1024):
+        """DerivativeCache 초기화.
+
+        Args:
+            root: 캐시 디렉토리 ({folder}/.cache/derivatives)
+            max_bytes: 캐시 크기 한도 (None이면 제한 없음)
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def for_folder(cls, folder: str | Path, max_bytes: int | None = None) -> "DerivativeCache":
+        """포스트 폴더의 캐시 (max_bytes가 None이면 기본 한도)."""
+        if max_bytes is None:
+            max_bytes = DEFAULT_MAX_MB * 1024 * 1024
+        return cls(Path(folder) / CACHE_DIRNAME / DERIVATIVES_DIRNAME, max_bytes)
+
+    def key(self, source_path: str | Path, params: dict) -> str:
+        """원본 파일과 변환 파라미터의 캐시 키."""
+        return cache_key(file_sha256(source_path), params)
+
+    def entry_dir(self, key: str) -> Path:
+        """항목 디렉토리 (결과 파일을 여기에 쓴다)."""
+        return self.root / key
+
+    def get(self, key: str) -> dict | None:
+        """캐시된 결과 반환 (없거나 파일이 빠졌으면 None). 사용 시각을 갱신한다."""
+        entry_file = self.entry_dir(key) / ENTRY_FILENAME
+        try:
+            entry = json.loads(entry_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        entry_dir = self.entry_dir(key)
+        result = {
+            **entry,
+            "path": str(entry_dir / entry["path"]),
+            "files": [str(entry_dir / name) for name in entry["files"]],
+        }
+        if not all(Path(f).exists() for f in result["files"]):
+            return None
+
+        os.utime(entry_file)
+        return result
+
+    def put(self, key: str, result: dict) -> None:
+        """entry_dir(key)에 만든 결과 등록 (파일 경로는 항목 디렉토리 기준으로 저장)."""
+        entry_dir = self.entry_dir(key)
+        entry = {
+            **result,
+            "path": Path(result["path"]).name,
+            "files": [Path(f).name for f in result["files"]],
+        }
+        tmp_file = entry_dir / f"{ENTRY_FILENAME}.tmp"
+        tmp_file.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        tmp_file.replace(entry_dir / ENTRY_FILENAME)
+
+    def entries(self) -> list[tuple[Path, float, int]]:
+        """(항목 디렉토리, 마지막 사용 시각, 크기) 리스트 (오래된 순).
+
+        entry.json이 없는 항목(작성 중 중단 등)은 사용 시각 0으로 취급한다.
+        """
+        if not self.root.exists():
+            return []
+        entries = []
+        for entry_dir in self.root.iterdir():
+            if not entry_dir.is_dir():
+                continue
+            entry_file = entry_dir / ENTRY_FILENAME
+            used_at = entry_file.stat().st_mtime if entry_file.exists() else 0.0
+            entries.append((entry_dir, used_at, _dir_size(entry_dir)))
+        return sorted(entries, key=lambda entry: entry[1])
+
+    def size(self) -> int:
+        """캐시 전체 크기 (bytes)."""
+        return sum(size for _, _, size in self.entries())
+
+    def prune(self, max_bytes: int | None = None, keep: set[str] | None = None) -> int:
+        """크기 한도를 넘으면 오래 사용하지 않은 항목부터 삭제.
+
+        Args:
+            max_bytes: 크기 한도 (None이면 self.max_bytes, 0이면 전부 삭제)
+            keep: 삭제하지 않을 키 (방금 사용한 항목 등)
+
+        Returns:
+            삭제한 바이트 수
+        """
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+        if max_bytes is None:
+            return 0
+
+        entries = self.entries()
+        total = sum(size for _, _, size in entries)
+        freed = 0
+        for entry_dir, _, size in entries:
+            if total - freed <= max_bytes:
+                break
+            if keep and entry_dir.name in keep:
+                continue
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            freed += size
+        return freed
@@ -0,0 +1,376 @@
+"""업로드 전 이미지 최적화 (축소, 메타데이터 제거, 재압축, WebP/AVIF 변형).
+
+Pillow가 필요하다 (pip install 'indieshout[images]'). 이미지마다 다음 파일을 만든다.
+
+    {base}.{jpg|png}      max_width 이하로 축소한 기본 파일 (마크다운/SNS가 사용).
+                          투명도가 없는 PNG(스크린샷 등)는 JPEG로 변환
+    {base}.{fmt}          formats의 각 형식 (예: 1.webp, 1.avif)
+    {base}-{w}w.{fmt}     responsive_widths의 각 폭 (예: 1-480w.webp)
+
+{base}는 기본 파일의 확장자가 원본과 같으면 원본 stem(1.jpg → 1), 다르면 원본
+확장자를 붙인 이름(1.png → 1-png)이라 1.png와 1.jpg가 같은 이름이 되지 않는다.
+변형 파일 목록은 결과의 variants에 담기며, HugoPublisher가 <picture>/srcset으로
+참조한다 (images.picture). 인코딩은 CPU를 많이 쓰므로 프로세스 풀에서
+이미지별로 병렬 처리하고, 결과는 폴더별 파생 이미지 캐시에 보관해 원본과 설정이
+같으면 다시 인코딩하지 않는다.
+"""
+
+import importlib.util
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from indieshout.utils.derivative_cache import DerivativeCache
+
+DEFAULT_MAX_WIDTH = 1600
+DEFAULT_QUALITY = 82
+DEFAULT_FORMATS = ["webp"]
+DEFAULT_RESPONSIVE_WIDTHS = [480, 960]
+TRANSFORM_VERSION = 2  # 변환 결과가 달라지도록 코드를 바꾸면 올림 (캐시 무효화)
+AVIF_SPEED = 8  # AVIF 인코더 속도 (0~10, 기본값 6보다 2배 빠르고 크기 차이는 3% 정도)
+
+# 재인코딩하지 않는 형식 (애니메이션 GIF 등은 그대로 업로드)
+PASSTHROUGH_SUFFIXES = {".gif", ".svg"}
+
+_PIL_FORMATS = {"webp": "WEBP", "avif": "AVIF"}
+
+
+def process_pool_context() -> multiprocessing.context.BaseContext:
+    """인코딩 프로세스 풀의 시작 방식 (forkserver, 없으면 spawn).
+
+    fork는 부모의 스레드 상태(게시 워커가 잡고 있는 락 등)까지 복사해 자식이
+    멈출 수 있으므로 사용하지 않는다.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def pillow_available() -> bool:
+    """Pillow 설치 여부."""
+    return importlib.util.find_spec("PIL") is not None
+
+
+def format_supported(fmt: str) -> bool:
+    """Pillow가 해당 형식(webp, avif)으로 저장할 수 있는지 확인."""
+    from PIL import features
+
+    return bool(features.check(fmt))
+
+
+def _save(image, path: Path, pil_format: str, quality: int) -> None:
+    """메타데이터 없이 저장 (exif/icc를 넘기지 않으면 Pillow는 기록하지 않음)."""
+    options: dict = {}
+    if pil_format == "JPEG":
+        options = {"quality": quality, "optimize": True, "progressive": True}
+    elif pil_format == "PNG":
+        options = {"optimize": True}
+    elif pil_format == "WEBP":
+        options = {"quality": quality}
+    elif pil_format == "AVIF":
+        options = {"quality": quality, "speed": AVIF_SPEED}
+    image.save(path, pil_format, **options)
+
+
+def _has_alpha(image) -> bool:
+    """실제로 투명한 픽셀이 있는지 확인 (알파 채널이 모두 불투명이면 False)."""
+    if image.mode == "P" and "transparency" in image.info:
+        image = image.convert("RGBA")
+    if image.mode not in ("RGBA", "LA"):
+        return False
+    return image.getchannel("A").getextrema()[0] < 255
+
+
+def _resized(image, width: int):
+    """비율을 유지하며 width 이하로 축소 (이미 작으면 그대로)."""
+    from PIL import Image
+
+    if image.width <= width:
+        return image
+    height = round(image.height * width / image.width)
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def output_base(source: Path, extension: str) -> str:
+    """결과 파일 이름의 기본 부분 (확장자가 바뀌면 원본 확장자를 붙여 이름 충돌 방지)."""
+    if source.suffix == f".{extension}":
+        return source.stem
+    return f"{source.stem}-{source.suffix.lstrip('.')}"
+
+
+def optimize_image(
+    image_path: str,
+    output_dir: str,
+    max_width: int = DEFAULT_MAX_WIDTH,
+    quality: int = DEFAULT_QUALITY,
+    formats: list[str] | None = None,
+    responsive_widths: list[int] | None = None,
+    convert_png: bool = True,
+) -> dict:
+    """이미지 하나 최적화 (프로세스 풀 워커에서 실행되므로 모듈 최상위 함수).
+
+    Args:
+        image_path: 원본 이미지 경로
+        output_dir: 결과 파일 디렉토리
+        max_width: 최대 폭 (px, 더 크면 비율 유지하며 축소)
+        quality: JPEG/WebP/AVIF 품질 (1~100)
+        formats: 추가로 만들 형식 (webp, avif)
+        responsive_widths: 추가로 만들 폭 (max_width 이상이거나 원본보다 큰 폭은 생략)
+        convert_png: True면 투명도가 없는 PNG를 JPEG로 저장
+
+    Returns:
+        dict with keys:
+            - path: 마크다운/SNS가 사용할 파일 (JPEG 또는 PNG)
+            - files: 업로드할 전체 파일 (path 포함)
+            - variants: 변형 파일 [{"file": 파일 이름, "format": 형식, "width": 폭}]
+              (path와 같은 디렉토리)
+            - original_bytes: 원본 크기
+            - bytes: path 크기
+    """
+    from PIL import Image, ImageOps
+
+    source = Path(image_path)
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    original_bytes = source.stat().st_size
+
+    if source.suffix.lower() in PASSTHROUGH_SUFFIXES:
+        main_path = output / source.name
+        shutil.copy2(source, main_path)
+        return {
+            "path": str(main_path),
+            "files": [str(main_path)],
+            "variants": [],
+            "original_bytes": original_bytes,
+            "bytes": original_bytes,
+        }
+
+    with Image.open(source) as opened:
+        image = ImageOps.exif_transpose(opened)  # 회전 정보를 픽셀에 반영한 뒤 EXIF는 버림
+        image.load()
+
+    image = image.convert("RGBA" if _has_alpha(image) else "RGB")
+    resized = _resized(image, max_width)
+
+    # 투명도가 있으면 PNG, 나머지는 JPEG (convert_png가 false면 PNG는 PNG로 유지)
+    keep_png = source.suffix.lower() == ".png" and not convert_png
+    main_format = "PNG" if image.mode == "RGBA" or keep_png else "JPEG"
+    extension = "png" if main_format == "PNG" else "jpg"
+    base = output_base(source, extension)
+    main_path = output / f"{base}.{extension}"
+    _save(resized, main_path, main_format, quality)
+
+    files = [str(main_path)]
+    variants: list[dict] = []
+    widths = [w for w in (responsive_widths or []) if w < min(max_width, image.width)]
+    for fmt in formats or []:
+        pil_format = _PIL_FORMATS[fmt]
+        for width, name in [(None, f"{base}.{fmt}")] + [(w, f"{base}-{w}w.{fmt}") for w in widths]:
+            variant = resized if width is None else _resized(image, width)
+            _save(variant, output / name, pil_format, quality)
+            files.append(str(output / name))
+            variants.append({"file": name, "format": fmt, "width": variant.width})
+
+    return {
+        "path": str(main_path),
+        "files": files,
+        "variants": variants,
+        "original_bytes": original_bytes,
+        "bytes": main_path.stat().st_size,
+    }
+
+
+class ImageOptimizer:
+    """여러 이미지를 프로세스 풀에서 병렬로 최적화."""
+
+    def __init__(
+        self,
+        max_width: int = DEFAULT_MAX_WIDTH,
+        quality: int = DEFAULT_QUALITY,
+        formats: list[str] | None = None,
+        responsive_widths: list[int] | None = None,
+        convert_png: bool = True,
+        workers: int | None = None,
+        cache_max_mb: float | None = None,
+    ):
+        """ImageOptimizer 초기화.
+
+        Args:
+            max_width: 최대 폭 (px)
+            quality: JPEG/WebP/AVIF 품질 (1~100)
+            formats: 추가로 만들 형식 (webp, avif). 설치된 Pillow가 지원하지 않는 형식은 제외
+            responsive_widths: 추가로 만들 폭 (px)
+            convert_png: True면 투명도가 없는 PNG를 JPEG로 저장
+            workers: 프로세스 수 (기본: CPU 코어 수)
+            cache_max_mb: 폴더별 파생 이미지 캐시 크기 한도 (MB, 기본 200)
+
+        Raises:
+            RuntimeError: Pillow가 설치되지 않았을 때
+            ValueError: 알 수 없는 형식일 때
+        """
+        if not pillow_available():
+            raise RuntimeError("이미지 최적화에는 Pillow가 필요합니다 (pip install 'indieshout[images]')")
+
+        formats = list(DEFAULT_FORMATS if formats is None else formats)
+        for fmt in formats:
+            if fmt not in ("webp", "avif"):
+                raise ValueError(f"Unknown image format: {fmt}")
+
+        self.max_width = max_width
+        self.quality = quality
+        self.formats = []
+        for fmt in formats:
+            if format_supported(fmt):
+                self.formats.append(fmt)
+            else:
+                print(f"⚠️ 설치된 Pillow가 {fmt} 저장을 지원하지 않아 {fmt} 변형을 만들지 않습니다")
+        self.responsive_widths = sorted(
+            DEFAULT_RESPONSIVE_WIDTHS if responsive_widths is None else responsive_widths
+        )
+        self.convert_png = convert_png
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_max_bytes = int(cache_max_mb * 1024 * 1024) if cache_max_mb is not None else None
+
+    def cache_for(self, folder: str | Path) -> DerivativeCache:
+        """포스트 폴더의 파생 이미지 캐시."""
+        return DerivativeCache.for_folder(folder, self.cache_max_bytes)
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ImageOptimizer | None":
+        """images 설정으로 생성 (images.optimize가 false이거나 Pillow가 없으면 None).
+
+        images:
+          optimize: true
+          max_width: 1600
+          quality: 82
+          picture: true            # false면 변형을 만들지 않음 (formats/responsive_widths 무시)
+          formats: [webp, avif]
+          responsive_widths: [480, 960]
+          convert_png: true
+          workers: 4
+          cache_max_mb: 200
+        """
+        images_config = config.get("images", {})
+        if not images_config.get("optimize", False):
+            return None
+        if not pillow_available():
+            print("⚠️ Pillow가 없어 이미지 최적화를 건너뜁니다 (pip install 'indieshout[images]')")
+            return None
+
+        workers = images_config.get("workers")
+        # 변형은 마크다운이 <picture>로 참조할 때만 만든다 (참조하지 않는 파일은 올리지 않음)
+        picture = bool(images_config.get("picture", False))
+        return cls(
+            max_width=int(images_config.get("max_width", DEFAULT_MAX_WIDTH)),
+            quality=int(images_config.get("quality", DEFAULT_QUALITY)),
+            formats=images_config.get("formats") if picture else [],
+            responsive_widths=images_config.get("responsive_widths") if picture else [],
+            convert_png=bool(images_config.get("convert_png", True)),
+            workers=int(workers) if workers else None,
+            cache_max_mb=images_config.get("cache_max_mb"),
+        )
+
+    def optimize_many(
+        self,
+        image_paths: list[str],
+        output_dir: str | Path | None = None,
+        cache: DerivativeCache | None = None,
+    ) -> dict[str, dict]:
+        """이미지들을 병렬로 최적화하고 원본 경로 → optimize_image() 결과 반환.
+
+        cache가 주어지면 (원본 해시, 변환 설정)이 같은 결과를 재사용하고 새로 만든
+        결과만 캐시 항목 디렉토리에 쓴다. 모두 캐시에 있으면 인코딩을 하지 않는다.
+        최적화에 실패한 이미지는 경고 후 원본을 그대로 사용한다.
+
+        Args:
+            image_paths: 원본 이미지 경로 리스트
+            output_dir: 결과 디렉토리 (cache가 없을 때)
+            cache: 파생 이미지 캐시
+
+        Raises:
+            ValueError: output_dir와 cache가 모두 없을 때
+        """
+        if output_dir is None and cache is None:
+            raise ValueError("output_dir or cache is required")
+
+        options = {
+            "max_width": self.max_width,
+            "quality": self.quality,
+            "formats": self.formats,
+            "responsive_widths": self.responsive_widths,
+            "convert_png": self.convert_png,
+        }
+
+        # 캐시 조회: 없는 이미지만 (출력 디렉토리, 캐시 키)와 함께 처리 대상으로
+        results: dict[str, dict] = {}
+        pending: dict[str, tuple[str, str | None]] = {}
+        for image_path in image_paths:
+            if cache is None:
+                pending[image_path] = (str(output_dir), None)
+                continue
+            try:
+                # 결과 파일 이름이 원본 이름을 따르므로 이름도 키에 포함
+                params = {**options, "name": Path(image_path).name, "version": TRANSFORM_VERSION}
+                key = cache.key(image_path, params)
+            except OSError as e:
+                results[image_path] = self._original(image_path, e)
+                continue
+            cached = cache.get(key)
+            if cached is not None:
+                results[image_path] = cached
+            else:
+                pending[image_path] = (str(cache.entry_dir(key)), key)
+
+        cache_hits = len(results)
+        if len(pending) <= 1 or self.workers <= 1:
+            for image_path, (target_dir, _) in pending.items():
+                results[image_path] = self._optimize_or_original(image_path, target_dir, options)
+        else:
+            workers = min(self.workers, len(pending))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=process_pool_context()) as executor:
+                futures = {
+                    image_path: executor.submit(optimize_image, image_path, target_dir, **options)
+                    for image_path, (target_dir, _) in pending.items()
+                }
+                for image_path, future in futures.items():
+                    try:
+                        results[image_path] = future.result()
+                    except Exception as e:
+                        results[image_path] = self._original(image_path, e)
+
+        if cache is not None and pending:
+            for image_path, (_, key) in pending.items():
+                if results[image_path]["path"] != image_path:  # 원본으로 대체된 결과는 캐시하지 않음
+                    cache.put(key, results[image_path])
+            cache.prune(keep={Path(r["path"]).parent.name for r in results.values()})
+
+        results = {image_path: results[image_path] for image_path in image_paths}
+        original_total = sum(r["original_bytes"] for r in results.values())
+        optimized_total = sum(r["bytes"] for r in results.values())
+        if results:
+            cached_note = f", 캐시 {cache_hits}장" if cache_hits else ""
+            print(
+                f"🖼️ 이미지 최적화: {original_total / 1024 / 1024:.1f}MB → "
+                f"{optimized_total / 1024 / 1024:.1f}MB ({len(results)}장{cached_note})"
+            )
+        return results
+
+    def _optimize_or_original(self, image_path: str, output_dir: str, options: dict) -> dict:
+        try:
+            return optimize_image(image_path, output_dir, **options)
+        except Exception as e:
+            return self._original(image_path, e)
+
+    @staticmethod
+    def _original(image_path: str, error: Exception) -> dict:
+        print(f"Warning: Image optimization failed for {Path(image_path).name}: {error}")
+        size = Path(image_path).stat().st_size if Path(image_path).exists() else 0
+        return {
+            "path": image_path,
+            "files": [image_path],
+            "variants": [],
+            "original_bytes": size,
+            "bytes": size,
+        }
@@ -0,0 +1,170 @@
+"""마크다운 이미지 참조를 찾아 업로드한 URL로 치환.
+
+다음 참조를 정규식 한 번으로 찾고 re.sub 한 번으로 치환한다.
+
+    ![alt](assets/1.png "title")     인라인 이미지
+    <img src="assets/1.png">         HTML img 태그
+    ![alt][logo] + [logo]: assets/logo.png   참조형 이미지의 정의
+
+상대 경로는 포스트 폴더(content.md 위치) 기준으로 해석하고, 코드 블록과 인라인
+코드 안의 참조는 건드리지 않는다. http(s)/data URL 같은 외부 참조는 대상이
+아니며, 로컬 경로인데 URL 매핑이 없는 참조는 unresolved로 보고한다.
+
+render_pictures()는 치환이 끝난 인라인 이미지 중 WebP/AVIF 변형이 있는 것을
+<picture> 태그로 바꾼다.
+"""
+
+import html
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import unquote
+
+_REFERENCE_RE = re.compile(
+    r"""
+      (?P<fence>^[ ]{0,3}(?P<fence_mark>```|~~~)(?s:.*?)(?:^[ ]{0,3}(?P=fence_mark)[ \t]*$|\Z))
+    | (?P<code>`[^`\n]+`)
+    | (?P<md_head>!\[[^\]\n]*\]\([ \t]*)(?P<md_dest><[^>\n]+>|[^)\s]+)
+    | (?P<html_head><img\b[^>]*?\bsrc[ \t]*=[ \t]*)(?P<quote>["'])(?P<html_dest>[^"'\n]*)(?P=quote)
+    | (?P<def_head>^[ ]{0,3}\[(?P<def_id>[^\]\n]+)\]:[ \t]*)(?P<def_dest><[^>\n]+>|\S+)
+    """,
+    re.VERBOSE | re.MULTILINE | re.IGNORECASE,
+)
+# 참조형 이미지: ![alt][id], ![id][], ![id]
+_IMAGE_LABEL_RE = re.compile(r"!\[(?P<alt>[^\]\n]*)\](?:\[(?P<id>[^\]\n]*)\])?(?!\()")
+# 인라인 이미지 ![alt](url "title") (코드 블록/인라인 코드는 건너뛰기 위해 함께 매칭)
+_INLINE_IMAGE_RE = re.compile(
+    r"""
+      (?P<fence>^[ ]{0,3}(?P<fence_mark>```|~~~)(?s:.*?)(?:^[ ]{0,3}(?P=fence_mark)[ \t]*$|\Z))
+    | (?P<code>`[^`\n]+`)
+    | !\[(?P<alt>[^\]\n]*)\]\([ \t]*(?P<dest><[^>\n]+>|[^)\s]+)(?:[ \t]+"(?P<title>[^"\n]*)")?[ \t]*\)
+    """,
+    re.VERBOSE | re.MULTILINE,
+)
+_MIME_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+_EXTERNAL_RE = re.compile(r"^(?:[a-z][a-z0-9+.-]*:|//|#)", re.IGNORECASE)
+
+
+@dataclass
+class ImageRewrite:
+    """치환 결과.
+
+    Attributes:
+        text: 치환된 마크다운
+        replaced: 치환한 참조 수
+        unresolved: URL 매핑이 없는 로컬 참조 ("줄 번호: 경로")
+    """
+
+    text: str
+    replaced: int = 0
+    unresolved: list[str] = field(default_factory=list)
+
+
+def _normalize(path: str | Path) -> str:
+    return os.path.normpath(os.path.abspath(path))
+
+
+def _image_labels(markdown: str) -> set[str]:
+    """참조형 이미지가 사용하는 참조 이름 (대소문자 구분 없음)."""
+    return {
+        (match.group("id") or match.group("alt")).strip().lower()
+        for match in _IMAGE_LABEL_RE.finditer(markdown)
+    }
+
+
+def rewrite_image_refs(
+    markdown: str, url_map: dict[str, str], base_dir: str | Path | None = None
+) -> ImageRewrite:
+    """마크다운의 로컬 이미지 참조를 URL로 치환 (한 번의 패스).
+
+    Args:
+        markdown: 마크다운 텍스트
+        url_map: 로컬 경로 → URL 매핑 (경로는 정규화해서 비교)
+        base_dir: 상대 경로 기준 디렉토리 (None이면 현재 디렉토리)
+
+    Returns:
+        ImageRewrite
+    """
+    urls = {_normalize(path): url for path, url in url_map.items()}
+    base = Path(base_dir) if base_dir is not None else Path(".")
+    labels = _image_labels(markdown) if "]:" in markdown else set()
+    result = ImageRewrite(text=markdown)
+
+    def resolve(match: re.Match, dest: str) -> str | None:
+        """참조 대상의 URL (외부 참조면 None, 매핑이 없으면 unresolved에 기록)."""
+        path = unquote(dest[1:-1] if dest.startswith("<") else dest)
+        if _EXTERNAL_RE.match(path):
+            return None
+        url = urls.get(_normalize(base / path))
+        if url is None:
+            line = markdown.count("\n", 0, match.start()) + 1
+            result.unresolved.append(f"{line}: {path}")
+            return None
+        result.replaced += 1
+        return f"<{url}>" if dest.startswith("<") else url
+
+    def replace(match: re.Match) -> str:
+        if match.group("fence") or match.group("code"):
+            return match.group(0)
+        if match.group("md_dest"):
+            url = resolve(match, match.group("md_dest"))
+            return match.group(0) if url is None else match.group("md_head") + url
+        if match.group("html_dest") is not None:
+            url = resolve(match, match.group("html_dest"))
+            quote = match.group("quote")
+            return match.group(0) if url is None else f"{match.group('html_head')}{quote}{url}{quote}"
+        # 참조 정의는 이미지가 사용하는 것만 (일반 링크 정의는 그대로)
+        if match.group("def_id").strip().lower() not in labels:
+            return match.group(0)
+        url = resolve(match, match.group("def_dest"))
+        return match.group(0) if url is None else match.group("def_head") + url
+
+    result.text = _REFERENCE_RE.sub(replace, markdown)
+    return result
+
+
+def render_pictures(markdown: str, sources: dict[str, list[dict]]) -> str:
+    """변형이 있는 인라인 이미지를 <picture>로 변환 (형식별 <source srcset>, 기본 파일은 <img>).
+
+    Hugo에서 HTML을 그대로 출력하려면 markup.goldmark.renderer.unsafe가 켜져 있어야 한다.
+
+    Args:
+        markdown: URL 치환이 끝난 마크다운
+        sources: 기본 파일 URL → [{"url": 변형 URL, "format": 형식, "width": 폭}]
+
+    Returns:
+        변환된 마크다운
+    """
+    if not sources:
+        return markdown
+
+    def replace(match: re.Match) -> str:
+        if match.group("fence") or match.group("code"):
+            return match.group(0)
+        dest = match.group("dest")
+        url = dest[1:-1] if dest.startswith("<") else dest
+        variants = sources.get(url)
+        if not variants:
+            return match.group(0)
+
+        by_format: dict[str, list[dict]] = {}
+        for variant in variants:
+            by_format.setdefault(variant["format"], []).append(variant)
+        # 압축률이 좋은 형식을 먼저 (브라우저는 지원하는 첫 <source>를 사용)
+        tags = []
+        for fmt in sorted(by_format, key=lambda f: list(_MIME_TYPES).index(f)):
+            srcset = ", ".join(
+                f"{html.escape(v['url'])} {v['width']}w"
+                for v in sorted(by_format[fmt], key=lambda v: v["width"])
+            )
+            tags.append(f'<source type="{_MIME_TYPES[fmt]}" srcset="{srcset}" sizes="100vw">')
+
+        title = match.group("title")
+        title_attr = f' title="{html.escape(title)}"' if title else ""
+        tags.append(
+            f'<img src="{html.escape(url)}" alt="{html.escape(match.group("alt"))}"{title_attr} loading="lazy">'
+        )
+        return f"<picture>{''.join(tags)}</picture>"
+
+    return _INLINE_IMAGE_RE.sub(replace, markdown)
@@ -0,0 +1,148 @@
+"""번역용 마크다운 분할.
+
+본문을 제목/문단 단위 블록으로 나누고, 번역하면 안 되는 블록(코드 블록,
+이미지만 있는 줄, URL, 참조 링크 정의)은 그대로 보존한다.
+"""
+
+import re
+from dataclasses import dataclass
+
+DEFAULT_MAX_CHUNK_CHARS = 2000
+
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+_HEADING_RE = re.compile(r"^#{1,6}\s")
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_HTML_IMG_RE = re.compile(r"<img\b[^>]*>", re.IGNORECASE)
+_LINK_DEST_RE = re.compile(r"(\]\()([^)\s]+)((?:\s+\"[^\"]*\")?\))")
+_BARE_URL_RE = re.compile(r"https?://[^\s<>()\[\]]+")
+_REFERENCE_DEF_RE = re.compile(r"^\s*\[[^\]]+\]:\s*\S+")
+_PLACEHOLDER = "⟦URL{}⟧"
+
+
+@dataclass
+class Segment:
+    """마크다운 블록 (translatable=False면 원문 그대로 유지)."""
+
+    text: str
+    translatable: bool
+
+
+def _is_preserved_block(block: str) -> bool:
+    """이미지/URL/참조 정의만으로 이루어진 블록인지 확인."""
+    for line in block.split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if _REFERENCE_DEF_RE.match(stripped):
+            continue
+        rest = _IMAGE_RE.sub("", stripped)
+        rest = _HTML_IMG_RE.sub("", rest)
+        rest = _BARE_URL_RE.sub("", rest)
+        if rest.strip():
+            return False
+    return True
+
+
+def _split_blocks(markdown: str) -> list[Segment]:
+    """빈 줄과 코드 펜스 기준으로 블록 분할."""
+    blocks: list[Segment] = []
+    current: list[str] = []
+    fence: str | None = None
+
+    def flush() -> None:
+        if current:
+            text = "\n".join(current)
+            blocks.append(Segment(text, not _is_preserved_block(text)))
+            current.clear()
+
+    for line in markdown.split("\n"):
+        match = _FENCE_RE.match(line)
+        if fence is not None:
+            current.append(line)
+            if match and match.group(1) == fence:
+                blocks.append(Segment("\n".join(current), False))
+                current.clear()
+                fence = None
+        elif match:
+            flush()
+            fence = match.group(1)
+            current.append(line)
+        elif not line.strip():
+            flush()
+        elif _HEADING_RE.match(line):
+            # 제목은 항상 새 블록의 시작
+            flush()
+            current.append(line)
+        else:
+            current.append(line)
+
+    if fence is not None:
+        # 닫히지 않은 코드 블록도 그대로 보존
+        blocks.append(Segment("\n".join(current), False))
+    else:
+        flush()
+
+    return blocks
+
+
+def split_markdown(markdown: str, max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS) -> list[Segment]:
+    """마크다운을 번역 단위(청크)로 분할.
+
+    연속된 번역 대상 블록은 max_chunk_chars를 넘지 않는 범위에서 하나의 청크로
+    묶되, 제목에서는 항상 새 청크를 시작한다.
+
+    Args:
+        markdown: 마크다운 본문
+        max_chunk_chars: 청크 하나의 최대 글자 수
+
+    Returns:
+        순서대로 이어 붙이면 원문이 되는 Segment 리스트
+    """
+    segments: list[Segment] = []
+
+    for block in _split_blocks(markdown):
+        previous = segments[-1] if segments else None
+        if (
+            block.translatable
+            and previous is not None
+            and previous.translatable
+            and not _HEADING_RE.match(block.text)
+            and len(previous.text) + len(block.text) + 2 <= max_chunk_chars
+        ):
+            previous.text = f"{previous.text}\n\n{block.text}"
+        else:
+            segments.append(Segment(block.text, block.translatable))
+
+    return segments
+
+
+def join_segments(segments: list[Segment]) -> str:
+    """Segment 리스트를 마크다운으로 재조합."""
+    return "\n\n".join(segment.text for segment in segments)
+
+
+def protect_urls(text: str) -> tuple[str, dict[str, str]]:
+    """이미지, 링크 주소, URL을 자리표시자로 치환.
+
+    Returns:
+        (치환된 텍스트, 자리표시자 → 원문 매핑)
+    """
+    placeholders: dict[str, str] = {}
+
+    def store(value: str) -> str:
+        token = _PLACEHOLDER.format(len(placeholders))
+        placeholders[token] = value
+        return token
+
+    text = _IMAGE_RE.sub(lambda m: store(m.group(0)), text)
+    text = _HTML_IMG_RE.sub(lambda m: store(m.group(0)), text)
+    text = _LINK_DEST_RE.sub(lambda m: m.group(1) + store(m.group(2)) + m.group(3), text)
+    text = _BARE_URL_RE.sub(lambda m: store(m.group(0)), text)
+    return text, placeholders
+
+
+def restore_urls(text: str, placeholders: dict[str, str]) -> str:
+    """자리표시자를 원래 값으로 복원."""
+    for token, value in placeholders.items():
+        text = text.replace(token, value)
+    return text
@@ -0,0 +1,144 @@
+"""큰 미디어 파일(동영상 등)을 일정한 메모리로 다루는 스트리밍 유틸리티.
+
+파일을 통째로 읽지 않고 고정 크기 청크로 나눠 읽으므로 메모리 사용량은 파일
+크기가 아니라 청크 크기 × 동시 전송 수에 비례한다.
+
+- iter_chunks(): 파일 구간을 청크 단위로 읽는 제너레이터
+- upload_in_chunks(): 퍼블리셔의 청크 업로드(INIT/APPEND/FINALIZE) 구현용 드라이버
+- MultipartResumeState: S3 멀티파트 업로드 진행 상황 (중단 후 이어 올리기)
+"""
+
+import hashlib
+import json
+import math
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+MB = 1024 * 1024
+DEFAULT_CHUNK_SIZE = 4 * MB
+S3_MIN_PART_SIZE = 5 * MB  # 마지막 파트를 제외한 S3 파트 최소 크기
+S3_MAX_PARTS = 10000
+DEFAULT_RESUME_DIR = ".indieshout/multipart"
+
+# (누적 전송 바이트, 전체 바이트)
+ChunkProgress = Callable[[int, int], None]
+
+
+def iter_chunks(
+    path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    offset: int = 0,
+    length: int | None = None,
+) -> Iterator[bytes]:
+    """파일의 [offset, offset + length) 구간을 chunk_size씩 읽기.
+
+    Args:
+        path: 파일 경로
+        chunk_size: 한 번에 읽을 바이트 수
+        offset: 시작 위치
+        length: 읽을 바이트 수 (None이면 파일 끝까지)
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        remaining = length
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            data = f.read(size)
+            if not data:
+                return
+            if remaining is not None:
+                remaining -= len(data)
+            yield data
+
+
+def read_part(path: str | Path, offset: int, length: int) -> bytes:
+    """파일의 한 구간 읽기 (멀티파트 업로드의 파트 하나)."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return f.read(length)
+
+
+def part_size_for(size: int, min_part_size: int, max_parts: int = S3_MAX_PARTS) -> int:
+    """파트 수 한도 안에 들어가는 파트 크기 (min_part_size 이상, MB 단위로 올림)."""
+    needed = math.ceil(size / max_parts) if size else 0
+    part_size = max(min_part_size, S3_MIN_PART_SIZE, needed)
+    return math.ceil(part_size / MB) * MB
+
+
+def upload_in_chunks(
+    path: str | Path,
+    append: Callable[[int, bytes], None],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    start_segment: int = 0,
+    progress: ChunkProgress | None = None,
+) -> int:
+    """파일을 청크로 나눠 append(세그먼트 번호, 데이터)를 차례로 호출.
+
+    퍼블리셔의 upload_video()가 플랫폼 APPEND 요청을 append로 넘겨 사용한다.
+    start_segment를 주면 앞 세그먼트를 건너뛰고 이어서 보낸다.
+
+    Args:
+        path: 파일 경로
+        append: 세그먼트 하나를 전송하는 함수
+        chunk_size: 세그먼트 크기
+        start_segment: 시작할 세그먼트 번호
+        progress: (누적 전송 바이트, 전체 바이트) 콜백
+
+    Returns:
+        보낸 세그먼트 수 (start_segment 포함)
+    """
+    total = Path(path).stat().st_size
+    offset = start_segment * chunk_size
+    segment = start_segment
+    for data in iter_chunks(path, chunk_size, offset=offset):
+        append(segment, data)
+        segment += 1
+        offset += len(data)
+        if progress is not None:
+            progress(offset, total)
+    return segment
+
+
+class MultipartResumeState:
+    """S3 멀티파트 업로드 진행 상황 파일.
+
+    (버킷, 키, 로컬 경로, 크기, 수정 시각)마다 JSON 파일 하나에 upload_id와 완료한
+    파트 번호를 기록한다. 파일이 바뀌면 다른 상태 파일을 사용하므로 이전 업로드를
+    잘못 이어 붙이지 않는다.
+    """
+
+    def __init__(self, state_file: str | Path):
+        self.state_file = Path(state_file)
+
+    @classmethod
+    def for_upload(
+        cls, root: str | Path, bucket: str, s3_key: str, file_path: str | Path
+    ) -> "MultipartResumeState":
+        """업로드 대상의 상태 파일."""
+        stat = Path(file_path).stat()
+        identity = json.dumps(
+            [bucket, s3_key, str(Path(file_path).resolve()), stat.st_size, stat.st_mtime_ns]
+        )
+        name = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:24]
+        return cls(Path(root) / f"{name}.json")
+
+    def load(self) -> dict | None:
+        """{"upload_id", "part_size", "parts": {번호: ETag}} (없거나 손상되면 None)."""
+        try:
+            state = json.loads(self.state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        state["parts"] = {int(number): etag for number, etag in state.get("parts", {}).items()}
+        return state
+
+    def save(self, upload_id: str, part_size: int, parts: dict[int, str]) -> None:
+        """진행 상황 기록 (임시 파일 후 교체)."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"upload_id": upload_id, "part_size": part_size, "parts": parts}
+        tmp_file = self.state_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_file.replace(self.state_file)
+
+    def delete(self) -> None:
+        """업로드 완료/취소 후 상태 파일 삭제."""
+        self.state_file.unlink(missing_ok=True)
@@ -0,0 +1,217 @@
+"""폴더별 게시 상태 저장소.
+
+무엇을 어떤 입력으로 게시했는지 기록해 두고, 다시 실행할 때 입력이 바뀐
+단계만 처리하며 같은 폴더의 SNS 중복 게시를 막는다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from indieshout.utils.upload_manifest import file_sha256
+
+STATE_FILENAME = ".publish-state.sqlite3"
+SNS_UNKNOWN = "unknown"  # 타임아웃 등으로 게시 여부를 알 수 없는 SNS 기록 (--force 없이는 다시 게시하지 않음)
+
+
+def fingerprint_folder(folder_path: str | Path) -> dict:
+    """폴더 입력 파일들의 해시 계산.
+
+    Returns:
+        dict with keys:
+            - content_hash: content.md 해시 (없으면 None)
+            - meta_hash: meta.md 해시 (없으면 None)
+            - asset_hashes: assets/ 하위 파일 이름 → 해시
+    """
+    folder_path = Path(folder_path)
+    content_file = folder_path / "content.md"
+    meta_file = folder_path / "meta.md"
+    assets_dir = folder_path / "assets"
+
+    asset_hashes = {}
+    if assets_dir.exists():
+        for asset in sorted(assets_dir.iterdir()):
+            if asset.is_file():
+                asset_hashes[asset.name] = file_sha256(asset)
+
+    return {
+        "content_hash": file_sha256(content_file) if content_file.exists() else None,
+        "meta_hash": file_sha256(meta_file) if meta_file.exists() else None,
+        "asset_hashes": asset_hashes,
+    }
+
+
+def is_blog_current(state: dict | None, fingerprint: dict) -> bool:
+    """기록된 상태가 같은 입력으로 블로그를 게시한 것인지 확인."""
+    return bool(
+        state
+        and state["blog_url"]
+        and state["content_hash"] == fingerprint["content_hash"]
+        and state["meta_hash"] == fingerprint["meta_hash"]
+        and state["asset_hashes"] == fingerprint["asset_hashes"]
+    )
+
+
+def text_sha256(text: str) -> str:
+    """문자열의 SHA-256 해시."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class PublishStateStore:
+    """SQLite 기반 게시 상태 저장소 (폴더 이름이 키).
+
+    폴더마다 content.md/meta.md/각 에셋의 해시, 블로그 URL, S3 URL,
+    번역 결과 해시, 플랫폼별 SNS 게시 결과를 기록한다.
+    여러 스레드에서 동시에 사용할 수 있다.
+    """
+
+    def __init__(self, path: str | Path):
+        """PublishStateStore 초기화.
+
+        DB 파일은 처음 사용할 때 생성된다.
+
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict, blog_content_dir: str | Path) -> "PublishStateStore | None":
+        """workflow 설정으로 저장소 생성 (workflow.state가 false면 None).
+
+        경로 기본값은 blog-content/.publish-state.sqlite3
+        """
+        workflow_config = config.get("workflow", {})
+        if not workflow_config.get("state", True):
+            return None
+        return cls(workflow_config.get("state_path", Path(blog_content_dir) / STATE_FILENAME))
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS folders (
+                    folder TEXT PRIMARY KEY,
+                    content_hash TEXT,
+                    meta_hash TEXT,
+                    asset_hashes TEXT NOT NULL DEFAULT '{}',
+                    blog_slug TEXT,
+                    blog_url TEXT,
+                    s3_urls TEXT NOT NULL DEFAULT '{}',
+                    translation_hash TEXT,
+                    sns TEXT NOT NULL DEFAULT '{}',
+                    updated_at TEXT
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, folder_name: str) -> dict | None:
+        """폴더의 게시 상태 반환 (기록이 없으면 None)."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT * FROM folders WHERE folder = ?", (folder_name,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        state = dict(row)
+        for key in ("asset_hashes", "s3_urls", "sns"):
+            state[key] = json.loads(state[key])
+        return state
+
+    def get_sns(self, folder_name: str, platform: str) -> dict | None:
+        """플랫폼 게시 기록 반환 (없으면 None)."""
+        state = self.get(folder_name)
+        if state is None:
+            return None
+        return state["sns"].get(platform)
+
+    def record_blog(
+        self,
+        folder_name: str,
+        fingerprint: dict,
+        blog_result: dict,
+        translation_hash: str | None = None,
+    ) -> None:
+        """블로그 게시 결과 기록.
+
+        Args:
+            folder_name: 폴더 이름
+            fingerprint: fingerprint_folder() 결과
+            blog_result: HugoPublisher.publish() 결과
+            translation_hash: 영문 번역 결과 해시
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                """
+                INSERT INTO folders (
+                    folder, content_hash, meta_hash, asset_hashes,
+                    blog_slug, blog_url, s3_urls, translation_hash, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (folder) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    meta_hash = excluded.meta_hash,
+                    asset_hashes = excluded.asset_hashes,
+                    blog_slug = excluded.blog_slug,
+                    blog_url = excluded.blog_url,
+                    s3_urls = excluded.s3_urls,
+                    translation_hash = excluded.translation_hash,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    folder_name,
+                    fingerprint["content_hash"],
+                    fingerprint["meta_hash"],
+                    json.dumps(fingerprint["asset_hashes"], sort_keys=True),
+                    blog_result.get("slug"),
+                    blog_result["url"],
+                    json.dumps(blog_result.get("images") or {}, ensure_ascii=False),
+                    translation_hash,
+                    now,
+                ),
+            )
+            conn.commit()
+
+    def record_sns(self, folder_name: str, platform: str, sns_result: dict, text: str) -> None:
+        """SNS 게시 결과 기록 (게시 ID/URL과 게시한 텍스트 해시)."""
+        now = datetime.now().isoformat(timespec="seconds")
+        entry = {**sns_result, "text_hash": text_sha256(text), "published_at": now}
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR IGNORE INTO folders (folder, updated_at) VALUES (?, ?)",
+                (folder_name, now),
+            )
+            row = conn.execute("SELECT sns FROM folders WHERE folder = ?", (folder_name,)).fetchone()
+            sns = json.loads(row[0])
+            sns[platform] = entry
+            conn.execute(
+                "UPDATE folders SET sns = ?, updated_at = ? WHERE folder = ?",
+                (json.dumps(sns, ensure_ascii=False), now, folder_name),
+            )
+            conn.commit()
+
+    def record_sns_unknown(self, folder_name: str, platform: str, error: str, text: str) -> None:
+        """게시 여부를 알 수 없는 SNS 결과 기록 (타임아웃 후 백그라운드에서 게시됐을 수 있음)."""
+        self.record_sns(folder_name, platform, {"status": SNS_UNKNOWN, "error": error}, text)
+
+    def close(self) -> None:
+        """DB 연결 종료."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,286 @@
+"""플랫폼별 클라이언트 측 게시 한도 관리.
+
+플랫폼마다 토큰 버킷 하나를 두고 게시 한 번에 토큰 하나를 쓴다.
+한도는 설정(rate_limits.<platform>)에서 읽고, 응답 헤더/429 응답으로 보정한다.
+한도 초과(429)는 지수 백오프 + jitter로 재시도한다.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+
+# 플랫폼 문서 기준 게시 한도 (게시 수, 기간 초)
+DEFAULT_LIMITS = {
+    "x": (100, 24 * 3600),
+    "threads": (250, 24 * 3600),
+}
+DEFAULT_LIMIT = (60, 60.0)  # 알 수 없는 플랫폼: 분당 60회
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BASE_DELAY = 2.0  # 초
+DEFAULT_MAX_DELAY = 300.0  # 초
+
+
+class RetryableError(RuntimeError):
+    """다시 시도해도 안전한 실패 (retry_after: 서버가 알려준 대기 시간, 초)."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimitError(RetryableError):
+    """플랫폼 게시 한도 초과 (HTTP 429 등)."""
+
+
+class TokenBucket:
+    """기간(window) 동안 capacity번 허용하는 토큰 버킷.
+
+    토큰은 capacity / window 속도로 연속 충전된다. 여러 스레드에서 동시에
+    사용할 수 있다.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        window: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """TokenBucket 초기화.
+
+        Args:
+            capacity: 기간당 허용 횟수 (버킷 크기)
+            window: 기간 (초)
+            clock: 단조 증가 시계 (테스트용)
+        """
+        if capacity <= 0 or window <= 0:
+            raise ValueError("capacity and window must be positive")
+
+        self.capacity = capacity
+        self.window = window
+        self.rate = capacity / window  # 초당 충전량
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._reset_pending = False  # 차단이 끝나면 서버 한도가 초기화됨
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self._reset_pending and now >= self._blocked_until:
+            self._tokens = float(self.capacity)
+            self._reset_pending = False
+            self._updated = now
+            return
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def wait_time(self) -> float:
+        """토큰 하나를 얻기까지 기다려야 하는 시간 (초)."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return self._wait_time(now)
+
+    def _wait_time(self, now: float) -> float:
+        wait = max(0.0, (1.0 - self._tokens) / self.rate)
+        return max(wait, self._blocked_until - now)
+
+    def try_acquire(self) -> float:
+        """토큰을 바로 얻으면 0, 아니면 기다려야 할 시간(초)을 반환."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            wait = self._wait_time(now)
+            if wait <= 0:
+                self._tokens -= 1.0
+            return wait
+
+    def update(self, remaining: int | None = None, reset_after: float | None = None) -> None:
+        """서버가 알려준 남은 횟수/초기화 시각으로 버킷 보정.
+
+        Args:
+            remaining: 현재 기간에 남은 허용 횟수
+            reset_after: 한도가 초기화되기까지 남은 시간 (초)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if remaining is not None:
+                self._tokens = min(self._tokens, float(remaining))
+            if remaining == 0 and reset_after is not None:
+                self._blocked_until = max(self._blocked_until, now + reset_after)
+                self._reset_pending = True
+
+    def schedule(self, count: int) -> list[float]:
+        """지금부터 count번 게시할 때 각 게시가 가능한 시점 (초 단위 지연).
+
+        남은 토큰만큼은 바로, 그 이후는 충전 속도에 맞춰 간격을 둔다.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            start = max(0.0, self._blocked_until - now)
+            tokens = float(self.capacity) if self._reset_pending else self._tokens
+            delays = []
+            for i in range(count):
+                needed = (i + 1) - tokens
+                delays.append(start + max(0.0, needed / self.rate))
+            return delays
+
+
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책."""
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: bool = True,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """attempt번째(0부터) 재시도 전 대기 시간.
+
+        서버가 retry_after를 알려주면 그보다 짧게 기다리지 않는다.
+        """
+        backoff = min(self.max_delay, self.base_delay * (2**attempt))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        if retry_after is not None:
+            backoff = max(backoff, retry_after)
+        return backoff
+
+
+class RateLimiter:
+    """퍼블리셔들이 공유하는 플랫폼별 토큰 버킷과 재시도 스케줄러."""
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[int, float]] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """RateLimiter 초기화.
+
+        Args:
+            limits: 플랫폼 → (기간당 게시 수, 기간 초). 없는 플랫폼은 DEFAULT_LIMITS
+            retry_policy: 재시도 정책
+            clock: 단조 증가 시계 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "RateLimiter":
+        """rate_limits 설정으로 생성.
+
+        rate_limits:
+          x: {requests: 100, window: 86400}
+          max_retries: 3
+          base_delay: 2
+          max_delay: 300
+        """
+        rate_config = config.get("rate_limits", {})
+        limits = {
+            platform: (int(value["requests"]), float(value.get("window", 24 * 3600)))
+            for platform, value in rate_config.items()
+            if isinstance(value, dict)
+        }
+        policy = RetryPolicy(
+            max_retries=int(rate_config.get("max_retries", DEFAULT_MAX_RETRIES)),
+            base_delay=float(rate_config.get("base_delay", DEFAULT_BASE_DELAY)),
+            max_delay=float(rate_config.get("max_delay", DEFAULT_MAX_DELAY)),
+        )
+        return cls(limits, policy)
+
+    def bucket(self, platform: str) -> TokenBucket:
+        """플랫폼 토큰 버킷 (처음 요청 시 생성)."""
+        with self._lock:
+            if platform not in self._buckets:
+                capacity, window = self.limits.get(platform, DEFAULT_LIMIT)
+                self._buckets[platform] = TokenBucket(capacity, window, clock=self._clock)
+            return self._buckets[platform]
+
+    def update(
+        self, platform: str, remaining: int | None = None, reset_after: float | None = None
+    ) -> None:
+        """응답 헤더 등 서버 정보로 플랫폼 버킷 보정."""
+        self.bucket(platform).update(remaining, reset_after)
+
+    def acquire(self, platform: str, deadline: float | None = None) -> float:
+        """토큰 하나를 얻을 때까지 대기 후 대기한 시간(초) 반환.
+
+        Args:
+            platform: 플랫폼 이름
+            deadline: 이 시각(clock 기준)까지 토큰을 얻을 수 없으면 바로 실패
+
+        Raises:
+            RateLimitError: deadline 안에 토큰을 얻을 수 없을 때
+        """
+        bucket = self.bucket(platform)
+        waited = 0.0
+        while True:
+            # 이미 deadline이 지났으면 토큰을 쓰지 않고 실패
+            self._check_deadline(platform, deadline)
+            wait = bucket.try_acquire()
+            if wait <= 0:
+                return waited
+            if deadline is not None and self._clock() + wait > deadline:
+                raise RateLimitError(
+                    f"{platform} rate limit: next slot in {wait:.0f}s", retry_after=wait
+                )
+            self._sleep(wait)
+            waited += wait
+
+    def call(self, platform: str, fn: Callable, *args, deadline: float | None = None, **kwargs):
+        """한도 안에서 fn 실행, RetryableError는 백오프 후 재시도.
+
+        Args:
+            platform: 플랫폼 이름
+            fn: 실행할 함수 (보통 publisher.publish)
+            deadline: 대기/재시도가 이 시각(clock 기준)을 넘기면 포기
+
+        Raises:
+            RetryableError: 재시도 횟수 또는 deadline을 넘겼을 때 마지막 에러
+        """
+        attempt = 0
+        while True:
+            self.acquire(platform, deadline)
+            self._check_deadline(platform, deadline)
+            try:
+                return fn(*args, **kwargs)
+            except RetryableError as e:
+                if attempt >= self.retry_policy.max_retries:
+                    raise
+
+                delay = self.retry_policy.delay(attempt, e.retry_after)
+                if deadline is not None and self._clock() + delay > deadline:
+                    raise
+                print(
+                    f"  ⏳ {platform}: {e} → {delay:.1f}초 후 재시도 "
+                    f"({attempt + 1}/{self.retry_policy.max_retries})"
+                )
+                self._sleep(delay)
+                attempt += 1
+
+    def _check_deadline(self, platform: str, deadline: float | None) -> None:
+        """deadline이 지났으면 RateLimitError (게시를 시작하지 않음)."""
+        if deadline is not None and self._clock() >= deadline:
+            raise RateLimitError(f"{platform}: deadline passed before posting", retry_after=0.0)
+
+    def schedule(self, platform: str, count: int) -> list[float]:
+        """count개 게시를 한도 안에서 처리할 때 각 게시의 예상 지연 (초)."""
+        return self.bucket(platform).schedule(count)
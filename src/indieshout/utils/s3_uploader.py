@@ -1,12 +1,50 @@
-"""AWS S3 이미지 업로드 유틸리티."""
+"""AWS S3 이미지/미디어 업로드 유틸리티."""
 
+import math
 import mimetypes
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from indieshout.utils.media_stream import (
+    DEFAULT_RESUME_DIR,
+    MultipartResumeState,
+    part_size_for,
+    read_part,
+)
+from indieshout.utils.upload_manifest import compute_s3_etag
+
+MB = 1024 * 1024
+DEFAULT_UPLOAD_WORKERS = 8  # 동시에 업로드할 파일 수
+DEFAULT_MULTIPART_THRESHOLD_MB = 8  # 이 크기 이상이면 멀티파트 업로드
+DEFAULT_MULTIPART_CHUNKSIZE_MB = 8
+DEFAULT_MAX_CONCURRENCY = 4  # 파일 하나당 동시 파트 업로드 수
+DEFAULT_RESUMABLE_THRESHOLD_MB = 256  # 이 크기 이상은 재개 가능한 멀티파트 업로드 (upload_large)
+
+# (로컬 경로, 누적 전송 바이트, 전체 바이트)
+ProgressCallback = Callable[[str, int, int], None]
+
+
+class S3BatchUploadError(RuntimeError):
+    """일부 파일 업로드 실패.
+
+    Attributes:
+        url_map: 업로드에 성공한 로컬 경로 → URL 매핑
+        errors: 실패한 로컬 경로 → 예외 매핑
+    """
+
+    def __init__(self, url_map: dict[str, str], errors: dict[str, Exception]):
+        self.url_map = url_map
+        self.errors = errors
+        super().__init__(f"S3 업로드 실패: {len(errors)}개 파일")
+
 
 class S3Uploader:
     """S3에 파일을 업로드하는 클래스."""
@@ -15,7 +53,9 @@ class S3Uploader:
         """S3Uploader 초기화.
 
         Args:
-            config: S3 설정 (access_key_id, secret_access_key, bucket_name, region)
+            config: S3 설정 (access_key_id, secret_access_key, bucket_name, region,
+                upload_workers, multipart_threshold_mb, multipart_chunksize_mb,
+                max_concurrency, resumable_threshold_mb, resume_dir)
         """
         s3_config = config.get("s3", {})
         self.bucket_name = s3_config.get("bucket_name")
@@ -24,12 +64,33 @@ class S3Uploader:
         if not self.bucket_name:
             raise ValueError("S3 bucket_name이 설정되지 않았습니다")
 
-        # boto3 S3 클라이언트 생성
+        self.upload_workers = int(s3_config.get("upload_workers", DEFAULT_UPLOAD_WORKERS))
+        max_concurrency = int(s3_config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
+        self.max_concurrency = max_concurrency
+        self.resumable_threshold = int(
+            s3_config.get("resumable_threshold_mb", DEFAULT_RESUMABLE_THRESHOLD_MB) * MB
+        )
+        self.resume_dir = Path(s3_config.get("resume_dir", DEFAULT_RESUME_DIR))
+
+        # 모든 업로드가 공유하는 전송 설정 (큰 파일은 멀티파트)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=int(
+                s3_config.get("multipart_threshold_mb", DEFAULT_MULTIPART_THRESHOLD_MB) * MB
+            ),
+            multipart_chunksize=int(
+                s3_config.get("multipart_chunksize_mb", DEFAULT_MULTIPART_CHUNKSIZE_MB) * MB
+            ),
+            max_concurrency=max_concurrency,
+        )
+
+        # boto3 S3 클라이언트 생성 (스레드 간 공유, 동시 업로드 수만큼 커넥션 풀 확보)
         self.s3_client = boto3.client(
             "s3",
             aws_access_key_id=s3_config.get("access_key_id"),
             aws_secret_access_key=s3_config.get("secret_access_key"),
             region_name=self.region,
+            endpoint_url=s3_config.get("endpoint_url"),
+            config=Config(max_pool_connections=max(10, self.upload_workers * max_concurrency)),
         )
 
     def upload_file(
@@ -37,6 +98,7 @@ class S3Uploader:
         file_path: str | Path,
         s3_key: str | None = None,
         content_type: str | None = None,
+        callback: Callable[[int], None] | None = None,
     ) -> str:
         """파일을 S3에 업로드하고 URL 반환.
 
@@ -44,6 +106,7 @@ class S3Uploader:
             file_path: 업로드할 파일 경로
             s3_key: S3 객체 키 (None이면 파일명 사용)
             content_type: MIME 타입 (None이면 자동 감지)
+            callback: 전송된 바이트 수를 받는 콜백 (boto3 Callback)
 
         Returns:
             업로드된 파일의 공개 URL
@@ -67,6 +130,10 @@ class S3Uploader:
             if content_type is None:
                 content_type = "application/octet-stream"
 
+        # 큰 파일(동영상 등)은 중단돼도 이어 올릴 수 있는 멀티파트 업로드
+        if file_path.stat().st_size >= self.resumable_threshold:
+            return self.upload_large(file_path, s3_key, content_type=content_type, callback=callback)
+
         # S3 업로드
         try:
             extra_args = {
@@ -79,15 +146,242 @@ class S3Uploader:
                 self.bucket_name,
                 s3_key,
                 ExtraArgs=extra_args,
+                Config=self.transfer_config,
+                Callback=callback,
             )
 
-            # 공개 URL 생성
-            url = f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{s3_key}"
-            return url
+            return self.get_url(s3_key)
 
         except ClientError as e:
             raise RuntimeError(f"S3 업로드 실패: {e}") from e
 
+    def upload_large(
+        self,
+        file_path: str | Path,
+        s3_key: str | None = None,
+        content_type: str | None = None,
+        callback: Callable[[int], None] | None = None,
+    ) -> str:
+        """큰 파일을 재개 가능한 멀티파트 업로드로 스트리밍하고 URL 반환.
+
+        파트는 업로드할 때 하나씩 읽고 최대 max_concurrency개만 동시에 전송하므로
+        메모리 사용량은 파일 크기와 관계없이 파트 크기 × max_concurrency 이하다.
+        완료한 파트는 resume_dir의 상태 파일에 기록되며, 중단된 업로드를 같은
+        파일/키로 다시 호출하면 S3에 남아 있는 파트는 건너뛰고 나머지만 올린다.
+
+        Args:
+            file_path: 업로드할 파일 경로
+            s3_key: S3 객체 키 (None이면 파일명 사용)
+            content_type: MIME 타입 (None이면 자동 감지)
+            callback: 전송된 바이트 수를 받는 콜백
+
+        Returns:
+            업로드된 파일의 공개 URL
+
+        Raises:
+            FileNotFoundError: 파일이 존재하지 않을 때
+            RuntimeError: 파트 업로드/완료 실패 시 (상태 파일은 남겨 다음 호출에서 재개)
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+        if s3_key is None:
+            s3_key = file_path.name
+        if content_type is None:
+            content_type = mimetypes.guess_type(str(file_path))[0] or "application/octet-stream"
+
+        size = file_path.stat().st_size
+        state = MultipartResumeState.for_upload(self.resume_dir, self.bucket_name, s3_key, file_path)
+        saved = state.load()
+        remote_parts = self._list_parts(s3_key, saved["upload_id"]) if saved else None
+
+        if saved and remote_parts is not None:
+            upload_id, part_size = saved["upload_id"], saved["part_size"]
+            # 상태 파일과 S3 양쪽에 같은 ETag로 있는 파트만 완료로 취급
+            parts = {n: etag for n, etag in remote_parts.items() if saved["parts"].get(n) == etag}
+        else:
+            if saved:
+                # 상태 파일의 업로드를 이어갈 수 없음: 남은 파트가 과금되지 않도록 정리
+                self._abort_upload(s3_key, saved["upload_id"])
+            part_size = part_size_for(size, self.transfer_config.multipart_chunksize)
+            try:
+                response = self.s3_client.create_multipart_upload(
+                    Bucket=self.bucket_name, Key=s3_key, ContentType=content_type
+                )
+            except ClientError as e:
+                raise RuntimeError(f"S3 멀티파트 업로드 시작 실패: {e}") from e
+            upload_id = response["UploadId"]
+            parts = {}
+            state.save(upload_id, part_size, parts)
+
+        part_count = max(1, math.ceil(size / part_size))
+        pending = [number for number in range(1, part_count + 1) if number not in parts]
+        if parts:
+            print(f"🔁 멀티파트 업로드 재개: {file_path.name} ({len(parts)}/{part_count} 파트 완료)")
+            if callback is not None:
+                callback(sum(min(part_size, size - (n - 1) * part_size) for n in parts))
+
+        lock = threading.Lock()
+
+        def upload_part(number: int) -> None:
+            # 파트는 전송 직전에 읽으므로 동시에 메모리에 있는 파트는 워커 수 이하
+            data = read_part(file_path, (number - 1) * part_size, part_size)
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=data,
+            )
+            with lock:
+                parts[number] = response["ETag"]
+                state.save(upload_id, part_size, parts)
+            if callback is not None:
+                callback(len(data))
+
+        # 동시에 진행 중인 파트를 workers개로 유지하고, 실패하면 새 파트는 시작하지 않음
+        errors: list[Exception] = []
+        if pending:
+            workers = min(self.max_concurrency, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-part") as executor:
+                in_flight: set = set()
+                for number in pending:
+                    if len(in_flight) >= workers:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        errors += [f.exception() for f in done if f.exception()]
+                        if errors:
+                            break
+                    in_flight.add(executor.submit(upload_part, number))
+                done, _ = wait(in_flight)
+                errors += [f.exception() for f in done if f.exception()]
+        if errors:
+            raise RuntimeError(
+                f"S3 멀티파트 업로드 중단 ({len(parts)}/{part_count} 파트 완료, "
+                f"다시 실행하면 이어서 업로드): {errors[0]}"
+            ) from errors[0]
+
+        try:
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [{"PartNumber": n, "ETag": parts[n]} for n in sorted(parts)]
+                },
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "NoSuchUpload":
+                state.delete()  # 만료/취소된 업로드는 다음 호출에서 새로 시작
+            raise RuntimeError(f"S3 멀티파트 업로드 완료 실패: {e}") from e
+
+        state.delete()
+        return self.get_url(s3_key)
+
+    def _list_parts(self, s3_key: str, upload_id: str) -> dict[int, str] | None:
+        """S3에 올라간 파트 번호 → ETag (업로드가 없으면 None).
+
+        Raises:
+            RuntimeError: 업로드가 없는 경우(NoSuchUpload) 외의 조회 실패 시
+                (권한/네트워크 오류로 진행 중인 업로드를 버리지 않도록)
+        """
+        parts: dict[int, str] = {}
+        marker = 0
+        try:
+            while True:
+                response = self.s3_client.list_parts(
+                    Bucket=self.bucket_name, Key=s3_key, UploadId=upload_id, PartNumberMarker=marker
+                )
+                for part in response.get("Parts", []):
+                    parts[part["PartNumber"]] = part["ETag"]
+                if not response.get("IsTruncated"):
+                    return parts
+                marker = int(response["NextPartNumberMarker"])
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "NoSuchUpload":
+                return None
+            raise RuntimeError(f"S3 멀티파트 파트 조회 실패: {e}") from e
+
+    def _abort_upload(self, s3_key: str, upload_id: str) -> None:
+        """멀티파트 업로드 취소 (이미 없으면 무시)."""
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=s3_key, UploadId=upload_id
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                print(f"⚠️ 이전 멀티파트 업로드 취소 실패 ({upload_id}): {e}")
+
+    def upload_many(
+        self,
+        files: dict[str, str],
+        progress_callback: ProgressCallback | None = None,
+    ) -> dict[str, str]:
+        """여러 파일을 동시에 S3에 업로드.
+
+        하나의 boto3 클라이언트와 전송 설정을 공유하며, 최대 upload_workers개
+        파일을 동시에 올린다. 큰 파일은 TransferConfig에 따라 멀티파트로 전송된다.
+
+        Args:
+            files: 로컬 경로 → S3 키 매핑
+            progress_callback: (로컬 경로, 누적 전송 바이트, 전체 바이트) 콜백
+
+        Returns:
+            로컬 경로 → 공개 URL 매핑 (입력 순서 유지)
+
+        Raises:
+            S3BatchUploadError: 일부 파일 업로드 실패 시 (성공분은 url_map에 포함)
+        """
+        if not files:
+            return {}
+
+        def upload(file_path: str, s3_key: str) -> str:
+            callback = None
+            if progress_callback is not None:
+                callback = self._make_progress_callback(file_path, progress_callback)
+            return self.upload_file(file_path, s3_key, callback=callback)
+
+        results: dict[str, str] = {}
+        errors: dict[str, Exception] = {}
+        workers = min(self.upload_workers, len(files))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-upload") as executor:
+            futures = {
+                file_path: executor.submit(upload, str(file_path), s3_key)
+                for file_path, s3_key in files.items()
+            }
+            for file_path, future in futures.items():
+                try:
+                    results[file_path] = future.result()
+                except Exception as e:
+                    errors[file_path] = e
+
+        if errors:
+            raise S3BatchUploadError(results, errors)
+
+        return results
+
+    def get_url(self, s3_key: str) -> str:
+        """S3 객체의 공개 URL 반환."""
+        return f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{s3_key}"
+
+    def _make_progress_callback(
+        self, file_path: str, progress_callback: ProgressCallback
+    ) -> Callable[[int], None]:
+        """boto3의 증분 바이트 콜백을 누적 진행률 콜백으로 변환."""
+        total = Path(file_path).stat().st_size
+        transferred = 0
+        lock = threading.Lock()
+
+        def callback(bytes_amount: int) -> None:
+            nonlocal transferred
+            # 멀티파트 업로드 시 여러 스레드에서 호출됨
+            with lock:
+                transferred += bytes_amount
+                current = transferred
+            progress_callback(file_path, current, total)
+
+        return callback
+
     def upload_multiple(
         self,
         file_paths: list[str | Path],
@@ -102,14 +396,18 @@ class S3Uploader:
         Returns:
             업로드된 파일들의 URL 리스트
         """
-        urls = []
+        files = {}
         for file_path in file_paths:
             file_path = Path(file_path)
             s3_key = f"{s3_prefix}/{file_path.name}" if s3_prefix else file_path.name
-            url = self.upload_file(file_path, s3_key)
-            urls.append(url)
+            files[str(file_path)] = s3_key
 
-        return urls
+        try:
+            url_map = self.upload_many(files)
+        except S3BatchUploadError as e:
+            # 기존 동작과 같이 첫 번째 실패 원인을 그대로 전달
+            raise next(iter(e.errors.values())) from e
+        return list(url_map.values())
 
     def delete_file(self, s3_key: str) -> None:
         """S3에서 파일 삭제.
@@ -139,3 +437,50 @@ class S3Uploader:
             return True
         except ClientError:
             return False
+
+    def get_etag(self, s3_key: str) -> str | None:
+        """S3 객체의 ETag 반환 (따옴표 제외, 없으면 None).
+
+        Args:
+            s3_key: 확인할 S3 객체 키
+
+        Returns:
+            ETag 문자열 또는 None
+        """
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError:
+            return None
+        return response.get("ETag", "").strip('"') or None
+
+    def head_many(self, s3_keys: list[str]) -> dict[str, str | None]:
+        """여러 객체의 ETag를 동시에 조회.
+
+        Args:
+            s3_keys: 확인할 S3 객체 키 리스트
+
+        Returns:
+            S3 키 → ETag (없으면 None) 매핑
+        """
+        if not s3_keys:
+            return {}
+
+        workers = min(self.upload_workers, len(s3_keys))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-head") as executor:
+            etags = list(executor.map(self.get_etag, s3_keys))
+
+        return dict(zip(s3_keys, etags))
+
+    def local_etag(self, file_path: str | Path) -> str:
+        """현재 전송 설정으로 업로드했을 때 S3가 부여할 ETag 계산."""
+        size = Path(file_path).stat().st_size
+        if size >= self.resumable_threshold:
+            # upload_large는 항상 멀티파트이며 파트 크기는 파일 크기에 따라 정해짐
+            return compute_s3_etag(
+                file_path, 0, part_size_for(size, self.transfer_config.multipart_chunksize)
+            )
+        return compute_s3_etag(
+            file_path,
+            self.transfer_config.multipart_threshold,
+            self.transfer_config.multipart_chunksize,
+        )
@@ -0,0 +1,292 @@
+"""SNS 첨부 이미지를 플랫폼 규격에 맞게 변환.
+
+퍼블리셔는 IMAGE_SPEC(장수, 파일 크기, 가로 폭, 비율 한도)을 선언하고, 어댑터는
+포스트 이미지 앞에서부터 N장을 골라 플랫폼마다 다음을 적용한다.
+
+    1. 비율이 한도를 벗어나면 가운데 기준으로 잘라냄 (예: 긴 스크린샷 → 4:5)
+    2. max_width 이하로 축소하고 메타데이터 제거
+    3. JPEG/WebP로 인코딩하며 max_bytes 이하가 되는 가장 높은 품질을 이진 탐색
+       (최저 품질로도 넘으면 더 축소)
+
+모든 플랫폼의 변환은 프로세스 풀에서 함께 실행하고, 결과는 폴더별 파생 이미지
+캐시에 (원본 해시, 규격)으로 보관한다. Pillow가 필요하다 (pip install 'indieshout[images]').
+"""
+
+import io
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from indieshout.utils.derivative_cache import DerivativeCache
+from indieshout.utils.image_optimizer import process_pool_context
+
+ADAPT_VERSION = 1  # 변환 결과가 달라지도록 코드를 바꾸면 올림 (캐시 무효화)
+MIN_WIDTH = 320  # 크기 한도를 맞추려고 축소할 때의 최소 폭
+SHRINK_STEP = 0.8  # 최저 품질로도 한도를 넘을 때 한 번에 줄이는 비율
+
+_PIL_FORMATS = {"jpeg": ("JPEG", "jpg"), "webp": ("WEBP", "webp")}
+
+
+@dataclass(frozen=True)
+class ImageSpec:
+    """플랫폼 첨부 이미지 규격.
+
+    Attributes:
+        max_images: 게시물당 최대 장수
+        max_bytes: 파일 크기 한도
+        max_width: 가로 폭 한도 (px)
+        min_aspect: 최소 가로/세로 비율 (이보다 세로로 길면 잘라냄, None이면 제한 없음)
+        max_aspect: 최대 가로/세로 비율 (이보다 가로로 길면 잘라냄, None이면 제한 없음)
+        format: 인코딩 형식 (jpeg | webp)
+        quality: 시작 품질 (한도 안이면 그대로 사용)
+        min_quality: 품질 탐색 하한
+        public_url: True면 파일 대신 공개 URL로 첨부 (변환한 파일을 S3에 업로드)
+    """
+
+    max_images: int
+    max_bytes: int
+    max_width: int = 2048
+    min_aspect: float | None = None
+    max_aspect: float | None = None
+    format: str = "jpeg"
+    quality: int = 85
+    min_quality: int = 40
+    public_url: bool = False
+
+    def __post_init__(self) -> None:
+        if self.format not in _PIL_FORMATS:
+            raise ValueError(f"Unsupported SNS image format: {self.format}")
+
+
+def _cropped(image, min_aspect: float | None, max_aspect: float | None):
+    """비율이 한도를 벗어나면 가운데 기준으로 잘라냄."""
+    ratio = image.width / image.height
+    if min_aspect and ratio < min_aspect:
+        height = round(image.width / min_aspect)
+        top = (image.height - height) // 2
+        return image.crop((0, top, image.width, top + height))
+    if max_aspect and ratio > max_aspect:
+        width = round(image.height * max_aspect)
+        left = (image.width - width) // 2
+        return image.crop((left, 0, left + width, image.height))
+    return image
+
+
+def _encode(image, pil_format: str, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    options = {"quality": quality}
+    if pil_format == "JPEG":
+        options.update(optimize=True, progressive=True)
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def _encode_under(image, pil_format: str, max_bytes: int, quality: int, min_quality: int) -> bytes | None:
+    """max_bytes 이하가 되는 가장 높은 품질로 인코딩 (최저 품질로도 넘으면 None)."""
+    data = _encode(image, pil_format, quality)
+    if len(data) <= max_bytes:
+        return data
+
+    best = None
+    low, high = min_quality, quality - 1
+    while low <= high:
+        middle = (low + high) // 2
+        data = _encode(image, pil_format, middle)
+        if len(data) <= max_bytes:
+            best, low = data, middle + 1
+        else:
+            high = middle - 1
+    return best
+
+
+def adapt_image(image_path: str, output_dir: str, spec: ImageSpec) -> dict:
+    """이미지 하나를 플랫폼 규격으로 변환.
+
+    크기 한도 안의 GIF는 애니메이션을 유지하도록 그대로 복사한다.
+
+    Args:
+        image_path: 원본 이미지 경로
+        output_dir: 결과 디렉토리
+        spec: 플랫폼 이미지 규격
+
+    Returns:
+        {"path", "files", "original_bytes", "bytes"} (optimize_image()와 같은 형태)
+
+    Raises:
+        ValueError: 최소 폭까지 줄여도 크기 한도를 넘을 때
+    """
+    from PIL import Image, ImageOps
+
+    source = Path(image_path)
+    target_dir = Path(output_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    original_bytes = source.stat().st_size
+
+    if source.suffix.lower() == ".gif" and original_bytes <= spec.max_bytes:
+        target = target_dir / source.name
+        shutil.copyfile(source, target)
+        return {"path": str(target), "files": [str(target)], "original_bytes": original_bytes, "bytes": original_bytes}
+
+    pil_format, suffix = _PIL_FORMATS[spec.format]
+    with Image.open(source) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image = _cropped(image, spec.min_aspect, spec.max_aspect)
+        if image.width > spec.max_width:
+            height = round(image.height * spec.max_width / image.width)
+            image = image.resize((spec.max_width, height), Image.Resampling.LANCZOS)
+        if pil_format == "JPEG" or image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if pil_format == "WEBP" else "RGB")
+
+        data = _encode_under(image, pil_format, spec.max_bytes, spec.quality, spec.min_quality)
+        while data is None and image.width > MIN_WIDTH:
+            width = max(MIN_WIDTH, round(image.width * SHRINK_STEP))
+            image = image.resize((width, round(image.height * width / image.width)), Image.Resampling.LANCZOS)
+            data = _encode_under(image, pil_format, spec.max_bytes, spec.quality, spec.min_quality)
+
+    if data is None:
+        raise ValueError(f"Cannot fit {source.name} under {spec.max_bytes} bytes")
+
+    target = target_dir / f"{source.stem}.{suffix}"
+    target.write_bytes(data)
+    return {"path": str(target), "files": [str(target)], "original_bytes": original_bytes, "bytes": len(data)}
+
+
+class SnsImageAdapter:
+    """플랫폼별 SNS 첨부 이미지 변환기."""
+
+    def __init__(self, workers: int | None = None, cache_max_mb: float | None = None):
+        """SnsImageAdapter 초기화.
+
+        Args:
+            workers: 프로세스 수 (기본: CPU 코어 수)
+            cache_max_mb: 폴더별 파생 이미지 캐시 크기 한도 (MB, 기본 200)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_max_bytes = int(cache_max_mb * 1024 * 1024) if cache_max_mb is not None else None
+
+    @classmethod
+    def from_config(cls, config: dict) -> "SnsImageAdapter | None":
+        """설정에서 변환기 생성 (images.sns_adapt가 꺼져 있거나 Pillow가 없으면 None).
+
+        config.yaml 예시:
+            images:
+              sns_adapt: true
+              workers: 4
+              cache_max_mb: 200
+        """
+        from indieshout.utils.image_optimizer import pillow_available
+
+        images_config = config.get("images") or {}
+        if not images_config.get("sns_adapt", False):
+            return None
+        if not pillow_available():
+            print("⚠️ Pillow가 없어 SNS 이미지 변환을 건너뜁니다 (pip install 'indieshout[images]')")
+            return None
+
+        workers = images_config.get("workers")
+        return cls(
+            workers=int(workers) if workers else None,
+            cache_max_mb=images_config.get("cache_max_mb"),
+        )
+
+    def cache_for(self, folder: str | Path) -> DerivativeCache:
+        """포스트 폴더의 파생 이미지 캐시."""
+        return DerivativeCache.for_folder(folder, self.cache_max_bytes)
+
+    def adapt(
+        self,
+        image_paths: list[str],
+        specs: dict[str, ImageSpec],
+        cache: DerivativeCache | None = None,
+        output_dir: str | Path | None = None,
+    ) -> dict[str, list[str]]:
+        """플랫폼별로 앞에서부터 max_images장을 규격에 맞게 변환.
+
+        플랫폼 규격이 같으면 변환은 한 번만 한다. 변환에 실패한 이미지는 경고 후
+        제외한다.
+
+        Args:
+            image_paths: 원본 이미지 경로 (포스트 순서)
+            specs: 플랫폼 이름 → 이미지 규격
+            cache: 파생 이미지 캐시
+            output_dir: 결과 디렉토리 (cache가 없을 때, 플랫폼별 하위 디렉토리 사용)
+
+        Returns:
+            플랫폼 이름 → 변환된 이미지 경로 리스트
+
+        Raises:
+            ValueError: output_dir와 cache가 모두 없을 때
+        """
+        if output_dir is None and cache is None:
+            raise ValueError("output_dir or cache is required")
+
+        # (원본, 규격)마다 결과 위치를 정하고 캐시에 없는 것만 변환 대상으로
+        selected: dict[str, list[tuple[str, str]]] = {}
+        results: dict[str, dict] = {}
+        pending: dict[str, tuple[str, str, ImageSpec]] = {}
+        for platform, spec in specs.items():
+            selected[platform] = []
+            for image_path in image_paths[: spec.max_images]:
+                if cache is None:
+                    task = f"{platform}:{image_path}"
+                    target_dir = str(Path(output_dir) / platform)
+                else:
+                    params = {**asdict(spec), "name": Path(image_path).name, "version": ADAPT_VERSION}
+                    try:
+                        task = cache.key(image_path, params)
+                    except OSError as e:
+                        print(f"⚠️ 이미지를 읽을 수 없어 {platform} SNS 첨부에서 제외합니다: {e}")
+                        continue
+                    target_dir = str(cache.entry_dir(task))
+                selected[platform].append((image_path, task))
+                if task in results or task in pending:
+                    continue
+                cached = cache.get(task) if cache is not None else None
+                if cached is not None:
+                    results[task] = cached
+                else:
+                    pending[task] = (image_path, target_dir, spec)
+
+        cache_hits = len(results)
+        errors: dict[str, Exception] = {}
+        if len(pending) <= 1 or self.workers <= 1:
+            for task, (image_path, target_dir, spec) in pending.items():
+                try:
+                    results[task] = adapt_image(image_path, target_dir, spec)
+                except Exception as e:
+                    errors[task] = e
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(pending)), mp_context=process_pool_context()
+            ) as executor:
+                futures = {
+                    task: executor.submit(adapt_image, image_path, target_dir, spec)
+                    for task, (image_path, target_dir, spec) in pending.items()
+                }
+                for task, future in futures.items():
+                    try:
+                        results[task] = future.result()
+                    except Exception as e:
+                        errors[task] = e
+
+        for task, error in errors.items():
+            print(f"⚠️ SNS 이미지 변환 실패 ({Path(pending[task][0]).name}): {error}")
+
+        if cache is not None:
+            for task in pending:
+                if task in results:
+                    cache.put(task, results[task])
+            if pending:
+                cache.prune(keep=set(results))
+
+        adapted = {
+            platform: [results[task]["path"] for _, task in items if task in results]
+            for platform, items in selected.items()
+        }
+        if adapted:
+            summary = ", ".join(f"{platform} {len(paths)}장" for platform, paths in adapted.items())
+            cached_note = f" (캐시 {cache_hits}장)" if cache_hits else ""
+            print(f"📐 SNS 이미지 변환: {summary}{cached_note}")
+        return adapted
@@ -0,0 +1,237 @@
+"""번역 백엔드.
+
+translator.provider 설정으로 선택한다.
+    - claude-code: 호출마다 `claude -p` 프로세스 실행 (기본값)
+    - anthropic: Anthropic Messages API (HTTP 커넥션 재사용)
+    - stub: 결정적인 로컬 가짜 번역 (테스트용)
+"""
+
+import json
+import os
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+
+import httpx
+
+DEFAULT_PROVIDER = "claude-code"
+DEFAULT_TIMEOUT = 180.0  # 초
+ANTHROPIC_API_BASE = "https://api.anthropic.com"
+ANTHROPIC_API_VERSION = "2023-06-01"
+DEFAULT_ANTHROPIC_MODEL = "claude-sonnet-4-5"
+DEFAULT_MAX_TOKENS = 8192
+
+
+def build_translate_prompt(text: str, source_lang: str, target_lang: str) -> str:
+    """단일 텍스트 번역 프롬프트."""
+    return f"""Translate the following {source_lang} text to {target_lang}.
+Preserve markdown formatting, links, and code blocks.
+Keep placeholders like ⟦URL0⟧ exactly as they are.
+Only return the translated text, no explanations.
+
+Text to translate:
+{text}
+"""
+
+
+def build_batch_prompt(texts: list[str], source_lang: str, target_lang: str) -> str:
+    """문자열 리스트 일괄 번역 프롬프트 (JSON 배열)."""
+    return f"""Translate each string in the following JSON array from {source_lang} to {target_lang}.
+Return only a JSON array of the translated strings, with exactly {len(texts)} items in the same order.
+No explanations.
+
+{json.dumps(texts, ensure_ascii=False)}
+"""
+
+
+def parse_batch_response(response: str, expected: int) -> list[str]:
+    """일괄 번역 응답에서 JSON 배열 추출.
+
+    Raises:
+        ValueError: 배열을 찾을 수 없거나 길이/형식이 맞지 않을 때
+    """
+    start = response.find("[")
+    end = response.rfind("]")
+    if start == -1 or end < start:
+        raise ValueError("No JSON array in batch translation response")
+
+    items = json.loads(response[start : end + 1])
+    if (
+        not isinstance(items, list)
+        or len(items) != expected
+        or not all(isinstance(item, str) for item in items)
+    ):
+        raise ValueError("Batch translation response does not match request")
+
+    return [item.strip() for item in items]
+
+
+class TranslationBackend(ABC):
+    """번역 백엔드 인터페이스.
+
+    하위 클래스는 프롬프트를 실행하는 complete()만 구현하면 된다.
+    여러 스레드에서 동시에 호출될 수 있다.
+    """
+
+    @abstractmethod
+    def complete(self, prompt: str) -> str:
+        """프롬프트를 실행하고 응답 텍스트 반환.
+
+        Raises:
+            RuntimeError: 백엔드 호출 실패 시
+        """
+        ...
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        """텍스트 하나 번역."""
+        return self.complete(build_translate_prompt(text, source_lang, target_lang))
+
+    def translate_batch(self, texts: list[str], source_lang: str, target_lang: str) -> list[str]:
+        """문자열 리스트를 한 번의 요청으로 번역.
+
+        Raises:
+            ValueError: 응답을 해석할 수 없을 때
+        """
+        response = self.complete(build_batch_prompt(texts, source_lang, target_lang))
+        return parse_batch_response(response, len(texts))
+
+    def close(self) -> None:
+        """백엔드 리소스 정리."""
+
+
+class ClaudeCodeBackend(TranslationBackend):
+    """Claude Code -p 옵션을 사용하는 백엔드 (호출마다 프로세스 실행)."""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
+        self.timeout = timeout
+
+    def complete(self, prompt: str) -> str:
+        try:
+            # 중첩 세션 방지를 위해 CLAUDECODE 환경변수 제거
+            env = os.environ.copy()
+            env.pop("CLAUDECODE", None)
+
+            # Claude Code -p 실행
+            result = subprocess.run(
+                ["claude", "-p", prompt],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                check=True,
+                env=env,
+            )
+
+            return result.stdout.strip()
+
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Translation timeout ({self.timeout:g}s)")
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Translation failed: {e.stderr}")
+        except Exception as e:
+            raise RuntimeError(f"Translation error: {e}")
+
+
+class AnthropicBackend(TranslationBackend):
+    """Anthropic Messages API 백엔드.
+
+    하나의 httpx.Client를 계속 사용하므로 호출마다 프로세스를 띄우거나
+    TLS 연결을 새로 맺는 비용이 없다.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = DEFAULT_ANTHROPIC_MODEL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        if not api_key:
+            raise ValueError("Anthropic api_key is required")
+
+        self.model = model
+        self.max_tokens = max_tokens
+        self._client = httpx.Client(
+            base_url=ANTHROPIC_API_BASE,
+            headers={
+                "x-api-key": api_key,
+                "anthropic-version": ANTHROPIC_API_VERSION,
+            },
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+            transport=transport,
+        )
+
+    def complete(self, prompt: str) -> str:
+        try:
+            response = self._client.post(
+                "/v1/messages",
+                json={
+                    "model": self.model,
+                    "max_tokens": self.max_tokens,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            )
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"Translation error: {e}")
+
+        if response.status_code != 200:
+            raise RuntimeError(f"Translation failed: {response.status_code} {response.text}")
+
+        blocks = response.json().get("content", [])
+        return "".join(block.get("text", "") for block in blocks if block.get("type") == "text").strip()
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class StubBackend(TranslationBackend):
+    """결정적인 가짜 번역 백엔드 (테스트/dry-run용).
+
+    "[대상 언어] 원문" 형태로 돌려주며, 받은 텍스트를 requests에 기록한다.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+
+    def _record(self, texts: list[str]) -> None:
+        with self._lock:
+            self.requests.extend(texts)
+
+    def complete(self, prompt: str) -> str:
+        self._record([prompt])
+        return prompt
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        self._record([text])
+        return f"[{target_lang}] {text}"
+
+    def translate_batch(self, texts: list[str], source_lang: str, target_lang: str) -> list[str]:
+        self._record(texts)
+        return [f"[{target_lang}] {text}" for text in texts]
+
+
+def create_backend(config: dict) -> TranslationBackend:
+    """translator.provider 설정에 맞는 백엔드 생성.
+
+    Raises:
+        ValueError: 알 수 없는 provider일 때
+    """
+    translator_config = config.get("translator", {})
+    provider = translator_config.get("provider", DEFAULT_PROVIDER)
+    timeout = float(translator_config.get("timeout", DEFAULT_TIMEOUT))
+
+    if provider == "claude-code":
+        return ClaudeCodeBackend(timeout=timeout)
+    if provider == "anthropic":
+        return AnthropicBackend(
+            api_key=translator_config.get("api_key", ""),
+            model=translator_config.get("model", DEFAULT_ANTHROPIC_MODEL),
+            timeout=timeout,
+            max_tokens=int(translator_config.get("max_tokens", DEFAULT_MAX_TOKENS)),
+        )
+    if provider == "stub":
+        return StubBackend()
+
+    raise ValueError(f"Unknown translator provider: {provider}")
@@ -0,0 +1,180 @@
+"""번역 결과 캐시 (translation memory)."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+from indieshout.utils.translation_backends import DEFAULT_ANTHROPIC_MODEL, DEFAULT_PROVIDER
+
+DEFAULT_CACHE_PATH = ".indieshout/translations.sqlite3"
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키 계산용 텍스트 정규화.
+
+    유니코드 NFC 정규화, 줄바꿈 통일, 줄 끝 공백 및 앞뒤 공백 제거.
+    """
+    text = unicodedata.normalize("NFC", text)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = [line.rstrip() for line in text.split("\n")]
+    return "\n".join(lines).strip()
+
+
+def make_cache_key(source_lang: str, target_lang: str, text: str, namespace: str = "") -> str:
+    """(백엔드, 원본 언어, 대상 언어, 정규화된 텍스트 해시) 캐시 키.
+
+    namespace는 번역을 만든 백엔드(provider/model)로, 다른 백엔드의 번역을
+    돌려주지 않도록 키에 포함한다.
+    """
+    normalized = normalize_text(text)
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    key = f"{source_lang}:{target_lang}:{digest}"
+    return f"{namespace}|{key}" if namespace else key
+
+
+def backend_namespace(translator_config: dict) -> str:
+    """translator 설정의 provider/model로 캐시 namespace 계산."""
+    provider = translator_config.get("provider", DEFAULT_PROVIDER)
+    if provider == "anthropic":
+        return f"{provider}/{translator_config.get('model', DEFAULT_ANTHROPIC_MODEL)}"
+    return provider
+
+
+class TranslationCache:
+    """SQLite 기반 번역 캐시.
+
+    최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거한다 (LRU).
+    여러 스레드에서 동시에 사용할 수 있다.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        namespace: str = "",
+    ):
+        """TranslationCache 초기화.
+
+        DB 파일은 처음 사용할 때 생성된다.
+
+        Args:
+            path: SQLite 파일 경로
+            max_entries: 보관할 최대 번역 수
+            namespace: 번역 백엔드 식별자 (다른 백엔드와 캐시를 공유하지 않음)
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "TranslationCache | None":
+        """translator 설정으로 캐시 생성.
+
+        translator.cache가 false이거나 provider가 stub(가짜 번역)이면 None.
+        """
+        translator_config = config.get("translator", {})
+        if not translator_config.get("cache", True):
+            return None
+        if translator_config.get("provider", DEFAULT_PROVIDER) == "stub":
+            return None
+        return cls(
+            translator_config.get("cache_path", DEFAULT_CACHE_PATH),
+            int(translator_config.get("cache_max_entries", DEFAULT_MAX_ENTRIES)),
+            namespace=backend_namespace(translator_config),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS translations (
+                    key TEXT PRIMARY KEY,
+                    translation TEXT NOT NULL,
+                    last_used INTEGER NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(
+        self, source_lang: str, target_lang: str, text: str, stats: dict[str, int] | None = None
+    ) -> str | None:
+        """캐시된 번역 반환 (없으면 None).
+
+        stats를 주면 캐시 전체 통계와 별도로 그 dict의 hits/misses도 센다
+        (여러 스레드가 같은 캐시를 쓸 때 호출 단위 통계용).
+        """
+        key = make_cache_key(source_lang, target_lang, text, self.namespace)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT translation FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                if stats is not None:
+                    stats["misses"] = stats.get("misses", 0) + 1
+                return None
+
+            conn.execute(
+                "UPDATE translations SET last_used = ? WHERE key = ?",
+                (time.time_ns(), key),
+            )
+            conn.commit()
+            self.hits += 1
+            if stats is not None:
+                stats["hits"] = stats.get("hits", 0) + 1
+            return row[0]
+
+    def set(self, source_lang: str, target_lang: str, text: str, translation: str) -> None:
+        """번역 결과 저장 후 최대 항목 수를 넘으면 LRU 제거."""
+        key = make_cache_key(source_lang, target_lang, text, self.namespace)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO translations (key, translation, last_used) VALUES (?, ?, ?)",
+                (key, translation, time.time_ns()),
+            )
+            conn.execute(
+                """
+                DELETE FROM translations WHERE key IN (
+                    SELECT key FROM translations ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def stats(self) -> dict[str, int]:
+        """적중/미스 횟수 반환."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def reset_stats(self) -> None:
+        """적중/미스 횟수 초기화."""
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        """DB 연결 종료."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,17 +1,75 @@
 import re
-import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from indieshout.utils.markdown_segmenter import (
+    DEFAULT_MAX_CHUNK_CHARS,
+    join_segments,
+    protect_urls,
+    restore_urls,
+    split_markdown,
+)
+from indieshout.utils.translation_backends import (
+    ClaudeCodeBackend,
+    TranslationBackend,
+    create_backend,
+)
+from indieshout.utils.translation_cache import TranslationCache
+
+DEFAULT_WORKERS = 4  # 동시에 번역할 청크 수
+DEFAULT_MAX_RETRIES = 2  # 청크별 재시도 횟수
+DEFAULT_RETRY_DELAY = 1.0  # 재시도 간격 (초, 시도마다 증가)
+
 
 class Translator:
-    """Claude Code -p 옵션을 사용한 번역기."""
+    """마크다운 번역기 (기본 백엔드: Claude Code -p)."""
 
-    def __init__(self, source_lang: str = "ko", target_lang: str = "en"):
+    def __init__(
+        self,
+        source_lang: str = "ko",
+        target_lang: str = "en",
+        cache: TranslationCache | None = None,
+        backend: TranslationBackend | None = None,
+        max_workers: int = DEFAULT_WORKERS,
+        max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ):
         self.source_lang = source_lang
         self.target_lang = target_lang
+        self.cache = cache
+        self.backend = backend or ClaudeCodeBackend()
+        self.max_workers = max_workers
+        self.max_chunk_chars = max_chunk_chars
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    @classmethod
+    def from_config(cls, config: dict) -> "Translator":
+        """translator 설정으로 번역기 생성."""
+        translator_config = config.get("translator", {})
+        return cls(
+            source_lang=translator_config.get("source_lang", "ko"),
+            target_lang=translator_config.get("target_lang", "en"),
+            cache=TranslationCache.from_config(config),
+            backend=create_backend(config),
+            max_workers=int(translator_config.get("workers", DEFAULT_WORKERS)),
+            max_chunk_chars=int(translator_config.get("chunk_chars", DEFAULT_MAX_CHUNK_CHARS)),
+            max_retries=int(translator_config.get("max_retries", DEFAULT_MAX_RETRIES)),
+            retry_delay=float(translator_config.get("retry_delay", DEFAULT_RETRY_DELAY)),
+        )
 
-    def translate_markdown(self, markdown: str) -> str:
-        """마크다운 전체를 번역 (Front matter 포함)."""
+    def translate_markdown(self, markdown: str, stats: dict[str, int] | None = None) -> str:
+        """마크다운 전체를 번역 (Front matter 포함).
+
+        Args:
+            markdown: 번역할 마크다운
+            stats: 이 호출의 캐시 적중/미스를 셀 dict (예: {"hits": 0, "misses": 0})
+
+        Returns:
+            번역된 마크다운
+        """
         # Front matter와 본문 분리
         if markdown.startswith("---"):
             parts = markdown.split("---", 2)
@@ -20,115 +78,231 @@ class Translator:
                 body = parts[2].strip()
 
                 # Front matter 번역
-                translated_front_matter = self._translate_front_matter(front_matter)
+                translated_front_matter = self._translate_front_matter(front_matter, stats)
 
                 # 본문 번역
-                translated_body = self._translate_text(body)
+                translated_body = self._translate_body(body, stats)
 
                 # 재조합
                 return f"---\n{translated_front_matter}\n---\n\n{translated_body}"
 
         # Front matter 없으면 본문만 번역
-        return self._translate_text(markdown)
+        return self._translate_body(markdown, stats)
 
     def translate_text(self, text: str) -> str:
         """일반 텍스트 번역."""
         return self._translate_text(text)
 
-    def _translate_front_matter(self, front_matter: str) -> str:
-        """Front matter 번역 (title, tags, categories)."""
+    def _translate_body(self, body: str, stats: dict[str, int] | None = None) -> str:
+        """본문을 제목/문단 단위 청크로 나눠 동시에 번역 후 순서대로 재조합.
+
+        코드 블록, 이미지만 있는 줄, URL은 번역하지 않는다.
+        """
+        if not body or not body.strip():
+            return body
+
+        segments = split_markdown(body, self.max_chunk_chars)
+        indices = [i for i, segment in enumerate(segments) if segment.translatable]
+
+        if len(indices) <= 1 or self.max_workers <= 1:
+            for i in indices:
+                segments[i].text = self._translate_chunk(segments[i].text, stats)
+        else:
+            workers = min(self.max_workers, len(indices))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate") as executor:
+                futures = {
+                    i: executor.submit(self._translate_chunk, segments[i].text, stats)
+                    for i in indices
+                }
+                for i, future in futures.items():
+                    segments[i].text = future.result()
+
+        return join_segments(segments)
+
+    def _translate_chunk(self, text: str, stats: dict[str, int] | None = None) -> str:
+        """청크 하나를 번역 (URL 보호, 청크 단위 캐시 및 재시도).
+
+        Raises:
+            RuntimeError: 재시도 후에도 번역에 실패했을 때
+        """
+        masked, placeholders = protect_urls(text)
+
+        if self.cache is not None:
+            cached = self.cache.get(self.source_lang, self.target_lang, masked, stats)
+            if cached is not None:
+                return restore_urls(cached, placeholders)
+
+        last_error: Exception | None = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * attempt)
+            try:
+                translated = self._run_backend(masked)
+                missing = [token for token in placeholders if token not in translated]
+                if missing:
+                    raise ValueError(f"Translation dropped placeholders: {missing}")
+                break
+            except (RuntimeError, ValueError) as e:
+                last_error = e
+        else:
+            raise RuntimeError(
+                f"Chunk translation failed after {self.max_retries + 1} attempts: {last_error}"
+            )
+
+        if self.cache is not None:
+            self.cache.set(self.source_lang, self.target_lang, masked, translated)
+
+        return restore_urls(translated, placeholders)
+
+    def translate_batch(
+        self, texts: list[str], stats: dict[str, int] | None = None
+    ) -> list[str]:
+        """짧은 문자열 여러 개를 한 번의 요청으로 번역.
+
+        캐시에 없는 문자열만 JSON 배열로 묶어 보내고, 응답 배열을 위치 순서로
+        매핑한다. 응답을 해석할 수 없으면 항목별 번역으로 대체한다.
+
+        Args:
+            texts: 번역할 문자열 리스트
+            stats: 이 호출의 캐시 적중/미스를 셀 dict
+
+        Returns:
+            입력과 같은 순서의 번역 결과 리스트
+        """
+        results: list[str | None] = [None] * len(texts)
+        pending: list[str] = []
+
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = text
+                continue
+            if self.cache is not None:
+                cached = self.cache.get(self.source_lang, self.target_lang, text, stats)
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            if text not in pending:
+                pending.append(text)
+
+        if pending:
+            translated = self._translate_pending_batch(pending)
+            for i, text in enumerate(texts):
+                if results[i] is None:
+                    results[i] = translated[text]
+
+        return results
+
+    def _translate_pending_batch(self, texts: list[str]) -> dict[str, str]:
+        """캐시에 없는 문자열을 일괄 번역하고 캐시에 저장."""
+        if len(texts) == 1:
+            translations = [self._run_backend(texts[0])]
+        else:
+            try:
+                translations = self._run_backend_batch(texts)
+            except ValueError:
+                # 응답 형식이 어긋나면 항목별 번역
+                translations = [self._run_backend(text) for text in texts]
+
+        if self.cache is not None:
+            for text, translation in zip(texts, translations):
+                self.cache.set(self.source_lang, self.target_lang, text, translation)
+
+        return dict(zip(texts, translations))
+
+    def _translate_front_matter(
+        self, front_matter: str, stats: dict[str, int] | None = None
+    ) -> str:
+        """Front matter 번역 (title, tags, categories).
+
+        번역할 문자열을 모두 모아 한 번의 일괄 번역으로 처리한다.
+        """
         lines = front_matter.strip().split("\n")
-        translated_lines = []
 
-        for line in lines:
+        # 1. 번역 대상 수집: 줄 번호 → (키, 값 리스트)
+        fields: dict[int, tuple[str, list[str]]] = {}
+        for index, line in enumerate(lines):
             # title: "..." 번역
             if line.startswith("title:"):
                 match = re.match(r'title:\s*"(.+)"', line)
                 if match:
-                    title = match.group(1)
-                    translated_title = self._translate_text(title)
-                    translated_lines.append(f'title: "{translated_title}"')
-                else:
-                    translated_lines.append(line)
-
-            # tags: [...] 번역
-            elif line.startswith("tags:"):
-                match = re.match(r"tags:\s*\[(.+)\]", line)
+                    fields[index] = ("title", [match.group(1)])
+
+            # tags: [...] / categories: [...] 번역
+            elif line.startswith(("tags:", "categories:")):
+                match = re.match(r"(tags|categories):\s*\[(.+)\]", line)
                 if match:
-                    tags_str = match.group(1)
                     # ['tag1', 'tag2'] 형식 파싱
-                    tags = [
-                        t.strip().strip("'\"")
-                        for t in tags_str.split(",")
-                        if t.strip()
-                    ]
-                    translated_tags = [self._translate_text(tag) for tag in tags]
-                    tags_formatted = ", ".join(f"'{tag}'" for tag in translated_tags)
-                    translated_lines.append(f"tags: [{tags_formatted}]")
-                else:
-                    translated_lines.append(line)
-
-            # categories: [...] 번역
-            elif line.startswith("categories:"):
-                match = re.match(r"categories:\s*\[(.+)\]", line)
-                if match:
-                    cats_str = match.group(1)
-                    cats = [
-                        c.strip().strip("'\"")
-                        for c in cats_str.split(",")
-                        if c.strip()
+                    values = [
+                        v.strip().strip("'\"")
+                        for v in match.group(2).split(",")
+                        if v.strip()
                     ]
-                    translated_cats = [self._translate_text(cat) for cat in cats]
-                    cats_formatted = ", ".join(f"'{cat}'" for cat in translated_cats)
-                    translated_lines.append(f"categories: [{cats_formatted}]")
-                else:
-                    translated_lines.append(line)
+                    fields[index] = (match.group(1), values)
 
             # 나머지 (date, draft 등)는 그대로
+
+        texts = [value for _, values in fields.values() for value in values]
+        if not texts:
+            return "\n".join(lines)
+
+        # 2. 일괄 번역 후 위치 순서대로 다시 배치
+        translated = iter(self.translate_batch(texts, stats))
+        translated_lines = list(lines)
+        for index, (key, values) in fields.items():
+            items = [next(translated) for _ in values]
+            if key == "title":
+                translated_lines[index] = f'title: "{items[0]}"'
             else:
-                translated_lines.append(line)
+                formatted = ", ".join(f"'{item}'" for item in items)
+                translated_lines[index] = f"{key}: [{formatted}]"
 
         return "\n".join(translated_lines)
 
     def _translate_text(self, text: str) -> str:
-        """Claude Code -p로 텍스트 번역."""
+        """텍스트 번역 (캐시에 있으면 캐시 결과 반환)."""
         if not text or not text.strip():
             return text
 
-        # 번역 프롬프트
-        prompt = f"""Translate the following {self.source_lang} text to {self.target_lang}.
-Preserve markdown formatting, links, and code blocks.
-Only return the translated text, no explanations.
-
-Text to translate:
-{text}
-"""
-
-        try:
-            # 중첩 세션 방지를 위해 CLAUDECODE 환경변수 제거
-            import os
-            env = os.environ.copy()
-            env.pop("CLAUDECODE", None)
-
-            # Claude Code -p 실행
-            result = subprocess.run(
-                ["claude", "-p", prompt],
-                capture_output=True,
-                text=True,
-                timeout=180,  # 3분으로 증가
-                check=True,
-                env=env,
-            )
+        if self.cache is not None:
+            cached = self.cache.get(self.source_lang, self.target_lang, text)
+            if cached is not None:
+                return cached
+
+        translated = self._run_backend(text)
+
+        if self.cache is not None:
+            self.cache.set(self.source_lang, self.target_lang, text, translated)
+
+        return translated
+
+    def _run_backend(self, text: str) -> str:
+        """백엔드로 텍스트 하나 번역."""
+        return self.backend.translate(text, self.source_lang, self.target_lang)
+
+    def _run_backend_batch(self, texts: list[str]) -> list[str]:
+        """백엔드로 문자열 리스트 일괄 번역.
+
+        Raises:
+            ValueError: 응답을 해석할 수 없을 때
+        """
+        return self.backend.translate_batch(texts, self.source_lang, self.target_lang)
+
+    def close(self) -> None:
+        """백엔드와 캐시 연결 정리."""
+        self.backend.close()
+        if self.cache is not None:
+            self.cache.close()
 
-            translated = result.stdout.strip()
-            return translated
+    def cache_summary(self, stats: dict[str, int] | None = None) -> str | None:
+        """캐시 적중/미스 요약 문자열 (캐시 미사용 시 None).
 
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("Translation timeout (180s)")
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Translation failed: {e.stderr}")
-        except Exception as e:
-            raise RuntimeError(f"Translation error: {e}")
+        stats를 주면 그 호출 단위 통계를, 없으면 캐시 전체 누적 통계를 요약한다.
+        """
+        if self.cache is None:
+            return None
+        if stats is None:
+            stats = self.cache.stats()
+        return f"번역 캐시: 적중 {stats.get('hits', 0)}, 미스 {stats.get('misses', 0)}"
 
     def translate_file(self, input_file: Path, output_file: Path) -> None:
         """파일 번역 (input → output)."""
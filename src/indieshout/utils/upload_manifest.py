@@ -0,0 +1,116 @@
+"""업로드 매니페스트: 콘텐츠 해시 → S3 키/URL/ETag 기록."""
+
+import hashlib
+import json
+from pathlib import Path
+
+MANIFEST_FILENAME = ".upload-manifest.json"
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path: str | Path) -> str:
+    """파일 내용의 SHA-256 해시 반환 (청크 단위로 읽음)."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_s3_etag(file_path: str | Path, multipart_threshold: int, chunk_size: int) -> str:
+    """S3가 부여할 ETag를 로컬에서 계산.
+
+    단일 PUT은 파일 MD5, 멀티파트 업로드는 각 파트 MD5를 이어붙인 값의
+    MD5에 "-<파트 수>"를 붙인 형식이다.
+
+    Args:
+        file_path: 로컬 파일 경로
+        multipart_threshold: 멀티파트 업로드 기준 크기 (bytes)
+        chunk_size: 멀티파트 파트 크기 (bytes)
+
+    Returns:
+        따옴표를 제외한 ETag 문자열
+    """
+    file_path = Path(file_path)
+
+    if file_path.stat().st_size < multipart_threshold:
+        digest = hashlib.md5()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    part_digests = []
+    with open(file_path, "rb") as f:
+        for part in iter(lambda: f.read(chunk_size), b""):
+            part_digests.append(hashlib.md5(part).digest())
+
+    combined = hashlib.md5(b"".join(part_digests)).hexdigest()
+    return f"{combined}-{len(part_digests)}"
+
+
+class UploadManifest:
+    """포스트 폴더별 업로드 기록.
+
+    blog-content/{folder}/.upload-manifest.json 에 저장되며, 내용이 같은 파일을
+    같은 키로 다시 올리지 않도록 해시 → 키 → URL/ETag를 기록한다.
+
+    형식:
+        {
+            "version": 1,
+            "bucket": "rex-blog-assets",
+            "entries": {
+                "<sha256>": {"posts/slug/1.png": {"url": "...", "etag": "..."}}
+            }
+        }
+    """
+
+    def __init__(self, path: str | Path, bucket: str):
+        """UploadManifest 초기화.
+
+        Args:
+            path: 매니페스트 파일 경로
+            bucket: 대상 S3 버킷 (다른 버킷의 기록은 무시)
+        """
+        self.path = Path(path)
+        self.bucket = bucket
+        self.entries: dict[str, dict[str, dict]] = {}
+        self.loaded = False
+
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == MANIFEST_VERSION and data.get("bucket") == bucket:
+                self.entries = data.get("entries", {})
+                self.loaded = True
+
+    @classmethod
+    def for_folder(cls, folder: str | Path, bucket: str) -> "UploadManifest":
+        """포스트 폴더의 매니페스트 로드."""
+        return cls(Path(folder) / MANIFEST_FILENAME, bucket)
+
+    def lookup(self, content_hash: str, s3_key: str) -> dict | None:
+        """같은 내용이 같은 키로 업로드된 기록 반환 (없으면 None)."""
+        return self.entries.get(content_hash, {}).get(s3_key)
+
+    def record(self, content_hash: str, s3_key: str, url: str, etag: str) -> None:
+        """업로드 결과 기록."""
+        # 같은 키에 남아 있는 이전 내용의 기록 제거
+        for keys in self.entries.values():
+            keys.pop(s3_key, None)
+        self.entries = {h: keys for h, keys in self.entries.items() if keys}
+        self.entries.setdefault(content_hash, {})[s3_key] = {"url": url, "etag": etag}
+
+    def save(self) -> None:
+        """매니페스트를 파일에 저장."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "bucket": self.bucket,
+            "entries": self.entries,
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self.path)
@@ -1,5 +1,23 @@
 """통합 워크플로우."""
 
-from indieshout.workflows.publish_workflow import PublishWorkflow
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from indieshout.workflows.publish_workflow import PublishWorkflow
+
+# 하위 모듈은 처음 접근할 때 import (퍼블리셔/boto3 로딩을 필요할 때까지 미룸)
+_LAZY_ATTRS = {
+    "PublishWorkflow": "indieshout.workflows.publish_workflow",
+}
 
 __all__ = ["PublishWorkflow"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
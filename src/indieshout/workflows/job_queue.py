@@ -0,0 +1,628 @@
+"""재시작 가능한 게시 작업 큐.
+
+폴더 게시 하나를 작업(job)으로, 그 안의 format/upload/translate/write/commit/
+sns:<platform>을 단계(step)로 나눠 SQLite에 기록한다. 단계마다 결과를 저장하므로
+프로세스가 죽거나 일부 단계가 실패해도 다시 실행하면 완료되지 않은 첫 단계부터
+이어서 처리하고, 이미 끝난 S3 업로드/번역은 반복하지 않는다.
+작업은 lease로 점유하므로 여러 워커(스레드/프로세스)가 같은 큐를 동시에 처리할 수 있다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from indieshout.models.content import Content, ContentType
+from indieshout.utils.publish_state import SNS_UNKNOWN, fingerprint_folder
+from indieshout.utils.upload_manifest import file_sha256
+from indieshout.workflows.publish_workflow import PublishWorkflow
+
+DEFAULT_JOBS_PATH = ".indieshout/jobs.sqlite3"
+DEFAULT_WORKERS = 2
+DEFAULT_LEASE = 600.0  # 작업 점유 시간 (초, 단계마다 연장)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+STEP_PENDING = "pending"
+STEP_RUNNING = "running"
+STEP_DONE = "done"
+STEP_SKIPPED = "skipped"
+STEP_FAILED = "failed"
+
+BLOG_STEPS = ["format", "upload", "translate", "write", "commit"]
+SNS_STEP_PREFIX = "sns:"
+# 게시 요청을 보냈지만 결과를 모르는 SNS 단계 (중단/타임아웃): 자동으로 다시 게시하지 않음
+SNS_INTERRUPTED_ERROR = "interrupted while posting; check the platform before retrying"
+
+
+def job_key(folder_name: str, fingerprint: dict, options: dict) -> str:
+    """작업 idempotency key (같은 폴더/입력/옵션이면 같은 키)."""
+    payload = json.dumps(
+        {"folder": folder_name, "fingerprint": fingerprint, "options": options},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class StepFailedError(RuntimeError):
+    """작업 단계 실패 (결과는 큐에 기록됨)."""
+
+
+class JobQueue:
+    """SQLite 기반 게시 작업 큐.
+
+    여러 스레드/프로세스에서 동시에 사용할 수 있다. 작업 점유(claim)는
+    BEGIN IMMEDIATE 트랜잭션으로 처리해 같은 작업을 두 워커가 가져가지 않는다.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_JOBS_PATH):
+        """JobQueue 초기화.
+
+        DB 파일은 처음 사용할 때 생성된다.
+
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "JobQueue":
+        """jobs 설정으로 생성 (jobs.path, 기본 .indieshout/jobs.sqlite3)."""
+        return cls(config.get("jobs", {}).get("path", DEFAULT_JOBS_PATH))
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._conn.row_factory = sqlite3.Row
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    folder TEXT NOT NULL,
+                    idempotency_key TEXT NOT NULL UNIQUE,
+                    options TEXT NOT NULL DEFAULT '{}',
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    worker TEXT,
+                    lease_until REAL,
+                    last_error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS steps (
+                    job_id INTEGER NOT NULL REFERENCES jobs (id),
+                    position INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    idempotency_key TEXT NOT NULL UNIQUE,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (job_id, name)
+                );
+                """
+            )
+        return self._conn
+
+    def enqueue(self, folder_name: str, key: str, steps: list[str], options: dict) -> int:
+        """작업 등록 후 작업 ID 반환.
+
+        같은 idempotency key의 작업이 이미 있으면 새로 만들지 않는다.
+        그 작업이 실패 상태면 실패한 단계부터 다시 실행하도록 대기열에 되돌린다.
+
+        Args:
+            folder_name: 폴더 이름
+            key: 작업 idempotency key (job_key() 결과)
+            steps: 실행할 단계 이름 (실행 순서)
+            options: 작업 옵션 (skip_blog, skip_sns, force)
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT id, status FROM jobs WHERE idempotency_key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    job_id = row["id"]
+                    if row["status"] == JOB_FAILED:
+                        self._requeue(conn, job_id, now)
+                else:
+                    cursor = conn.execute(
+                        """
+                        INSERT INTO jobs (folder, idempotency_key, options, status, created_at, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        (folder_name, key, json.dumps(options), JOB_QUEUED, now, now),
+                    )
+                    job_id = cursor.lastrowid
+                    conn.executemany(
+                        """
+                        INSERT INTO steps (job_id, position, name, idempotency_key, status, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (job_id, position, name, f"{key}:{name}", STEP_PENDING, now)
+                            for position, name in enumerate(steps)
+                        ],
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return job_id
+
+    def claim(self, worker: str, lease: float = DEFAULT_LEASE) -> dict | None:
+        """처리할 작업 하나를 점유해 반환 (없으면 None).
+
+        대기 중인 작업과, lease가 만료된 실행 중 작업(워커가 죽은 작업)을
+        등록 순서대로 가져간다.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    """
+                    SELECT id FROM jobs
+                    WHERE status = ? OR (status = ? AND lease_until < ?)
+                    ORDER BY id LIMIT 1
+                    """,
+                    (JOB_QUEUED, JOB_RUNNING, now),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    """
+                    UPDATE jobs SET status = ?, worker = ?, lease_until = ?,
+                        attempts = attempts + 1, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (JOB_RUNNING, worker, now + lease, now, row["id"]),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return self.get(row["id"])
+
+    def renew(self, job_id: int, lease: float = DEFAULT_LEASE) -> None:
+        """작업 점유 연장."""
+        self._execute(
+            "UPDATE jobs SET lease_until = ?, updated_at = ? WHERE id = ?",
+            (time.time() + lease, time.time(), job_id),
+        )
+
+    def get(self, job_id: int) -> dict | None:
+        """작업 반환 (없으면 None)."""
+        with self._lock:
+            row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["options"] = json.loads(job["options"])
+        return job
+
+    def list_jobs(self, status: str | None = None) -> list[dict]:
+        """작업 목록 (등록 순)."""
+        query = "SELECT * FROM jobs"
+        params: tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        with self._lock:
+            rows = self._connect().execute(query + " ORDER BY id", params).fetchall()
+        return [{**dict(row), "options": json.loads(row["options"])} for row in rows]
+
+    def steps(self, job_id: int) -> list[dict]:
+        """작업 단계 목록 (실행 순, result는 디코딩된 값)."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT * FROM steps WHERE job_id = ? ORDER BY position", (job_id,)
+            ).fetchall()
+        steps = []
+        for row in rows:
+            step = dict(row)
+            step["result"] = json.loads(step["result"]) if step["result"] is not None else None
+            steps.append(step)
+        return steps
+
+    def start_step(self, job_id: int, name: str) -> None:
+        """단계 실행 시작 기록."""
+        self._set_step(job_id, name, STEP_RUNNING)
+
+    def finish_step(self, job_id: int, name: str, result, status: str = STEP_DONE) -> None:
+        """단계 완료 기록 (result는 JSON 직렬화 가능한 값)."""
+        self._set_step(job_id, name, status, result=json.dumps(result, ensure_ascii=False))
+
+    def fail_step(self, job_id: int, name: str, error: str) -> None:
+        """단계 실패 기록."""
+        self._set_step(job_id, name, STEP_FAILED, error=error)
+
+    def finish_job(self, job_id: int, status: str, error: str | None = None) -> None:
+        """작업 종료 기록 (JOB_DONE 또는 JOB_FAILED)."""
+        self._execute(
+            """
+            UPDATE jobs SET status = ?, last_error = ?, lease_until = NULL, updated_at = ?
+            WHERE id = ?
+            """,
+            (status, error, time.time(), job_id),
+        )
+
+    def retry(self, job_id: int) -> bool:
+        """실패한 작업을 실패한 단계부터 다시 실행하도록 대기열에 되돌림.
+
+        Returns:
+            되돌렸으면 True (작업이 없거나 실패 상태가 아니면 False)
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None or row["status"] != JOB_FAILED:
+                conn.execute("COMMIT")
+                return False
+            self._requeue(conn, job_id, time.time())
+            conn.execute("COMMIT")
+        return True
+
+    @staticmethod
+    def _requeue(conn: sqlite3.Connection, job_id: int, now: float) -> None:
+        conn.execute(
+            "UPDATE steps SET status = ?, error = NULL, updated_at = ? WHERE job_id = ? AND status = ?",
+            (STEP_PENDING, now, job_id, STEP_FAILED),
+        )
+        conn.execute(
+            "UPDATE jobs SET status = ?, last_error = NULL, updated_at = ? WHERE id = ?",
+            (JOB_QUEUED, now, job_id),
+        )
+
+    def _set_step(self, job_id: int, name: str, status: str, **fields) -> None:
+        fields = {"result": None, "error": None, **fields}
+        if status == STEP_RUNNING:
+            fields.pop("result")  # 실행 중에는 이전 결과를 지우지 않음
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        self._execute(
+            f"UPDATE steps SET status = ?, {assignments}, updated_at = ? WHERE job_id = ? AND name = ?",
+            (status, *fields.values(), time.time(), job_id, name),
+        )
+
+    def _execute(self, query: str, params: tuple) -> None:
+        with self._lock:
+            self._connect().execute(query, params)
+
+    def close(self) -> None:
+        """DB 연결 종료."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class JobRunner:
+    """작업 큐를 여러 워커로 처리하는 실행기.
+
+    블로그 단계(format → upload/translate → write → commit)는 순서대로 실행하고
+    하나라도 실패하면 작업을 실패로 기록한다. 업로드와 번역은 서로 의존하지
+    않으므로 동시에 실행한다. SNS 단계는 블로그 URL이 정해진 뒤 플랫폼별로
+    동시에 실행하며 한 플랫폼의 실패가 다른 플랫폼을 막지 않는다.
+    """
+
+    def __init__(
+        self,
+        workflow: PublishWorkflow,
+        queue: JobQueue,
+        workers: int = DEFAULT_WORKERS,
+        lease: float = DEFAULT_LEASE,
+    ):
+        """JobRunner 초기화.
+
+        Args:
+            workflow: 게시에 사용할 PublishWorkflow
+            queue: 작업 큐
+            workers: 동시에 처리할 작업 수
+            lease: 작업 점유 시간 (초, 워커가 죽으면 이 시간 뒤 다른 워커가 이어받음)
+        """
+        self.workflow = workflow
+        self.queue = queue
+        self.workers = workers
+        self.lease = lease
+        self._commits = 0
+        self._commits_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, workflow: PublishWorkflow, config: dict, **kwargs) -> "JobRunner":
+        """jobs 설정으로 생성."""
+        jobs_config = config.get("jobs", {})
+        options = {
+            "workers": int(jobs_config.get("workers", DEFAULT_WORKERS)),
+            "lease": float(jobs_config.get("lease", DEFAULT_LEASE)),
+            **kwargs,
+        }
+        return cls(workflow, JobQueue.from_config(config), **options)
+
+    def enqueue_folder(
+        self,
+        folder_name: str,
+        skip_blog: bool = False,
+        skip_sns: bool = False,
+        force: bool = False,
+    ) -> int:
+        """폴더 게시 작업 등록 후 작업 ID 반환.
+
+        입력 파일과 옵션이 같으면 같은 작업으로 취급하므로 여러 번 등록해도
+        중복 게시되지 않는다.
+        """
+        data = self.workflow.content_loader.load_from_folder(folder_name)
+        fingerprint = fingerprint_folder(self.workflow.content_loader.blog_content_dir / folder_name)
+        options = {"skip_blog": skip_blog, "skip_sns": skip_sns, "force": force}
+
+        steps = [] if skip_blog else list(BLOG_STEPS)
+        if not skip_sns and data["sns_text"]:
+            steps += [f"{SNS_STEP_PREFIX}{platform}" for platform in data["platforms"]]
+
+        return self.queue.enqueue(
+            folder_name, job_key(folder_name, fingerprint, options), steps, options
+        )
+
+    def run(self, push: bool = True) -> dict[int, str]:
+        """큐가 빌 때까지 작업을 처리하고 작업 ID → 최종 상태 반환.
+
+        Args:
+            push: True면 모든 작업이 끝난 뒤 새 커밋이 있을 때 한 번만 git push
+        """
+        results: dict[int, str] = {}
+        self._commits = 0
+
+        def drain() -> None:
+            worker = f"{uuid.uuid4().hex[:8]}-{threading.current_thread().name}"
+            while True:
+                job = self.queue.claim(worker, self.lease)
+                if job is None:
+                    return
+                results[job["id"]] = self.process(job)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job") as executor:
+            futures = [executor.submit(drain) for _ in range(self.workers)]
+            for future in futures:
+                future.result()
+
+        if push and self._commits:
+            try:
+                self.workflow.hugo_publisher.deploy()
+                print("🚀 git push 완료")
+            except Exception as e:
+                print(f"❌ git push 실패: {e}")
+
+        return results
+
+    def process(self, job: dict) -> str:
+        """작업 하나를 완료되지 않은 첫 단계부터 실행하고 최종 상태 반환."""
+        job_id = job["id"]
+        folder_name = job["folder"]
+        print(f"⚙️ 작업 #{job_id} 시작: {folder_name}")
+
+        try:
+            steps = self._recover_steps(job_id)
+            data = self.workflow.content_loader.load_from_folder(folder_name)
+            blog = self._run_blog_steps(job, steps, data)
+            self._run_sns_steps(job, steps, data, blog)
+        except Exception as e:
+            print(f"❌ 작업 #{job_id} 실패: {e}")
+            self.queue.finish_job(job_id, JOB_FAILED, str(e))
+            return JOB_FAILED
+
+        failed = [step["name"] for step in self.queue.steps(job_id) if step["status"] == STEP_FAILED]
+        if failed:
+            error = f"failed steps: {', '.join(failed)}"
+            print(f"❌ 작업 #{job_id} 일부 실패: {', '.join(failed)}")
+            self.queue.finish_job(job_id, JOB_FAILED, error)
+            return JOB_FAILED
+
+        print(f"✅ 작업 #{job_id} 완료: {folder_name}")
+        self.queue.finish_job(job_id, JOB_DONE)
+        return JOB_DONE
+
+    def _recover_steps(self, job_id: int) -> dict[str, dict]:
+        """이전 워커가 실행 도중 멈춘 단계 정리.
+
+        블로그 단계는 다시 실행해도 안전하므로 대기로 되돌린다. SNS 단계는
+        이미 게시되었을 수 있으므로 실패로 기록해 사람이 확인한 뒤
+        `jobs retry`로 다시 실행하게 한다.
+        """
+        for step in self.queue.steps(job_id):
+            if step["status"] != STEP_RUNNING:
+                continue
+            if step["name"].startswith(SNS_STEP_PREFIX):
+                self.queue.fail_step(
+                    job_id,
+                    step["name"],
+                    SNS_INTERRUPTED_ERROR,
+                )
+            else:
+                self.queue.finish_step(job_id, step["name"], None, status=STEP_PENDING)
+        return {step["name"]: step for step in self.queue.steps(job_id)}
+
+    def _run_step(self, job_id: int, steps: dict[str, dict], name: str, fn):
+        """단계 실행 (이미 완료된 단계는 기록된 결과 반환).
+
+        Raises:
+            StepFailedError: 단계가 실패했을 때
+        """
+        step = steps[name]
+        if step["status"] in (STEP_DONE, STEP_SKIPPED):
+            return step["result"]
+
+        self.queue.renew(job_id, self.lease)
+        self.queue.start_step(job_id, name)
+        try:
+            result = fn()
+        except Exception as e:
+            self.queue.fail_step(job_id, name, str(e))
+            raise StepFailedError(f"{name}: {e}") from e
+        self.queue.finish_step(job_id, name, result)
+        step.update(status=STEP_DONE, result=result)
+        return result
+
+    def _run_blog_steps(self, job: dict, steps: dict[str, dict], data: dict) -> dict | None:
+        """블로그 단계 실행 후 블로그 정보 반환 ({"url", "images"}, 블로그 단계가 없으면 이전 기록)."""
+        job_id = job["id"]
+        folder_name = job["folder"]
+        state = self.workflow.state
+        previous = state.get(folder_name) if state is not None else None
+
+        if "format" not in steps:
+            if previous and previous["blog_url"]:
+                return {"url": previous["blog_url"], "images": previous["s3_urls"]}
+            return None
+
+        hugo = self.workflow.hugo_publisher
+        content: Content = data["blog_content"]
+
+        if steps["format"]["status"] == STEP_PENDING and not job["options"].get("force"):
+            fingerprint = fingerprint_folder(self.workflow.content_loader.blog_content_dir / folder_name)
+            if self.workflow.is_blog_unchanged(fingerprint, previous):
+                print(f"  ⏭️ 입력 변경 없음 (블로그 단계 생략): {previous['blog_url']}")
+                blog = {"url": previous["blog_url"], "images": previous["s3_urls"]}
+                for name in BLOG_STEPS:
+                    self.queue.finish_step(job_id, name, blog, status=STEP_SKIPPED)
+                return blog
+
+        def format_post() -> dict:
+            hugo.authenticate()
+            hugo.validate(content)
+            return hugo.format_content(content)
+
+        formatted = self._run_step(job_id, steps, "format", format_post)
+        slug, markdown = formatted["slug"], formatted["markdown"]
+
+        # 업로드와 번역은 서로 의존하지 않으므로 동시에 실행
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"job{job_id}") as executor:
+            upload_future = executor.submit(
+                self._run_step, job_id, steps, "upload", lambda: hugo.upload_images(content, slug)
+            )
+            translate_future = executor.submit(
+                self._run_step,
+                job_id,
+                steps,
+                "translate",
+                lambda: {"markdown": hugo.translate(markdown)},
+            )
+            image_url_map = upload_future.result()
+            translated = translate_future.result()["markdown"]
+
+        def write() -> dict:
+            blog_result = hugo.write_post(content, slug, markdown, translated, image_url_map)
+            # 게시 상태는 커밋 후에 기록하므로 쓴 시점의 입력 해시를 단계 결과에 보관
+            blog_result["fingerprint"] = fingerprint_folder(
+                self.workflow.content_loader.blog_content_dir / folder_name
+            )
+            return blog_result
+
+        blog_result = self._run_step(job_id, steps, "write", write)
+
+        def commit() -> dict:
+            hugo.git.stage_post(Path(blog_result["files"]["ko"]).parent, content.title)
+            commits = hugo.commit_pending()
+            with self._commits_lock:
+                self._commits += commits
+            if state is not None:
+                en_file = blog_result["files"]["en"]
+                state.record_blog(
+                    folder_name,
+                    blog_result["fingerprint"],
+                    blog_result,
+                    translation_hash=file_sha256(en_file) if en_file else None,
+                )
+            return {"commits": commits}
+
+        self._run_step(job_id, steps, "commit", commit)
+        print(f"  ✅ 블로그: {blog_result['url']}")
+        return {"url": blog_result["url"], "images": blog_result["images"]}
+
+    def _run_sns_steps(
+        self, job: dict, steps: dict[str, dict], data: dict, blog: dict | None
+    ) -> None:
+        """대기 중인 SNS 단계를 플랫폼별로 동시에 실행."""
+        job_id = job["id"]
+        folder_name = job["folder"]
+        state = self.workflow.state
+        force = job["options"].get("force", False)
+
+        pending = [
+            name[len(SNS_STEP_PREFIX):]
+            for name, step in steps.items()
+            if name.startswith(SNS_STEP_PREFIX) and step["status"] == STEP_PENDING
+        ]
+        if not pending:
+            return
+
+        text = data["sns_text"]
+        if blog and blog["url"]:
+            text = f"{text}\n\n🔗 {blog['url']}"
+
+        targets = []
+        for platform in pending:
+            name = f"{SNS_STEP_PREFIX}{platform}"
+            posted = state.get_sns(folder_name, platform) if state is not None else None
+            if platform not in self.workflow.publishers:
+                self.queue.finish_step(job_id, name, {"reason": "not_configured"}, status=STEP_SKIPPED)
+            elif posted and posted.get("status") == SNS_UNKNOWN and not force:
+                # 이전 게시가 타임아웃됨: 플랫폼 확인 후 --force로 다시 등록해야 게시
+                self.queue.fail_step(job_id, name, f"{SNS_INTERRUPTED_ERROR} ({posted.get('error')})")
+            elif posted and not force:
+                self.queue.finish_step(
+                    job_id, name, {**posted, "reason": "already_published"}, status=STEP_SKIPPED
+                )
+            else:
+                targets.append(platform)
+        if not targets:
+            return
+
+        content = Content(
+            content_type=ContentType.SNS,
+            text=text,
+            platforms=targets,
+            image_urls=self.workflow.sns_image_urls(list((blog or {}).get("images", {}).values())),
+        )
+
+        self.queue.renew(job_id, self.lease)
+        for platform in targets:
+            self.queue.start_step(job_id, f"{SNS_STEP_PREFIX}{platform}")
+
+        contents = self.workflow.sns_contents(
+            folder_name, targets, content, data["blog_content"].image_paths
+        )
+        results = self.workflow.publish_sns_concurrently(targets, contents)
+        for platform in targets:
+            name = f"{SNS_STEP_PREFIX}{platform}"
+            sns_result = results[platform]
+            if sns_result.get("timed_out"):
+                # 응답은 기다리지 않았지만 게시는 됐을 수 있음 (중단된 단계와 같게 처리)
+                print(f"  ❌ {platform}: {sns_result['error']} (게시 여부 불명)")
+                self.queue.fail_step(job_id, name, f"{SNS_INTERRUPTED_ERROR} ({sns_result['error']})")
+                if state is not None:
+                    state.record_sns_unknown(folder_name, platform, sns_result["error"], text)
+            elif "error" in sns_result:
+                print(f"  ❌ {platform}: {sns_result['error']}")
+                self.queue.fail_step(job_id, name, sns_result["error"])
+            else:
+                print(f"  ✅ {platform}: 게시 완료")
+                self.queue.finish_step(job_id, name, sns_result)
+                if state is not None:
+                    state.record_sns(folder_name, platform, sns_result, text)
@@ -1,12 +1,37 @@
 """블로그 + SNS 통합 게시 워크플로우."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime
 from pathlib import Path
 
 from indieshout.blog.content_loader import ContentLoader
 from indieshout.blog.hugo_publisher import HugoPublisher
 from indieshout.models.content import Content, ContentType
-from indieshout.publishers.threads import ThreadsPublisher
-from indieshout.publishers.twitter import TwitterPublisher
+from indieshout.publishers.base import BasePublisher
+from indieshout.publishers.registry import (
+    LazyPublishers,
+    configured_platforms,
+    create_publisher,
+    get_publisher_class,
+)
+from indieshout.utils.auth_cache import AuthCache
+from indieshout.utils.publish_state import (
+    SNS_UNKNOWN,
+    PublishStateStore,
+    fingerprint_folder,
+    is_blog_current,
+)
+from indieshout.utils.rate_limiter import RateLimiter
+from indieshout.utils.sns_image_adapter import ImageSpec, SnsImageAdapter
+from indieshout.utils.upload_manifest import file_sha256
+
+DEFAULT_SNS_TIMEOUT = 60.0  # 플랫폼별 게시 타임아웃 (초)
+DEFAULT_BATCH_WORKERS = 2  # 일괄 게시 시 동시에 처리할 폴더 수
+DEFAULT_PLATFORM_CONCURRENCY = 1  # 플랫폼별 동시 게시 수
+MAX_SNS_IMAGES = 10  # SNS에 첨부할 블로그 이미지 수 (Threads 캐러셀 최대 장수)
 
 
 class PublishWorkflow:
@@ -20,15 +45,42 @@ class PublishWorkflow:
             blog_content_dir: blog-content 디렉토리 경로
         """
         self.config = config
+        self.workflow_config = config.get("workflow", {})
         self.content_loader = ContentLoader(blog_content_dir)
-        self.hugo_publisher = HugoPublisher(config)
+        # 모든 퍼블리셔가 인증 캐시를 공유 (일괄 게시 시 플랫폼별 인증 확인은 한 번)
+        self.auth_cache = AuthCache.from_config(config)
+        # 플랫폼별 게시 한도도 공유 (일괄 게시의 모든 폴더가 같은 버킷 사용)
+        self.rate_limiter = RateLimiter.from_config(config)
+        self.hugo_publisher = HugoPublisher(config, auth_cache=self.auth_cache)
+        self.state = PublishStateStore.from_config(config, self.content_loader.blog_content_dir)
+
+        # SNS 첨부 이미지를 플랫폼 규격으로 변환 (images.sns_adapt, Pillow 필요)
+        self.sns_image_adapter = SnsImageAdapter.from_config(config)
 
-        # SNS 퍼블리셔 초기화
-        self.publishers = {}
-        if config.get("twitter"):
-            self.publishers["x"] = TwitterPublisher(config)
-        if config.get("threads"):
-            self.publishers["threads"] = ThreadsPublisher(config)
+        # SNS 퍼블리셔: 설정 섹션이 있는 플랫폼만, 실제로 게시할 때 생성
+        self.publishers = LazyPublishers(configured_platforms(config), self._create_publisher)
+
+        # 플랫폼별 동시 게시 수 제한 (일괄 게시 시 여러 폴더가 같은 API를 동시에 호출)
+        platform_concurrency = self.workflow_config.get("platform_concurrency", {})
+        self._platform_semaphores = {
+            platform: threading.BoundedSemaphore(
+                int(platform_concurrency.get(platform, DEFAULT_PLATFORM_CONCURRENCY))
+            )
+            for platform in self.publishers
+        }
+
+        # commit=False로 게시한 블로그 결과 (커밋/푸시가 성공한 뒤에 상태 저장소에 기록)
+        self._uncommitted_blogs: dict[str, tuple[dict, dict, str | None]] = {}
+        self._uncommitted_lock = threading.Lock()
+
+    def _create_publisher(self, platform: str) -> BasePublisher:
+        """레지스트리에서 퍼블리셔 클래스를 가져와 공유 인증 캐시/게시 한도로 생성."""
+        publisher_cls = get_publisher_class(platform)
+        if publisher_cls is None:
+            raise KeyError(f"Unknown platform: {platform}")
+        return create_publisher(
+            publisher_cls, self.config, auth_cache=self.auth_cache, rate_limiter=self.rate_limiter
+        )
 
     def publish_from_folder(
         self,
@@ -36,14 +88,21 @@ class PublishWorkflow:
         dry_run: bool = False,
         skip_blog: bool = False,
         skip_sns: bool = False,
+        commit: bool = True,
+        force: bool = False,
     ) -> dict:
         """폴더에서 블로그 + SNS 통합 게시.
 
+        게시 상태 저장소에 기록된 입력 해시와 비교해 입력이 바뀌지 않은 블로그
+        게시는 건너뛰고, 이미 게시한 SNS 플랫폼에는 다시 게시하지 않는다.
+
         Args:
             folder_name: blog-content 하위 폴더 이름
             dry_run: True면 실제 게시 안 함
             skip_blog: True면 블로그 게시 건너뛰기
             skip_sns: True면 SNS 게시 건너뛰기
+            commit: False면 블로그 Git commit을 호출자에게 맡김 (일괄 게시용)
+            force: True면 입력이 같아도 블로그를 다시 게시하고 SNS 중복 게시 허용
 
         Returns:
             게시 결과 dict
@@ -63,11 +122,26 @@ class PublishWorkflow:
 
         result = {"blog": None, "sns": {}}
 
+        fingerprint = None
+        previous = None
+        if self.state is not None:
+            fingerprint = fingerprint_folder(self.content_loader.blog_content_dir / folder_name)
+            previous = self.state.get(folder_name)
+
         # 2. 블로그 게시
-        blog_url = None
+        blog_url = previous["blog_url"] if previous else None
+        image_urls = list(previous["s3_urls"].values()) if previous else []
         if not skip_blog:
             print(f"\n📝 블로그 게시 중...")
-            if dry_run:
+            if not force and self.is_blog_unchanged(fingerprint, previous):
+                print(f"  ⏭️ 입력 변경 없음 (게시 생략): {blog_url}")
+                result["blog"] = {
+                    "url": blog_url,
+                    "slug": previous["blog_slug"],
+                    "title": blog_content.title,
+                    "status": "unchanged",
+                }
+            elif dry_run:
                 print("  [DRY RUN] 블로그 게시 생략")
                 blog_url = f"https://example.com/posts/{blog_content.slug or 'test'}/"
                 result["blog"] = {"url": blog_url, "status": "dry_run"}
@@ -75,9 +149,23 @@ class PublishWorkflow:
                 try:
                     self.hugo_publisher.authenticate()
                     self.hugo_publisher.validate(blog_content)
-                    blog_result = self.hugo_publisher.publish(blog_content)
+                    blog_result = self.hugo_publisher.publish(blog_content, commit=commit)
                     blog_url = blog_result["url"]
+                    image_urls = list((blog_result.get("images") or {}).values())
                     result["blog"] = blog_result
+                    if self.state is not None:
+                        en_file = blog_result.get("files", {}).get("en")
+                        record = (
+                            fingerprint,
+                            blog_result,
+                            file_sha256(en_file) if en_file else None,
+                        )
+                        if commit:
+                            self.state.record_blog(folder_name, *record)
+                        else:
+                            # 커밋 전에 기록하면 커밋이 실패해도 게시된 것으로 남음
+                            with self._uncommitted_lock:
+                                self._uncommitted_blogs[folder_name] = record
 
                     print(f"✅ 블로그 게시 완료: {blog_url}")
                     if blog_result.get("images"):
@@ -97,35 +185,68 @@ class PublishWorkflow:
                 full_sns_text = f"{sns_text}\n\n🔗 {blog_url}"
 
             # Content 객체 생성 (SNS용)
+            # 블로그 단계에서 올린 S3 이미지 URL은 공개 URL이 필요한 플랫폼(Threads)이 사용
             sns_content = Content(
                 content_type=ContentType.SNS,
                 text=full_sns_text,
                 platforms=platforms,
+                image_urls=self.sns_image_urls(image_urls),
             )
 
-            # 각 플랫폼에 게시
+            # 설정된 플랫폼만 동시에 게시 (이미 게시한 플랫폼은 --force 없이는 건너뛰기)
+            targets = []
             for platform in platforms:
                 if platform not in self.publishers:
                     print(f"  ⚠️ {platform}: 설정되지 않음 (건너뛰기)")
                     continue
+                posted = previous["sns"].get(platform) if previous else None
+                if posted and posted.get("status") == SNS_UNKNOWN and not force:
+                    print(
+                        f"  ⚠️ {platform}: 이전 게시가 타임아웃되어 게시 여부를 알 수 없음 "
+                        f"({posted.get('error')}), 플랫폼을 확인한 뒤 --force로 다시 게시"
+                    )
+                    result["sns"][platform] = {
+                        **posted,
+                        "status": "skipped",
+                        "reason": "unknown_after_timeout",
+                    }
+                    continue
+                if posted and not force:
+                    print(f"  ⏭️ {platform}: 이미 게시됨 ({posted.get('url', '-')}), 다시 게시하려면 --force")
+                    result["sns"][platform] = {
+                        **posted,
+                        "status": "skipped",
+                        "reason": "already_published",
+                    }
+                    continue
+                targets.append(platform)
 
-                publisher = self.publishers[platform]
-
-                if dry_run:
+            if dry_run:
+                for platform in targets:
                     print(f"  [DRY RUN] {platform}: 게시 생략")
                     result["sns"][platform] = {"status": "dry_run"}
-                else:
-                    try:
-                        publisher.authenticate()
-                        publisher.validate(sns_content)
-                        sns_result = publisher.publish(sns_content)
-                        result["sns"][platform] = sns_result
+            elif targets:
+                sns_contents = self.sns_contents(
+                    folder_name, targets, sns_content, blog_content.image_paths
+                )
+                sns_results = self.publish_sns_concurrently(targets, sns_contents)
+                for platform in targets:
+                    sns_result = sns_results[platform]
+                    result["sns"][platform] = sns_result
 
+                    if sns_result.get("timed_out"):
+                        # 응답은 기다리지 않았지만 게시는 됐을 수 있으므로 다시 게시하지 않도록 기록
+                        print(f"  ❌ {platform}: 게시 실패 - {sns_result['error']} (게시 여부 불명)")
+                        if self.state is not None:
+                            self.state.record_sns_unknown(
+                                folder_name, platform, sns_result["error"], full_sns_text
+                            )
+                    elif "error" in sns_result:
+                        print(f"  ❌ {platform}: 게시 실패 - {sns_result['error']}")
+                    else:
                         print(f"  ✅ {platform}: 게시 완료")
-
-                    except Exception as e:
-                        print(f"  ❌ {platform}: 게시 실패 - {e}")
-                        result["sns"][platform] = {"error": str(e)}
+                        if self.state is not None:
+                            self.state.record_sns(folder_name, platform, sns_result, full_sns_text)
 
         # 4. 최종 요약
         print(f"\n{'='*50}")
@@ -134,6 +255,9 @@ class PublishWorkflow:
 
         if result["blog"]:
             print(f"✅ 블로그: {result['blog']['url']}")
+            timings = self.hugo_publisher.git.format_timings()
+            if timings and commit:
+                print(f"  ⏱️ {timings}")
         elif skip_blog:
             print(f"⏭️ 블로그: 건너뛰기")
         else:
@@ -142,11 +266,402 @@ class PublishWorkflow:
         if result["sns"]:
             print(f"\nSNS 게시:")
             for platform, sns_result in result["sns"].items():
-                if "error" in sns_result:
+                if sns_result.get("reason") == "unknown_after_timeout":
+                    print(f"  ⚠️ {platform}: 게시 여부 불명 (확인 후 --force)")
+                elif "error" in sns_result:
                     print(f"  ❌ {platform}: {sns_result['error']}")
+                elif sns_result.get("status") == "skipped":
+                    print(f"  ⏭️ {platform}: 이미 게시됨")
                 else:
                     print(f"  ✅ {platform}: 성공")
         elif skip_sns:
             print(f"⏭️ SNS: 건너뛰기")
 
         return result
+
+    def sns_image_urls(self, image_urls: list[str]) -> list[str] | None:
+        """SNS에 첨부할 블로그 이미지 URL (workflow.sns_images가 false면 None)."""
+        if not image_urls or not self.workflow_config.get("sns_images", True):
+            return None
+        return image_urls[:MAX_SNS_IMAGES]
+
+    def sns_contents(
+        self,
+        folder_name: str,
+        platforms: list[str],
+        content: Content,
+        image_paths: list[str] | None,
+    ) -> dict[str, Content]:
+        """플랫폼별 SNS Content (포스트 이미지를 플랫폼 규격으로 변환해 첨부).
+
+        파일로 첨부하는 플랫폼(X)은 image_paths를, 공개 URL이 필요한 플랫폼(Threads)은
+        변환한 이미지를 S3에 올린 URL을 image_urls로 사용한다. 변환기가 없거나
+        변환/업로드에 실패하면 content(블로그 S3 이미지 URL)를 그대로 사용한다.
+        """
+        contents = {platform: content for platform in platforms}
+        if (
+            self.sns_image_adapter is None
+            or not image_paths
+            or not self.workflow_config.get("sns_images", True)
+        ):
+            return contents
+
+        specs: dict[str, ImageSpec] = {}
+        for platform in platforms:
+            publisher_cls = get_publisher_class(platform)
+            spec = getattr(publisher_cls, "IMAGE_SPEC", None)
+            if spec is None:
+                continue
+            if spec.public_url and self.hugo_publisher.s3_uploader is None:
+                continue
+            specs[platform] = spec
+        if not specs:
+            return contents
+
+        folder = self.content_loader.blog_content_dir / folder_name
+        slug = self.content_loader.get_slug(folder_name)
+        try:
+            adapted = self.sns_image_adapter.adapt(
+                image_paths, specs, cache=self.sns_image_adapter.cache_for(folder)
+            )
+            for platform, paths in adapted.items():
+                if not paths:
+                    continue
+                if specs[platform].public_url:
+                    url_map = self.hugo_publisher.upload_sns_images(paths, slug, platform, str(folder))
+                    if url_map:
+                        contents[platform] = content.model_copy(
+                            update={"image_urls": list(url_map.values()), "image_paths": None}
+                        )
+                else:
+                    contents[platform] = content.model_copy(
+                        update={"image_paths": paths, "image_urls": None}
+                    )
+        except Exception as e:
+            print(f"  ⚠️ SNS 이미지 변환 실패 (블로그 이미지 사용): {e}")
+        return contents
+
+    def is_blog_unchanged(self, fingerprint: dict | None, previous: dict | None) -> bool:
+        """같은 입력으로 게시한 블로그 포스트가 아직 저장소에 있는지 확인."""
+        if fingerprint is None or not is_blog_current(previous, fingerprint):
+            return False
+        return self.hugo_publisher.is_published(previous["blog_slug"])
+
+    def __enter__(self) -> "PublishWorkflow":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """퍼블리셔 HTTP 연결, 번역 백엔드, 상태 저장소 정리."""
+        if isinstance(self.publishers, LazyPublishers):
+            publishers = self.publishers.loaded()  # 생성되지 않은 퍼블리셔는 만들지 않음
+        else:
+            publishers = list(self.publishers.values())
+        for publisher in publishers:
+            publisher.close()
+        self.hugo_publisher.translator.close()
+        if self.state is not None:
+            self.state.close()
+
+    def _get_sns_timeout(self, platform: str) -> float:
+        """플랫폼별 게시 타임아웃 반환 (workflow.sns_timeouts > workflow.sns_timeout)."""
+        timeouts = self.workflow_config.get("sns_timeouts", {})
+        if platform in timeouts:
+            return float(timeouts[platform])
+        return float(self.workflow_config.get("sns_timeout", DEFAULT_SNS_TIMEOUT))
+
+    def _publish_to_platform(
+        self, platform: str, content: Content, deadline: float | None = None
+    ) -> dict:
+        """단일 플랫폼 인증 → 검증 → 게시 (플랫폼별 동시 게시 수 제한).
+
+        게시는 플랫폼 게시 한도(토큰 버킷) 안에서 실행되며, 한도 초과(429)는
+        백오프 후 재시도한다. deadline(time.monotonic 기준) 안에 게시할 수
+        없으면 기다리지 않고 실패한다.
+        """
+        publisher = self.publishers[platform]
+        semaphore = self._platform_semaphores.get(platform)
+        if semaphore is None:
+            semaphore = self._platform_semaphores.setdefault(
+                platform, threading.BoundedSemaphore(DEFAULT_PLATFORM_CONCURRENCY)
+            )
+
+        with semaphore:
+            # 동시 게시 슬롯을 기다리는 동안 타임아웃이 지났으면 게시하지 않음
+            # (호출자는 이미 타임아웃으로 기록했고 스레드는 기다려 주지 않음)
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"{platform}: timed out waiting for a publish slot")
+            publisher.authenticate()
+            publisher.validate(content)
+            return self.rate_limiter.call(platform, publisher.publish, content, deadline=deadline)
+
+    def publish_sns_concurrently(
+        self, platforms: list[str], content: Content | dict[str, Content]
+    ) -> dict[str, dict]:
+        """여러 SNS 플랫폼에 동시에 게시.
+
+        플랫폼마다 스레드 하나에서 authenticate/validate/publish를 실행하므로
+        전체 소요 시간은 가장 느린 플랫폼의 지연 시간에 가깝다.
+        타임아웃을 넘긴 플랫폼은 결과를 기다리지 않고 에러로 기록한다.
+
+        Args:
+            platforms: 게시할 플랫폼 리스트 (설정된 퍼블리셔만)
+            content: SNS용 Content 객체 (플랫폼마다 다르면 플랫폼 → Content)
+
+        Returns:
+            플랫폼 → 게시 결과 dict (실패 시 {"error": ...}, 타임아웃이면 "timed_out": True 추가)
+        """
+        contents = content if isinstance(content, dict) else {platform: content for platform in platforms}
+        results: dict[str, dict] = {}
+        executor = ThreadPoolExecutor(max_workers=len(platforms), thread_name_prefix="sns")
+        try:
+            started = time.monotonic()
+            futures = {
+                platform: executor.submit(
+                    self._publish_to_platform,
+                    platform,
+                    contents[platform],
+                    started + self._get_sns_timeout(platform),
+                )
+                for platform in platforms
+            }
+
+            for platform, future in futures.items():
+                timeout = self._get_sns_timeout(platform)
+                remaining = max(0.0, started + timeout - time.monotonic())
+                try:
+                    results[platform] = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    future.cancel()
+                    results[platform] = {"error": f"Timeout after {timeout:g}s", "timed_out": True}
+                except Exception as e:
+                    results[platform] = {"error": str(e)}
+        finally:
+            # 타임아웃된 작업을 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    def list_unpublished_folders(self, include_scheduled: bool = False) -> list[str]:
+        """게시가 필요한 폴더를 숫자 prefix 순서로 반환.
+
+        게시 기록이 있는 폴더는 입력(content.md/meta.md/assets)이 바뀐 경우에만,
+        기록이 없는 폴더는 블로그에 포스트가 없거나 커밋되지 않은 경우에만 포함한다.
+        meta.md의 scheduled_at이 아직 오지 않은 폴더는 스케줄러 몫이므로 제외한다.
+
+        Args:
+            include_scheduled: True면 예약 시각이 미래인 폴더도 포함
+        """
+        folder_names = []
+        now = time.time()
+        uncommitted = self.hugo_publisher.uncommitted_slugs()
+        for folder_name in self.content_loader.list_folders():
+            if not include_scheduled:
+                try:
+                    scheduled_at = self.content_loader.get_scheduled_at(folder_name)
+                except ValueError as e:
+                    print(f"⚠️ {folder_name}: {e}")
+                    continue
+                if scheduled_at is not None and scheduled_at.timestamp() > now:
+                    continue
+            previous = self.state.get(folder_name) if self.state is not None else None
+            if previous and previous["blog_url"]:
+                fingerprint = fingerprint_folder(self.content_loader.blog_content_dir / folder_name)
+                if not self.is_blog_unchanged(fingerprint, previous):
+                    folder_names.append(folder_name)
+            else:
+                slug = self.content_loader.get_slug(folder_name)
+                if slug in uncommitted or not self.hugo_publisher.is_published(slug):
+                    folder_names.append(folder_name)
+        return folder_names
+
+    def publish_batch(
+        self,
+        folder_names: list[str],
+        dry_run: bool = False,
+        skip_blog: bool = False,
+        skip_sns: bool = False,
+        max_workers: int | None = None,
+        push: bool = True,
+        schedule_store=None,
+    ) -> dict:
+        """여러 폴더를 동시에 게시하고 Git commit/push는 한 번만 실행.
+
+        폴더는 워커 풀에서 병렬로 처리되며, 같은 SNS 플랫폼에 대한 동시
+        게시 수는 workflow.platform_concurrency로 제한된다.
+
+        플랫폼 게시 한도 때문에 SNS 타임아웃 안에 게시할 수 없는 폴더는 블로그만
+        게시하고, SNS는 토큰 버킷이 계산한 게시 가능 시각으로 예약 목록에 넘긴다
+        (`schedule run`이 그 시각에 게시). workflow.defer_rate_limited가 false면
+        미루지 않는다.
+
+        Args:
+            folder_names: 게시할 폴더 이름 리스트 (처리 순서)
+            dry_run: True면 실제 게시 안 함
+            skip_blog: True면 블로그 게시 건너뛰기
+            skip_sns: True면 SNS 게시 건너뛰기
+            max_workers: 동시에 처리할 폴더 수 (기본: workflow.batch_workers)
+            push: True면 커밋 후 git push
+            schedule_store: 미룬 SNS 게시를 등록할 ScheduleStore (None이면 schedule 설정으로 생성)
+
+        Returns:
+            dict with keys:
+                - posts: 폴더 이름 → publish_from_folder 결과 (실패 시 {"error": ...})
+                - committed: 일괄 커밋 여부
+                - pushed: push 여부
+                - deferred: SNS를 미룬 폴더 → 예약 시각 (epoch 초)
+        """
+        if max_workers is None:
+            max_workers = int(self.workflow_config.get("batch_workers", DEFAULT_BATCH_WORKERS))
+
+        batch_result: dict = {"posts": {}, "committed": False, "pushed": False, "deferred": {}}
+        if not folder_names:
+            print("📭 게시할 폴더가 없습니다")
+            return batch_result
+
+        print(f"📦 일괄 게시: {len(folder_names)}개 폴더 (워커 {max_workers})")
+        deferred: dict[str, float] = {}
+        if not skip_sns and self.workflow_config.get("defer_rate_limited", True):
+            deferred = self.plan_rate_limited(folder_names)
+
+        def publish_one(folder_name: str) -> dict:
+            return self.publish_from_folder(
+                folder_name,
+                dry_run=dry_run,
+                skip_blog=skip_blog,
+                skip_sns=skip_sns or folder_name in deferred,
+                commit=False,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch") as executor:
+            futures = {name: executor.submit(publish_one, name) for name in folder_names}
+            for folder_name, future in futures.items():
+                try:
+                    batch_result["posts"][folder_name] = future.result()
+                except Exception as e:
+                    batch_result["posts"][folder_name] = {"error": str(e)}
+
+        # 블로그 게시에 성공한 포스트를 한 번에 커밋/푸시
+        if not dry_run and self.hugo_publisher.git.has_pending():
+            try:
+                commits = self.hugo_publisher.commit_pending()
+                batch_result["committed"] = commits > 0
+                if push and commits:
+                    self.hugo_publisher.deploy()
+                    batch_result["pushed"] = True
+            except Exception as e:
+                print(f"❌ Git 커밋/푸시 실패: {e}")
+                batch_result["git_error"] = str(e)
+        if "git_error" not in batch_result:
+            self._record_committed_blogs()
+        if deferred:
+            batch_result["deferred"] = self._defer_sns(deferred, dry_run, schedule_store)
+
+        self._print_batch_summary(batch_result)
+        return batch_result
+
+    def _record_committed_blogs(self) -> None:
+        """커밋(과 푸시)까지 끝난 블로그 게시 결과를 상태 저장소에 기록.
+
+        커밋이 실패하면 기록하지 않으므로 다음 실행에서 해당 폴더를 다시 게시한다.
+        """
+        with self._uncommitted_lock:
+            records = dict(self._uncommitted_blogs)
+            self._uncommitted_blogs.clear()
+        if self.state is None:
+            return
+        for folder_name, record in records.items():
+            self.state.record_blog(folder_name, *record)
+
+    def plan_rate_limited(self, folder_names: list[str]) -> dict[str, float]:
+        """게시 한도 때문에 SNS를 지금 게시할 수 없는 폴더와 게시 가능 시점까지의 지연.
+
+        플랫폼마다 SNS 게시가 필요한 폴더를 순서대로 토큰 버킷 슬롯에 배정하고,
+        슬롯까지의 대기가 SNS 타임아웃을 넘는 폴더를 고른다. 이미 게시한(또는
+        게시 여부가 불명인) 플랫폼은 토큰을 쓰지 않으므로 세지 않는다.
+
+        Returns:
+            폴더 이름 → 모든 플랫폼의 슬롯이 열릴 때까지의 지연 (초)
+        """
+        queues: dict[str, list[str]] = {}
+        for folder_name in folder_names:
+            try:
+                platforms = self.content_loader.get_platforms(folder_name)
+            except (OSError, ValueError):
+                continue
+            for platform in platforms:
+                if platform not in self.publishers:
+                    continue
+                if self.state is not None and self.state.get_sns(folder_name, platform):
+                    continue
+                queues.setdefault(platform, []).append(folder_name)
+
+        deferred: dict[str, float] = {}
+        for platform, names in queues.items():
+            timeout = self._get_sns_timeout(platform)
+            for folder_name, delay in zip(names, self.rate_limiter.schedule(platform, len(names))):
+                if delay > timeout:
+                    deferred[folder_name] = max(deferred.get(folder_name, 0.0), delay)
+        return deferred
+
+    def _defer_sns(
+        self, deferred: dict[str, float], dry_run: bool, schedule_store=None
+    ) -> dict[str, float]:
+        """미룬 SNS 게시를 게시 가능 시각으로 예약 목록에 등록.
+
+        Returns:
+            폴더 이름 → 예약 시각 (epoch 초)
+        """
+        from indieshout.workflows.scheduler import SOURCE_RATE_LIMIT, ScheduleStore
+
+        now = time.time()
+        scheduled = {folder_name: now + delay for folder_name, delay in deferred.items()}
+        store = schedule_store or (None if dry_run else ScheduleStore.from_config(self.config))
+        try:
+            for folder_name, timestamp in scheduled.items():
+                at = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+                if dry_run:
+                    print(f"  [DRY RUN] ⏳ {folder_name}: 게시 한도 → SNS를 {at}에 게시 예정")
+                    continue
+                store.add(folder_name, timestamp, source=SOURCE_RATE_LIMIT)
+                print(f"  ⏳ {folder_name}: 게시 한도 → SNS를 {at}로 예약 (schedule run이 게시)")
+        finally:
+            if store is not None and store is not schedule_store:
+                store.close()
+        return scheduled
+
+    def _print_batch_summary(self, batch_result: dict) -> None:
+        """일괄 게시 결과 요약 출력."""
+        posts = batch_result["posts"]
+        blog_ok = sum(1 for post in posts.values() if post.get("blog"))
+        sns_ok = sum(
+            1
+            for post in posts.values()
+            for sns_result in post.get("sns", {}).values()
+            if "error" not in sns_result and sns_result.get("status") != "skipped"
+        )
+        sns_failed = sum(
+            1
+            for post in posts.values()
+            for sns_result in post.get("sns", {}).values()
+            if "error" in sns_result
+        )
+
+        print(f"\n{'='*50}")
+        print("📊 일괄 게시 결과 요약")
+        print(f"{'='*50}")
+        for folder_name, post in posts.items():
+            if "error" in post:
+                print(f"❌ {folder_name}: {post['error']}")
+            elif post.get("blog"):
+                print(f"✅ {folder_name}: {post['blog']['url']}")
+            else:
+                print(f"⏭️ {folder_name}: 블로그 없음")
+        print(f"\n블로그: {blog_ok}/{len(posts)}, SNS: 성공 {sns_ok}, 실패 {sns_failed}")
+        if batch_result["committed"]:
+            print(f"Git: 커밋 완료{' + push 완료' if batch_result['pushed'] else ''}")
+        timings = self.hugo_publisher.git.format_timings()
+        if timings:
+            print(f"⏱️ {timings}")
@@ -0,0 +1,397 @@
+"""예약 게시 스케줄러.
+
+meta.md의 scheduled_at(또는 `schedule add`)으로 등록된 폴더를 예약 시각 순서의
+우선순위 큐(heap)에 넣고, 다음 예약 시각까지 Event.wait로 잠들었다가 도래한
+폴더를 PublishWorkflow로 게시한다. 예약 상태는 SQLite에 저장되어 재시작 후에도
+이어서 처리된다.
+"""
+
+import heapq
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+from indieshout.workflows.publish_workflow import PublishWorkflow
+
+DEFAULT_SCHEDULE_PATH = ".indieshout/schedule.sqlite3"
+DEFAULT_RESCAN_INTERVAL = 300.0  # blog-content 재검사 간격 (초)
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = 300.0  # 실패 후 재시도 대기 시작값 (초, 시도마다 2배)
+
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+SOURCE_META = "meta"
+SOURCE_MANUAL = "manual"
+SOURCE_RATE_LIMIT = "rate_limit"  # 게시 한도 때문에 일괄 게시에서 미룬 SNS 게시
+
+
+class ScheduleStore:
+    """SQLite 기반 예약 목록 (폴더 이름이 키).
+
+    여러 스레드에서 동시에 사용할 수 있다.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_SCHEDULE_PATH):
+        """ScheduleStore 초기화.
+
+        DB 파일은 처음 사용할 때 생성된다.
+
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ScheduleStore":
+        """schedule 설정으로 생성 (schedule.path, 기본 .indieshout/schedule.sqlite3)."""
+        return cls(config.get("schedule", {}).get("path", DEFAULT_SCHEDULE_PATH))
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS schedule (
+                    folder TEXT PRIMARY KEY,
+                    scheduled_at REAL NOT NULL,
+                    status TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_schedule_status ON schedule (status, scheduled_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def add(self, folder_name: str, scheduled_at: float, source: str = SOURCE_MANUAL) -> None:
+        """예약 등록 (이미 있으면 시각을 바꾸고 대기 상태로 되돌림).
+
+        Args:
+            folder_name: 폴더 이름
+            scheduled_at: 예약 시각 (epoch 초)
+            source: 등록 경로 (SOURCE_META: meta.md, SOURCE_MANUAL: schedule add,
+                SOURCE_RATE_LIMIT: 게시 한도로 미룬 SNS 게시)
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                """
+                INSERT INTO schedule (folder, scheduled_at, status, source, attempts, updated_at)
+                VALUES (?, ?, ?, ?, 0, ?)
+                ON CONFLICT (folder) DO UPDATE SET
+                    scheduled_at = excluded.scheduled_at,
+                    status = excluded.status,
+                    source = excluded.source,
+                    attempts = 0,
+                    last_error = NULL,
+                    updated_at = excluded.updated_at
+                """,
+                (folder_name, scheduled_at, STATUS_PENDING, source, time.time()),
+            )
+            conn.commit()
+
+    def get(self, folder_name: str) -> dict | None:
+        """예약 항목 반환 (없으면 None)."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT * FROM schedule WHERE folder = ?", (folder_name,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def pending(self) -> list[tuple[float, str]]:
+        """대기 중인 (예약 시각, 폴더) 리스트 (시각 순)."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT scheduled_at, folder FROM schedule WHERE status = ? ORDER BY scheduled_at",
+                (STATUS_PENDING,),
+            ).fetchall()
+        return [(row["scheduled_at"], row["folder"]) for row in rows]
+
+    def list_all(self) -> list[dict]:
+        """전체 예약 항목 (시각 순)."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT * FROM schedule ORDER BY scheduled_at"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def mark_done(self, folder_name: str) -> None:
+        """게시 완료 기록."""
+        self._update(folder_name, status=STATUS_DONE, last_error=None)
+
+    def mark_failed(self, folder_name: str, error: str, retry_at: float | None) -> None:
+        """게시 실패 기록 (retry_at이 있으면 그 시각에 다시 시도, 없으면 포기)."""
+        with self._lock:
+            conn = self._connect()
+            if retry_at is None:
+                conn.execute(
+                    """
+                    UPDATE schedule SET status = ?, attempts = attempts + 1,
+                        last_error = ?, updated_at = ?
+                    WHERE folder = ?
+                    """,
+                    (STATUS_FAILED, error, time.time(), folder_name),
+                )
+            else:
+                conn.execute(
+                    """
+                    UPDATE schedule SET status = ?, attempts = attempts + 1,
+                        last_error = ?, scheduled_at = ?, updated_at = ?
+                    WHERE folder = ?
+                    """,
+                    (STATUS_PENDING, error, retry_at, time.time(), folder_name),
+                )
+            conn.commit()
+
+    def remove(self, folder_name: str) -> bool:
+        """예약 삭제 (삭제했으면 True)."""
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute("DELETE FROM schedule WHERE folder = ?", (folder_name,))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def _update(self, folder_name: str, **fields) -> None:
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                f"UPDATE schedule SET {assignments}, updated_at = ? WHERE folder = ?",
+                (*fields.values(), time.time(), folder_name),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        """DB 연결 종료."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class PublishScheduler:
+    """예약 시각 순서로 폴더를 게시하는 스케줄러.
+
+    다음 예약 시각(또는 재검사 시각)까지 Event.wait로 잠들기 때문에 대기 중에는
+    CPU를 거의 쓰지 않는다. 같은 시각에 도래한 폴더들은 publish_batch로 묶어
+    Git commit/push를 한 번만 실행한다.
+    """
+
+    def __init__(
+        self,
+        workflow: PublishWorkflow,
+        store: ScheduleStore,
+        rescan_interval: float = DEFAULT_RESCAN_INTERVAL,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        push: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        """PublishScheduler 초기화.
+
+        Args:
+            workflow: 게시에 사용할 PublishWorkflow
+            store: 예약 상태 저장소
+            rescan_interval: blog-content의 scheduled_at 재검사 간격 (초)
+            max_attempts: 폴더당 최대 게시 시도 횟수
+            retry_delay: 실패 후 재시도 대기 시작값 (초, 시도마다 2배)
+            push: True면 게시 후 git push
+            clock: 현재 시각 (epoch 초, 테스트용)
+        """
+        self.workflow = workflow
+        self.store = store
+        self.rescan_interval = rescan_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.push = push
+        self._clock = clock
+        self._heap: list[tuple[float, str]] = []
+        self._heap_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_config(cls, workflow: PublishWorkflow, config: dict, **kwargs) -> "PublishScheduler":
+        """schedule 설정으로 생성."""
+        schedule_config = config.get("schedule", {})
+        options = {
+            "rescan_interval": float(
+                schedule_config.get("rescan_interval", DEFAULT_RESCAN_INTERVAL)
+            ),
+            "max_attempts": int(schedule_config.get("max_attempts", DEFAULT_MAX_ATTEMPTS)),
+            "retry_delay": float(schedule_config.get("retry_delay", DEFAULT_RETRY_DELAY)),
+            "push": bool(schedule_config.get("push", True)),
+            **kwargs,
+        }
+        return cls(workflow, ScheduleStore.from_config(config), **options)
+
+    def sync(self) -> int:
+        """blog-content의 scheduled_at을 예약 목록에 반영하고 큐를 다시 구성.
+
+        새로 예약되었거나 아직 시도하지 않은 예약의 시각이 바뀐 폴더만 반영한다.
+        이미 게시했거나 포기한 폴더, `schedule add`로 직접 등록한 폴더는
+        건드리지 않는다.
+
+        Returns:
+            새로 반영한 폴더 수
+        """
+        changed = 0
+        loader = self.workflow.content_loader
+        for folder_name in loader.list_folders():
+            try:
+                scheduled_at = loader.get_scheduled_at(folder_name)
+            except ValueError as e:
+                print(f"⚠️ {folder_name}: {e}")
+                continue
+            if scheduled_at is None:
+                continue
+
+            timestamp = scheduled_at.timestamp()
+            entry = self.store.get(folder_name)
+            if entry is None or (
+                entry["source"] == SOURCE_META
+                and entry["status"] == STATUS_PENDING
+                and entry["attempts"] == 0
+                and entry["scheduled_at"] != timestamp
+            ):
+                self.store.add(folder_name, timestamp, source=SOURCE_META)
+                changed += 1
+
+        self.reload()
+        return changed
+
+    def reload(self) -> None:
+        """저장소의 대기 중 예약으로 큐 재구성."""
+        with self._heap_lock:
+            self._heap = self.store.pending()
+            heapq.heapify(self._heap)
+        self._wakeup.set()
+
+    def add(self, folder_name: str, scheduled_at: datetime) -> None:
+        """예약 추가 후 실행 중인 루프를 깨움."""
+        timestamp = scheduled_at.timestamp()
+        self.store.add(folder_name, timestamp)
+        with self._heap_lock:
+            heapq.heappush(self._heap, (timestamp, folder_name))
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """실행 루프 종료 요청."""
+        self._stop.set()
+        self._wakeup.set()
+
+    def next_due(self) -> float | None:
+        """가장 이른 예약 시각 (큐가 비어 있으면 None)."""
+        with self._heap_lock:
+            return self._heap[0][0] if self._heap else None
+
+    def _pop_due(self, now: float) -> list[str]:
+        """도래한 폴더를 큐에서 꺼냄.
+
+        큐에는 예약 변경/삭제 전의 항목이 남아 있을 수 있으므로 저장소와
+        시각/상태가 일치하는 항목만 사용한다.
+        """
+        due: list[str] = []
+        with self._heap_lock:
+            while self._heap and self._heap[0][0] <= now:
+                scheduled_at, folder_name = heapq.heappop(self._heap)
+                entry = self.store.get(folder_name)
+                if (
+                    entry is not None
+                    and entry["status"] == STATUS_PENDING
+                    and entry["scheduled_at"] == scheduled_at
+                    and folder_name not in due
+                ):
+                    due.append(folder_name)
+        return due
+
+    def run_due(self) -> dict[str, dict]:
+        """도래한 예약을 게시하고 결과 반환 (폴더 → publish_from_folder 결과)."""
+        now = self._clock()
+        due = self._pop_due(now)
+        if not due:
+            return {}
+
+        print(f"⏰ 예약 게시: {', '.join(due)}")
+        batch_result = self.workflow.publish_batch(due, push=self.push, schedule_store=self.store)
+
+        for folder_name in due:
+            deferred_at = batch_result.get("deferred", {}).get(folder_name)
+            if deferred_at is not None:
+                # 아직 게시 한도가 차 있음: publish_batch가 다음 게시 가능 시각으로 다시 예약
+                with self._heap_lock:
+                    heapq.heappush(self._heap, (deferred_at, folder_name))
+                continue
+
+            post = batch_result["posts"].get(folder_name, {})
+            error = self._post_error(post) or batch_result.get("git_error")
+            if error is None:
+                self.store.mark_done(folder_name)
+                continue
+
+            attempts = self.store.get(folder_name)["attempts"] + 1
+            if attempts >= self.max_attempts:
+                print(f"❌ {folder_name}: {attempts}회 실패, 예약 포기 ({error})")
+                self.store.mark_failed(folder_name, error, retry_at=None)
+            else:
+                retry_at = now + self.retry_delay * (2 ** (attempts - 1))
+                print(f"⚠️ {folder_name}: 게시 실패, {retry_at - now:.0f}초 후 재시도 ({error})")
+                self.store.mark_failed(folder_name, error, retry_at=retry_at)
+                with self._heap_lock:
+                    heapq.heappush(self._heap, (retry_at, folder_name))
+
+        return batch_result["posts"]
+
+    @staticmethod
+    def _post_error(post: dict) -> str | None:
+        """게시 결과의 실패 사유 (성공이면 None)."""
+        if "error" in post:
+            return post["error"]
+        if not post.get("blog"):
+            return "blog publish failed"
+        errors = [
+            f"{platform}: {sns_result['error']}"
+            for platform, sns_result in post.get("sns", {}).items()
+            if "error" in sns_result
+        ]
+        return "; ".join(errors) or None
+
+    def run(self, once: bool = False) -> None:
+        """예약 게시 루프.
+
+        Args:
+            once: True면 도래한 예약만 처리하고 종료 (cron 등에서 사용)
+        """
+        self.sync()
+        if once:
+            self.run_due()
+            return
+
+        next_scan = self._clock() + self.rescan_interval
+        while not self._stop.is_set():
+            self.run_due()
+
+            now = self._clock()
+            if now >= next_scan:
+                self.sync()
+                next_scan = now + self.rescan_interval
+
+            next_due = self.next_due()
+            wake_at = next_scan if next_due is None else min(next_due, next_scan)
+            self._wakeup.clear()
+            if not self._stop.is_set():
+                self._wakeup.wait(max(0.0, wake_at - self._clock()))
@@ -0,0 +1,76 @@
+import json
+import time
+
+from indieshout.utils.auth_cache import AuthCache, credential_fingerprint
+
+
+class TestAuthCache:
+    def test_set_and_get(self):
+        cache = AuthCache(ttl=60)
+        cache.set("x", "fp", {"id": "1"})
+
+        assert cache.get("x", "fp") == {"id": "1"}
+        assert cache.get("threads", "fp") is None
+
+    def test_changed_credentials_miss(self):
+        cache = AuthCache(ttl=60)
+        cache.set("x", credential_fingerprint("key", "token"), {"id": "1"})
+
+        assert cache.get("x", credential_fingerprint("key", "other")) is None
+
+    def test_expired_entry_removed(self):
+        cache = AuthCache(ttl=60)
+        cache.set("x", "fp", {"id": "1"}, token_expires_at=time.time() - 1)
+
+        assert cache.get("x", "fp") is None
+
+    def test_zero_ttl_disables(self):
+        cache = AuthCache(ttl=0)
+        cache.set("x", "fp", {"id": "1"})
+
+        assert cache.get("x", "fp") is None
+
+    def test_invalidate(self):
+        cache = AuthCache(ttl=60)
+        cache.set("x", "fp", {"id": "1"})
+
+        cache.invalidate("x")
+
+        assert cache.get("x", "fp") is None
+
+    def test_persists_to_disk(self, tmp_path):
+        path = tmp_path / "auth.json"
+        AuthCache(ttl=60, path=path).set("threads", "fp", {"id": "1"})
+
+        assert AuthCache(ttl=60, path=path).get("threads", "fp") == {"id": "1"}
+        # 토큰 원문은 저장하지 않음
+        assert "fp" in path.read_text() and (path.stat().st_mode & 0o777) == 0o600
+
+    def test_invalidate_persists(self, tmp_path):
+        path = tmp_path / "auth.json"
+        cache = AuthCache(ttl=60, path=path)
+        cache.set("threads", "fp", {"id": "1"})
+
+        cache.invalidate("threads")
+
+        assert json.loads(path.read_text()) == {}
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / "auth.json"
+        path.write_text("{not json")
+
+        assert AuthCache(path=path).get("x", "fp") is None
+
+
+class TestFromConfig:
+    def test_memory_only_by_default(self):
+        cache = AuthCache.from_config({})
+        assert cache.path is None
+        assert cache.ttl == 3600
+
+    def test_persist(self, tmp_path):
+        cache = AuthCache.from_config(
+            {"auth": {"cache_ttl": 10, "persist": True, "cache_path": str(tmp_path / "a.json")}}
+        )
+        assert cache.path == tmp_path / "a.json"
+        assert cache.ttl == 10
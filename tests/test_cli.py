@@ -1,3 +1,4 @@
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
@@ -62,7 +63,7 @@ class TestCli:
         mock_publisher.publish.return_value = {"tweet_id": "123", "url": "https://x.com/i/status/123"}
         mock_cls = MagicMock(return_value=mock_publisher)
 
-        with patch.dict("indieshout.main.PLATFORM_PUBLISHERS", {"x": mock_cls}):
+        with patch.dict("indieshout.publishers.registry.PLATFORM_PUBLISHERS", {"x": mock_cls}):
             result = self.runner.invoke(
                 cli, ["sns", "post", "Hello!", "--platforms", "x", "--no-dry-run"]
             )
@@ -71,3 +72,90 @@ class TestCli:
         mock_publisher.authenticate.assert_called_once()
         mock_publisher.validate.assert_called_once()
         mock_publisher.publish.assert_called_once()
+
+    def test_blog_publish_all(self):
+        mock_workflow = MagicMock()
+        mock_workflow.__enter__.return_value = mock_workflow
+        mock_workflow.list_unpublished_folders.return_value = ["00001-a", "00002-b", "00003-c"]
+        mock_workflow.publish_batch.return_value = {
+            "posts": {"00001-a": {"blog": {"url": "u"}, "sns": {}}},
+            "committed": True,
+            "pushed": False,
+        }
+
+        with patch("indieshout.workflows.publish_workflow.PublishWorkflow", return_value=mock_workflow):
+            result = self.runner.invoke(
+                cli, ["blog", "publish-all", "--limit", "1", "--no-push", "--workers", "3"]
+            )
+
+        assert result.exit_code == 0
+        assert "일괄 게시 완료" in result.output
+        args, kwargs = mock_workflow.publish_batch.call_args
+        assert args[0] == ["00001-a"]
+        assert kwargs["max_workers"] == 3
+        assert kwargs["push"] is False
+        mock_workflow.list_unpublished_folders.assert_called_once_with(include_scheduled=False)
+        mock_workflow.__exit__.assert_called_once()
+
+    def test_blog_publish_all_closes_workflow_on_error(self):
+        mock_workflow = MagicMock()
+        mock_workflow.__enter__.return_value = mock_workflow
+        mock_workflow.publish_batch.side_effect = RuntimeError("boom")
+
+        with patch("indieshout.workflows.publish_workflow.PublishWorkflow", return_value=mock_workflow):
+            result = self.runner.invoke(cli, ["blog", "publish-all", "--no-push"])
+
+        assert result.exit_code == 1
+        mock_workflow.__exit__.assert_called_once()
+
+    def test_schedule_add_list_remove(self, tmp_path):
+        config = {"schedule": {"path": str(tmp_path / "schedule.sqlite3")}}
+
+        with patch("indieshout.main.load_config", return_value=config):
+            added = self.runner.invoke(cli, ["schedule", "add", "00001-a", "--at", "2026-03-01T09:00"])
+            listed = self.runner.invoke(cli, ["schedule", "list"])
+            removed = self.runner.invoke(cli, ["schedule", "remove", "00001-a"])
+            empty = self.runner.invoke(cli, ["schedule", "list"])
+
+        assert added.exit_code == 0
+        assert "2026-03-01 09:00  pending  00001-a" in listed.output
+        assert "예약 삭제" in removed.output
+        assert "예약된 게시가 없습니다" in empty.output
+
+    def test_schedule_add_invalid_time(self, tmp_path):
+        config = {"schedule": {"path": str(tmp_path / "schedule.sqlite3")}}
+
+        with patch("indieshout.main.load_config", return_value=config):
+            result = self.runner.invoke(cli, ["schedule", "add", "00001-a", "--at", "tomorrow"])
+
+        assert result.exit_code != 0
+        assert "ISO" in result.output
+
+    def test_jobs_list_and_retry(self, tmp_path):
+        from indieshout.workflows.job_queue import JOB_FAILED, JobQueue
+
+        config = {"jobs": {"path": str(tmp_path / "jobs.sqlite3")}}
+        queue = JobQueue(tmp_path / "jobs.sqlite3")
+        job_id = queue.enqueue("00001-a", "key", ["upload", "sns:x"], {})
+        queue.fail_step(job_id, "sns:x", "denied")
+        queue.finish_job(job_id, JOB_FAILED, "failed steps: sns:x")
+        queue.close()
+
+        with patch("indieshout.main.load_config", return_value=config):
+            listed = self.runner.invoke(cli, ["jobs", "list"])
+            retried = self.runner.invoke(cli, ["jobs", "retry", str(job_id)])
+
+        assert "#1 failed   00001-a  upload=pending sns:x=failed" in listed.output
+        assert "재시도 등록" in retried.output
+
+    def test_cache_prune_all(self, tmp_path):
+        with self.runner.isolated_filesystem(temp_dir=tmp_path) as cwd:
+            cache_entry = Path(cwd) / "blog-content" / "00001-a" / ".cache" / "derivatives" / "abc"
+            cache_entry.mkdir(parents=True)
+            (cache_entry / "1.jpg").write_bytes(b"x" * 2048)
+            with patch("indieshout.main.load_config", return_value={}):
+                result = self.runner.invoke(cli, ["cache", "prune", "--all"])
+
+            assert result.exit_code == 0
+            assert "캐시 정리 완료" in result.output
+            assert not cache_entry.exists()
@@ -1,6 +1,7 @@
 """ContentLoader 테스트."""
 
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -191,3 +192,41 @@ def test_load_with_number_prefix(temp_blog_dir):
     # slug에서 숫자가 제거됨
     assert data["blog_content"].slug == "test-post"
     assert data["blog_content"].title == "Test Post"
+
+
+def test_list_folders_numeric_order(temp_blog_dir):
+    """숫자 prefix 순서 정렬, prefix 없는 폴더는 뒤로."""
+    for name in ["00010-c", "notes", "00002-b", "00001-a"]:
+        (temp_blog_dir / name).mkdir()
+
+    loader = ContentLoader(temp_blog_dir)
+
+    assert loader.list_folders() == ["00001-a", "00002-b", "00010-c", "notes"]
+    assert loader.get_slug("00010-c") == "c"
+
+
+def test_scheduled_at(temp_blog_dir):
+    """scheduled_at 파싱."""
+    folder = temp_blog_dir / "scheduled"
+    folder.mkdir()
+    (folder / "content.md").write_text("# test")
+    (folder / "meta.md").write_text("title: Scheduled\nscheduled_at: 2026-03-01 09:00\n---\nSNS")
+
+    loader = ContentLoader(temp_blog_dir)
+    data = loader.load_from_folder("scheduled")
+
+    assert data["scheduled_at"] == datetime(2026, 3, 1, 9, 0)
+    assert data["blog_content"].scheduled_at == datetime(2026, 3, 1, 9, 0)
+    assert loader.get_scheduled_at("scheduled") == datetime(2026, 3, 1, 9, 0)
+    assert loader.get_scheduled_at("missing") is None
+
+
+def test_scheduled_at_invalid(temp_blog_dir):
+    """잘못된 scheduled_at 형식."""
+    folder = temp_blog_dir / "bad"
+    folder.mkdir()
+    (folder / "content.md").write_text("# test")
+    (folder / "meta.md").write_text("title: Bad\nscheduled_at: next monday\n---\nSNS")
+
+    with pytest.raises(ValueError, match="scheduled_at"):
+        ContentLoader(temp_blog_dir).load_from_folder("bad")
@@ -0,0 +1,84 @@
+import os
+
+from indieshout.utils.derivative_cache import DerivativeCache, cache_key
+
+
+def put_entry(cache: DerivativeCache, key: str, size: int = 1024, used_at: float | None = None) -> dict:
+    entry_dir = cache.entry_dir(key)
+    entry_dir.mkdir(parents=True)
+    path = entry_dir / "1.jpg"
+    path.write_bytes(b"x" * size)
+    cache.put(key, {"path": str(path), "files": [str(path)], "original_bytes": size * 2, "bytes": size})
+    if used_at is not None:
+        os.utime(entry_dir / "entry.json", (used_at, used_at))
+    return {"path": str(path)}
+
+
+class TestCacheKey:
+    def test_depends_on_source_and_params(self):
+        key = cache_key("abc", {"quality": 82})
+        assert key == cache_key("abc", {"quality": 82})
+        assert key != cache_key("abd", {"quality": 82})
+        assert key != cache_key("abc", {"quality": 80})
+
+    def test_source_content_changes_key(self, tmp_path):
+        cache = DerivativeCache(tmp_path / "cache")
+        source = tmp_path / "1.png"
+        source.write_bytes(b"one")
+        first = cache.key(source, {})
+        source.write_bytes(b"two")
+        assert cache.key(source, {}) != first
+
+
+class TestDerivativeCache:
+    def test_put_and_get(self, tmp_path):
+        cache = DerivativeCache.for_folder(tmp_path)
+        put_entry(cache, "k1")
+
+        result = cache.get("k1")
+
+        assert result["path"] == str(tmp_path / ".cache" / "derivatives" / "k1" / "1.jpg")
+        assert result["files"] == [result["path"]]
+        assert result["bytes"] == 1024
+
+    def test_miss_when_absent_or_file_missing(self, tmp_path):
+        cache = DerivativeCache(tmp_path)
+        assert cache.get("k1") is None
+
+        entry = put_entry(cache, "k1")
+        os.remove(entry["path"])
+        assert cache.get("k1") is None
+
+    def test_get_refreshes_last_used(self, tmp_path):
+        cache = DerivativeCache(tmp_path)
+        put_entry(cache, "k1", used_at=1000)
+
+        cache.get("k1")
+
+        assert cache.entries()[0][1] > 1000
+
+    def test_prune_evicts_least_recently_used(self, tmp_path):
+        cache = DerivativeCache(tmp_path, max_bytes=2500)
+        put_entry(cache, "old", used_at=1000)
+        put_entry(cache, "mid", used_at=2000)
+        put_entry(cache, "new", used_at=3000)
+
+        freed = cache.prune()
+
+        assert freed > 0
+        assert [entry[0].name for entry in cache.entries()] == ["mid", "new"]
+        assert cache.size() <= 2500
+
+    def test_prune_keeps_given_keys(self, tmp_path):
+        cache = DerivativeCache(tmp_path, max_bytes=0)
+        put_entry(cache, "old", used_at=1000)
+        put_entry(cache, "new", used_at=2000)
+
+        cache.prune(keep={"old"})
+
+        assert [entry[0].name for entry in cache.entries()] == ["old"]
+
+    def test_prune_unlimited(self, tmp_path):
+        cache = DerivativeCache(tmp_path, max_bytes=None)
+        put_entry(cache, "k1")
+        assert cache.prune() == 0
@@ -0,0 +1,174 @@
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from indieshout.blog.git_session import GitSession
+
+
+def git(repo, *args):
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "blog-site"
+    path.mkdir()
+    git(path, "init", "-q")
+    git(path, "config", "user.name", "tester")
+    git(path, "config", "user.email", "tester@example.com")
+    return path
+
+
+def add_post(repo, slug):
+    post_dir = repo / "content" / "posts" / slug
+    post_dir.mkdir(parents=True)
+    (post_dir / "index.ko.md").write_text(f"# {slug}\n")
+    return post_dir
+
+
+class TestInit:
+    def test_unknown_commit_mode_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown commit_mode"):
+            GitSession(tmp_path, commit_mode="squash")
+
+
+class TestCheckConfig:
+    @patch("subprocess.run")
+    def test_runs_once_per_session(self, mock_run, tmp_path):
+        mock_run.return_value = MagicMock(returncode=0)
+        session = GitSession(tmp_path)
+
+        assert session.check_config() is True
+        assert session.check_config() is True
+        assert mock_run.call_count == 1
+
+    @patch("subprocess.run")
+    def test_missing_user_raises(self, mock_run, tmp_path):
+        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+        with pytest.raises(RuntimeError, match="user.name"):
+            GitSession(tmp_path).check_config()
+
+
+class TestCommit:
+    def test_batch_mode_single_commit(self, repo):
+        session = GitSession(repo)
+        for slug in ("a", "b", "c"):
+            session.stage_post(add_post(repo, slug), f"제목 {slug}")
+
+        assert session.commit() == 1
+        assert git(repo, "rev-list", "--count", "HEAD") == "1"
+        message = git(repo, "log", "-1", "--format=%B")
+        assert message.startswith("Add 3 posts")
+        assert "- 제목 b" in message
+        assert not session.has_pending()
+
+    def test_single_post_message(self, repo):
+        session = GitSession(repo)
+        session.stage_post(add_post(repo, "a"), "제목")
+
+        session.commit()
+
+        assert git(repo, "log", "-1", "--format=%s") == "Add post: 제목"
+
+    def test_per_post_mode(self, repo):
+        session = GitSession(repo, commit_mode="per_post")
+        for slug in ("a", "b"):
+            session.stage_post(add_post(repo, slug), slug)
+
+        assert session.commit() == 2
+        assert git(repo, "rev-list", "--count", "HEAD") == "2"
+
+    def test_nothing_to_commit_ignored(self, repo):
+        session = GitSession(repo)
+        post_dir = add_post(repo, "a")
+        session.stage_post(post_dir, "a")
+        session.commit()
+
+        session.stage_post(post_dir, "a")
+        assert session.commit() == 0
+
+    def test_failed_commit_keeps_pending(self, repo):
+        session = GitSession(repo)
+        session.stage_post(add_post(repo, "a"), "a")
+
+        with patch.object(session, "_commit", side_effect=RuntimeError("Git commit failed")):
+            with pytest.raises(RuntimeError):
+                session.commit()
+
+        assert session.has_pending()
+        assert session.commit() == 1
+        assert git(repo, "log", "-1", "--format=%s") == "Add post: a"
+
+    def test_per_post_failure_keeps_uncommitted_posts(self, repo):
+        session = GitSession(repo, commit_mode="per_post")
+        for slug in ("a", "b"):
+            session.stage_post(add_post(repo, slug), slug)
+        commit = session._commit
+        messages = []
+
+        def fail_second(message):
+            messages.append(message)
+            if len(messages) == 2:
+                raise RuntimeError("Git commit failed")
+            return commit(message)
+
+        with patch.object(session, "_commit", side_effect=fail_second):
+            with pytest.raises(RuntimeError):
+                session.commit()
+
+        assert session.commit() == 1
+        assert git(repo, "log", "--format=%s") == "Add post: b\nAdd post: a"
+
+    def test_uncommitted_paths(self, repo):
+        session = GitSession(repo)
+        session.stage_post(add_post(repo, "a"), "a")
+        session.commit()
+        add_post(repo, "b")
+
+        assert session.uncommitted_paths("content/posts") == {"content/posts/b/"}
+
+    def test_uncommitted_paths_outside_repo(self, tmp_path):
+        assert GitSession(tmp_path / "missing").uncommitted_paths("content/posts") == set()
+
+    def test_no_pending_skips_git(self, tmp_path):
+        with patch("subprocess.run") as mock_run:
+            assert GitSession(tmp_path).commit() == 0
+        mock_run.assert_not_called()
+
+    def test_relative_repo_path(self, repo, monkeypatch):
+        monkeypatch.chdir(repo.parent)
+        session = GitSession("./blog-site")
+        session.stage_post(repo.name / add_post(repo, "a").relative_to(repo), "a")
+
+        assert session.commit() == 1
+
+
+class TestPush:
+    @patch("subprocess.run")
+    def test_push_to_remote_branch(self, mock_run, tmp_path):
+        session = GitSession(tmp_path, remote="origin", branch="main")
+        session.push()
+        assert mock_run.call_args.args[0] == ["git", "push", "origin", "main"]
+
+    @patch("subprocess.run")
+    def test_push_failure_raises(self, mock_run, tmp_path):
+        mock_run.side_effect = subprocess.CalledProcessError(1, "git", stderr=b"rejected")
+        with pytest.raises(RuntimeError, match="rejected"):
+            GitSession(tmp_path).push()
+
+
+class TestTimings:
+    def test_records_each_phase(self, repo):
+        session = GitSession(repo)
+        session.check_config()
+        session.stage_post(add_post(repo, "a"), "a")
+        session.commit()
+
+        assert set(session.timings) == {"config", "add", "commit"}
+        assert session.format_timings().startswith("Git 소요 시간: config")
+
+    def test_no_timings(self, tmp_path):
+        assert GitSession(tmp_path).format_timings() is None
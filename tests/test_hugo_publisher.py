@@ -177,6 +177,27 @@ class TestS3Integration:
         assert "test-slug" in url_map[str(image1)]
         assert "image1.jpg" in url_map[str(image1)]
 
+    def test_uncommitted_slugs(self, publisher):
+        """커밋되지 않은 포스트 디렉토리만 slug로 반환."""
+        publisher.git.uncommitted_paths = MagicMock(
+            return_value={"content/posts/b/", "content/posts/c/index.en.md", "static/x.png"}
+        )
+        assert publisher.uncommitted_slugs() == {"b", "c"}
+
+    def test_upload_progress_printed_per_file(self, capsys):
+        """업로드 진행률은 파일별로 25% 단위로 한 번씩만 출력."""
+        progress = HugoPublisher._upload_progress_printer()
+        for transferred in (10, 30, 40, 100, 100):
+            progress("/tmp/a.jpg", transferred, 100)
+        progress("/tmp/b.jpg", 100, 100)
+
+        out = capsys.readouterr().out
+        assert [line.split(":")[1].split()[0] for line in out.splitlines() if "a.jpg" in line] == [
+            "25%",
+            "100%",
+        ]
+        assert "b.jpg: 100%" in out
+
     def test_replace_image_paths(self, publisher):
         """마크다운의 이미지 경로를 S3 URL로 치환."""
         markdown = """
@@ -209,3 +230,147 @@ Some text here.
 
         assert "/local/image.jpg" not in result
         assert "https://s3.amazonaws.com/image.jpg" in result
+
+    def test_replace_relative_image_paths(self, publisher, tmp_path, capsys):
+        """content.md의 상대 경로는 포스트 폴더 기준으로 치환하고 누락은 경고."""
+        markdown = "![1](assets/1.png)\n\n![2](assets/2.png)"
+        url_map = {str(tmp_path / "assets" / "1.png"): "https://s3.amazonaws.com/1.png"}
+
+        result = publisher._replace_image_paths(markdown, url_map, str(tmp_path))
+
+        assert "![1](https://s3.amazonaws.com/1.png)" in result
+        assert "![2](assets/2.png)" in result
+        assert "3: assets/2.png" in capsys.readouterr().out
+
+
+class TestUploadManifest:
+    """업로드 매니페스트로 변경 없는 이미지 재업로드 생략."""
+
+    @pytest.fixture
+    def moto_publisher(self, hugo_config, monkeypatch):
+        moto = pytest.importorskip("moto")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test_key")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test_secret")
+        hugo_config["s3"] = {"bucket_name": "test-bucket", "region": "ap-northeast-2"}
+
+        with moto.mock_aws():
+            publisher = HugoPublisher(hugo_config)
+            publisher.s3_uploader.s3_client.create_bucket(
+                Bucket="test-bucket",
+                CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"},
+            )
+            yield publisher
+
+    @pytest.fixture
+    def post_folder(self, tmp_path):
+        assets = tmp_path / "00001-post" / "assets"
+        assets.mkdir(parents=True)
+        (assets / "1.png").write_bytes(b"image 1")
+        (assets / "2.png").write_bytes(b"image 2")
+        return tmp_path / "00001-post"
+
+    def test_unchanged_images_skip_network(self, moto_publisher, post_folder):
+        images = [str(post_folder / "assets" / "1.png"), str(post_folder / "assets" / "2.png")]
+        first = moto_publisher._upload_images_to_s3(images, "post", source_dir=str(post_folder))
+
+        s3_client = moto_publisher.s3_uploader.s3_client
+        s3_client.upload_file = MagicMock(side_effect=AssertionError("re-upload"))
+        s3_client.head_object = MagicMock(side_effect=AssertionError("network call"))
+
+        second = moto_publisher._upload_images_to_s3(images, "post", source_dir=str(post_folder))
+
+        assert second == first
+        assert list(second) == images
+
+    def test_changed_image_reuploaded(self, moto_publisher, post_folder):
+        images = [str(post_folder / "assets" / "1.png"), str(post_folder / "assets" / "2.png")]
+        moto_publisher._upload_images_to_s3(images, "post", source_dir=str(post_folder))
+
+        (post_folder / "assets" / "2.png").write_bytes(b"edited image 2")
+        s3_client = moto_publisher.s3_uploader.s3_client
+        original_upload = s3_client.upload_file
+        s3_client.upload_file = MagicMock(side_effect=original_upload)
+
+        url_map = moto_publisher._upload_images_to_s3(images, "post", source_dir=str(post_folder))
+
+        assert len(url_map) == 2
+        assert s3_client.upload_file.call_count == 1
+        assert s3_client.upload_file.call_args.args[0].endswith("2.png")
+
+    def test_missing_manifest_falls_back_to_etag(self, moto_publisher, post_folder):
+        images = [str(post_folder / "assets" / "1.png"), str(post_folder / "assets" / "2.png")]
+        moto_publisher._upload_images_to_s3(images, "post", source_dir=str(post_folder))
+        (post_folder / ".upload-manifest.json").unlink()
+
+        s3_client = moto_publisher.s3_uploader.s3_client
+        s3_client.upload_file = MagicMock(side_effect=AssertionError("re-upload"))
+
+        url_map = moto_publisher._upload_images_to_s3(images, "post", source_dir=str(post_folder))
+
+        assert len(url_map) == 2
+        assert (post_folder / ".upload-manifest.json").exists()
+
+
+class TestPublishPipeline:
+    """업로드와 번역을 겹쳐 실행하는 publish 파이프라인."""
+
+    @pytest.fixture
+    def pipeline_publisher(self, hugo_config, tmp_path):
+        hugo_config["hugo"]["blog_repo_path"] = str(tmp_path / "blog-site")
+        hugo_config["translator"] = {"provider": "stub", "cache": False}
+        publisher = HugoPublisher(hugo_config)
+        publisher.s3_uploader = MagicMock()
+        publisher.git = MagicMock()
+        return publisher
+
+    def test_upload_and_translation_overlap(self, pipeline_publisher, tmp_path):
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+        image = tmp_path / "assets" / "1.png"
+        image.parent.mkdir()
+        image.write_bytes(b"png")
+
+        def upload(image_paths, slug, source_dir=None):
+            # 번역이 동시에 진행 중이어야 통과
+            barrier.wait()
+            return {str(image): "https://cdn.example.com/posts/test/1.png"}
+
+        original_translate = pipeline_publisher.translator.translate_markdown
+
+        def translate(markdown, **kwargs):
+            barrier.wait()
+            return original_translate(markdown, **kwargs)
+
+        pipeline_publisher._upload_images_to_s3 = upload
+        pipeline_publisher.translator.translate_markdown = translate
+
+        content = Content(
+            content_type=ContentType.BLOG,
+            title="제목",
+            text=f"본문\n\n![그림]({image})",
+            slug="test",
+            image_paths=[str(image)],
+        )
+        result = pipeline_publisher.publish(content)
+
+        ko = Path(result["files"]["ko"]).read_text(encoding="utf-8")
+        en = Path(result["files"]["en"]).read_text(encoding="utf-8")
+        for text in (ko, en):
+            assert "](https://cdn.example.com/posts/test/1.png)" in text
+            assert str(image) not in text
+        assert "[en] 본문" in en
+        pipeline_publisher.git.stage_post.assert_called_once()
+        assert pipeline_publisher.git.stage_post.call_args.args[1] == "제목"
+        pipeline_publisher.git.commit.assert_called_once()
+
+    def test_translation_failure_skips_en_file(self, pipeline_publisher):
+        pipeline_publisher.translator.translate_markdown = MagicMock(
+            side_effect=RuntimeError("boom")
+        )
+        content = Content(content_type=ContentType.BLOG, title="제목", text="본문", slug="test")
+
+        result = pipeline_publisher.publish(content)
+
+        assert result["files"]["en"] is None
+        assert Path(result["files"]["ko"]).exists()
@@ -0,0 +1,225 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+from indieshout.blog.hugo_publisher import HugoPublisher  # noqa: E402
+from indieshout.models.content import Content, ContentType  # noqa: E402
+from indieshout.utils.derivative_cache import DerivativeCache  # noqa: E402
+from indieshout.utils.image_optimizer import (  # noqa: E402
+    ImageOptimizer,
+    optimize_image,
+    process_pool_context,
+)
+
+
+def make_image(path: Path, size=(2000, 1000), mode="RGB", exif=False) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    color = (10, 120, 200, 128) if mode == "RGBA" else (10, 120, 200)
+    image = Image.new(mode, size, color)
+    options = {}
+    if exif:
+        exif_data = Image.Exif()
+        exif_data[0x010F] = "TestCamera"  # Make
+        options["exif"] = exif_data.tobytes()
+    image.save(path, **options)
+    return path
+
+
+class TestOptimizeImage:
+    def test_downscales_and_converts_opaque_png_to_jpeg(self, tmp_path):
+        source = make_image(tmp_path / "assets" / "1.png")
+
+        result = optimize_image(str(source), str(tmp_path / "out"), max_width=800, formats=[])
+
+        assert result["path"].endswith("1-png.jpg")
+        with Image.open(result["path"]) as image:
+            assert image.size == (800, 400)
+            assert image.format == "JPEG"
+
+    def test_keeps_png_with_transparency(self, tmp_path):
+        source = make_image(tmp_path / "1.png", mode="RGBA")
+
+        result = optimize_image(str(source), str(tmp_path / "out"), formats=[])
+
+        assert result["path"].endswith("1.png")
+
+    def test_convert_png_disabled(self, tmp_path):
+        source = make_image(tmp_path / "1.png")
+
+        result = optimize_image(str(source), str(tmp_path / "out"), formats=[], convert_png=False)
+
+        assert result["path"].endswith("1.png")
+
+    def test_strips_metadata(self, tmp_path):
+        source = make_image(tmp_path / "1.jpg", exif=True)
+        with Image.open(source) as image:
+            assert image.getexif()
+
+        result = optimize_image(str(source), str(tmp_path / "out"), formats=[])
+
+        with Image.open(result["path"]) as image:
+            assert not image.getexif()
+
+    def test_variants_and_responsive_widths(self, tmp_path):
+        source = make_image(tmp_path / "1.png")
+
+        result = optimize_image(
+            str(source),
+            str(tmp_path / "out"),
+            max_width=1600,
+            formats=["webp"],
+            responsive_widths=[480, 960, 3000],
+        )
+
+        names = [Path(f).name for f in result["files"]]
+        assert names == ["1-png.jpg", "1-png.webp", "1-png-480w.webp", "1-png-960w.webp"]
+        assert [(v["file"], v["width"]) for v in result["variants"]] == [
+            ("1-png.webp", 1600),
+            ("1-png-480w.webp", 480),
+            ("1-png-960w.webp", 960),
+        ]
+        with Image.open(tmp_path / "out" / "1-png-480w.webp") as image:
+            assert image.size == (480, 240)
+
+    def test_same_stem_different_extension_do_not_collide(self, tmp_path):
+        png = make_image(tmp_path / "1.png")
+        jpg = make_image(tmp_path / "1.jpg")
+
+        png_result = optimize_image(str(png), str(tmp_path / "out"), formats=["webp"])
+        jpg_result = optimize_image(str(jpg), str(tmp_path / "out"), formats=["webp"])
+
+        assert Path(jpg_result["path"]).name == "1.jpg"
+        assert not set(png_result["files"]) & set(jpg_result["files"])
+
+    def test_gif_passed_through(self, tmp_path):
+        source = tmp_path / "anim.gif"
+        Image.new("P", (10, 10)).save(source)
+
+        result = optimize_image(str(source), str(tmp_path / "out"), formats=["webp"])
+
+        assert result["files"] == [str(tmp_path / "out" / "anim.gif")]
+        assert Path(result["path"]).read_bytes() == source.read_bytes()
+
+
+class TestImageOptimizer:
+    def test_unknown_format_raises(self):
+        with pytest.raises(ValueError, match="Unknown image format"):
+            ImageOptimizer(formats=["bmp"])
+
+    def test_from_config_disabled_by_default(self):
+        assert ImageOptimizer.from_config({}) is None
+
+    def test_from_config(self):
+        optimizer = ImageOptimizer.from_config(
+            {"images": {"optimize": True, "max_width": 1200, "formats": [], "workers": 2}}
+        )
+        assert optimizer.max_width == 1200
+        assert optimizer.formats == []
+        assert optimizer.workers == 2
+
+    def test_from_config_variants_only_with_picture(self):
+        images = {"optimize": True, "formats": ["webp"], "responsive_widths": [480]}
+
+        optimizer = ImageOptimizer.from_config({"images": images})
+        assert (optimizer.formats, optimizer.responsive_widths) == ([], [])
+
+        optimizer = ImageOptimizer.from_config({"images": {**images, "picture": True}})
+        assert (optimizer.formats, optimizer.responsive_widths) == (["webp"], [480])
+
+    def test_process_pool_keeps_order(self, tmp_path):
+        sources = [str(make_image(tmp_path / f"{i}.png", size=(600, 300))) for i in range(3)]
+
+        results = ImageOptimizer(formats=[], workers=2).optimize_many(sources, tmp_path / "out")
+
+        assert list(results) == sources
+        assert [Path(r["path"]).name for r in results.values()] == ["0-png.jpg", "1-png.jpg", "2-png.jpg"]
+
+    def test_process_pool_does_not_fork(self):
+        assert process_pool_context().get_start_method() in ("forkserver", "spawn")
+
+    def test_broken_image_falls_back_to_original(self, tmp_path):
+        broken = tmp_path / "broken.png"
+        broken.write_bytes(b"not an image")
+
+        results = ImageOptimizer(formats=[], workers=1).optimize_many([str(broken)], tmp_path / "out")
+
+        assert results[str(broken)]["path"] == str(broken)
+
+    def test_cache_skips_encoding_when_unchanged(self, tmp_path, monkeypatch):
+        from indieshout.utils import image_optimizer
+
+        sources = [str(make_image(tmp_path / f"{i}.png", size=(600, 300))) for i in range(2)]
+        cache = DerivativeCache(tmp_path / "cache")
+        optimizer = ImageOptimizer(formats=[], workers=1)
+        first = optimizer.optimize_many(sources, cache=cache)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("re-encoded a cached image")
+
+        monkeypatch.setattr(image_optimizer, "optimize_image", fail)
+        second = optimizer.optimize_many(sources, cache=cache)
+
+        assert second == first
+
+    def test_cache_misses_when_settings_change(self, tmp_path):
+        source = str(make_image(tmp_path / "1.png", size=(600, 300)))
+        cache = DerivativeCache(tmp_path / "cache")
+
+        first = ImageOptimizer(formats=[], workers=1).optimize_many([source], cache=cache)
+        second = ImageOptimizer(formats=[], quality=60, workers=1).optimize_many([source], cache=cache)
+
+        assert first[source]["path"] != second[source]["path"]
+        assert len(cache.entries()) == 2
+
+    def test_requires_output_dir_or_cache(self):
+        with pytest.raises(ValueError):
+            ImageOptimizer(formats=[]).optimize_many([])
+
+
+class TestHugoUpload:
+    def test_uploads_optimized_files_and_maps_original(self, tmp_path):
+        config = {
+            "hugo": {"blog_repo_path": str(tmp_path / "blog-site")},
+            "images": {
+                "optimize": True,
+                "picture": True,
+                "formats": ["webp"],
+                "responsive_widths": [],
+                "workers": 1,
+            },
+        }
+        publisher = HugoPublisher(config)
+        publisher.s3_uploader = MagicMock()
+        publisher.image_optimizer = ImageOptimizer.from_config(config)
+        uploaded = {}
+
+        def upload(image_paths, slug, source_dir=None):
+            uploaded.update({p: f"https://cdn/{Path(p).name}" for p in image_paths})
+            return dict(uploaded)
+
+        publisher._upload_images_to_s3 = upload
+        folder = tmp_path / "00001-post"
+        image = make_image(folder / "assets" / "1.png")
+        content = Content(
+            content_type=ContentType.BLOG,
+            title="t",
+            text="x",
+            image_paths=[str(image)],
+            source_dir=str(folder),
+        )
+
+        url_map = publisher.upload_images(content, "post")
+
+        assert url_map == {str(image): "https://cdn/1-png.jpg"}
+        assert sorted(Path(p).name for p in uploaded) == ["1-png.jpg", "1-png.webp"]
+        assert list((folder / ".cache" / "derivatives").glob("*/1-png.jpg"))
+
+        markdown = publisher._replace_image_paths("![그림](assets/1.png)", url_map, str(folder))
+        assert markdown == (
+            '<picture><source type="image/webp" srcset="https://cdn/1-png.webp 1600w" sizes="100vw">'
+            '<img src="https://cdn/1-png.jpg" alt="그림" loading="lazy"></picture>'
+        )
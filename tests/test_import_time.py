@@ -0,0 +1,71 @@
+"""CLI 시작 시간 회귀 테스트 (python -X importtime)."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# CLI import 시 불러오면 안 되는 무거운 모듈
+HEAVY_MODULES = {"boto3", "botocore", "tweepy", "httpx", "pydantic"}
+
+# indieshout.main import 누적 시간 예산 (ms, 느린 CI에서는 환경 변수로 조정)
+IMPORT_BUDGET_MS = float(os.environ.get("INDIESHOUT_IMPORT_BUDGET_MS", "200"))
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """-X importtime 출력 → 모듈 이름: 누적 시간(us)."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def test_main_import_skips_heavy_modules():
+    timings = parse_importtime(run_python("import indieshout.main", "-X", "importtime").stderr)
+
+    loaded = {name.split(".")[0] for name in timings} & HEAVY_MODULES
+    assert loaded == set()
+
+
+def test_main_import_within_budget():
+    # 첫 실행은 .pyc 생성 시간이 섞이므로 한 번 데운 뒤 측정
+    run_python("import indieshout.main")
+    timings = parse_importtime(run_python("import indieshout.main", "-X", "importtime").stderr)
+
+    assert timings["indieshout.main"] / 1000 < IMPORT_BUDGET_MS
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["--help"], ["sns", "post", "hello", "--dry-run"], ["blog", "--help"]],
+)
+def test_light_commands_skip_publishers(args):
+    code = (
+        "import sys\n"
+        "from indieshout.main import cli\n"
+        f"cli({args!r}, standalone_mode=False)\n"
+        f"print(sorted(m for m in {sorted(HEAVY_MODULES - {'pydantic'})!r} if m in sys.modules))"
+    )
+    result = run_python(code)
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_workflow_import_skips_publisher_modules():
+    code = (
+        "import sys\n"
+        "import indieshout.workflows.publish_workflow\n"
+        "print(sorted(m for m in ('tweepy', 'indieshout.publishers.twitter', "
+        "'indieshout.publishers.threads') if m in sys.modules))"
+    )
+    assert run_python(code).stdout.strip() == "[]"
@@ -0,0 +1,294 @@
+import subprocess
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from indieshout.blog.git_session import GitSession
+from indieshout.workflows.job_queue import (
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_QUEUED,
+    STEP_DONE,
+    STEP_FAILED,
+    STEP_PENDING,
+    STEP_RUNNING,
+    STEP_SKIPPED,
+    JobQueue,
+    JobRunner,
+)
+from indieshout.workflows.publish_workflow import PublishWorkflow
+
+
+@pytest.fixture
+def blog_dir(tmp_path):
+    blog_dir = tmp_path / "blog-content"
+    for name in ("00001-first", "00002-second"):
+        folder = blog_dir / name
+        folder.mkdir(parents=True)
+        (folder / "content.md").write_text(f"# {name}\n\n본문", encoding="utf-8")
+        (folder / "meta.md").write_text(
+            f"title: {name}\nplatforms: x, threads\n\n---\n\nSNS 텍스트", encoding="utf-8"
+        )
+    return blog_dir
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = JobQueue(tmp_path / "jobs.sqlite3")
+    yield queue
+    queue.close()
+
+
+def make_publisher(publish):
+    publisher = MagicMock()
+    publisher.publish.side_effect = publish
+    return publisher
+
+
+@pytest.fixture
+def workflow(blog_dir, tmp_path):
+    config = {"hugo": {"blog_repo_path": str(tmp_path / "blog-site")}}
+    workflow = PublishWorkflow(config, blog_content_dir=blog_dir)
+    hugo = workflow.hugo_publisher
+    hugo.authenticate = MagicMock(return_value=True)
+    hugo.validate = MagicMock(return_value=True)
+    hugo.upload_images = MagicMock(return_value={"assets/1.jpg": "https://cdn/1.jpg"})
+    hugo.translate = MagicMock(return_value="# English")
+    hugo.git = MagicMock()
+    hugo.git.commit.return_value = 1
+    workflow.publishers = {
+        "x": make_publisher(lambda content: {"tweet_id": "1"}),
+        "threads": make_publisher(lambda content: {"post_id": "2"}),
+    }
+    yield workflow
+    workflow.close()
+
+
+def step_status(queue, job_id):
+    return {step["name"]: step["status"] for step in queue.steps(job_id)}
+
+
+class TestJobQueue:
+    def test_enqueue_is_idempotent(self, queue):
+        first = queue.enqueue("a", "key", ["format", "sns:x"], {})
+        second = queue.enqueue("a", "key", ["format", "sns:x"], {})
+
+        assert first == second
+        assert len(queue.list_jobs()) == 1
+        assert [step["idempotency_key"] for step in queue.steps(first)] == ["key:format", "key:sns:x"]
+
+    def test_claim_in_order_and_once(self, queue):
+        first = queue.enqueue("a", "k1", ["format"], {})
+        second = queue.enqueue("b", "k2", ["format"], {})
+
+        assert queue.claim("w1")["id"] == first
+        assert queue.claim("w2")["id"] == second
+        assert queue.claim("w3") is None
+
+    def test_expired_lease_reclaimed(self, queue):
+        job_id = queue.enqueue("a", "k1", ["format"], {})
+        queue.claim("dead-worker", lease=-1)
+
+        job = queue.claim("w2")
+
+        assert job["id"] == job_id
+        assert job["worker"] == "w2"
+        assert job["attempts"] == 2
+
+    def test_retry_resets_failed_steps_only(self, queue):
+        job_id = queue.enqueue("a", "k1", ["upload", "sns:x"], {})
+        queue.finish_step(job_id, "upload", {"a": "b"})
+        queue.fail_step(job_id, "sns:x", "boom")
+        queue.finish_job(job_id, JOB_FAILED, "boom")
+
+        assert queue.retry(job_id) is True
+        assert queue.get(job_id)["status"] == JOB_QUEUED
+        assert step_status(queue, job_id) == {"upload": STEP_DONE, "sns:x": STEP_PENDING}
+        assert queue.steps(job_id)[0]["result"] == {"a": "b"}
+        assert queue.retry(job_id) is False
+
+    def test_reenqueue_failed_job_requeues(self, queue):
+        job_id = queue.enqueue("a", "k1", ["upload"], {})
+        queue.fail_step(job_id, "upload", "boom")
+        queue.finish_job(job_id, JOB_FAILED, "boom")
+
+        assert queue.enqueue("a", "k1", ["upload"], {}) == job_id
+        assert queue.get(job_id)["status"] == JOB_QUEUED
+
+
+class TestJobRunner:
+    def test_runs_all_steps(self, workflow, queue):
+        runner = JobRunner(workflow, queue, workers=2)
+        job_id = runner.enqueue_folder("00001-first")
+
+        assert runner.run(push=False) == {job_id: JOB_DONE}
+        assert set(step_status(queue, job_id).values()) == {STEP_DONE}
+        assert workflow.state.get_sns("00001-first", "x")["tweet_id"] == "1"
+        blog_dir = workflow.content_loader.blog_content_dir
+        assert workflow.state.get("00001-first")["blog_url"].endswith("/first/")
+        assert (blog_dir.parent / "blog-site" / "content" / "posts" / "first" / "index.en.md").exists()
+
+        sns_content = workflow.publishers["x"].publish.call_args.args[0]
+        assert sns_content.image_urls == ["https://cdn/1.jpg"]
+        assert "/first/" in sns_content.text
+
+    def test_failed_step_resumes_without_redoing_done_steps(self, workflow, queue):
+        calls = {"threads": 0}
+
+        def flaky(content):
+            calls["threads"] += 1
+            if calls["threads"] == 1:
+                raise RuntimeError("API down")
+            return {"post_id": "2"}
+
+        workflow.publishers["threads"] = make_publisher(flaky)
+        runner = JobRunner(workflow, queue, workers=1)
+        job_id = runner.enqueue_folder("00001-first")
+
+        assert runner.run(push=False) == {job_id: JOB_FAILED}
+        assert step_status(queue, job_id)["sns:threads"] == STEP_FAILED
+        assert step_status(queue, job_id)["sns:x"] == STEP_DONE
+
+        queue.retry(job_id)
+        assert runner.run(push=False) == {job_id: JOB_DONE}
+
+        hugo = workflow.hugo_publisher
+        assert hugo.upload_images.call_count == 1
+        assert hugo.translate.call_count == 1
+        assert workflow.publishers["x"].publish.call_count == 1
+        assert calls["threads"] == 2
+
+    def test_blog_failure_stops_before_sns(self, workflow, queue):
+        workflow.hugo_publisher.upload_images.side_effect = RuntimeError("S3 down")
+        runner = JobRunner(workflow, queue, workers=1)
+        job_id = runner.enqueue_folder("00001-first")
+
+        assert runner.run(push=False) == {job_id: JOB_FAILED}
+        status = step_status(queue, job_id)
+        assert status["upload"] == STEP_FAILED
+        assert status["write"] == STEP_PENDING
+        assert status["sns:x"] == STEP_PENDING
+        assert queue.get(job_id)["last_error"] == "upload: S3 down"
+        workflow.publishers["x"].publish.assert_not_called()
+
+    def test_blog_state_recorded_after_commit(self, workflow, queue):
+        workflow.hugo_publisher.git.commit.side_effect = RuntimeError("index.lock exists")
+        runner = JobRunner(workflow, queue, workers=1)
+        job_id = runner.enqueue_folder("00001-first", skip_sns=True)
+
+        assert runner.run(push=False) == {job_id: JOB_FAILED}
+        assert step_status(queue, job_id)["commit"] == STEP_FAILED
+        assert workflow.state.get("00001-first") is None
+
+        workflow.hugo_publisher.git.commit.side_effect = None
+        queue.retry(job_id)
+        assert runner.run(push=False) == {job_id: JOB_DONE}
+        assert workflow.state.get("00001-first")["blog_url"]
+        assert workflow.hugo_publisher.translate.call_count == 1
+
+    def test_crashed_job_resumes(self, workflow, queue):
+        runner = JobRunner(workflow, queue, workers=1)
+        job_id = runner.enqueue_folder("00001-first")
+        # 이전 프로세스가 번역 중, x 게시 중에 죽은 상황
+        queue.claim("dead-worker", lease=-1)
+        queue.finish_step(job_id, "format", {"slug": "first", "markdown": "# first"})
+        queue.finish_step(job_id, "upload", {})
+        queue.start_step(job_id, "translate")
+        queue.start_step(job_id, "sns:x")
+
+        assert runner.run(push=False) == {job_id: JOB_FAILED}
+
+        status = step_status(queue, job_id)
+        assert status["translate"] == STEP_DONE
+        assert status["sns:x"] == STEP_FAILED
+        assert status["sns:threads"] == STEP_DONE
+        assert "check the platform" in queue.steps(job_id)[-2]["error"]
+        workflow.hugo_publisher.upload_images.assert_not_called()
+        workflow.publishers["x"].publish.assert_not_called()
+
+    def test_timed_out_sns_step_not_reposted(self, workflow, queue):
+        release = threading.Event()
+
+        def slow(content):
+            release.wait(5)
+            return {"tweet_id": "late"}
+
+        workflow.workflow_config["sns_timeout"] = 0.1
+        workflow.publishers["x"] = make_publisher(slow)
+        runner = JobRunner(workflow, queue, workers=1)
+        job_id = runner.enqueue_folder("00001-first")
+
+        assert runner.run(push=False) == {job_id: JOB_FAILED}
+        release.set()
+        step = next(step for step in queue.steps(job_id) if step["name"] == "sns:x")
+        assert step["status"] == STEP_FAILED
+        assert "check the platform" in step["error"]
+        assert workflow.state.get_sns("00001-first", "x")["status"] == "unknown"
+
+        queue.retry(job_id)
+        assert runner.run(push=False) == {job_id: JOB_FAILED}
+        assert workflow.publishers["x"].publish.call_count == 1
+
+        forced = runner.enqueue_folder("00001-first", force=True)
+        runner.run(push=False)
+        assert step_status(queue, forced)["sns:x"] == STEP_DONE
+        assert workflow.publishers["x"].publish.call_count == 2
+
+    def test_unchanged_blog_and_posted_sns_skipped(self, workflow, queue):
+        runner = JobRunner(workflow, queue, workers=1)
+        runner.enqueue_folder("00001-first")
+        runner.run(push=False)
+        post_dir = workflow.hugo_publisher.blog_repo_path / "content" / "posts" / "first"
+        assert (post_dir / "index.ko.md").exists()
+
+        job_id = runner.enqueue_folder("00001-first")
+        assert queue.get(job_id)["status"] == JOB_DONE  # 같은 입력 → 같은 작업
+
+        (workflow.content_loader.blog_content_dir / "00001-first" / "meta.md").write_text(
+            "title: 00001-first\nplatforms: x\n\n---\n\n수정된 SNS 텍스트", encoding="utf-8"
+        )
+        workflow.hugo_publisher.translate.reset_mock()
+        job_id = runner.enqueue_folder("00001-first")
+        runner.run(push=False)
+
+        assert workflow.hugo_publisher.translate.call_count == 1  # meta 변경 → 블로그 재게시
+        assert step_status(queue, job_id)["sns:x"] == STEP_SKIPPED
+        assert workflow.publishers["x"].publish.call_count == 1
+
+    def test_workers_drain_queue_and_push_once(self, workflow, queue):
+        runner = JobRunner(workflow, queue, workers=2)
+        ids = [runner.enqueue_folder(name) for name in ("00001-first", "00002-second")]
+
+        results = runner.run(push=True)
+
+        assert results == {job_id: JOB_DONE for job_id in ids}
+        workflow.hugo_publisher.git.push.assert_called_once()
+
+    def test_parallel_jobs_commit_to_real_repo(self, workflow, queue, tmp_path):
+        repo = tmp_path / "blog-site"
+        repo.mkdir(exist_ok=True)
+        for args in (["init", "-q"], ["config", "user.name", "t"], ["config", "user.email", "t@e"]):
+            subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+        workflow.hugo_publisher.git = GitSession(repo)
+        runner = JobRunner(workflow, queue, workers=2)
+        ids = [
+            runner.enqueue_folder(name, skip_sns=True) for name in ("00001-first", "00002-second")
+        ]
+
+        assert runner.run(push=False) == {job_id: JOB_DONE for job_id in ids}
+        untracked = subprocess.run(
+            ["git", "status", "--porcelain"], cwd=repo, check=True, capture_output=True, text=True
+        ).stdout
+        assert untracked == ""
+        assert not (repo / ".git" / "index.lock").exists()
+
+    def test_interrupted_blog_step_rerun(self, workflow, queue):
+        runner = JobRunner(workflow, queue, workers=1)
+        job_id = runner.enqueue_folder("00001-first", skip_sns=True)
+        queue.start_step(job_id, "format")
+        assert step_status(queue, job_id)["format"] == STEP_RUNNING
+        queue.claim("dead-worker", lease=-1)
+
+        assert runner.run(push=False) == {job_id: JOB_DONE}
+        assert list(step_status(queue, job_id)) == ["format", "upload", "translate", "write", "commit"]
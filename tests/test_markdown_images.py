@@ -0,0 +1,84 @@
+from indieshout.utils.markdown_images import render_pictures, rewrite_image_refs
+
+
+def test_relative_inline_image_resolved_against_base_dir(tmp_path):
+    url_map = {str(tmp_path / "assets" / "1.png"): "https://cdn/1.png"}
+
+    result = rewrite_image_refs('![표 1](assets/1.png "제목")', url_map, tmp_path)
+
+    assert result.text == '![표 1](https://cdn/1.png "제목")'
+    assert result.replaced == 1
+    assert result.unresolved == []
+
+
+def test_dot_slash_angle_brackets_and_encoded_spaces(tmp_path):
+    url_map = {str(tmp_path / "assets" / "my shot.png"): "https://cdn/my-shot.png"}
+
+    result = rewrite_image_refs("![a](<./assets/my shot.png>) ![b](assets/my%20shot.png)", url_map, tmp_path)
+
+    assert result.text == "![a](<https://cdn/my-shot.png>) ![b](https://cdn/my-shot.png)"
+
+
+def test_html_img_src(tmp_path):
+    url_map = {str(tmp_path / "assets" / "1.png"): "https://cdn/1.png"}
+
+    result = rewrite_image_refs("<img alt='x' src='assets/1.png' width=300>", url_map, tmp_path)
+
+    assert result.text == "<img alt='x' src='https://cdn/1.png' width=300>"
+
+
+def test_reference_style_image_definition(tmp_path):
+    url_map = {str(tmp_path / "assets" / "logo.png"): "https://cdn/logo.png"}
+    markdown = "![로고][logo]\n\n[Logo]: assets/logo.png\n[docs]: guide.md\n"
+
+    result = rewrite_image_refs(markdown, url_map, tmp_path)
+
+    assert "[Logo]: https://cdn/logo.png" in result.text
+    assert "[docs]: guide.md" in result.text
+    assert result.unresolved == []
+
+
+def test_code_blocks_untouched(tmp_path):
+    url_map = {str(tmp_path / "assets" / "1.png"): "https://cdn/1.png"}
+    markdown = "```md\n![a](assets/1.png)\n```\n\n`![b](assets/1.png)`\n\n![c](assets/1.png)"
+
+    result = rewrite_image_refs(markdown, url_map, tmp_path)
+
+    assert result.text.count("assets/1.png") == 2
+    assert result.text.endswith("![c](https://cdn/1.png)")
+
+
+def test_external_skipped_and_missing_reported(tmp_path):
+    markdown = "![a](https://example.com/a.png)\n![b](data:image/png;base64,xx)\n\n![c](assets/9.png)"
+
+    result = rewrite_image_refs(markdown, {}, tmp_path)
+
+    assert result.text == markdown
+    assert result.unresolved == ["4: assets/9.png"]
+
+
+def test_absolute_paths_still_supported():
+    result = rewrite_image_refs("![a](/path/to/1.jpg)", {"/path/to/1.jpg": "https://cdn/1.jpg"})
+
+    assert result.text == "![a](https://cdn/1.jpg)"
+
+
+def test_render_pictures_groups_variants_by_format():
+    sources = {
+        "https://cdn/1.jpg": [
+            {"url": "https://cdn/1.webp", "format": "webp", "width": 1600},
+            {"url": "https://cdn/1-480w.webp", "format": "webp", "width": 480},
+            {"url": "https://cdn/1.avif", "format": "avif", "width": 1600},
+        ]
+    }
+    markdown = '![a](https://cdn/1.jpg "t")\n\n```\n![a](https://cdn/1.jpg)\n```\n![b](https://cdn/2.jpg)'
+
+    result = render_pictures(markdown, sources)
+
+    assert result.split("\n")[0] == (
+        '<picture><source type="image/avif" srcset="https://cdn/1.avif 1600w" sizes="100vw">'
+        '<source type="image/webp" srcset="https://cdn/1-480w.webp 480w, https://cdn/1.webp 1600w"'
+        ' sizes="100vw"><img src="https://cdn/1.jpg" alt="a" title="t" loading="lazy"></picture>'
+    )
+    assert "```\n![a](https://cdn/1.jpg)\n```" in result
+    assert result.endswith("![b](https://cdn/2.jpg)")
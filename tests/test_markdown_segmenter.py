@@ -0,0 +1,76 @@
+"""마크다운 분할 테스트."""
+
+from indieshout.utils.markdown_segmenter import (
+    join_segments,
+    protect_urls,
+    restore_urls,
+    split_markdown,
+)
+
+SAMPLE = """# 제목
+
+첫 문단입니다.
+
+두 번째 문단입니다.
+
+```python
+print("코드는 번역하지 않음")
+
+x = 1
+```
+
+![스크린샷](assets/1.png)
+
+## 섹션
+
+섹션 본문 [링크](https://example.com/a) 입니다."""
+
+
+def test_roundtrip_preserves_text():
+    segments = split_markdown(SAMPLE)
+    assert join_segments(segments) == SAMPLE
+
+
+def test_code_and_images_not_translatable():
+    segments = split_markdown(SAMPLE)
+    preserved = [s.text for s in segments if not s.translatable]
+
+    assert any(text.startswith("```python") and text.endswith("```") for text in preserved)
+    assert "![스크린샷](assets/1.png)" in preserved
+    assert all("print(" not in s.text for s in segments if s.translatable)
+
+
+def test_headings_start_new_chunk():
+    segments = [s for s in split_markdown(SAMPLE) if s.translatable]
+
+    assert segments[0].text == "# 제목\n\n첫 문단입니다.\n\n두 번째 문단입니다."
+    assert segments[1].text.startswith("## 섹션")
+
+
+def test_max_chunk_chars_splits_paragraphs():
+    markdown = "\n\n".join(["가" * 50] * 4)
+
+    segments = split_markdown(markdown, max_chunk_chars=110)
+
+    assert len(segments) == 2
+    assert join_segments(segments) == markdown
+
+
+def test_unclosed_fence_preserved():
+    markdown = "문단\n\n```\n열린 코드"
+    segments = split_markdown(markdown)
+    assert segments[-1].translatable is False
+    assert join_segments(segments) == markdown
+
+
+def test_protect_and_restore_urls():
+    text = '보기 ![a](x.png) 와 [링크](https://a.com/b "t") 그리고 https://c.com/d <img src="y.png">'
+
+    masked, placeholders = protect_urls(text)
+
+    assert "x.png" not in masked
+    assert "https://a.com/b" not in masked
+    assert "https://c.com/d" not in masked
+    assert "y.png" not in masked
+    assert "[링크](" in masked
+    assert restore_urls(masked, placeholders) == text
@@ -0,0 +1,71 @@
+from indieshout.utils.media_stream import (
+    MB,
+    S3_MIN_PART_SIZE,
+    MultipartResumeState,
+    iter_chunks,
+    part_size_for,
+    read_part,
+    upload_in_chunks,
+)
+
+
+def write_file(path, size):
+    path.write_bytes(bytes(i % 256 for i in range(size)))
+    return path
+
+
+class TestChunks:
+    def test_iter_chunks(self, tmp_path):
+        path = write_file(tmp_path / "f.bin", 10)
+        assert list(iter_chunks(path, 4)) == [path.read_bytes()[:4], path.read_bytes()[4:8], path.read_bytes()[8:]]
+
+    def test_iter_chunks_range(self, tmp_path):
+        path = write_file(tmp_path / "f.bin", 10)
+        assert b"".join(iter_chunks(path, 2, offset=3, length=5)) == path.read_bytes()[3:8]
+
+    def test_read_part(self, tmp_path):
+        path = write_file(tmp_path / "f.bin", 10)
+        assert read_part(path, 8, 4) == path.read_bytes()[8:]
+
+    def test_upload_in_chunks_resumes_from_segment(self, tmp_path):
+        path = write_file(tmp_path / "f.bin", 10)
+        sent = {}
+        progress = []
+
+        count = upload_in_chunks(
+            path, sent.__setitem__, chunk_size=4, start_segment=1, progress=lambda done, total: progress.append(done)
+        )
+
+        assert count == 3
+        assert sent == {1: path.read_bytes()[4:8], 2: path.read_bytes()[8:]}
+        assert progress == [8, 10]
+
+
+class TestPartSize:
+    def test_minimum_part_size(self):
+        assert part_size_for(10 * MB, 1 * MB) == S3_MIN_PART_SIZE
+        assert part_size_for(10 * MB, 8 * MB) == 8 * MB
+
+    def test_grows_to_stay_under_part_limit(self):
+        size = 200 * 1024 * MB
+        part_size = part_size_for(size, 8 * MB)
+        assert size / part_size <= 10000
+        assert part_size % MB == 0
+
+
+class TestMultipartResumeState:
+    def test_save_load_delete(self, tmp_path):
+        source = write_file(tmp_path / "video.mp4", 10)
+        state = MultipartResumeState.for_upload(tmp_path / "state", "bucket", "key", source)
+
+        assert state.load() is None
+        state.save("upload-1", 8 * MB, {1: '"a"', 2: '"b"'})
+        assert state.load() == {"upload_id": "upload-1", "part_size": 8 * MB, "parts": {1: '"a"', 2: '"b"'}}
+        state.delete()
+        assert state.load() is None
+
+    def test_changed_file_uses_new_state(self, tmp_path):
+        source = write_file(tmp_path / "video.mp4", 10)
+        first = MultipartResumeState.for_upload(tmp_path, "bucket", "key", source)
+        write_file(source, 20)
+        assert MultipartResumeState.for_upload(tmp_path, "bucket", "key", source).state_file != first.state_file
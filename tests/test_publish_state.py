@@ -0,0 +1,107 @@
+from indieshout.utils.publish_state import (
+    STATE_FILENAME,
+    PublishStateStore,
+    fingerprint_folder,
+    is_blog_current,
+)
+
+
+def make_folder(tmp_path):
+    folder = tmp_path / "00001-post"
+    (folder / "assets").mkdir(parents=True)
+    (folder / "content.md").write_text("본문", encoding="utf-8")
+    (folder / "meta.md").write_text("title: 제목", encoding="utf-8")
+    (folder / "assets" / "1.png").write_bytes(b"png")
+    return folder
+
+
+BLOG_RESULT = {
+    "slug": "post",
+    "url": "https://example.com/post/",
+    "images": {"assets/1.png": "https://cdn.example.com/posts/post/1.png"},
+}
+
+
+class TestFingerprint:
+    def test_hashes_inputs(self, tmp_path):
+        fingerprint = fingerprint_folder(make_folder(tmp_path))
+
+        assert fingerprint["content_hash"] and fingerprint["meta_hash"]
+        assert list(fingerprint["asset_hashes"]) == ["1.png"]
+
+    def test_asset_change_detected(self, tmp_path):
+        folder = make_folder(tmp_path)
+        before = fingerprint_folder(folder)
+        (folder / "assets" / "1.png").write_bytes(b"other")
+
+        assert fingerprint_folder(folder)["asset_hashes"] != before["asset_hashes"]
+
+
+class TestStore:
+    def test_missing_folder(self, tmp_path):
+        assert PublishStateStore(tmp_path / "state.sqlite3").get("none") is None
+
+    def test_record_blog_roundtrip(self, tmp_path):
+        store = PublishStateStore(tmp_path / "state.sqlite3")
+        fingerprint = fingerprint_folder(make_folder(tmp_path))
+
+        store.record_blog("00001-post", fingerprint, BLOG_RESULT, translation_hash="abc")
+        state = store.get("00001-post")
+
+        assert state["blog_url"] == "https://example.com/post/"
+        assert state["blog_slug"] == "post"
+        assert state["s3_urls"] == BLOG_RESULT["images"]
+        assert state["translation_hash"] == "abc"
+        assert is_blog_current(state, fingerprint)
+
+    def test_changed_inputs_not_current(self, tmp_path):
+        store = PublishStateStore(tmp_path / "state.sqlite3")
+        folder = make_folder(tmp_path)
+        store.record_blog("00001-post", fingerprint_folder(folder), BLOG_RESULT)
+        (folder / "meta.md").write_text("title: 바뀐 제목", encoding="utf-8")
+
+        assert not is_blog_current(store.get("00001-post"), fingerprint_folder(folder))
+
+    def test_record_sns_keeps_blog(self, tmp_path):
+        store = PublishStateStore(tmp_path / "state.sqlite3")
+        store.record_blog("00001-post", fingerprint_folder(make_folder(tmp_path)), BLOG_RESULT)
+
+        store.record_sns("00001-post", "x", {"tweet_id": "1"}, "텍스트")
+        store.record_sns("00001-post", "threads", {"thread_id": "2"}, "텍스트")
+
+        state = store.get("00001-post")
+        assert state["blog_url"] == BLOG_RESULT["url"]
+        assert state["sns"]["x"]["tweet_id"] == "1"
+        assert state["sns"]["threads"]["thread_id"] == "2"
+        assert state["sns"]["x"]["text_hash"]
+
+    def test_sns_without_blog(self, tmp_path):
+        store = PublishStateStore(tmp_path / "state.sqlite3")
+        store.record_sns("draft", "x", {"tweet_id": "1"}, "텍스트")
+
+        state = store.get("draft")
+        assert state["blog_url"] is None
+        assert not is_blog_current(state, fingerprint_folder(tmp_path))
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "state.sqlite3"
+        store = PublishStateStore(path)
+        store.record_sns("00001-post", "x", {"tweet_id": "1"}, "텍스트")
+        store.close()
+
+        assert PublishStateStore(path).get_sns("00001-post", "x")["tweet_id"] == "1"
+
+
+class TestFromConfig:
+    def test_default_path_in_content_dir(self, tmp_path):
+        store = PublishStateStore.from_config({}, tmp_path)
+        assert store.path == tmp_path / STATE_FILENAME
+
+    def test_custom_path(self, tmp_path):
+        store = PublishStateStore.from_config(
+            {"workflow": {"state_path": str(tmp_path / "s.sqlite3")}}, "blog-content"
+        )
+        assert store.path == tmp_path / "s.sqlite3"
+
+    def test_disabled(self, tmp_path):
+        assert PublishStateStore.from_config({"workflow": {"state": False}}, tmp_path) is None
@@ -0,0 +1,466 @@
+"""PublishWorkflow 테스트."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from indieshout.utils.rate_limiter import RateLimiter, RateLimitError, RetryPolicy
+from indieshout.workflows.publish_workflow import PublishWorkflow
+from indieshout.workflows.scheduler import STATUS_DONE, PublishScheduler, ScheduleStore
+
+
+@pytest.fixture
+def blog_dir(tmp_path):
+    """SNS 텍스트가 있는 blog-content 디렉토리."""
+    blog_dir = tmp_path / "blog-content"
+    folder = blog_dir / "00001-test-post"
+    folder.mkdir(parents=True)
+    (folder / "content.md").write_text("# 테스트\n\n본문", encoding="utf-8")
+    (folder / "meta.md").write_text(
+        "title: 테스트\nplatforms: x, threads\n\n---\n\nSNS 텍스트",
+        encoding="utf-8",
+    )
+    return blog_dir
+
+
+def make_publisher(publish=None):
+    publisher = MagicMock()
+    publisher.authenticate.return_value = True
+    publisher.validate.return_value = True
+    if publish is not None:
+        publisher.publish.side_effect = publish
+    return publisher
+
+
+class TestSnsFanOut:
+    def test_publishes_platforms_concurrently(self, blog_dir):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def publish(content):
+            # 두 플랫폼이 동시에 실행 중이어야 barrier 통과
+            barrier.wait()
+            return {"id": "ok"}
+
+        workflow = PublishWorkflow({}, blog_content_dir=blog_dir)
+        workflow.publishers = {"x": make_publisher(publish), "threads": make_publisher(publish)}
+
+        result = workflow.publish_from_folder("00001-test-post", skip_blog=True)
+
+        assert result["sns"] == {"x": {"id": "ok"}, "threads": {"id": "ok"}}
+
+    def test_platform_error_recorded(self, blog_dir):
+        def fail(content):
+            raise RuntimeError("API down")
+
+        workflow = PublishWorkflow({}, blog_content_dir=blog_dir)
+        workflow.publishers = {
+            "x": make_publisher(lambda c: {"tweet_id": "1"}),
+            "threads": make_publisher(fail),
+        }
+
+        result = workflow.publish_from_folder("00001-test-post", skip_blog=True)
+
+        assert result["sns"]["x"] == {"tweet_id": "1"}
+        assert result["sns"]["threads"] == {"error": "API down"}
+
+    def test_slow_platform_times_out(self, blog_dir):
+        release = threading.Event()
+
+        def slow(content):
+            release.wait(5)
+            return {"id": "late"}
+
+        config = {"workflow": {"sns_timeout": 5, "sns_timeouts": {"threads": 0.1}}}
+        workflow = PublishWorkflow(config, blog_content_dir=blog_dir)
+        workflow.publishers = {
+            "x": make_publisher(lambda c: {"tweet_id": "1"}),
+            "threads": make_publisher(slow),
+        }
+
+        started = time.monotonic()
+        result = workflow.publish_from_folder("00001-test-post", skip_blog=True)
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert elapsed < 2
+        assert result["sns"]["x"] == {"tweet_id": "1"}
+        assert "Timeout" in result["sns"]["threads"]["error"]
+
+    def test_no_publish_after_waiting_past_deadline_for_slot(self, blog_dir):
+        publisher = make_publisher(lambda c: {"tweet_id": "1"})
+        workflow = PublishWorkflow({}, blog_content_dir=blog_dir)
+        workflow.publishers = {"x": publisher}
+        semaphore = workflow._platform_semaphores["x"] = threading.BoundedSemaphore(1)
+        semaphore.acquire()
+        threading.Timer(0.2, semaphore.release).start()
+
+        with pytest.raises(TimeoutError):
+            workflow._publish_to_platform("x", MagicMock(), deadline=time.monotonic() + 0.1)
+        publisher.publish.assert_not_called()
+
+    def test_unconfigured_platform_skipped(self, blog_dir):
+        workflow = PublishWorkflow({}, blog_content_dir=blog_dir)
+        workflow.publishers = {"x": make_publisher(lambda c: {"tweet_id": "1"})}
+
+        result = workflow.publish_from_folder("00001-test-post", skip_blog=True)
+
+        assert result["sns"] == {"x": {"tweet_id": "1"}}
+
+    def test_rate_limited_platform_retried(self, blog_dir):
+        calls = []
+
+        def publish(content):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RateLimitError("429", retry_after=0.01)
+            return {"tweet_id": "1"}
+
+        workflow = PublishWorkflow({}, blog_content_dir=blog_dir)
+        workflow.rate_limiter = RateLimiter(
+            retry_policy=RetryPolicy(base_delay=0.01, jitter=False), sleep=lambda s: None
+        )
+        workflow.publishers = {"x": make_publisher(publish)}
+
+        result = workflow.publish_from_folder("00001-test-post", skip_blog=True)
+
+        assert result["sns"]["x"] == {"tweet_id": "1"}
+        assert len(calls) == 2
+
+    def test_rate_limit_beyond_timeout_fails_fast(self, blog_dir):
+        workflow = PublishWorkflow(
+            {"workflow": {"sns_timeout": 5}, "rate_limits": {"x": {"requests": 1, "window": 3600}}},
+            blog_content_dir=blog_dir,
+        )
+        publisher = make_publisher(lambda content: {"tweet_id": "1"})
+        workflow.publishers = {"x": publisher}
+        workflow.rate_limiter.acquire("x")
+
+        started = time.monotonic()
+        result = workflow.publish_from_folder("00001-test-post", skip_blog=True)
+
+        assert "rate limit" in result["sns"]["x"]["error"]
+        assert time.monotonic() - started < 2
+        publisher.publish.assert_not_called()
+
+    def test_dry_run_does_not_publish(self, blog_dir):
+        publisher = make_publisher()
+        workflow = PublishWorkflow({}, blog_content_dir=blog_dir)
+        workflow.publishers = {"x": publisher}
+
+        result = workflow.publish_from_folder("00001-test-post", skip_blog=True, dry_run=True)
+
+        assert result["sns"] == {"x": {"status": "dry_run"}}
+        publisher.publish.assert_not_called()
+
+
+def test_context_manager_closes_publishers_on_error(blog_dir):
+    publisher = make_publisher()
+
+    with pytest.raises(RuntimeError):
+        with PublishWorkflow({}, blog_content_dir=blog_dir) as workflow:
+            workflow.publishers = {"x": publisher}
+            raise RuntimeError("boom")
+
+    publisher.close.assert_called_once()
+
+
+@pytest.fixture
+def batch_dir(tmp_path):
+    """여러 폴더가 있는 blog-content 디렉토리."""
+    blog_dir = tmp_path / "blog-content"
+    for name in ["00010-third", "00002-second", "00001-first", "draft"]:
+        folder = blog_dir / name
+        folder.mkdir(parents=True)
+        (folder / "content.md").write_text(f"# {name}", encoding="utf-8")
+        (folder / "meta.md").write_text(
+            f"title: {name}\nplatforms: x\n\n---\n\nSNS {name}", encoding="utf-8"
+        )
+    return blog_dir
+
+
+class TestBatch:
+    def make_workflow(self, batch_dir, tmp_path, config=None):
+        config = config or {}
+        config["hugo"] = {"blog_repo_path": str(tmp_path / "blog-site")}
+        workflow = PublishWorkflow(config, blog_content_dir=batch_dir)
+        workflow.hugo_publisher.authenticate = MagicMock(return_value=True)
+        workflow.hugo_publisher.validate = MagicMock(return_value=True)
+        workflow.hugo_publisher.publish = MagicMock(
+            side_effect=lambda content, commit=True: {
+                "url": f"https://example.com/{content.slug}/",
+                "title": content.title,
+                "slug": content.slug,
+            }
+        )
+        workflow.hugo_publisher.git.has_pending = MagicMock(return_value=True)
+        workflow.hugo_publisher.commit_pending = MagicMock(return_value=1)
+        workflow.hugo_publisher.deploy = MagicMock(return_value=True)
+        return workflow
+
+    def test_unpublished_folders_in_numeric_order(self, batch_dir, tmp_path):
+        workflow = self.make_workflow(batch_dir, tmp_path)
+        published = tmp_path / "blog-site" / "content" / "posts" / "second"
+        published.mkdir(parents=True)
+        (published / "index.ko.md").write_text("---\n---\n")
+
+        assert workflow.list_unpublished_folders() == ["00001-first", "00010-third", "draft"]
+
+    def test_future_scheduled_folder_left_to_scheduler(self, batch_dir, tmp_path):
+        future = datetime.now() + timedelta(days=1)
+        past = datetime.now() - timedelta(days=1)
+        (batch_dir / "00002-second" / "meta.md").write_text(
+            f"title: second\nplatforms: x\nscheduled_at: {future.isoformat(timespec='minutes')}\n\n---\n\nSNS",
+            encoding="utf-8",
+        )
+        (batch_dir / "00010-third" / "meta.md").write_text(
+            f"title: third\nplatforms: x\nscheduled_at: {past.isoformat(timespec='minutes')}\n\n---\n\nSNS",
+            encoding="utf-8",
+        )
+        workflow = self.make_workflow(batch_dir, tmp_path)
+
+        folders = workflow.list_unpublished_folders()
+        assert folders == ["00001-first", "00010-third", "draft"]
+        result = workflow.publish_batch(folders, skip_sns=True)
+        assert "00002-second" not in result["posts"]
+
+        assert "00002-second" in workflow.list_unpublished_folders(include_scheduled=True)
+
+    def test_single_commit_and_push(self, batch_dir, tmp_path):
+        workflow = self.make_workflow(batch_dir, tmp_path)
+        folders = workflow.list_unpublished_folders()
+
+        result = workflow.publish_batch(folders, skip_sns=True, max_workers=3)
+
+        assert set(result["posts"]) == set(folders)
+        for call in workflow.hugo_publisher.publish.call_args_list:
+            assert call.kwargs["commit"] is False
+        workflow.hugo_publisher.commit_pending.assert_called_once()
+        workflow.hugo_publisher.deploy.assert_called_once()
+        assert result["committed"] and result["pushed"]
+
+    def test_blog_state_recorded_only_after_commit(self, batch_dir, tmp_path):
+        workflow = self.make_workflow(batch_dir, tmp_path)
+        workflow.hugo_publisher.commit_pending.side_effect = RuntimeError("index.lock exists")
+
+        result = workflow.publish_batch(["00001-first"], skip_sns=True)
+
+        assert result["git_error"] == "index.lock exists"
+        assert workflow.state.get("00001-first") is None
+        assert workflow.list_unpublished_folders()[0] == "00001-first"
+
+        workflow.hugo_publisher.commit_pending.side_effect = None
+        workflow.publish_batch(["00002-second"], skip_sns=True)
+
+        assert workflow.state.get("00001-first")["blog_url"] == "https://example.com/first/"
+        assert workflow.state.get("00002-second")["blog_url"] == "https://example.com/second/"
+
+    def test_posts_over_rate_limit_deferred_to_their_slots(self, batch_dir, tmp_path):
+        config = {
+            "workflow": {"sns_timeout": 0.1},
+            "rate_limits": {"x": {"requests": 2, "window": 0.6}},
+            "schedule": {"path": str(tmp_path / "schedule.sqlite3")},
+        }
+        workflow = self.make_workflow(batch_dir, tmp_path, config)
+        posted_at = {}
+
+        def publish(content):
+            posted_at[content.text.split("\n")[0].removeprefix("SNS ")] = time.time()
+            return {"tweet_id": "1"}
+
+        workflow.publishers = {"x": make_publisher(publish)}
+        folders = workflow.list_unpublished_folders()
+        assert len(folders) == 4
+
+        started = time.time()
+        result = workflow.publish_batch(folders, push=False)
+
+        # 버킷 2개는 바로, 나머지는 0.3초 간격의 슬롯으로 예약
+        assert set(posted_at) == set(folders[:2])
+        deferred = result["deferred"]
+        assert list(deferred) == folders[2:]
+        assert deferred[folders[2]] - started == pytest.approx(0.3, abs=0.1)
+        assert deferred[folders[3]] - started == pytest.approx(0.6, abs=0.1)
+
+        store = ScheduleStore(config["schedule"]["path"])
+        scheduler = PublishScheduler(workflow, store, push=False)
+        scheduler.reload()
+        while scheduler.next_due() is not None and time.time() - started < 5:
+            time.sleep(max(0.0, scheduler.next_due() - time.time()))
+            scheduler.run_due()
+
+        assert set(posted_at) == set(folders)
+        for folder_name, scheduled_at in deferred.items():
+            assert posted_at[folder_name] >= scheduled_at
+            assert store.get(folder_name)["status"] == STATUS_DONE
+        store.close()
+
+    def test_folder_error_recorded(self, batch_dir, tmp_path):
+        workflow = self.make_workflow(batch_dir, tmp_path)
+
+        result = workflow.publish_batch(["00001-first", "missing"], skip_sns=True, push=False)
+
+        assert "error" in result["posts"]["missing"]
+        assert result["posts"]["00001-first"]["blog"]["url"].endswith("/first/")
+        workflow.hugo_publisher.deploy.assert_not_called()
+
+    def test_dry_run_does_not_commit(self, batch_dir, tmp_path):
+        workflow = self.make_workflow(batch_dir, tmp_path)
+
+        workflow.publish_batch(["00001-first"], dry_run=True)
+
+        workflow.hugo_publisher.commit_pending.assert_not_called()
+
+    def test_platform_concurrency_bounded(self, batch_dir, tmp_path):
+        active = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def publish(content):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return {"tweet_id": "1"}
+
+        workflow = self.make_workflow(
+            batch_dir, tmp_path, {"workflow": {"platform_concurrency": {"x": 1}}}
+        )
+        workflow.publishers = {"x": make_publisher(publish)}
+
+        result = workflow.publish_batch(
+            workflow.content_loader.list_folders(), skip_blog=True, max_workers=4
+        )
+
+        assert active["max"] == 1
+        assert all(post["sns"]["x"] == {"tweet_id": "1"} for post in result["posts"].values())
+
+
+class TestIncrementalState:
+    """게시 상태 저장소를 이용한 증분 게시."""
+
+    def make_workflow(self, blog_dir, tmp_path):
+        config = {"hugo": {"blog_repo_path": str(tmp_path / "blog-site")}}
+        workflow = PublishWorkflow(config, blog_content_dir=blog_dir)
+        workflow.hugo_publisher.authenticate = MagicMock(return_value=True)
+        workflow.hugo_publisher.validate = MagicMock(return_value=True)
+
+        def publish(content, commit=True):
+            post_dir = tmp_path / "blog-site" / "content" / "posts" / content.slug
+            post_dir.mkdir(parents=True, exist_ok=True)
+            (post_dir / "index.ko.md").write_text(content.text, encoding="utf-8")
+            return {
+                "slug": content.slug,
+                "title": content.title,
+                "url": f"https://example.com/{content.slug}/",
+                "files": {"ko": str(post_dir / "index.ko.md"), "en": None},
+                "images": {},
+            }
+
+        workflow.hugo_publisher.publish = MagicMock(side_effect=publish)
+        workflow.publishers = {
+            "x": make_publisher(lambda content: {"tweet_id": "1", "url": "https://x.com/i/status/1"}),
+        }
+        return workflow
+
+    def test_unchanged_folder_skips_blog_and_sns(self, blog_dir, tmp_path):
+        workflow = self.make_workflow(blog_dir, tmp_path)
+        workflow.publish_from_folder("00001-test-post")
+
+        result = workflow.publish_from_folder("00001-test-post")
+
+        assert workflow.hugo_publisher.publish.call_count == 1
+        assert workflow.publishers["x"].publish.call_count == 1
+        assert result["blog"]["status"] == "unchanged"
+        assert result["blog"]["url"] == "https://example.com/test-post/"
+        assert result["sns"]["x"]["status"] == "skipped"
+        assert result["sns"]["x"]["tweet_id"] == "1"
+
+    def test_changed_content_republishes_blog_only(self, blog_dir, tmp_path):
+        workflow = self.make_workflow(blog_dir, tmp_path)
+        workflow.publish_from_folder("00001-test-post")
+        (blog_dir / "00001-test-post" / "content.md").write_text("# 수정\n\n본문", encoding="utf-8")
+
+        assert workflow.list_unpublished_folders() == ["00001-test-post"]
+        result = workflow.publish_from_folder("00001-test-post")
+
+        assert workflow.hugo_publisher.publish.call_count == 2
+        assert workflow.publishers["x"].publish.call_count == 1
+        assert result["sns"]["x"]["status"] == "skipped"
+        assert workflow.list_unpublished_folders() == []
+
+    def test_force_reposts(self, blog_dir, tmp_path):
+        workflow = self.make_workflow(blog_dir, tmp_path)
+        workflow.publish_from_folder("00001-test-post")
+
+        workflow.publish_from_folder("00001-test-post", force=True)
+
+        assert workflow.hugo_publisher.publish.call_count == 2
+        assert workflow.publishers["x"].publish.call_count == 2
+
+    def test_failed_platform_retried(self, blog_dir, tmp_path):
+        workflow = self.make_workflow(blog_dir, tmp_path)
+        workflow.publishers["x"].publish.side_effect = RuntimeError("boom")
+        workflow.publish_from_folder("00001-test-post")
+
+        workflow.publishers["x"].publish.side_effect = lambda content: {"tweet_id": "2"}
+        result = workflow.publish_from_folder("00001-test-post")
+
+        assert result["sns"]["x"] == {"tweet_id": "2"}
+
+    def test_timed_out_platform_not_reposted_without_force(self, blog_dir, tmp_path):
+        workflow = self.make_workflow(blog_dir, tmp_path)
+        workflow.workflow_config["sns_timeout"] = 0.1
+        release = threading.Event()
+
+        def slow(content):
+            release.wait(5)
+            return {"tweet_id": "late"}
+
+        workflow.publishers["x"].publish.side_effect = slow
+        first = workflow.publish_from_folder("00001-test-post")
+        release.set()
+        assert first["sns"]["x"]["timed_out"]
+
+        workflow.publishers["x"].publish.side_effect = lambda content: {"tweet_id": "2"}
+        second = workflow.publish_from_folder("00001-test-post")
+
+        assert second["sns"]["x"]["reason"] == "unknown_after_timeout"
+        assert workflow.publishers["x"].publish.call_count == 1
+
+        forced = workflow.publish_from_folder("00001-test-post", force=True)
+        assert forced["sns"]["x"] == {"tweet_id": "2"}
+
+    def test_skip_blog_reuses_recorded_url(self, blog_dir, tmp_path):
+        workflow = self.make_workflow(blog_dir, tmp_path)
+        workflow.publish_from_folder("00001-test-post", skip_sns=True)
+
+        workflow.publish_from_folder("00001-test-post", skip_blog=True)
+
+        sns_content = workflow.publishers["x"].publish.call_args.args[0]
+        assert sns_content.text.endswith("🔗 https://example.com/test-post/")
+
+    def test_state_disabled(self, blog_dir, tmp_path):
+        workflow = PublishWorkflow({"workflow": {"state": False}}, blog_content_dir=blog_dir)
+        assert workflow.state is None
+
+    def test_blog_image_urls_passed_to_sns(self, blog_dir, tmp_path):
+        workflow = self.make_workflow(blog_dir, tmp_path)
+        publish = workflow.hugo_publisher.publish.side_effect
+        urls = {"a.png": "https://cdn.example.com/a.png", "b.png": "https://cdn.example.com/b.png"}
+        workflow.hugo_publisher.publish.side_effect = lambda content, commit=True: {
+            **publish(content, commit),
+            "images": urls,
+        }
+
+        workflow.publish_from_folder("00001-test-post")
+        sns_content = workflow.publishers["x"].publish.call_args.args[0]
+        assert sns_content.image_urls == list(urls.values())
+
+        # 블로그 단계를 건너뛰어도 기록된 S3 URL 사용
+        workflow.publish_from_folder("00001-test-post", force=True, skip_blog=True)
+        sns_content = workflow.publishers["x"].publish.call_args.args[0]
+        assert sns_content.image_urls == list(urls.values())
@@ -0,0 +1,147 @@
+import sys
+import types
+from importlib.metadata import EntryPoint
+from unittest.mock import MagicMock
+
+import pytest
+
+from indieshout.publishers import registry
+from indieshout.publishers.registry import (
+    LazyPublishers,
+    available_platforms,
+    configured_platforms,
+    create_publisher,
+    get_publisher_class,
+)
+from indieshout.workflows.publish_workflow import PublishWorkflow
+
+
+class FakePublisher:
+    def __init__(self, config, auth_cache=None, rate_limiter=None):
+        self.config = config
+        self.auth_cache = auth_cache
+
+
+@pytest.fixture
+def plugin(monkeypatch):
+    """entry point로 설치된 mastodon 퍼블리셔."""
+    module = types.ModuleType("fake_mastodon")
+    module.MastodonPublisher = FakePublisher
+    monkeypatch.setitem(sys.modules, "fake_mastodon", module)
+
+    entry_point = EntryPoint(
+        name="mastodon", value="fake_mastodon:MastodonPublisher", group=registry.ENTRY_POINT_GROUP
+    )
+    monkeypatch.setattr(registry, "entry_points", lambda group: [entry_point])
+    monkeypatch.setattr(registry, "_discovered", None)
+    monkeypatch.setattr(registry, "PLATFORM_PUBLISHERS", {})
+    return module
+
+
+class TestRegistry:
+    def test_builtin_platforms(self):
+        assert available_platforms()[:2] == ["x", "threads"]
+
+    def test_unknown_platform(self):
+        assert get_publisher_class("myspace") is None
+
+    def test_entry_point_discovered(self, plugin):
+        assert "mastodon" in available_platforms()
+        assert get_publisher_class("mastodon") is FakePublisher
+
+    def test_plugin_replaces_builtin(self, plugin, monkeypatch):
+        builtin = MagicMock(spec=EntryPoint)
+        builtin.name = "x"
+        builtin.dist.name = registry.DISTRIBUTION_NAME
+        builtin.load.return_value = "builtin"
+        override = EntryPoint(
+            name="x", value="fake_mastodon:MastodonPublisher", group=registry.ENTRY_POINT_GROUP
+        )
+        # 플러그인이 먼저 조회되어도 내장 entry point보다 우선
+        monkeypatch.setattr(registry, "entry_points", lambda group: [override, builtin])
+
+        assert get_publisher_class("x") is FakePublisher
+        assert available_platforms()[:2] == ["x", "threads"]
+
+    def test_builtin_fallback_without_entry_points(self, plugin, monkeypatch):
+        monkeypatch.setattr(registry, "entry_points", lambda group: [])
+
+        assert available_platforms() == ["x", "threads"]
+        assert get_publisher_class("threads").__name__ == "ThreadsPublisher"
+
+    def test_registered_publisher_takes_precedence(self, plugin):
+        registry.register_publisher("mastodon", "indieshout.publishers.threads:ThreadsPublisher")
+
+        assert get_publisher_class("mastodon").__name__ == "ThreadsPublisher"
+        assert available_platforms().count("mastodon") == 1
+
+    def test_configured_platforms_use_config_section(self, plugin):
+        config = {"twitter": {"api_key": "k"}, "mastodon": {"token": "t"}}
+        assert configured_platforms(config) == ["x", "mastodon"]
+
+
+class TestCreatePublisher:
+    def test_passes_shared_services(self):
+        publisher = create_publisher(FakePublisher, {"a": 1}, auth_cache="cache", rate_limiter="rl")
+        assert publisher.config == {"a": 1}
+        assert publisher.auth_cache == "cache"
+
+    def test_config_only_plugin(self):
+        class ConfigOnlyPublisher:
+            def __init__(self, config):
+                self.config = config
+
+        publisher = create_publisher(
+            ConfigOnlyPublisher, {"a": 1}, auth_cache="cache", rate_limiter="rl"
+        )
+        assert publisher.config == {"a": 1}
+
+    def test_var_keyword_receives_all(self):
+        class KwargsPublisher:
+            def __init__(self, config, **kwargs):
+                self.kwargs = kwargs
+
+        publisher = create_publisher(KwargsPublisher, {}, auth_cache="cache", rate_limiter="rl")
+        assert publisher.kwargs == {"auth_cache": "cache", "rate_limiter": "rl"}
+
+
+class TestLazyPublishers:
+    def test_creates_on_first_access_only(self):
+        factory = MagicMock(side_effect=lambda platform: f"publisher-{platform}")
+        publishers = LazyPublishers(["x", "threads"], factory)
+
+        assert "x" in publishers
+        assert list(publishers) == ["x", "threads"]
+        factory.assert_not_called()
+
+        assert publishers["x"] == "publisher-x"
+        assert publishers["x"] == "publisher-x"
+        factory.assert_called_once_with("x")
+        assert publishers.loaded() == ["publisher-x"]
+
+    def test_unknown_platform_raises(self):
+        with pytest.raises(KeyError):
+            LazyPublishers(["x"], MagicMock())["threads"]
+
+
+class TestWorkflowPublishers:
+    def test_plugin_created_when_targeted(self, plugin, tmp_path):
+        workflow = PublishWorkflow({"mastodon": {"token": "t"}}, blog_content_dir=tmp_path)
+
+        assert list(workflow.publishers) == ["mastodon"]
+        assert workflow.publishers.loaded() == []
+
+        publisher = workflow.publishers["mastodon"]
+        assert isinstance(publisher, FakePublisher)
+        assert publisher.auth_cache is workflow.auth_cache
+
+    def test_unused_publishers_not_built(self, tmp_path, monkeypatch):
+        created = []
+        monkeypatch.setitem(registry.PLATFORM_PUBLISHERS, "x", MagicMock(side_effect=created.append))
+        config = {"twitter": {"api_key": "k"}}
+
+        workflow = PublishWorkflow(config, blog_content_dir=tmp_path)
+        workflow.close()
+
+        assert "x" in workflow.publishers
+        assert created == []
@@ -0,0 +1,198 @@
+import threading
+import time
+
+import pytest
+
+from indieshout.utils.rate_limiter import (
+    RateLimiter,
+    RateLimitError,
+    RetryableError,
+    RetryPolicy,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    """sleep하면 시간이 흐르는 가짜 시계."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_limiter(clock, limits=None, max_retries=3):
+    return RateLimiter(
+        limits or {"x": (2, 60.0)},
+        RetryPolicy(max_retries=max_retries, base_delay=1.0, max_delay=8.0, jitter=False),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self, clock):
+        bucket = TokenBucket(2, 60.0, clock=clock)
+
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == pytest.approx(30.0)
+
+        clock.now += 30.0
+        assert bucket.try_acquire() == 0
+
+    def test_update_blocks_until_reset(self, clock):
+        bucket = TokenBucket(10, 60.0, clock=clock)
+
+        bucket.update(remaining=0, reset_after=120.0)
+
+        assert bucket.wait_time() == pytest.approx(120.0)
+        clock.now += 120.0
+        # 서버 한도 초기화 후에는 버킷도 가득 참
+        for _ in range(10):
+            assert bucket.try_acquire() == 0
+
+    def test_update_remaining_lowers_tokens(self, clock):
+        bucket = TokenBucket(10, 60.0, clock=clock)
+
+        bucket.update(remaining=1)
+
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() > 0
+
+    def test_schedule_spreads_after_burst(self, clock):
+        bucket = TokenBucket(2, 60.0, clock=clock)
+
+        assert bucket.schedule(4) == pytest.approx([0.0, 0.0, 30.0, 60.0])
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0, 60.0)
+
+
+class TestRetryPolicy:
+    def test_exponential_without_jitter(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False)
+        assert [policy.delay(i) for i in range(4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_within_backoff(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=100.0)
+        assert all(0 <= policy.delay(3) <= 8.0 for _ in range(50))
+
+    def test_retry_after_is_minimum(self):
+        policy = RetryPolicy(base_delay=1.0, jitter=False)
+        assert policy.delay(0, retry_after=30.0) == 30.0
+
+
+class TestRateLimiter:
+    def test_waits_for_token(self, clock):
+        limiter = make_limiter(clock)
+
+        results = [limiter.call("x", lambda i=i: i) for i in range(3)]
+
+        assert results == [0, 1, 2]
+        assert clock.sleeps == [pytest.approx(30.0)]
+
+    def test_retries_rate_limit_with_retry_after(self, clock):
+        limiter = make_limiter(clock, {"x": (100, 60.0)})
+        calls = []
+
+        def publish():
+            calls.append(clock.now)
+            if len(calls) < 3:
+                raise RateLimitError("429", retry_after=10.0)
+            return "ok"
+
+        assert limiter.call("x", publish) == "ok"
+        assert clock.sleeps == [10.0, 10.0]
+
+    def test_gives_up_after_max_retries(self, clock):
+        limiter = make_limiter(clock, {"x": (100, 60.0)}, max_retries=2)
+
+        def publish():
+            raise RetryableError("503")
+
+        with pytest.raises(RetryableError):
+            limiter.call("x", publish)
+        assert clock.sleeps == [1.0, 2.0]
+
+    def test_non_retryable_error_not_retried(self, clock):
+        limiter = make_limiter(clock)
+        calls = []
+
+        def publish():
+            calls.append(1)
+            raise RuntimeError("bad request")
+
+        with pytest.raises(RuntimeError):
+            limiter.call("x", publish)
+        assert len(calls) == 1
+
+    def test_deadline_fails_fast(self, clock):
+        limiter = make_limiter(clock)
+        limiter.call("x", lambda: None)
+        limiter.call("x", lambda: None)
+
+        with pytest.raises(RateLimitError, match="next slot"):
+            limiter.call("x", lambda: None, deadline=clock.now + 5)
+        assert clock.sleeps == []
+
+    def test_past_deadline_does_not_call(self, clock):
+        limiter = make_limiter(clock)
+        calls = []
+
+        with pytest.raises(RateLimitError, match="deadline passed"):
+            limiter.call("x", lambda: calls.append(1), deadline=clock.now)
+        assert calls == []
+        # 토큰은 쓰지 않았으므로 다음 게시는 바로 가능
+        limiter.call("x", lambda: calls.append(1))
+        limiter.call("x", lambda: calls.append(1))
+        assert clock.sleeps == []
+
+
+        limiter = make_limiter(clock, {"x": (1, 60.0), "threads": (1, 60.0)})
+
+        limiter.call("x", lambda: None)
+        limiter.call("threads", lambda: None)
+
+        assert clock.sleeps == []
+
+    def test_shared_across_threads(self):
+        limiter = RateLimiter({"x": (5, 3600.0)})
+        acquired = []
+        deadline = time.monotonic() + 60
+
+        def worker():
+            try:
+                limiter.acquire("x", deadline=deadline)
+                acquired.append(1)
+            except RateLimitError:
+                pass
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(acquired) == 5
+
+    def test_from_config(self):
+        limiter = RateLimiter.from_config(
+            {"rate_limits": {"x": {"requests": 17, "window": 86400}, "max_retries": 5}}
+        )
+
+        assert limiter.limits["x"] == (17, 86400.0)
+        assert limiter.limits["threads"] == (250, 86400.0)
+        assert limiter.retry_policy.max_retries == 5
@@ -1,12 +1,14 @@
 """S3Uploader 테스트."""
 
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from indieshout.utils.s3_uploader import S3Uploader
+from indieshout.utils.media_stream import MultipartResumeState
+from indieshout.utils.s3_uploader import S3BatchUploadError, S3Uploader
 
 
 @pytest.fixture
@@ -145,3 +147,189 @@ def test_delete_file(uploader):
     uploader.s3_client.delete_object.assert_called_once_with(
         Bucket="test-bucket", Key="test-key"
     )
+
+
+def test_upload_many_returns_url_map(uploader, tmp_path):
+    """여러 파일 동시 업로드 시 입력 순서대로 URL 매핑 반환."""
+    files = {}
+    for i in range(5):
+        path = tmp_path / f"{i}.png"
+        path.write_bytes(b"x" * 10)
+        files[str(path)] = f"posts/slug/{i}.png"
+
+    uploader.s3_client.upload_file = MagicMock()
+
+    url_map = uploader.upload_many(files)
+
+    assert list(url_map) == list(files)
+    assert url_map[str(tmp_path / "3.png")].endswith("/posts/slug/3.png")
+    assert uploader.s3_client.upload_file.call_count == 5
+    _, kwargs = uploader.s3_client.upload_file.call_args
+    assert kwargs["Config"] is uploader.transfer_config
+
+
+def test_upload_many_partial_failure(uploader, tmp_path):
+    """일부 실패 시 성공분과 실패분을 함께 전달."""
+    ok = tmp_path / "ok.png"
+    ok.write_bytes(b"ok")
+    files = {str(ok): "ok.png", str(tmp_path / "missing.png"): "missing.png"}
+
+    uploader.s3_client.upload_file = MagicMock()
+
+    with pytest.raises(S3BatchUploadError) as exc_info:
+        uploader.upload_many(files)
+
+    assert list(exc_info.value.url_map) == [str(ok)]
+    assert isinstance(exc_info.value.errors[str(tmp_path / "missing.png")], FileNotFoundError)
+
+
+def test_upload_many_reports_progress(uploader, tmp_path):
+    """boto3 콜백을 누적 진행률로 전달."""
+    path = tmp_path / "1.png"
+    path.write_bytes(b"x" * 100)
+
+    def fake_upload(filename, bucket, key, ExtraArgs=None, Config=None, Callback=None):
+        Callback(40)
+        Callback(60)
+
+    uploader.s3_client.upload_file = MagicMock(side_effect=fake_upload)
+    progress = []
+
+    uploader.upload_many({str(path): "1.png"}, progress_callback=lambda *a: progress.append(a))
+
+    assert progress == [(str(path), 40, 100), (str(path), 100, 100)]
+
+
+class TestWithMoto:
+    """moto 로컬 S3로 실제 전송 경로 검증."""
+
+    @pytest.fixture
+    def moto_uploader(self, mock_config, monkeypatch, tmp_path):
+        moto = pytest.importorskip("moto")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test_key")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test_secret")
+
+        mock_config["s3"].update(
+            {
+                "multipart_threshold_mb": 5,
+                "multipart_chunksize_mb": 5,
+                "upload_workers": 4,
+                "resume_dir": str(tmp_path / "multipart"),
+            }
+        )
+        with moto.mock_aws():
+            uploader = S3Uploader(mock_config)
+            uploader.s3_client.create_bucket(
+                Bucket="test-bucket",
+                CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"},
+            )
+            yield uploader
+
+    def test_upload_many(self, moto_uploader, tmp_path):
+        files = {}
+        for i in range(6):
+            path = tmp_path / f"{i}.png"
+            path.write_bytes(bytes([i]) * 1024)
+            files[str(path)] = f"posts/slug/{i}.png"
+
+        url_map = moto_uploader.upload_many(files)
+
+        assert len(url_map) == 6
+        obj = moto_uploader.s3_client.get_object(Bucket="test-bucket", Key="posts/slug/2.png")
+        assert obj["Body"].read() == bytes([2]) * 1024
+        assert obj["ContentType"] == "image/png"
+
+    def test_large_file_uses_multipart(self, moto_uploader, tmp_path):
+        path = tmp_path / "large.png"
+        path.write_bytes(b"\0" * (11 * 1024 * 1024))
+
+        moto_uploader.upload_many({str(path): "posts/slug/large.png"})
+
+        head = moto_uploader.s3_client.head_object(Bucket="test-bucket", Key="posts/slug/large.png")
+        # 멀티파트 업로드 ETag는 "<md5>-<파트 수>" 형식
+        assert head["ETag"].strip('"').endswith("-3")
+
+    def test_upload_large_streams_parts(self, moto_uploader, tmp_path):
+        path = tmp_path / "video.mp4"
+        data = os.urandom(11 * 1024 * 1024)
+        path.write_bytes(data)
+        progress = []
+
+        url = moto_uploader.upload_large(path, "posts/slug/video.mp4", callback=progress.append)
+
+        assert url.endswith("/posts/slug/video.mp4")
+        obj = moto_uploader.s3_client.get_object(Bucket="test-bucket", Key="posts/slug/video.mp4")
+        assert obj["Body"].read() == data
+        assert obj["ContentType"] == "video/mp4"
+        assert sum(progress) == len(data)
+        assert moto_uploader.local_etag(path) == moto_uploader.get_etag("posts/slug/video.mp4")
+        assert not list((tmp_path / "multipart").glob("*.json"))
+
+    def test_upload_large_resumes_after_failure(self, moto_uploader, tmp_path):
+        path = tmp_path / "video.mp4"
+        data = os.urandom(11 * 1024 * 1024)
+        path.write_bytes(data)
+        moto_uploader.max_concurrency = 1
+        upload_part = moto_uploader.s3_client.upload_part
+        calls = []
+
+        def flaky_upload_part(**kwargs):
+            calls.append(kwargs["PartNumber"])
+            if kwargs["PartNumber"] == 2 and calls.count(2) == 1:
+                raise ConnectionError("network down")
+            return upload_part(**kwargs)
+
+        moto_uploader.s3_client.upload_part = flaky_upload_part
+
+        with pytest.raises(RuntimeError, match="이어서 업로드"):
+            moto_uploader.upload_large(path, "posts/slug/video.mp4")
+        assert list((tmp_path / "multipart").glob("*.json"))
+
+        moto_uploader.upload_large(path, "posts/slug/video.mp4")
+
+        assert calls == [1, 2, 2, 3]
+        obj = moto_uploader.s3_client.get_object(Bucket="test-bucket", Key="posts/slug/video.mp4")
+        assert obj["Body"].read() == data
+
+    def test_upload_large_replaces_missing_upload(self, moto_uploader, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(os.urandom(6 * 1024 * 1024))
+        state = MultipartResumeState.for_upload(
+            tmp_path / "multipart", "test-bucket", "posts/slug/video.mp4", path
+        )
+        state.save("expired-upload", 5 * 1024 * 1024, {1: '"etag"'})
+        abort = MagicMock(wraps=moto_uploader.s3_client.abort_multipart_upload)
+        moto_uploader.s3_client.abort_multipart_upload = abort
+
+        moto_uploader.upload_large(path, "posts/slug/video.mp4")
+
+        assert abort.call_args.kwargs["UploadId"] == "expired-upload"
+        assert moto_uploader.file_exists("posts/slug/video.mp4")
+
+    def test_upload_large_keeps_state_when_listing_fails(self, moto_uploader, tmp_path):
+        from botocore.exceptions import ClientError
+
+        path = tmp_path / "video.mp4"
+        path.write_bytes(os.urandom(6 * 1024 * 1024))
+        state = MultipartResumeState.for_upload(
+            tmp_path / "multipart", "test-bucket", "posts/slug/video.mp4", path
+        )
+        state.save("in-progress", 5 * 1024 * 1024, {})
+        moto_uploader.s3_client.list_parts = MagicMock(
+            side_effect=ClientError({"Error": {"Code": "AccessDenied"}}, "ListParts")
+        )
+        moto_uploader.s3_client.create_multipart_upload = MagicMock()
+
+        with pytest.raises(RuntimeError, match="파트 조회 실패"):
+            moto_uploader.upload_large(path, "posts/slug/video.mp4")
+
+        moto_uploader.s3_client.create_multipart_upload.assert_not_called()
+        assert state.load()["upload_id"] == "in-progress"
+
+    def test_upload_file_routes_large_files(self, moto_uploader, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(b"\0" * (6 * 1024 * 1024))
+        moto_uploader.resumable_threshold = 5 * 1024 * 1024
+        moto_uploader.upload_large = MagicMock(return_value="https://large")
+
+        assert moto_uploader.upload_file(path, "v.mp4") == "https://large"
@@ -0,0 +1,273 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from indieshout.blog.content_loader import ContentLoader
+from indieshout.workflows.scheduler import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    PublishScheduler,
+    ScheduleStore,
+)
+
+NOW = datetime(2026, 3, 1, 9, 0).timestamp()
+
+
+def add_folder(blog_dir, name, scheduled_at=None):
+    folder = blog_dir / name
+    folder.mkdir()
+    (folder / "content.md").write_text("# test")
+    meta = f"title: {name}\n"
+    if scheduled_at:
+        meta += f"scheduled_at: {scheduled_at}\n"
+    (folder / "meta.md").write_text(meta + "---\nSNS")
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def blog_dir(tmp_path):
+    path = tmp_path / "blog-content"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ScheduleStore(tmp_path / "schedule.sqlite3")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def workflow(blog_dir):
+    workflow = MagicMock()
+    workflow.content_loader = ContentLoader(blog_dir)
+    workflow.publish_batch.side_effect = lambda folders, push, **kwargs: {
+        "posts": {name: {"blog": {"url": f"https://example.com/{name}/"}, "sns": {}} for name in folders}
+    }
+    return workflow
+
+
+@pytest.fixture
+def clock():
+    return FakeClock(NOW)
+
+
+def make_scheduler(workflow, store, clock, **kwargs):
+    return PublishScheduler(workflow, store, clock=clock, **kwargs)
+
+
+class TestScheduleStore:
+    def test_add_and_pending_sorted(self, store):
+        store.add("b", NOW + 20)
+        store.add("a", NOW + 10)
+        assert store.pending() == [(NOW + 10, "a"), (NOW + 20, "b")]
+
+    def test_readd_resets_status(self, store):
+        store.add("a", NOW)
+        store.mark_failed("a", "boom", retry_at=None)
+        store.add("a", NOW + 10)
+
+        entry = store.get("a")
+        assert entry["status"] == STATUS_PENDING
+        assert entry["attempts"] == 0
+        assert entry["last_error"] is None
+
+    def test_mark_failed_reschedules(self, store):
+        store.add("a", NOW)
+        store.mark_failed("a", "boom", retry_at=NOW + 60)
+
+        entry = store.get("a")
+        assert entry["status"] == STATUS_PENDING
+        assert entry["scheduled_at"] == NOW + 60
+        assert entry["attempts"] == 1
+
+    def test_remove(self, store):
+        store.add("a", NOW)
+        assert store.remove("a") is True
+        assert store.remove("a") is False
+        assert store.pending() == []
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "schedule.sqlite3"
+        first = ScheduleStore(path)
+        first.add("a", NOW)
+        first.close()
+
+        second = ScheduleStore(path)
+        assert second.pending() == [(NOW, "a")]
+        second.close()
+
+
+class TestSync:
+    def test_picks_up_scheduled_folders(self, workflow, store, clock, blog_dir):
+        add_folder(blog_dir, "01-a", "2026-03-01T10:00")
+        add_folder(blog_dir, "02-b")
+
+        scheduler = make_scheduler(workflow, store, clock)
+
+        assert scheduler.sync() == 1
+        assert scheduler.next_due() == datetime(2026, 3, 1, 10, 0).timestamp()
+
+    def test_meta_change_updates_pending(self, workflow, store, clock, blog_dir):
+        add_folder(blog_dir, "01-a", "2026-03-01T10:00")
+        scheduler = make_scheduler(workflow, store, clock)
+        scheduler.sync()
+
+        (blog_dir / "01-a" / "meta.md").write_text("title: a\nscheduled_at: 2026-03-02T10:00\n---\nSNS")
+
+        assert scheduler.sync() == 1
+        assert scheduler.next_due() == datetime(2026, 3, 2, 10, 0).timestamp()
+
+    def test_manual_schedule_wins(self, workflow, store, clock, blog_dir):
+        add_folder(blog_dir, "01-a", "2026-03-01T10:00")
+        store.add("01-a", NOW + 5)
+
+        scheduler = make_scheduler(workflow, store, clock)
+        assert scheduler.sync() == 0
+        assert scheduler.next_due() == NOW + 5
+
+    def test_done_folder_not_rescheduled(self, workflow, store, clock, blog_dir):
+        add_folder(blog_dir, "01-a", "2026-03-01T08:00")
+        scheduler = make_scheduler(workflow, store, clock)
+        scheduler.run(once=True)
+
+        assert scheduler.sync() == 0
+        assert store.get("01-a")["status"] == STATUS_DONE
+
+    def test_invalid_scheduled_at_skipped(self, workflow, store, clock, blog_dir):
+        add_folder(blog_dir, "01-a", "someday")
+        assert make_scheduler(workflow, store, clock).sync() == 0
+
+
+class TestRunDue:
+    def test_publishes_only_due_folders_in_one_batch(self, workflow, store, clock):
+        scheduler = make_scheduler(workflow, store, clock, push=False)
+        scheduler.add("a", datetime.fromtimestamp(NOW - 10))
+        scheduler.add("b", datetime.fromtimestamp(NOW))
+        scheduler.add("c", datetime.fromtimestamp(NOW + 10))
+
+        posts = scheduler.run_due()
+
+        assert set(posts) == {"a", "b"}
+        workflow.publish_batch.assert_called_once_with(["a", "b"], push=False, schedule_store=store)
+        assert store.get("a")["status"] == STATUS_DONE
+        assert store.get("c")["status"] == STATUS_PENDING
+        assert scheduler.next_due() == NOW + 10
+
+    def test_nothing_due(self, workflow, store, clock):
+        scheduler = make_scheduler(workflow, store, clock)
+        scheduler.add("a", datetime.fromtimestamp(NOW + 10))
+
+        assert scheduler.run_due() == {}
+        workflow.publish_batch.assert_not_called()
+
+    def test_stale_heap_entry_ignored(self, workflow, store, clock):
+        scheduler = make_scheduler(workflow, store, clock)
+        scheduler.add("a", datetime.fromtimestamp(NOW - 10))
+        store.add("a", NOW + 100)  # 다른 프로세스에서 예약 변경
+
+        assert scheduler.run_due() == {}
+        workflow.publish_batch.assert_not_called()
+
+    def test_failure_retries_with_backoff(self, workflow, store, clock):
+        workflow.publish_batch.side_effect = lambda folders, push, **kwargs: {
+            "posts": {name: {"error": "boom"} for name in folders}
+        }
+        scheduler = make_scheduler(workflow, store, clock, retry_delay=60, max_attempts=3)
+        scheduler.add("a", datetime.fromtimestamp(NOW))
+
+        scheduler.run_due()
+        assert store.get("a")["scheduled_at"] == NOW + 60
+
+        clock.now = NOW + 60
+        scheduler.run_due()
+        entry = store.get("a")
+        assert entry["scheduled_at"] == NOW + 60 + 120
+        assert entry["attempts"] == 2
+
+        clock.now = NOW + 180
+        scheduler.run_due()
+        entry = store.get("a")
+        assert entry["status"] == STATUS_FAILED
+        assert entry["last_error"] == "boom"
+        assert scheduler.next_due() is None
+
+    def test_sns_error_counts_as_failure(self, workflow, store, clock):
+        workflow.publish_batch.side_effect = lambda folders, push, **kwargs: {
+            "posts": {
+                name: {"blog": {"url": "u"}, "sns": {"x": {"error": "denied"}}} for name in folders
+            }
+        }
+        scheduler = make_scheduler(workflow, store, clock)
+        scheduler.add("a", datetime.fromtimestamp(NOW))
+
+        scheduler.run_due()
+
+        assert store.get("a")["last_error"] == "x: denied"
+
+    def test_git_error_counts_as_failure(self, workflow, store, clock):
+        workflow.publish_batch.side_effect = lambda folders, push, **kwargs: {
+            "posts": {name: {"blog": {"url": "u"}, "sns": {}} for name in folders},
+            "git_error": "push rejected",
+        }
+        scheduler = make_scheduler(workflow, store, clock)
+        scheduler.add("a", datetime.fromtimestamp(NOW))
+
+        scheduler.run_due()
+
+        assert store.get("a")["last_error"] == "push rejected"
+
+
+class TestRun:
+    def test_sleeps_until_next_due_then_stops(self, workflow, store, clock, monkeypatch):
+        scheduler = make_scheduler(workflow, store, clock, rescan_interval=3600)
+        scheduler.add("a", datetime.fromtimestamp(NOW + 30))
+        waits = []
+
+        def fake_wait(timeout):
+            waits.append(timeout)
+            if len(waits) == 1:
+                clock.now = NOW + 30
+            else:
+                scheduler.stop()
+            return True
+
+        monkeypatch.setattr(scheduler._wakeup, "wait", fake_wait)
+        scheduler.run()
+
+        assert waits[0] == 30
+        workflow.publish_batch.assert_called_once_with(["a"], push=True, schedule_store=store)
+
+    def test_stop_before_run_exits(self, workflow, store, clock):
+        scheduler = make_scheduler(workflow, store, clock)
+        scheduler.stop()
+        scheduler.run()
+        workflow.publish_batch.assert_not_called()
+
+
+class TestFromConfig:
+    def test_reads_schedule_section(self, workflow, tmp_path):
+        config = {
+            "schedule": {
+                "path": str(tmp_path / "s.sqlite3"),
+                "rescan_interval": 10,
+                "max_attempts": 5,
+                "push": False,
+            }
+        }
+        scheduler = PublishScheduler.from_config(workflow, config)
+
+        assert scheduler.rescan_interval == 10
+        assert scheduler.max_attempts == 5
+        assert scheduler.push is False
+        assert scheduler.store.path == tmp_path / "s.sqlite3"
@@ -0,0 +1,165 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+from indieshout.utils.derivative_cache import DerivativeCache  # noqa: E402
+from indieshout.utils.sns_image_adapter import ImageSpec, SnsImageAdapter, adapt_image  # noqa: E402
+from indieshout.workflows.publish_workflow import PublishWorkflow  # noqa: E402
+
+
+def make_noise(path: Path, size=(1200, 800)) -> Path:
+    """압축이 잘 안 되는 이미지 (품질 탐색 테스트용)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.effect_noise(size, 80).convert("RGB").save(path)
+    return path
+
+
+class TestAdaptImage:
+    def test_crops_tall_screenshot_to_min_aspect(self, tmp_path):
+        source = make_noise(tmp_path / "shot.png", size=(400, 1600))
+        spec = ImageSpec(max_images=1, max_bytes=5 * 1024 * 1024, min_aspect=4 / 5)
+
+        result = adapt_image(str(source), str(tmp_path / "out"), spec)
+
+        assert result["path"].endswith("shot.jpg")
+        with Image.open(result["path"]) as image:
+            assert image.size == (400, 500)
+            assert image.format == "JPEG"
+
+    def test_crops_wide_image_to_max_aspect(self, tmp_path):
+        source = make_noise(tmp_path / "wide.png", size=(1600, 400))
+        spec = ImageSpec(max_images=1, max_bytes=5 * 1024 * 1024, max_aspect=16 / 9)
+
+        result = adapt_image(str(source), str(tmp_path / "out"), spec)
+
+        with Image.open(result["path"]) as image:
+            assert image.size == (711, 400)
+
+    def test_quality_search_fits_byte_limit(self, tmp_path):
+        source = make_noise(tmp_path / "big.png")
+        full = adapt_image(str(source), str(tmp_path / "full"), ImageSpec(max_images=1, max_bytes=10**9))
+        limit = full["bytes"] * 4 // 5
+
+        result = adapt_image(str(source), str(tmp_path / "out"), ImageSpec(max_images=1, max_bytes=limit))
+
+        assert result["bytes"] <= limit
+        with Image.open(result["path"]) as image:
+            assert image.size == (1200, 800)
+
+    def test_shrinks_when_lowest_quality_is_too_large(self, tmp_path):
+        source = make_noise(tmp_path / "big.png")
+        spec = ImageSpec(max_images=1, max_bytes=30 * 1024, min_quality=80)
+
+        result = adapt_image(str(source), str(tmp_path / "out"), spec)
+
+        assert result["bytes"] <= 30 * 1024
+        with Image.open(result["path"]) as image:
+            assert image.width < 1200
+
+    def test_webp_format(self, tmp_path):
+        source = make_noise(tmp_path / "1.png", size=(300, 300))
+        spec = ImageSpec(max_images=1, max_bytes=10**7, format="webp")
+
+        result = adapt_image(str(source), str(tmp_path / "out"), spec)
+
+        assert result["path"].endswith("1.webp")
+
+    def test_small_gif_copied(self, tmp_path):
+        source = tmp_path / "anim.gif"
+        Image.new("P", (50, 50)).save(source)
+
+        result = adapt_image(str(source), str(tmp_path / "out"), ImageSpec(max_images=1, max_bytes=10**6))
+
+        assert result["path"].endswith("anim.gif")
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(ValueError, match="Unsupported SNS image format"):
+            ImageSpec(max_images=1, max_bytes=1, format="png")
+
+
+class TestSnsImageAdapter:
+    def test_from_config_disabled_by_default(self):
+        assert SnsImageAdapter.from_config({}) is None
+
+    def test_from_config(self):
+        adapter = SnsImageAdapter.from_config({"images": {"sns_adapt": True, "workers": 2}})
+        assert adapter.workers == 2
+
+    def test_picks_first_n_per_platform(self, tmp_path):
+        sources = [str(make_noise(tmp_path / f"{i}.png", size=(300, 200))) for i in range(3)]
+        specs = {
+            "x": ImageSpec(max_images=2, max_bytes=10**7),
+            "threads": ImageSpec(max_images=10, max_bytes=10**7, format="webp"),
+        }
+
+        adapted = SnsImageAdapter(workers=2).adapt(sources, specs, output_dir=tmp_path / "out")
+
+        assert [Path(p).name for p in adapted["x"]] == ["0.jpg", "1.jpg"]
+        assert [Path(p).name for p in adapted["threads"]] == ["0.webp", "1.webp", "2.webp"]
+
+    def test_cache_skips_work_and_shares_identical_specs(self, tmp_path, monkeypatch):
+        from indieshout.utils import sns_image_adapter
+
+        source = str(make_noise(tmp_path / "1.png", size=(300, 200)))
+        spec = ImageSpec(max_images=4, max_bytes=10**7)
+        cache = DerivativeCache(tmp_path / "cache")
+        adapter = SnsImageAdapter(workers=1)
+
+        first = adapter.adapt([source], {"x": spec, "other": spec}, cache=cache)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("re-encoded a cached image")
+
+        monkeypatch.setattr(sns_image_adapter, "adapt_image", fail)
+        second = adapter.adapt([source], {"x": spec}, cache=cache)
+
+        assert first["x"] == first["other"] == second["x"]
+        assert len(cache.entries()) == 1
+
+    def test_failed_image_is_dropped(self, tmp_path):
+        broken = tmp_path / "broken.png"
+        broken.write_bytes(b"not an image")
+        good = str(make_noise(tmp_path / "good.png", size=(100, 100)))
+
+        adapted = SnsImageAdapter(workers=1).adapt(
+            [str(broken), good], {"x": ImageSpec(max_images=4, max_bytes=10**7)}, output_dir=tmp_path / "out"
+        )
+
+        assert [Path(p).name for p in adapted["x"]] == ["good.jpg"]
+
+
+class TestWorkflowSnsImages:
+    def test_files_for_x_and_uploaded_urls_for_threads(self, tmp_path):
+        blog_dir = tmp_path / "blog-content"
+        folder = blog_dir / "00001-post"
+        make_noise(folder / "assets" / "1.png", size=(400, 1600))
+        (folder / "content.md").write_text("# 제목\n\n본문\n\n![](assets/1.png)", encoding="utf-8")
+        (folder / "meta.md").write_text("title: 제목\nplatforms: x, threads\n\n---\n\nSNS", encoding="utf-8")
+
+        workflow = PublishWorkflow({"images": {"sns_adapt": True, "workers": 1}}, blog_content_dir=blog_dir)
+        workflow.hugo_publisher.s3_uploader = MagicMock()
+        workflow.hugo_publisher.upload_sns_images = MagicMock(
+            side_effect=lambda paths, slug, platform, source_dir: {
+                p: f"https://cdn/posts/{slug}/sns/{platform}/{Path(p).name}" for p in paths
+            }
+        )
+        published = {}
+
+        def make_publisher(platform):
+            publisher = MagicMock()
+            publisher.publish.side_effect = lambda content: published.setdefault(platform, content) and {}
+            return publisher
+
+        workflow.publishers = {"x": make_publisher("x"), "threads": make_publisher("threads")}
+
+        workflow.publish_from_folder("00001-post", skip_blog=True)
+
+        assert [Path(p).name for p in published["x"].image_paths] == ["1.jpg"]
+        assert published["threads"].image_urls == ["https://cdn/posts/post/sns/threads/1.jpg"]
+        assert published["threads"].image_paths is None
+        with Image.open(published["x"].image_paths[0]) as image:
+            assert image.size == (400, 533)
@@ -1,5 +1,8 @@
+import asyncio
 import os
-from unittest.mock import MagicMock, Mock, patch
+import time
+from unittest.mock import patch
+from urllib.parse import parse_qs
 
 import httpx
 import pytest
@@ -10,6 +13,8 @@ from indieshout.publishers.threads import (
     MAX_IMAGES,
     ThreadsPublisher,
 )
+from indieshout.utils.auth_cache import credential_fingerprint
+from indieshout.utils.rate_limiter import RateLimitError, RetryableError
 
 
 @pytest.fixture
@@ -46,32 +51,93 @@ class TestInit:
         assert publisher.user_id is None
 
 
-class TestAuthenticate:
-    @patch("indieshout.publishers.threads.httpx.Client")
-    def test_authenticate_success(self, mock_client_cls, publisher):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "test_user_id", "username": "testuser"}
+def mock_transport(responses: dict[str, httpx.Response], seen: list | None = None):
+    """경로별 응답을 돌려주는 MockTransport (요청은 seen에 기록)."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if seen is not None:
+            seen.append(request)
+        return responses[request.url.path]
+
+    return httpx.MockTransport(handler)
+
+
+def make_publisher(threads_config, responses, seen=None):
+    return ThreadsPublisher(threads_config, transport=mock_transport(responses, seen))
+
+
+PUBLISH_RESPONSES = {
+    "/v1.0/test_user_id/threads": httpx.Response(200, json={"id": "container_123"}),
+    "/v1.0/test_user_id/threads_publish": httpx.Response(200, json={"id": "thread_456"}),
+}
 
-        mock_client = MagicMock()
-        mock_client.__enter__.return_value.get.return_value = mock_response
-        mock_client_cls.return_value = mock_client
+
+class TestAuthenticate:
+    def test_authenticate_success(self, threads_config):
+        seen = []
+        publisher = make_publisher(
+            threads_config,
+            {"/v1.0/me": httpx.Response(200, json={"id": "test_user_id", "username": "testuser"})},
+            seen,
+        )
 
         result = publisher.authenticate()
 
         assert result is True
         assert publisher.access_token == "test_access_token"
         assert publisher.user_id == "test_user_id"
+        assert str(seen[0].url).startswith("https://graph.threads.net/v1.0/me?")
+
+    def test_authenticate_cached(self, threads_config):
+        seen = []
+        publisher = make_publisher(
+            threads_config,
+            {"/v1.0/me": httpx.Response(200, json={"id": "test_user_id", "username": "testuser"})},
+            seen,
+        )
+
+        publisher.authenticate()
+        publisher.authenticate()
 
-    @patch("indieshout.publishers.threads.httpx.Client")
-    def test_authenticate_failure_invalid_token(self, mock_client_cls, publisher):
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = "Invalid token"
+        assert len(seen) == 1
+        assert publisher.auth_cache.get(
+            "threads", credential_fingerprint("test_access_token", "test_user_id")
+        ) == {"id": "test_user_id", "username": "testuser"}
 
-        mock_client = MagicMock()
-        mock_client.__enter__.return_value.get.return_value = mock_response
-        mock_client_cls.return_value = mock_client
+    def test_token_expiry_limits_cache(self, threads_config):
+        threads_config["threads"]["token_expires_at"] = "2000-01-01T00:00:00"
+        seen = []
+        publisher = make_publisher(
+            threads_config, {"/v1.0/me": httpx.Response(200, json={"id": "1"})}, seen
+        )
+
+        publisher.authenticate()
+        publisher.authenticate()
+
+        assert len(seen) == 2
+
+    def test_unauthorized_publish_invalidates_cache(self, threads_config):
+        seen = []
+        publisher = make_publisher(
+            threads_config,
+            {
+                "/v1.0/me": httpx.Response(200, json={"id": "test_user_id"}),
+                "/v1.0/test_user_id/threads": httpx.Response(401, text="expired"),
+            },
+            seen,
+        )
+        publisher.authenticate()
+
+        with pytest.raises(RuntimeError, match="expired"):
+            publisher.publish(Content(content_type=ContentType.SNS, text="Test"))
+        publisher.authenticate()
+
+        assert [r.url.path for r in seen].count("/v1.0/me") == 2
+
+    def test_authenticate_failure_invalid_token(self, threads_config):
+        publisher = make_publisher(
+            threads_config, {"/v1.0/me": httpx.Response(401, text="Invalid token")}
+        )
 
         with pytest.raises(RuntimeError, match="Authentication failed"):
             publisher.authenticate()
@@ -160,31 +226,31 @@ class TestFormatContent:
 
 
 class TestPublish:
-    @patch("indieshout.publishers.threads.httpx.Client")
-    def test_text_only(self, mock_client_cls, authenticated_publisher):
-        mock_create_response = Mock()
-        mock_create_response.status_code = 200
-        mock_create_response.json.return_value = {"id": "container_123"}
-
-        mock_publish_response = Mock()
-        mock_publish_response.status_code = 200
-        mock_publish_response.json.return_value = {"id": "thread_456"}
-
-        mock_client = MagicMock()
-        mock_client.__enter__.return_value.post.side_effect = [
-            mock_create_response,
-            mock_publish_response,
-        ]
-        mock_client_cls.return_value = mock_client
+    def test_text_only(self, threads_config):
+        seen = []
+        publisher = make_publisher(threads_config, PUBLISH_RESPONSES, seen)
+        publisher.access_token = "test_access_token"
+        publisher.user_id = "test_user_id"
 
         content = Content(content_type=ContentType.SNS, text="Test post")
-        result = authenticated_publisher.publish(content)
+        result = publisher.publish(content)
 
         assert result["thread_id"] == "thread_456"
         assert "url" in result
+        assert b"creation_id=container_123" in seen[1].content
+
+    def test_create_container_failure(self, threads_config):
+        publisher = make_publisher(
+            threads_config,
+            {"/v1.0/test_user_id/threads": httpx.Response(400, text="bad request")},
+        )
+        publisher.access_token = "test_access_token"
+        publisher.user_id = "test_user_id"
+
+        with pytest.raises(RuntimeError, match="Failed to create thread container"):
+            publisher.publish(Content(content_type=ContentType.SNS, text="Test"))
 
-    @patch("indieshout.publishers.threads.httpx.Client")
-    def test_with_image_not_implemented(self, mock_client_cls, authenticated_publisher, tmp_path):
+    def test_image_paths_without_urls_raises(self, authenticated_publisher, tmp_path):
         img = tmp_path / "test.jpg"
         img.write_bytes(b"fake")
 
@@ -192,5 +258,282 @@ class TestPublish:
             content_type=ContentType.SNS, text="Test", image_paths=[str(img)]
         )
 
-        with pytest.raises(NotImplementedError, match="Image posting not yet implemented"):
+        with pytest.raises(ValueError, match="requires public image URLs"):
             authenticated_publisher.publish(content)
+
+
+class FakeThreadsApi:
+    """컨테이너 생성/상태/게시를 흉내 내는 비동기 핸들러."""
+
+    def __init__(self, latency=0.0, pending_polls=0, status="FINISHED"):
+        self.latency = latency
+        self.pending_polls = pending_polls
+        self.status = status
+        self.created: list[dict] = []
+        self.polls: dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        path = request.url.path
+        if path.endswith("/threads"):
+            form = {k: v[0] for k, v in parse_qs(request.content.decode()).items()}
+            self.created.append(form)
+            return httpx.Response(200, json={"id": f"c{len(self.created)}"})
+        if path.endswith("/threads_publish"):
+            return httpx.Response(200, json={"id": "thread_1"})
+
+        container_id = path.rsplit("/", 1)[-1]
+        self.polls[container_id] = self.polls.get(container_id, 0) + 1
+        if self.polls[container_id] <= self.pending_polls:
+            return httpx.Response(200, json={"status": "IN_PROGRESS"})
+        return httpx.Response(200, json={"status": self.status, "error_message": "bad image"})
+
+
+def make_async_publisher(api, **threads_options):
+    config = {
+        "threads": {
+            "access_token": "test_access_token",
+            "user_id": "test_user_id",
+            "poll_interval": 0.01,
+            "poll_max_interval": 0.02,
+            **threads_options,
+        }
+    }
+    publisher = ThreadsPublisher(config, async_transport=httpx.MockTransport(api))
+    publisher.access_token = "test_access_token"
+    publisher.user_id = "test_user_id"
+    return publisher
+
+
+URLS = [f"https://cdn.example.com/posts/p/{i}.jpg" for i in range(1, 7)]
+
+
+class TestRateLimitResponses:
+    def make(self, threads_config, responses):
+        publisher = make_publisher(threads_config, responses)
+        publisher.access_token = "test_access_token"
+        publisher.user_id = "test_user_id"
+        return publisher
+
+    def test_429_raises_rate_limit_error(self, threads_config):
+        publisher = self.make(
+            threads_config,
+            {
+                "/v1.0/test_user_id/threads": httpx.Response(
+                    429, headers={"retry-after": "30"}, text="slow down"
+                )
+            },
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            publisher.publish(Content(content_type=ContentType.SNS, text="Test"))
+        assert exc_info.value.retry_after == 30.0
+
+    def test_rate_limit_error_code(self, threads_config):
+        publisher = self.make(
+            threads_config,
+            {
+                "/v1.0/test_user_id/threads": httpx.Response(
+                    400, json={"error": {"code": 4, "message": "Application request limit reached"}}
+                )
+            },
+        )
+
+        with pytest.raises(RateLimitError):
+            publisher.publish(Content(content_type=ContentType.SNS, text="Test"))
+
+    def test_server_error_before_publish_retryable(self, threads_config):
+        publisher = self.make(
+            threads_config, {"/v1.0/test_user_id/threads": httpx.Response(503, text="down")}
+        )
+
+        with pytest.raises(RetryableError):
+            publisher.publish(Content(content_type=ContentType.SNS, text="Test"))
+
+    def test_server_error_on_publish_not_retryable(self, threads_config):
+        publisher = self.make(
+            threads_config,
+            {
+                "/v1.0/test_user_id/threads": httpx.Response(200, json={"id": "c1"}),
+                "/v1.0/test_user_id/threads_publish": httpx.Response(500, text="unknown"),
+            },
+        )
+
+        with pytest.raises(RuntimeError) as exc_info:
+            publisher.publish(Content(content_type=ContentType.SNS, text="Test"))
+        # 게시 여부를 알 수 없으므로 재시도하지 않음
+        assert not isinstance(exc_info.value, RetryableError)
+
+    def test_usage_header_blocks_bucket(self, threads_config):
+        responses = {
+            "/v1.0/test_user_id/threads": httpx.Response(
+                200,
+                json={"id": "c1"},
+                headers={"x-app-usage": '{"call_count": 100, "total_time": 10, "total_cputime": 5}'},
+            ),
+            "/v1.0/test_user_id/threads_publish": httpx.Response(200, json={"id": "t1"}),
+        }
+        publisher = self.make(threads_config, responses)
+
+        publisher.publish(Content(content_type=ContentType.SNS, text="Test"))
+
+        assert publisher.rate_limiter.bucket("threads").wait_time() > 3000
+
+
+class TestPublishImages:
+    def test_single_image(self):
+        api = FakeThreadsApi()
+        publisher = make_async_publisher(api)
+
+        result = publisher.publish(
+            Content(content_type=ContentType.SNS, text="Test", image_urls=URLS[:1])
+        )
+
+        assert result["thread_id"] == "thread_1"
+        assert api.created == [
+            {
+                "media_type": "IMAGE",
+                "image_url": URLS[0],
+                "text": "Test",
+                "access_token": "test_access_token",
+            }
+        ]
+
+    def test_carousel_items_created_concurrently(self):
+        api = FakeThreadsApi(latency=0.1)
+        publisher = make_async_publisher(api)
+
+        started = time.monotonic()
+        result = publisher.publish(
+            Content(content_type=ContentType.SNS, text="Test", image_urls=URLS)
+        )
+        elapsed = time.monotonic() - started
+
+        assert result["thread_id"] == "thread_1"
+        assert api.max_in_flight == 6
+        # 항목 생성/상태 조회가 각각 한 번의 지연 시간 안에 끝남 (순차면 1.2s 이상)
+        assert elapsed < 0.9
+
+        items, carousel = api.created[:6], api.created[6]
+        assert [item["image_url"] for item in items] == URLS
+        assert all(item["is_carousel_item"] == "true" for item in items)
+        assert carousel["media_type"] == "CAROUSEL"
+        assert carousel["children"] == "c1,c2,c3,c4,c5,c6"
+
+    def test_polls_until_finished(self):
+        api = FakeThreadsApi(pending_polls=2)
+        publisher = make_async_publisher(api)
+
+        publisher.publish(Content(content_type=ContentType.SNS, text="Test", image_urls=URLS[:1]))
+
+        assert api.polls == {"c1": 3}
+
+    def test_container_error_raises(self):
+        publisher = make_async_publisher(FakeThreadsApi(status="ERROR"))
+
+        with pytest.raises(RuntimeError, match="ERROR: bad image"):
+            publisher.publish(
+                Content(content_type=ContentType.SNS, text="Test", image_urls=URLS[:2])
+            )
+
+    def test_container_timeout(self):
+        publisher = make_async_publisher(
+            FakeThreadsApi(pending_polls=100), container_timeout=0.05
+        )
+
+        with pytest.raises(RuntimeError, match="not ready"):
+            publisher.publish(
+                Content(content_type=ContentType.SNS, text="Test", image_urls=URLS[:1])
+            )
+
+    def test_async_client_reused_across_publishes(self):
+        publisher = make_async_publisher(FakeThreadsApi())
+        content = Content(content_type=ContentType.SNS, text="Test", image_urls=URLS[:2])
+
+        with patch(
+            "indieshout.publishers.threads.httpx.AsyncClient", wraps=httpx.AsyncClient
+        ) as client_cls:
+            publisher.publish(content)
+            publisher.publish(content)
+
+        assert client_cls.call_count == 1
+        publisher.close()
+
+    def test_publish_inside_running_event_loop(self):
+        publisher = make_async_publisher(FakeThreadsApi())
+
+        async def caller():
+            return publisher.publish(
+                Content(content_type=ContentType.SNS, text="Test", image_urls=URLS[:1])
+            )
+
+        assert asyncio.run(caller())["thread_id"] == "thread_1"
+        publisher.close()
+
+    def test_close_closes_async_client_and_loop(self):
+        publisher = make_async_publisher(FakeThreadsApi())
+        publisher.publish(Content(content_type=ContentType.SNS, text="Test", image_urls=URLS[:1]))
+        client, thread = publisher.async_client, publisher._loop_thread
+
+        publisher.close()
+
+        assert client.is_closed
+        assert not thread.is_alive()
+        # 닫은 뒤에도 다시 게시할 수 있음
+        publisher.publish(Content(content_type=ContentType.SNS, text="Test", image_urls=URLS[:1]))
+        publisher.close()
+
+    def test_too_many_urls_invalid(self, authenticated_publisher):
+        content = Content(
+            content_type=ContentType.SNS,
+            text="Test",
+            image_urls=[f"https://cdn.example.com/{i}.jpg" for i in range(MAX_IMAGES + 1)],
+        )
+        with pytest.raises(ValueError, match=f"Maximum {MAX_IMAGES} images"):
+            authenticated_publisher.validate(content)
+
+
+class TestSharedClient:
+    def test_client_reused_across_requests(self, threads_config):
+        responses = {
+            "/v1.0/me": httpx.Response(200, json={"id": "test_user_id"}),
+            **PUBLISH_RESPONSES,
+        }
+        seen = []
+        publisher = make_publisher(threads_config, responses, seen)
+
+        with patch("indieshout.publishers.threads.httpx.Client", wraps=httpx.Client) as client_cls:
+            publisher.authenticate()
+            for _ in range(2):
+                publisher.publish(Content(content_type=ContentType.SNS, text="Test"))
+
+        assert client_cls.call_count == 1
+        assert len(seen) == 5
+
+    def test_timeouts_and_limits_from_config(self):
+        publisher = ThreadsPublisher(
+            {"threads": {"timeout": 5, "connect_timeout": 2, "max_connections": 3}}
+        )
+
+        client = publisher.client
+
+        assert client.timeout.read == 5
+        assert client.timeout.connect == 2
+        assert client._transport._pool._max_connections == 3
+
+    def test_close_recreates_client(self, threads_config):
+        publisher = make_publisher(threads_config, {})
+        first = publisher.client
+
+        publisher.close()
+
+        assert first.is_closed
+        assert publisher.client is not first
@@ -0,0 +1,122 @@
+"""번역 백엔드 테스트."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from indieshout.utils.translation_backends import (
+    AnthropicBackend,
+    ClaudeCodeBackend,
+    StubBackend,
+    create_backend,
+    parse_batch_response,
+)
+
+
+class TestCreateBackend:
+    def test_default_is_claude_code(self):
+        assert isinstance(create_backend({}), ClaudeCodeBackend)
+
+    def test_stub(self):
+        assert isinstance(create_backend({"translator": {"provider": "stub"}}), StubBackend)
+
+    def test_anthropic(self):
+        backend = create_backend(
+            {"translator": {"provider": "anthropic", "api_key": "key", "model": "m"}}
+        )
+        assert isinstance(backend, AnthropicBackend)
+        assert backend.model == "m"
+        backend.close()
+
+    def test_anthropic_requires_api_key(self):
+        with pytest.raises(ValueError, match="api_key"):
+            create_backend({"translator": {"provider": "anthropic"}})
+
+    def test_unknown_provider(self):
+        with pytest.raises(ValueError, match="Unknown translator provider"):
+            create_backend({"translator": {"provider": "nope"}})
+
+
+class TestParseBatchResponse:
+    def test_code_fenced_array(self):
+        assert parse_batch_response('```json\n["a", " b "]\n```', 2) == ["a", "b"]
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            parse_batch_response('["a"]', 2)
+
+    def test_no_array(self):
+        with pytest.raises(ValueError):
+            parse_batch_response("a, b", 2)
+
+
+class TestClaudeCodeBackend:
+    @patch("indieshout.utils.translation_backends.subprocess.run")
+    def test_complete(self, mock_run):
+        mock_run.return_value = MagicMock(stdout=" Hello \n")
+
+        assert ClaudeCodeBackend().complete("prompt") == "Hello"
+        assert mock_run.call_args.args[0] == ["claude", "-p", "prompt"]
+
+    @patch("indieshout.utils.translation_backends.subprocess.run")
+    def test_timeout(self, mock_run):
+        import subprocess
+
+        mock_run.side_effect = subprocess.TimeoutExpired("claude", 5)
+
+        with pytest.raises(RuntimeError, match="timeout"):
+            ClaudeCodeBackend(timeout=5).complete("prompt")
+
+
+class TestAnthropicBackend:
+    def make_backend(self, handler):
+        return AnthropicBackend(api_key="key", transport=httpx.MockTransport(handler))
+
+    def test_reuses_one_client(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            body = json.loads(request.content)
+            text = body["messages"][0]["content"]
+            return httpx.Response(200, json={"content": [{"type": "text", "text": f"ok {len(text)}"}]})
+
+        backend = self.make_backend(handler)
+        client = backend._client
+
+        for text in ["하나", "둘", "셋"]:
+            assert backend.translate(text, "ko", "en").startswith("ok")
+
+        assert backend._client is client
+        assert len(requests) == 3
+        assert requests[0].headers["x-api-key"] == "key"
+        assert requests[0].url.path == "/v1/messages"
+        backend.close()
+
+    def test_batch(self):
+        def handler(request):
+            return httpx.Response(
+                200, json={"content": [{"type": "text", "text": '["one", "two"]'}]}
+            )
+
+        backend = self.make_backend(handler)
+        assert backend.translate_batch(["하나", "둘"], "ko", "en") == ["one", "two"]
+        backend.close()
+
+    def test_error_status(self):
+        backend = self.make_backend(lambda request: httpx.Response(529, text="overloaded"))
+
+        with pytest.raises(RuntimeError, match="529"):
+            backend.complete("prompt")
+        backend.close()
+
+
+class TestStubBackend:
+    def test_deterministic(self):
+        backend = StubBackend()
+
+        assert backend.translate("안녕", "ko", "en") == "[en] 안녕"
+        assert backend.translate_batch(["가", "나"], "ko", "ja") == ["[ja] 가", "[ja] 나"]
+        assert backend.requests == ["안녕", "가", "나"]
@@ -0,0 +1,109 @@
+"""TranslationCache 테스트."""
+
+import pytest
+
+from indieshout.utils.translation_cache import (
+    TranslationCache,
+    make_cache_key,
+    normalize_text,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TranslationCache(tmp_path / "translations.sqlite3", max_entries=3)
+    yield cache
+    cache.close()
+
+
+def test_normalize_ignores_trailing_whitespace_and_newlines():
+    assert normalize_text("  안녕\r\n하세요  \n") == "안녕\n하세요"
+
+
+def test_cache_key_includes_languages():
+    assert make_cache_key("ko", "en", "안녕") != make_cache_key("ko", "ja", "안녕")
+    assert make_cache_key("ko", "en", "안녕 ") == make_cache_key("ko", "en", "안녕")
+
+
+def test_db_created_lazily(tmp_path):
+    path = tmp_path / "sub" / "cache.sqlite3"
+    cache = TranslationCache(path)
+    assert not path.exists()
+
+    cache.set("ko", "en", "안녕", "Hello")
+
+    assert path.exists()
+    cache.close()
+
+
+def test_get_set_and_stats(cache):
+    assert cache.get("ko", "en", "안녕") is None
+    cache.set("ko", "en", "안녕", "Hello")
+
+    assert cache.get("ko", "en", "안녕") == "Hello"
+    assert cache.get("ko", "ja", "안녕") is None
+    assert cache.stats() == {"hits": 1, "misses": 2}
+
+    cache.reset_stats()
+    assert cache.stats() == {"hits": 0, "misses": 0}
+
+
+def test_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    first = TranslationCache(path)
+    first.set("ko", "en", "안녕", "Hello")
+    first.close()
+
+    second = TranslationCache(path)
+    assert second.get("ko", "en", "안녕") == "Hello"
+    second.close()
+
+
+def test_lru_eviction(cache):
+    cache.set("ko", "en", "a", "A")
+    cache.set("ko", "en", "b", "B")
+    cache.set("ko", "en", "c", "C")
+    # a를 최근 사용으로 갱신 → b가 가장 오래됨
+    assert cache.get("ko", "en", "a") == "A"
+
+    cache.set("ko", "en", "d", "D")
+
+    assert len(cache) == 3
+    assert cache.get("ko", "en", "b") is None
+    assert cache.get("ko", "en", "a") == "A"
+    assert cache.get("ko", "en", "d") == "D"
+
+
+def test_from_config_disabled():
+    assert TranslationCache.from_config({"translator": {"cache": False}}) is None
+
+
+def test_from_config(tmp_path):
+    cache = TranslationCache.from_config(
+        {"translator": {"cache_path": str(tmp_path / "c.sqlite3"), "cache_max_entries": 10}}
+    )
+    assert cache.path == tmp_path / "c.sqlite3"
+    assert cache.max_entries == 10
+
+
+def test_from_config_stub_disabled(tmp_path):
+    config = {"translator": {"provider": "stub", "cache_path": str(tmp_path / "c.sqlite3")}}
+    assert TranslationCache.from_config(config) is None
+
+
+def test_backends_do_not_share_entries(tmp_path):
+    path = str(tmp_path / "c.sqlite3")
+    sonnet = TranslationCache.from_config(
+        {"translator": {"provider": "anthropic", "model": "sonnet", "cache_path": path}}
+    )
+    sonnet.set("ko", "en", "안녕", "Hello")
+    sonnet.close()
+
+    haiku = TranslationCache.from_config(
+        {"translator": {"provider": "anthropic", "model": "haiku", "cache_path": path}}
+    )
+    cli = TranslationCache.from_config({"translator": {"cache_path": path}})
+    assert haiku.get("ko", "en", "안녕") is None
+    assert cli.get("ko", "en", "안녕") is None
+    haiku.close()
+    cli.close()
@@ -0,0 +1,232 @@
+"""Translator 테스트."""
+
+import json
+import subprocess
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from indieshout.utils.translation_backends import StubBackend
+from indieshout.utils.translation_cache import TranslationCache
+from indieshout.utils.translator import Translator
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TranslationCache(tmp_path / "translations.sqlite3")
+    yield cache
+    cache.close()
+
+
+def fake_claude(args, **kwargs):
+    """프롬프트의 마지막 줄을 [en] 접두사로 돌려주는 가짜 claude -p."""
+    prompt = args[2]
+    text = prompt.split("Text to translate:\n", 1)[1].strip()
+    return MagicMock(stdout=f"[en] {text}\n")
+
+
+def fake_claude_batch(args, **kwargs):
+    """JSON 배열 요청이면 배열로, 아니면 단일 번역으로 응답."""
+    prompt = args[2]
+    if "JSON array" in prompt:
+        items = json.loads(prompt[prompt.index("[") : prompt.rindex("]") + 1])
+        return MagicMock(stdout="```json\n" + json.dumps([f"[en] {i}" for i in items]) + "\n```")
+    return fake_claude(args, **kwargs)
+
+
+class TestCache:
+    @patch("indieshout.utils.translation_backends.subprocess.run", side_effect=fake_claude)
+    def test_unchanged_text_served_from_cache(self, mock_run, cache):
+        translator = Translator(cache=cache)
+
+        assert translator.translate_text("안녕하세요") == "[en] 안녕하세요"
+        assert translator.translate_text("안녕하세요") == "[en] 안녕하세요"
+
+        assert mock_run.call_count == 1
+        assert cache.stats() == {"hits": 1, "misses": 1}
+
+    @patch("indieshout.utils.translation_backends.subprocess.run", side_effect=fake_claude_batch)
+    def test_only_edited_segments_reach_backend(self, mock_run, cache):
+        translator = Translator(cache=cache)
+        markdown = '---\ntitle: "제목"\ntags: [\'태그\']\n---\n\n본문'
+        translator.translate_markdown(markdown)
+        first_calls = mock_run.call_count
+
+        translator.translate_markdown(markdown.replace("본문", "수정된 본문"))
+
+        assert mock_run.call_count == first_calls + 1
+
+    @patch("indieshout.utils.translation_backends.subprocess.run", side_effect=fake_claude)
+    def test_without_cache(self, mock_run):
+        translator = Translator()
+
+        translator.translate_text("안녕")
+        translator.translate_text("안녕")
+
+        assert mock_run.call_count == 2
+        assert translator.cache_summary() is None
+
+    @patch("indieshout.utils.translation_backends.subprocess.run", side_effect=fake_claude_batch)
+    def test_per_call_stats(self, mock_run, cache):
+        translator = Translator(cache=cache)
+        markdown = '---\ntitle: "제목"\n---\n\n본문'
+
+        first = {"hits": 0, "misses": 0}
+        translator.translate_markdown(markdown, stats=first)
+        second = {"hits": 0, "misses": 0}
+        translator.translate_markdown(markdown, stats=second)
+
+        assert first == {"hits": 0, "misses": 2}
+        assert second == {"hits": 2, "misses": 0}
+        # 캐시 전체 통계는 초기화 없이 누적
+        assert cache.stats() == {"hits": 2, "misses": 2}
+        assert translator.cache_summary(second) == "번역 캐시: 적중 2, 미스 0"
+
+    def test_cache_summary(self, cache):
+        translator = Translator(cache=cache)
+        assert translator.cache_summary() == "번역 캐시: 적중 0, 미스 0"
+
+    def test_from_config(self, tmp_path):
+        translator = Translator.from_config(
+            {
+                "translator": {
+                    "provider": "stub",
+                    "source_lang": "ko",
+                    "target_lang": "ja",
+                    "cache_path": str(tmp_path / "c.sqlite3"),
+                }
+            }
+        )
+        assert translator.target_lang == "ja"
+        assert translator.cache is None  # stub 번역은 캐시하지 않음
+        assert isinstance(translator.backend, StubBackend)
+        assert translator.translate_text("안녕") == "[ja] 안녕"
+
+
+class TestBatch:
+    FRONT_MATTER = (
+        'title: "제목"\n'
+        "date: 2026-02-17T12:00:00+09:00\n"
+        "tags: ['태그1', '태그2', '태그3']\n"
+        "categories: ['개발', '기술']"
+    )
+
+    @patch("indieshout.utils.translation_backends.subprocess.run", side_effect=fake_claude_batch)
+    def test_front_matter_single_backend_call(self, mock_run):
+        translator = Translator()
+
+        result = translator._translate_front_matter(self.FRONT_MATTER)
+
+        assert mock_run.call_count == 1
+        assert result == (
+            'title: "[en] 제목"\n'
+            "date: 2026-02-17T12:00:00+09:00\n"
+            "tags: ['[en] 태그1', '[en] 태그2', '[en] 태그3']\n"
+            "categories: ['[en] 개발', '[en] 기술']"
+        )
+
+    @patch("indieshout.utils.translation_backends.subprocess.run")
+    def test_falls_back_per_item_on_unparseable_response(self, mock_run):
+        def respond(args, **kwargs):
+            if "JSON array" in args[2]:
+                return MagicMock(stdout="Sorry, here you go: one, two")
+            return fake_claude(args, **kwargs)
+
+        mock_run.side_effect = respond
+        translator = Translator()
+
+        assert translator.translate_batch(["하나", "둘"]) == ["[en] 하나", "[en] 둘"]
+        assert mock_run.call_count == 3
+
+    @patch("indieshout.utils.translation_backends.subprocess.run", side_effect=fake_claude_batch)
+    def test_batch_uses_cache_and_dedupes(self, mock_run, cache):
+        translator = Translator(cache=cache)
+        cache.set("ko", "en", "하나", "one")
+
+        result = translator.translate_batch(["하나", "둘", "셋", "둘", ""])
+
+        assert result == ["one", "[en] 둘", "[en] 셋", "[en] 둘", ""]
+        assert mock_run.call_count == 1
+        sent = mock_run.call_args.args[0][2]
+        assert "하나" not in sent
+        assert cache.get("ko", "en", "셋") == "[en] 셋"
+
+    def test_stub_backend_batch(self):
+        backend = StubBackend()
+        translator = Translator(backend=backend)
+
+        result = translator._translate_front_matter("title: \"제목\"\ntags: ['가', '나']")
+
+        assert result == "title: \"[en] 제목\"\ntags: ['[en] 가', '[en] 나']"
+        assert backend.requests == ["제목", "가", "나"]
+
+
+class TestChunkedBody:
+    BODY = (
+        "# 제목\n\n문단 하나\n\n```bash\necho 코드\n```\n\n"
+        "![그림](assets/1.png)\n\n## 둘\n\n[링크](https://example.com) 문단 둘"
+    )
+
+    @patch("indieshout.utils.translation_backends.subprocess.run", side_effect=fake_claude)
+    def test_preserves_code_images_and_urls(self, mock_run):
+        translator = Translator()
+
+        result = translator.translate_markdown(self.BODY)
+
+        assert result == (
+            "[en] # 제목\n\n문단 하나\n\n```bash\necho 코드\n```\n\n"
+            "![그림](assets/1.png)\n\n[en] ## 둘\n\n[링크](https://example.com) 문단 둘"
+        )
+        assert mock_run.call_count == 2
+        sent = " ".join(call.args[0][2] for call in mock_run.call_args_list)
+        assert "echo" not in sent
+        assert "https://example.com" not in sent
+
+    @patch("indieshout.utils.translation_backends.subprocess.run")
+    def test_chunks_translated_concurrently(self, mock_run):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def respond(args, **kwargs):
+            barrier.wait()
+            return fake_claude(args, **kwargs)
+
+        mock_run.side_effect = respond
+        translator = Translator(max_workers=2)
+
+        result = translator.translate_markdown("# 하나\n\n본문\n\n# 둘\n\n본문")
+
+        assert result == "[en] # 하나\n\n본문\n\n[en] # 둘\n\n본문"
+
+    @patch("indieshout.utils.translation_backends.subprocess.run")
+    def test_failed_chunk_retried(self, mock_run):
+        calls = {"count": 0}
+
+        def flaky(args, **kwargs):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise subprocess.TimeoutExpired("claude", 180)
+            return fake_claude(args, **kwargs)
+
+        mock_run.side_effect = flaky
+        translator = Translator(retry_delay=0)
+
+        assert translator.translate_markdown("본문") == "[en] 본문"
+        assert mock_run.call_count == 2
+
+    @patch("indieshout.utils.translation_backends.subprocess.run")
+    def test_dropped_placeholder_retried_then_fails(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="translated without link")
+        translator = Translator(max_retries=1, retry_delay=0)
+
+        with pytest.raises(RuntimeError, match="after 2 attempts"):
+            translator.translate_markdown("[링크](https://example.com) 본문")
+
+    @patch("indieshout.utils.translation_backends.subprocess.run", side_effect=fake_claude)
+    def test_chunks_cached_individually(self, mock_run, cache):
+        translator = Translator(cache=cache)
+        translator.translate_markdown("# 하나\n\n본문\n\n# 둘\n\n본문")
+
+        translator.translate_markdown("# 하나\n\n본문\n\n# 둘\n\n수정된 본문")
+
+        assert mock_run.call_count == 3
@@ -1,4 +1,6 @@
 import os
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,6 +12,7 @@ from indieshout.publishers.twitter import (
     MAX_IMAGES,
     TwitterPublisher,
 )
+from indieshout.utils.rate_limiter import RateLimitError, RetryableError
 
 
 @pytest.fixture
@@ -63,6 +66,19 @@ class TestAuthenticate:
         assert publisher.client is mock_client
         mock_client.get_me.assert_called_once()
 
+    @patch("indieshout.publishers.twitter.tweepy.API")
+    @patch("indieshout.publishers.twitter.tweepy.OAuth1UserHandler")
+    @patch("indieshout.publishers.twitter.tweepy.Client")
+    def test_authenticate_cached(self, mock_client_cls, mock_auth_cls, mock_api_cls, publisher):
+        mock_client = MagicMock()
+        mock_client.get_me.return_value = MagicMock(data={"id": "123", "username": "test"})
+        mock_client_cls.return_value = mock_client
+
+        publisher.authenticate()
+        publisher.authenticate()
+
+        mock_client.get_me.assert_called_once()
+
     @patch("indieshout.publishers.twitter.tweepy.API")
     @patch("indieshout.publishers.twitter.tweepy.OAuth1UserHandler")
     @patch("indieshout.publishers.twitter.tweepy.Client")
@@ -134,6 +150,13 @@ class TestValidate:
         with pytest.raises(ValueError, match="Image too large"):
             authenticated_publisher.validate(content)
 
+    def test_large_gif_allowed(self, authenticated_publisher, tmp_path):
+        gif = tmp_path / "anim.gif"
+        gif.write_bytes(b"x" * (MAX_IMAGE_SIZE + 1))
+
+        content = Content(content_type=ContentType.SNS, text="test", image_paths=[str(gif)])
+        assert authenticated_publisher.validate(content) is True
+
     def test_valid_content_passes(self, authenticated_publisher):
         content = Content(content_type=ContentType.SNS, text="hello world")
         assert authenticated_publisher.validate(content) is True
@@ -195,12 +218,10 @@ class TestPublish:
 
         content = Content(content_type=ContentType.SNS, text="Multi", image_paths=paths)
 
-        media_mocks = []
-        for i in range(3):
-            m = MagicMock()
-            m.media_id = 100 + i
-            media_mocks.append(m)
-        authenticated_publisher.api.media_upload.side_effect = media_mocks
+        media_ids = {path: 100 + i for i, path in enumerate(paths)}
+        authenticated_publisher.api.media_upload.side_effect = lambda filename, **kwargs: MagicMock(
+            media_id=media_ids[filename]
+        )
         authenticated_publisher.client.create_tweet.return_value = MagicMock(
             data={"id": "11111"}
         )
@@ -212,3 +233,151 @@ class TestPublish:
             text="Multi", media_ids=[100, 101, 102]
         )
         assert result["tweet_id"] == "11111"
+
+
+class TestMediaUpload:
+    """동시 업로드와 chunked 업로드."""
+
+    def make_images(self, tmp_path, names, size=100):
+        paths = []
+        for name in names:
+            p = tmp_path / name
+            p.write_bytes(b"\x00" * size)
+            paths.append(str(p))
+        return paths
+
+    def test_uploads_concurrently_in_order(self, authenticated_publisher, tmp_path):
+        paths = self.make_images(tmp_path, ["1.jpg", "2.jpg", "3.jpg", "4.jpg"])
+        barrier = threading.Barrier(4, timeout=5)
+        delays = {paths[0]: 0.15, paths[1]: 0.0, paths[2]: 0.1, paths[3]: 0.05}
+
+        def upload(filename, **kwargs):
+            # 4개가 동시에 진행 중이어야 통과
+            barrier.wait()
+            time.sleep(delays[filename])
+            return MagicMock(media_id=paths.index(filename))
+
+        authenticated_publisher.api.media_upload.side_effect = upload
+
+        assert authenticated_publisher._upload_media_many(paths) == [0, 1, 2, 3]
+
+    def test_large_file_uses_chunked(self, authenticated_publisher, tmp_path):
+        authenticated_publisher.config["twitter"]["chunked_threshold"] = 1000
+        (path,) = self.make_images(tmp_path, ["big.jpg"], size=1000)
+        authenticated_publisher.api.media_upload.return_value = MagicMock(media_id=1)
+
+        authenticated_publisher._upload_media_many([path])
+
+        authenticated_publisher.api.media_upload.assert_called_once_with(
+            filename=path, chunked=True, media_category="tweet_image"
+        )
+
+    def test_gif_uses_chunked(self, authenticated_publisher, tmp_path):
+        (path,) = self.make_images(tmp_path, ["anim.gif"])
+        authenticated_publisher.api.media_upload.return_value = MagicMock(media_id=1)
+
+        authenticated_publisher._upload_media_many([path])
+
+        authenticated_publisher.api.media_upload.assert_called_once_with(
+            filename=path, chunked=True, media_category="tweet_gif"
+        )
+
+    def test_upload_error_propagates(self, authenticated_publisher, tmp_path):
+        paths = self.make_images(tmp_path, ["1.jpg", "2.jpg"])
+        authenticated_publisher.api.media_upload.side_effect = tweepy.TweepyException("fail")
+
+        with pytest.raises(tweepy.TweepyException):
+            authenticated_publisher._upload_media_many(paths)
+
+    def test_unauthorized_invalidates_auth_cache(self, authenticated_publisher):
+        authenticated_publisher.auth_cache.set("x", "fp", {"id": "1"})
+        response = MagicMock(status_code=401, reason="Unauthorized")
+        response.json.return_value = {}
+        authenticated_publisher.client.create_tweet.side_effect = tweepy.Unauthorized(response)
+
+        with pytest.raises(tweepy.Unauthorized):
+            authenticated_publisher.publish(Content(content_type=ContentType.SNS, text="Hi"))
+
+        assert authenticated_publisher.auth_cache.get("x", "fp") is None
+
+    def test_too_many_requests_uses_reset_header(self, authenticated_publisher):
+        response = MagicMock(
+            status_code=429,
+            reason="Too Many Requests",
+            headers={
+                "x-user-limit-24hour-remaining": "0",
+                "x-user-limit-24hour-reset": str(int(time.time()) + 600),
+            },
+        )
+        response.json.return_value = {}
+        authenticated_publisher.client.create_tweet.side_effect = tweepy.TooManyRequests(response)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            authenticated_publisher.publish(Content(content_type=ContentType.SNS, text="Hi"))
+
+        assert 590 <= exc_info.value.retry_after <= 600
+        assert authenticated_publisher.rate_limiter.bucket("x").wait_time() > 590
+
+    def test_media_server_error_retryable(self, authenticated_publisher, tmp_path):
+        img = tmp_path / "1.jpg"
+        img.write_bytes(b"jpg")
+        response = MagicMock(status_code=503, reason="Service Unavailable")
+        response.json.return_value = {}
+        authenticated_publisher.api.media_upload.side_effect = tweepy.TwitterServerError(response)
+
+        with pytest.raises(RetryableError):
+            authenticated_publisher.publish(
+                Content(content_type=ContentType.SNS, text="Hi", image_paths=[str(img)])
+            )
+        authenticated_publisher.client.create_tweet.assert_not_called()
+
+    def test_video_uploaded_in_chunks(self, authenticated_publisher, tmp_path, monkeypatch):
+        import indieshout.publishers.twitter as twitter
+
+        monkeypatch.setattr(twitter, "VIDEO_CHUNK_SIZE", 4)
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"0123456789")
+        api = authenticated_publisher.api
+        api.chunked_upload_init.return_value = MagicMock(media_id=7)
+        api.chunked_upload_finalize.return_value = MagicMock(
+            processing_info={"state": "pending", "check_after_secs": 0}
+        )
+        api.get_media_upload_status.return_value = MagicMock(processing_info={"state": "succeeded"})
+        authenticated_publisher.client.create_tweet.return_value = MagicMock(data={"id": "1"})
+
+        authenticated_publisher.publish(
+            Content(content_type=ContentType.SNS, text="Hi", video_path=str(video))
+        )
+
+        api.chunked_upload_init.assert_called_once_with(10, "video/mp4", media_category="tweet_video")
+        segments = [c.args for c in api.chunked_upload_append.call_args_list]
+        assert segments == [(7, b"0123", 0), (7, b"4567", 1), (7, b"89", 2)]
+        authenticated_publisher.client.create_tweet.assert_called_once_with(text="Hi", media_ids=["7"])
+
+    def test_video_processing_failure_raises(self, authenticated_publisher, tmp_path):
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"0")
+        api = authenticated_publisher.api
+        api.chunked_upload_init.return_value = MagicMock(media_id=7)
+        api.chunked_upload_finalize.return_value = MagicMock(
+            processing_info={"state": "failed", "error": {"message": "bad codec"}}
+        )
+
+        with pytest.raises(RuntimeError, match="bad codec"):
+            authenticated_publisher.upload_video(str(video))
+
+    def test_video_with_images_raises(self, authenticated_publisher, tmp_path):
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"0")
+        img = tmp_path / "1.jpg"
+        img.write_bytes(b"jpg")
+
+        with pytest.raises(ValueError, match="video"):
+            authenticated_publisher.validate(
+                Content(
+                    content_type=ContentType.SNS,
+                    text="Hi",
+                    image_paths=[str(img)],
+                    video_path=str(video),
+                )
+            )
@@ -0,0 +1,75 @@
+"""UploadManifest 테스트."""
+
+import hashlib
+import json
+
+from indieshout.utils.upload_manifest import (
+    MANIFEST_FILENAME,
+    UploadManifest,
+    compute_s3_etag,
+    file_sha256,
+)
+
+
+def test_file_sha256(tmp_path):
+    path = tmp_path / "1.png"
+    path.write_bytes(b"image")
+    assert file_sha256(path) == hashlib.sha256(b"image").hexdigest()
+
+
+def test_compute_s3_etag_single_part(tmp_path):
+    path = tmp_path / "1.png"
+    path.write_bytes(b"small")
+    assert compute_s3_etag(path, 1024, 1024) == hashlib.md5(b"small").hexdigest()
+
+
+def test_compute_s3_etag_multipart(tmp_path):
+    data = b"a" * 10 + b"b" * 10 + b"c" * 5
+    path = tmp_path / "large.png"
+    path.write_bytes(data)
+
+    parts = [data[0:10], data[10:20], data[20:]]
+    expected = hashlib.md5(b"".join(hashlib.md5(p).digest() for p in parts)).hexdigest()
+
+    assert compute_s3_etag(path, 10, 10) == f"{expected}-3"
+
+
+def test_missing_manifest_not_loaded(tmp_path):
+    manifest = UploadManifest.for_folder(tmp_path, "bucket")
+    assert manifest.loaded is False
+    assert manifest.lookup("hash", "key") is None
+
+
+def test_record_save_and_reload(tmp_path):
+    manifest = UploadManifest.for_folder(tmp_path, "bucket")
+    manifest.record("hash1", "posts/a/1.png", "https://cdn/1.png", "etag1")
+    manifest.save()
+
+    reloaded = UploadManifest.for_folder(tmp_path, "bucket")
+    assert reloaded.loaded is True
+    assert reloaded.lookup("hash1", "posts/a/1.png") == {
+        "url": "https://cdn/1.png",
+        "etag": "etag1",
+    }
+    assert reloaded.lookup("hash1", "posts/b/1.png") is None
+
+
+def test_record_replaces_old_content_for_key(tmp_path):
+    manifest = UploadManifest.for_folder(tmp_path, "bucket")
+    manifest.record("old", "posts/a/1.png", "https://cdn/1.png", "etag-old")
+    manifest.record("new", "posts/a/1.png", "https://cdn/1.png", "etag-new")
+
+    assert manifest.lookup("old", "posts/a/1.png") is None
+    assert "old" not in manifest.entries
+    assert manifest.lookup("new", "posts/a/1.png")["etag"] == "etag-new"
+
+
+def test_other_bucket_ignored(tmp_path):
+    (tmp_path / MANIFEST_FILENAME).write_text(
+        json.dumps({"version": 1, "bucket": "old-bucket", "entries": {"h": {"k": {}}}})
+    )
+
+    manifest = UploadManifest.for_folder(tmp_path, "bucket")
+
+    assert manifest.loaded is False
+    assert manifest.entries == {}